@@ -0,0 +1,150 @@
+"""
+peakrdl-python is a tool to generate Python Register Access Layer (RAL) from SystemRDL
+Copyright (C) 2021 - 2023
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+The operations measured by the benchmarks, each is a function with no arguments which is timed
+over many calls
+"""
+from typing import Any, NamedTuple
+from collections.abc import Callable
+from functools import partial
+
+from .designs import SyntheticScale, LoadedDesign
+
+
+class Benchmark(NamedTuple):
+    """
+    An operation to be timed
+    """
+    name: str
+    function: Callable[[], Any]
+    #: number of items (for example memory entries) processed by each call, this is used to
+    #: report the throughput of the block operations
+    items: int = 1
+
+
+def dummy_callbacks(design: LoadedDesign) -> Any:
+    """
+    Callbacks which do nothing, so that only the time spent in the register model is measured
+    """
+    # pylint: disable-next=unused-argument
+    def read_block(addr: int, width: int, accesswidth: int, length: int) -> list[int]:
+        return [0] * length
+
+    return design.callback_set_cls(
+        read_callback=lambda addr, width, accesswidth: 0,
+        write_callback=lambda addr, width, accesswidth, data: None,
+        read_block_callback=read_block,
+        write_block_callback=lambda addr, width, accesswidth, data: None)
+
+
+def simulator_callbacks(design: LoadedDesign, simulator: Any) -> Any:
+    """
+    Callbacks which access the simulator of the design
+    """
+    return design.callback_set_cls(read_callback=simulator.read, write_callback=simulator.write,
+                                   read_block_callback=simulator.read_block,
+                                   write_block_callback=simulator.write_block)
+
+
+def construction_benchmarks(name: str, design: LoadedDesign) -> list[Benchmark]:
+    """
+    Benchmarks for building the register model of a design
+
+    Args:
+        name: name used to identify the design and build variant
+        design: classes of the design
+    """
+    callbacks = dummy_callbacks(design)
+    return [Benchmark(name=f'construct.{name}',
+                      function=lambda: design.reg_model_cls(callbacks=callbacks))]
+
+
+def lazy_benchmarks(design: LoadedDesign) -> list[Benchmark]:
+    """
+    Benchmarks for the synthetic design built with the lazy construction, where each register
+    is only built when it is first used
+    """
+    callbacks = dummy_callbacks(design)
+
+    def first_access() -> None:
+        reg_model = design.reg_model_cls(callbacks=callbacks)
+        reg_model.reg_file_0.regs[3].f1.read()
+
+    return [Benchmark(name='lazy.construct_and_first_access', function=first_access)]
+
+
+def access_benchmarks(design: LoadedDesign, scale: SyntheticScale) -> list[Benchmark]:
+    """
+    Benchmarks for accessing the synthetic design, with both the dummy callbacks and the
+    simulator
+
+    Args:
+        design: classes of the synthetic design
+        scale: size of the synthetic design
+    """
+    simulator = design.simulator_cls(address=0)
+    benchmarks = [
+        Benchmark(name='simulator.read',
+                  function=lambda: simulator.read(addr=0, width=32, accesswidth=32)),
+        Benchmark(name='simulator.write',
+                  function=lambda: simulator.write(addr=0, width=32, accesswidth=32, data=1)),
+    ]
+
+    for callback_name, callbacks in [('dummy', dummy_callbacks(design)),
+                                     ('simulator', simulator_callbacks(design, simulator))]:
+        reg_model = design.reg_model_cls(callbacks=callbacks)
+        register = reg_model.reg_0
+        field = register.f3
+        reg_array = reg_model.reg_array
+        memory = reg_model.table
+        memory_data = list(range(scale.memory_entries))
+
+        def cached_access(reg_array: Any) -> None:
+            with reg_array.single_read_modify_write():
+                pass
+
+        benchmarks += [
+            Benchmark(name=f'reg.read.{callback_name}', function=register.read),
+            Benchmark(name=f'reg.write.{callback_name}',
+                      function=partial(register.write, 0x1234_5678)),
+            Benchmark(name=f'reg.read_fields.{callback_name}', function=register.read_fields),
+            Benchmark(name=f'field.read.{callback_name}', function=field.read),
+            Benchmark(name=f'field.write.{callback_name}', function=partial(field.write, 5)),
+            Benchmark(name=f'reg_array.cached_access.{callback_name}',
+                      function=partial(cached_access, reg_array), items=scale.array_elements),
+            Benchmark(name=f'reg_array.read_field_columns.{callback_name}',
+                      function=reg_array.read_field_columns, items=scale.array_elements),
+            Benchmark(name=f'memory.read.{callback_name}',
+                      function=partial(memory.read, start_entry=0,
+                                       number_entries=scale.memory_entries),
+                      items=scale.memory_entries),
+            Benchmark(name=f'memory.write.{callback_name}',
+                      function=partial(memory.write, start_entry=0, data=memory_data),
+                      items=scale.memory_entries),
+        ]
+
+    reg_model = design.reg_model_cls(callbacks=dummy_callbacks(design))
+    reg_array = reg_model.reg_array
+    half = scale.array_elements // 2
+    benchmarks += [
+        Benchmark(name='reg_array.index', function=lambda: reg_array[half]),
+        Benchmark(name='reg_array.slice', function=lambda: reg_array[half // 2:half]),
+        Benchmark(name='lookup.path',
+                  function=lambda: reg_model.find(f'reg_file_{scale.reg_files - 1:d}.regs[15]')),
+    ]
+
+    return benchmarks
@@ -0,0 +1,186 @@
+"""
+peakrdl-python is a tool to generate Python Register Access Layer (RAL) from SystemRDL
+Copyright (C) 2021 - 2023
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Designs used by the benchmarks, these are a selection of the test cases and a synthetic design
+which can be scaled up to the size of a large device
+"""
+import sys
+import time
+import pathlib
+from importlib import import_module
+from typing import Any, NamedTuple
+
+from systemrdl import RDLCompiler  # type: ignore
+from systemrdl.node import AddrmapNode  # type: ignore
+
+from peakrdl_python import PythonExporter
+
+TEST_CASE_PATH = pathlib.Path('tests') / 'testcases'
+
+#: test cases which are exported to measure the export and construction time
+TEST_CASE_DESIGNS = ['simulator_test', 'regfile_and_arrays', 'memories_with_registers',
+                     'sizes_registers_array']
+
+#: name of the synthetic design
+SYNTHETIC_DESIGN = 'synthetic'
+
+#: number of fields in each register of the synthetic design, each field is 4 bits wide
+SYNTHETIC_FIELDS = 8
+
+
+class SyntheticScale(NamedTuple):
+    """
+    Size of the synthetic design
+    """
+    #: number of individual registers
+    registers: int
+    #: number of register files, each of which holds 16 registers
+    reg_files: int
+    #: number of elements in the register array
+    array_elements: int
+    #: number of entries in the memory
+    memory_entries: int
+
+
+SCALES = {
+    'small': SyntheticScale(registers=64, reg_files=4, array_elements=256, memory_entries=1024),
+    'large': SyntheticScale(registers=1024, reg_files=64, array_elements=4096,
+                            memory_entries=16384),
+}
+
+
+class BuildVariant(NamedTuple):
+    """
+    Options used to export a design, each variant is exported to its own python package so
+    that they can be loaded at the same time
+    """
+    package: str
+    lazy_construction: bool
+
+
+VARIANTS = [BuildVariant(package='bench_standard', lazy_construction=False),
+            BuildVariant(package='bench_lazy', lazy_construction=True)]
+
+
+def synthetic_rdl(scale: SyntheticScale) -> str:
+    """
+    systemRDL of the synthetic design
+
+    Args:
+        scale: size of the design
+
+    Returns:
+        systemRDL source code
+    """
+    fields = ''.join(f'        field {{}} f{index:d}[{(index * 4) + 3:d}:{index * 4:d}];\n'
+                     for index in range(SYNTHETIC_FIELDS))
+    registers = ''.join(f'    bench_reg reg_{index:d};\n' for index in range(scale.registers))
+    reg_files = ''.join(f'    bench_reg_file reg_file_{index:d};\n'
+                        for index in range(scale.reg_files))
+    return (f'addrmap {SYNTHETIC_DESIGN} {{\n'
+            f'    reg bench_reg {{\n{fields}    }};\n'
+            f'    regfile bench_reg_file {{\n        bench_reg regs[16];\n    }};\n'
+            f'{registers}{reg_files}'
+            f'    bench_reg reg_array[{scale.array_elements:d}];\n'
+            f'    external mem {{\n'
+            f'        mementries = {scale.memory_entries:d};\n'
+            f'        memwidth = 32;\n'
+            f'        sw=rw;\n'
+            f'    }} table;\n'
+            f'}};\n')
+
+
+def compile_design(name: str, output_path: pathlib.Path, scale: SyntheticScale) -> AddrmapNode:
+    """
+    Compile one of the designs
+
+    Args:
+        name: either one of the test cases or the synthetic design
+        output_path: folder to write the systemRDL of the synthetic design to
+        scale: size of the synthetic design
+
+    Returns:
+        the top level address map
+    """
+    if name == SYNTHETIC_DESIGN:
+        rdl_file = output_path / f'{SYNTHETIC_DESIGN}.rdl'
+        rdl_file.write_text(synthetic_rdl(scale), encoding='utf-8')
+    else:
+        rdl_file = TEST_CASE_PATH / f'{name}.rdl'
+
+    rdlc = RDLCompiler()
+    rdlc.compile_file(str(rdl_file))
+    return rdlc.elaborate(top_def_name=name).top
+
+
+def export_design(root: AddrmapNode, output_path: pathlib.Path, variant: BuildVariant) -> float:
+    """
+    Export a design into the package for a build variant
+
+    Args:
+        root: top level address map
+        output_path: folder to build the packages in
+        variant: options to export the design with
+
+    Returns:
+        time taken to export in seconds
+    """
+    package_path = output_path / variant.package
+    package_path.mkdir(parents=True, exist_ok=True)
+    with open(package_path / '__init__.py', 'w', encoding='utf-8') as fid:
+        fid.write('pass\n')
+
+    start_time = time.perf_counter()
+    PythonExporter().export(root, str(package_path),  # type: ignore[no-untyped-call]
+                            skip_test_case_generation=True,
+                            legacy_block_access=False,
+                            lazy_construction=variant.lazy_construction)
+    return time.perf_counter() - start_time
+
+
+class LoadedDesign(NamedTuple):
+    """
+    Classes from an exported design
+    """
+    reg_model_cls: Any
+    simulator_cls: Any
+    #: the callback set from the library copied into the package, the register model does not
+    #: accept the one from peakrdl_python
+    callback_set_cls: Any
+
+
+def load_design(output_path: pathlib.Path, variant: BuildVariant, name: str) -> LoadedDesign:
+    """
+    Import a design which has been exported
+
+    Args:
+        output_path: folder the packages were built in
+        variant: options the design was exported with
+        name: name of the design
+
+    Returns:
+        the classes of the register model, simulator and callback set
+    """
+    if str(output_path) not in sys.path:
+        sys.path.insert(0, str(output_path))
+    package = f'{variant.package}.{name}'
+    reg_model = import_module(f'{package}.reg_model.{name}')
+    simulator = import_module(f'{package}.sim.{name}')
+    lib = import_module(f'{package}.lib')
+    return LoadedDesign(reg_model_cls=getattr(reg_model, f'{name}_cls'),
+                        simulator_cls=getattr(simulator, f'{name}_simulator_cls'),
+                        callback_set_cls=lib.NormalCallbackSet)
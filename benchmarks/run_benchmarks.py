@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+peakrdl-python is a tool to generate Python Register Access Layer (RAL) from SystemRDL
+Copyright (C) 2021 - 2023
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+script to export the benchmark designs, time the register model operations on them and compare
+the results with a baseline saved from an earlier run, for example:
+
+    python -m benchmarks.run_benchmarks --save baseline.json
+    python -m benchmarks.run_benchmarks --compare baseline.json
+"""
+import sys
+import json
+import fnmatch
+import argparse
+import pathlib
+import platform
+import subprocess
+from timeit import Timer
+from typing import Any, Optional
+
+from .designs import TEST_CASE_DESIGNS, SYNTHETIC_DESIGN, SCALES, VARIANTS, SyntheticScale
+from .designs import compile_design, export_design, load_design
+from .cases import Benchmark, construction_benchmarks, lazy_benchmarks, access_benchmarks
+
+CommandLineParser = argparse.ArgumentParser(description='Benchmark the register model')
+CommandLineParser.add_argument('--output', dest='output_path', type=pathlib.Path,
+                               default='benchmark_output',
+                               help='folder to export the benchmark designs to')
+CommandLineParser.add_argument('--scale', dest='scale', choices=list(SCALES), default='small',
+                               help='size of the synthetic design')
+CommandLineParser.add_argument('--filter', dest='filter', type=str, default='*',
+                               help='only run the benchmarks whose name matches this pattern')
+CommandLineParser.add_argument('--repeat', dest='repeat', type=int, default=5,
+                               help='number of times each benchmark is repeated, the fastest '
+                                    'is reported')
+CommandLineParser.add_argument('--save', dest='save', type=pathlib.Path,
+                               help='save the results to a JSON file')
+CommandLineParser.add_argument('--compare', dest='compare', type=pathlib.Path,
+                               help='compare the results with a JSON file saved previously')
+CommandLineParser.add_argument('--threshold', dest='threshold', type=float, default=0.1,
+                               help='fractional slow down compared to the baseline which is '
+                                    'reported as a regression')
+
+
+def time_benchmark(benchmark: Benchmark, repeat: int) -> float:
+    """
+    Time a benchmark
+
+    Args:
+        benchmark: operation to time
+        repeat: number of times the timing is repeated
+
+    Returns:
+        the fastest time for a single call in seconds
+    """
+    timer = Timer(stmt=benchmark.function)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def git_commit() -> Optional[str]:
+    """
+    Commit of the repository the benchmarks are run from, if this can be found
+    """
+    try:
+        result = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+                                check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def run(output_path: pathlib.Path, scale: SyntheticScale, pattern: str,
+        repeat: int) -> dict[str, dict[str, float]]:
+    """
+    Export the designs and run all the benchmarks which match a pattern
+
+    Returns:
+        the time taken by each benchmark (in seconds) and the number of items it processes
+    """
+    output_path.mkdir(parents=True, exist_ok=True)
+    results: dict[str, dict[str, float]] = {}
+    benchmarks: list[Benchmark] = []
+
+    for design in TEST_CASE_DESIGNS + [SYNTHETIC_DESIGN]:
+        root = compile_design(design, output_path=output_path, scale=scale)
+        for variant in VARIANTS:
+            name = f'{design}.{variant.package}'
+            export_time = export_design(root, output_path=output_path, variant=variant)
+            if fnmatch.fnmatch(f'export.{name}', pattern):
+                # exporting is slow so it is only done once
+                results[f'export.{name}'] = {'seconds': export_time, 'items': 1}
+            loaded_design = load_design(output_path, variant=variant, name=design)
+            benchmarks += construction_benchmarks(name, loaded_design)
+            if design == SYNTHETIC_DESIGN:
+                if variant.lazy_construction:
+                    benchmarks += lazy_benchmarks(loaded_design)
+                else:
+                    benchmarks += access_benchmarks(loaded_design, scale=scale)
+
+    for benchmark in benchmarks:
+        if not fnmatch.fnmatch(benchmark.name, pattern):
+            continue
+        results[benchmark.name] = {'seconds': time_benchmark(benchmark, repeat=repeat),
+                                   'items': benchmark.items}
+    return results
+
+
+def report(results: dict[str, dict[str, float]],
+           baseline: Optional[dict[str, dict[str, float]]], threshold: float) -> list[str]:
+    """
+    Print the results, along with the change from the baseline if there is one
+
+    Returns:
+        names of the benchmarks which are slower than the baseline by more than the threshold
+    """
+    regressions: list[str] = []
+    name_width = max((len(name) for name in results), default=0)
+    for name, result in sorted(results.items()):
+        line = f'{name:<{name_width}}  {result["seconds"] * 1E6:12.2f}us'
+        if result['items'] > 1:
+            line += f'  {result["items"] / result["seconds"]:12.0f} items/s'
+        if baseline is not None and name in baseline:
+            ratio = result['seconds'] / baseline[name]['seconds']
+            line += f'  {ratio:6.2f}x baseline'
+            if ratio > 1 + threshold:
+                line += '  REGRESSION'
+                regressions.append(name)
+        print(line)
+    return regressions
+
+
+if __name__ == '__main__':
+
+    CommandLineArgs = CommandLineParser.parse_args()
+
+    benchmark_results = run(CommandLineArgs.output_path, scale=SCALES[CommandLineArgs.scale],
+                            pattern=CommandLineArgs.filter, repeat=CommandLineArgs.repeat)
+
+    baseline_results: Optional[dict[str, Any]] = None
+    if CommandLineArgs.compare is not None:
+        with open(CommandLineArgs.compare, encoding='utf-8') as fid:
+            baseline_file = json.load(fid)
+        if baseline_file['metadata']['scale'] != CommandLineArgs.scale:
+            raise ValueError(f'baseline was run at the {baseline_file["metadata"]["scale"]} '
+                             f'scale')
+        baseline_results = baseline_file['results']
+
+    regressed = report(benchmark_results, baseline=baseline_results,
+                       threshold=CommandLineArgs.threshold)
+
+    if CommandLineArgs.save is not None:
+        with open(CommandLineArgs.save, 'w', encoding='utf-8') as fid:
+            json.dump({'metadata': {'commit': git_commit(),
+                                    'python': platform.python_version(),
+                                    'platform': platform.platform(),
+                                    'scale': CommandLineArgs.scale},
+                       'results': benchmark_results}, fid, indent=2)
+
+    if regressed:
+        print(f'{len(regressed):d} benchmarks are slower than the baseline')
+        sys.exit(1)
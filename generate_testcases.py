@@ -77,7 +77,8 @@ def compile_rdl(infile: str,
 def generate(root: Node, outdir: str,
              asyncoutput: bool = False,
              skip_test_case_generation: bool = False,
-             legacy_block_access: bool = True) -> List[str]:
+             legacy_block_access: bool = True,
+             lazy_construction: bool = False) -> List[str]:
     """
     Generate a PeakRDL output package from compiled systemRDL
 
@@ -88,6 +89,7 @@ def generate(root: Node, outdir: str,
                 clean it up. This can slow down large jobs or mask problems
         legacy_block_access: If set to True the code build a register model the legacy array block
                              access as opposed to the newer list based
+        lazy_construction: If set to True the register model builds its children on first access
 
     Returns:
         List of strings with the module names generated
@@ -97,7 +99,8 @@ def generate(root: Node, outdir: str,
     modules = PythonExporter().export(root, outdir, # type: ignore[no-untyped-call]
                                       asyncoutput=asyncoutput,
                                       skip_test_case_generation=skip_test_case_generation,
-                                      legacy_block_access=legacy_block_access)
+                                      legacy_block_access=legacy_block_access,
+                                      lazy_construction=lazy_construction)
 
     return modules
 
@@ -134,7 +137,8 @@ if __name__ == '__main__':
                 [({'asyncoutput': True, 'legacy':False}, 'raw_async'),
                  ({'asyncoutput': False, 'legacy':False}, 'raw'),
                  ({'asyncoutput': True, 'legacy': True}, 'raw_async_legacy'),
-                 ({'asyncoutput': False, 'legacy': True}, 'raw_legacy')
+                 ({'asyncoutput': False, 'legacy': True}, 'raw_legacy'),
+                 ({'asyncoutput': False, 'legacy': False, 'lazy': True}, 'raw_lazy')
                  ]:
 
             # test cases that use the extended widths an not be tested in the non-legacy modes
@@ -144,7 +148,8 @@ if __name__ == '__main__':
 
             _ = generate(root, str(output_path / folder_name),
                          asyncoutput=build_options['asyncoutput'],
-                         legacy_block_access=build_options['legacy']
+                         legacy_block_access=build_options['legacy'],
+                         lazy_construction=build_options.get('lazy', False)
                          )
 
             module_fqfn = output_path / folder_name / '__init__.py'
@@ -81,6 +81,24 @@ class Exporter(ExporterSubcommandPlugin):
                                help='show addrmap, regfile, memory, register and fields that '
                                     'have been given the python_hide user defined property and '
                                     'would be removed from the build python by default')
+        arg_group.add_argument('--lazy', action='store_true',
+                               dest='lazy_construction',
+                               help='build the sections, registers, fields and array elements of '
+                                    'the register model when they are first accessed rather than '
+                                    'when the top level is created, this is useful for very '
+                                    'large register models')
+        arg_group.add_argument('--incremental', action='store_true', dest='incremental',
+                               help='keep a manifest of the content hash of each generated file '
+                                    'and only rewrite the files whose content has changed, this '
+                                    'avoids invalidating the cached bytecode of unchanged '
+                                    'modules when regenerating a package')
+        arg_group.add_argument('--processes', dest='processes', type=int, default=1,
+                               help='number of worker processes used to render the test cases, '
+                                    'one pair of test modules is generated for each address map')
+        arg_group.add_argument('--fast_api', action='store_true', dest='fast_api',
+                               help='also generate a module of plain functions to read and write '
+                                    'every register and field, with the address, mask and shift '
+                                    'inlined as constants, for latency critical code')
         arg_group.add_argument('--udp', dest='udp', nargs='*', type=str,
                                help='any user defined properties to include in the reg_model')
         arg_group.add_argument('--hide_regex', dest='hide_regex', type=str,
@@ -117,5 +135,9 @@ class Exporter(ExporterSubcommandPlugin):
             legacy_block_access=options.legacy_block_access,
             show_hidden=options.show_hidden,
             user_defined_properties_to_include=options.udp,
-            hidden_inst_name_regex=options.hide_regex
+            hidden_inst_name_regex=options.hide_regex,
+            lazy_construction=options.lazy_construction,
+            incremental=options.incremental,
+            processes=options.processes,
+            fast_api=options.fast_api
         )
@@ -0,0 +1,202 @@
+"""
+peakrdl-python is a tool to generate Python Register Access Layer (RAL) from SystemRDL
+Copyright (C) 2021 - 2023
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Writing of the files that make up the generated package
+"""
+import os
+import json
+import hashlib
+import multiprocessing
+from pathlib import Path
+from typing import Any
+from collections.abc import Callable, Sequence
+
+#: module paths and their content produced by a rendering job
+RenderedModules = list[tuple[Path, str]]
+#: job which renders one or more modules of the generated package
+RenderJob = Callable[[], RenderedModules]
+
+#: rendering jobs for the worker processes, this is populated before the worker processes are
+#: forked so that they inherit it, as the systemRDL nodes in the template context can not be
+#: pickled to send to them
+_FORKED_RENDER_JOBS: list[RenderJob] = []
+
+
+def _run_forked_render_job(index: int) -> RenderedModules:
+    return _FORKED_RENDER_JOBS[index]()
+
+
+class ModuleWriter:
+    """
+    Class to write the files of the generated package, in incremental mode this keeps a
+    manifest of the content hash of every file written so that files whose content has not
+    changed are not rewritten, leaving their modification time (and any cached bytecode)
+    untouched
+
+    Args:
+        root: root directory of the generated package, the manifest is stored here
+        incremental: only write files whose content has changed
+    """
+
+    manifest_name = '.peakrdl_python_manifest.json'
+
+    def __init__(self, root: Path, incremental: bool):
+        self.__root = root
+        self.__incremental = incremental
+        self.__previous_manifest: dict[str, dict[str, Any]] = {}
+        self.__manifest: dict[str, dict[str, Any]] = {}
+        self.__package_paths: list[Path] = []
+
+        if incremental and self.__manifest_path.exists():
+            try:
+                with self.__manifest_path.open('r', encoding='utf-8') as fid:
+                    previous_manifest = json.load(fid)
+            except (OSError, ValueError):
+                # a damaged manifest is treated as missing, so everything is written
+                previous_manifest = {}
+            if isinstance(previous_manifest, dict):
+                self.__previous_manifest = previous_manifest
+
+    @property
+    def __manifest_path(self) -> Path:
+        return self.__root / self.manifest_name
+
+    @property
+    def incremental(self) -> bool:
+        """
+        Only files whose content has changed are written
+        """
+        return self.__incremental
+
+    def __key(self, path: Path) -> str:
+        return path.relative_to(self.__root).as_posix()
+
+    def __unchanged(self, key: str, path: Path, digest: str) -> bool:
+        """
+        Check whether the file on disk is the one recorded in the previous manifest with the
+        same content hash, the size and modification time are also checked so that a file which
+        has been edited since it was generated gets rewritten
+        """
+        record = self.__previous_manifest.get(key)
+        if not isinstance(record, dict) or record.get('sha256') != digest:
+            return False
+        try:
+            stat = path.stat()
+        except OSError:
+            return False
+        return record.get('size') == stat.st_size and record.get('mtime_ns') == stat.st_mtime_ns
+
+    def add_package_path(self, path: Path) -> None:
+        """
+        Register the directory of a package, any python files in it which are not written
+        during the export are removed by :meth:`finish` if requested
+        """
+        self.__package_paths.append(path)
+
+    def write_bytes(self, path: Path, content: bytes) -> None:
+        """
+        Write a file of the generated package
+
+        Args:
+            path: path of the file
+            content: content of the file
+
+        Returns:
+            None
+        """
+        if not self.__incremental:
+            path.write_bytes(content)
+            return
+
+        key = self.__key(path)
+        digest = hashlib.sha256(content).hexdigest()
+        if not self.__unchanged(key=key, path=path, digest=digest):
+            path.write_bytes(content)
+        stat = path.stat()
+        self.__manifest[key] = {'sha256': digest,
+                                'size': stat.st_size,
+                                'mtime_ns': stat.st_mtime_ns}
+
+    def write_text(self, path: Path, content: str) -> None:
+        """
+        Write a text file of the generated package, with utf-8 encoding
+
+        Args:
+            path: path of the file
+            content: content of the file
+
+        Returns:
+            None
+        """
+        # the line endings are translated in the same way as a file opened in text mode
+        if os.linesep != '\n':
+            content = content.replace('\n', os.linesep)
+        self.write_bytes(path=path, content=content.encode('utf-8'))
+
+    def finish(self, remove_stale: bool) -> None:
+        """
+        Complete the export, in incremental mode this saves the manifest
+
+        Args:
+            remove_stale: in incremental mode, delete any python files in the packages that
+                          were not written during this export
+
+        Returns:
+            None
+        """
+        if not self.__incremental:
+            return
+
+        if remove_stale:
+            for package_path in self.__package_paths:
+                for file in package_path.glob('*.py'):
+                    if self.__key(file) not in self.__manifest:
+                        os.remove(file.resolve())
+
+        with self.__manifest_path.open('w', encoding='utf-8') as fid:
+            json.dump(self.__manifest, fid, indent=1, sort_keys=True)
+
+
+def run_render_jobs(jobs: Sequence[RenderJob], processes: int, writer: ModuleWriter) -> None:
+    """
+    Run a set of rendering jobs and write the resulting modules. If more than one process is
+    requested the jobs are shared between a pool of worker processes, this relies on the fork
+    start method so that the workers inherit the jobs (which can not be pickled), where fork is
+    not available the jobs are run in this process.
+
+    Args:
+        jobs: rendering jobs to run
+        processes: number of processes to use
+        writer: writer for the rendered modules
+
+    Returns:
+        None
+    """
+    if processes > 1 and len(jobs) > 1 and 'fork' in multiprocessing.get_all_start_methods():
+        _FORKED_RENDER_JOBS[:] = jobs
+        try:
+            with multiprocessing.get_context('fork').Pool(
+                    processes=min(processes, len(jobs))) as pool:
+                for rendered_modules in pool.imap(_run_forked_render_job, range(len(jobs))):
+                    for module_path, content in rendered_modules:
+                        writer.write_text(path=module_path, content=content)
+        finally:
+            _FORKED_RENDER_JOBS.clear()
+    else:
+        for job in jobs:
+            for module_path, content in job():
+                writer.write_text(path=module_path, content=content)
@@ -159,3 +159,36 @@ class OwnedbyAddressMap(RDLListener):
         """
         return self.addr_maps + self.reg_files + self.memories + self.registers
 # pylint: enable=too-many-instance-attributes
+
+
+class FastAPIRegisters(RDLListener):
+    """
+    class intended to be used as part of the walker/listener protocol to find all the registers
+    in an address map and all the sections within it, which are not in a memory. This is
+    intended to be used with an unrolled walk so that every element of an array is found
+    """
+    def __init__(self, hide_node_callback: HideNodeCallback) -> None:
+        super().__init__()
+        self.__registers: list[RegNode] = []
+        self.__hide_node_callback = hide_node_callback
+
+    def enter_Addrmap(self, node: AddrmapNode) -> Optional[WalkerAction]:
+        if self.__hide_node_callback(node):
+            return WalkerAction.SkipDescendants
+        return WalkerAction.Continue
+
+    def enter_Regfile(self, node: RegfileNode) -> Optional[WalkerAction]:
+        if self.__hide_node_callback(node):
+            return WalkerAction.SkipDescendants
+        return WalkerAction.Continue
+
+    def enter_Mem(self, node: MemNode) -> Optional[WalkerAction]:
+        return WalkerAction.SkipDescendants
+
+    def enter_Reg(self, node: RegNode) -> Optional[WalkerAction]:
+        if not self.__hide_node_callback(node):
+            self.__registers.append(node)
+        return WalkerAction.SkipDescendants
+
+    def __iter__(self) -> Iterator[RegNode]:
+        return self.__registers.__iter__()
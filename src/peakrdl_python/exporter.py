@@ -19,8 +19,9 @@ Main Classes for the peakrdl-python
 """
 import os
 import re
+from functools import partial
+from itertools import chain
 from pathlib import Path
-from shutil import copy
 from typing import NoReturn, Any, Optional, Union
 from collections.abc import Iterable
 
@@ -38,19 +39,24 @@ from .systemrdl_node_utility_functions import get_reg_readable_fields, get_reg_w
     get_table_block, get_dependent_component, \
     get_field_bitmask_hex_string, get_field_inv_bitmask_hex_string, \
     get_field_max_value_hex_string, get_reg_max_value_hex_string, get_fully_qualified_type_name, \
+    get_reg_reset_value_hex_string, get_reg_reset_mask_hex_string, \
     uses_enum, uses_memory, \
     get_memory_max_entry_value_hex_string, get_memory_width_bytes, \
     get_field_default_value, get_enum_values, get_properties_to_include, get_reg_fields, \
+    field_has_read_side_effect, field_has_write_side_effect, \
     HideNodeCallback, hide_based_on_property
 
 from .lib import get_array_typecode
 
-from .safe_name_utility import get_python_path_segments, safe_node_name
+from .safe_name_utility import get_python_path_segments, safe_node_name, get_fast_api_name
 
-from ._node_walkers import AddressMaps, OwnedbyAddressMap
+from ._node_walkers import AddressMaps, OwnedbyAddressMap, FastAPIRegisters
+from ._module_writer import ModuleWriter, run_render_jobs
 
 from .__about__ import __version__
 
+# pylint: disable=too-many-lines
+
 
 file_path = os.path.dirname(__file__)
 
@@ -106,17 +112,17 @@ class _PythonPackage:
     def _init_path(self) -> Path:
         return self.child_module_path('__init__.py')
 
-    def _make_empty_init_file(self) -> None:
-        with self._init_path.open('w', encoding='utf-8') as fid:
-            fid.write('pass\n')
+    def _make_empty_init_file(self, writer: ModuleWriter) -> None:
+        writer.write_text(path=self._init_path, content='pass\n')
 
-    def create_empty_package(self, cleanup: bool) -> None:
+    def create_empty_package(self, cleanup: bool, writer: ModuleWriter) -> None:
         """
         make the package folder (if it does not already exist), populate the __init__.py and
         optionally remove any existing python files
 
         Args:
             cleanup (bool) : delete any existing python files in the package
+            writer: writer used to generate the files of the package
 
         Returns:
             None
@@ -127,7 +133,8 @@ class _PythonPackage:
                     os.remove(file.resolve())
         else:
             self.path.mkdir(parents=True, exist_ok=False)
-        self._make_empty_init_file()
+        writer.add_package_path(self.path)
+        self._make_empty_init_file(writer=writer)
 
 
 class _CopiedPythonPackage(_PythonPackage):
@@ -139,25 +146,33 @@ class _CopiedPythonPackage(_PythonPackage):
         super().__init__(path=path)
         self._ref_package = ref_package
 
-    def create_empty_package(self, cleanup: bool) -> None:
+    def _make_empty_init_file(self, writer: ModuleWriter) -> None:
+        # the __init__.py is copied with the rest of the package if the reference package has
+        # one, writing it twice would make it look modified to an incremental export
+        if not self._ref_package.child_module_path('__init__.py').exists():
+            super()._make_empty_init_file(writer=writer)
+
+    def create_empty_package(self, cleanup: bool, writer: ModuleWriter) -> None:
         """
         make the package folder (if it does not already exist), populate the __init__.py and
         optionally remove any existing python files
 
         Args:
             cleanup (bool) : delete any existing python files in the package
+            writer: writer used to generate the files of the package
 
         Returns:
             None
         """
-        super().create_empty_package(cleanup=cleanup)
+        super().create_empty_package(cleanup=cleanup, writer=writer)
 
         # copy all the python source code that is part of the library which comes as part of the
         # peakrdl-python to the lib direction of the generated package
         files_in_package = self._ref_package.path.glob('*.py')
 
         for file_in_package in files_in_package:
-            copy(src=file_in_package, dst=self.path)
+            writer.write_bytes(path=self.path / file_in_package.name,
+                               content=file_in_package.read_bytes())
 
 
 class _Package(_PythonPackage):
@@ -200,13 +215,13 @@ class _Package(_PythonPackage):
         """
         return _CopiedPythonPackage(path=self.path / name, ref_package=ref_package)
 
-    def create_empty_package(self, cleanup: bool, ) -> None:
+    def create_empty_package(self, cleanup: bool, writer: ModuleWriter) -> None:
         """
         create the directories and __init__.py files associated with the exported package
 
         Args:
-            package_path: directory for the package output
             cleanup (bool): delete existing python files
+            writer: writer used to generate the files of the package
 
         Returns:
             None
@@ -214,15 +229,15 @@ class _Package(_PythonPackage):
         """
 
         # make the folder for this package and populate the empty __init__.py
-        super().create_empty_package(cleanup=cleanup)
+        super().create_empty_package(cleanup=cleanup, writer=writer)
         # make all the child packages folders and their __init__.py
-        self.reg_model.create_empty_package(cleanup=cleanup)
+        self.reg_model.create_empty_package(cleanup=cleanup, writer=writer)
         if self._include_tests:
-            self.tests.create_empty_package(cleanup=cleanup)
+            self.tests.create_empty_package(cleanup=cleanup, writer=writer)
         if self._include_libraries:
-            self.lib.create_empty_package(cleanup=cleanup)
-            self.sim_lib.create_empty_package(cleanup=cleanup)
-        self.sim.create_empty_package(cleanup=cleanup)
+            self.lib.create_empty_package(cleanup=cleanup, writer=writer)
+            self.sim_lib.create_empty_package(cleanup=cleanup, writer=writer)
+        self.sim.create_empty_package(cleanup=cleanup, writer=writer)
 
 
 class PythonExporter:
@@ -238,6 +253,9 @@ class PythonExporter:
 
     # pylint: disable=too-few-public-methods
 
+    # writer for the files of the package being exported, this is only set during an export
+    __writer: Optional[ModuleWriter]
+
     def __init__(self, **kwargs):  # type: ignore[no-untyped-def]
 
         user_template_dir = kwargs.pop("user_template_dir", None)
@@ -279,18 +297,36 @@ class PythonExporter:
         # Dictionary used for determining the unique type names to use
         self.node_type_name = {}
 
-    def __stream_jinja_template(self,
+        self.__writer = None
+
+    @property
+    def _writer(self) -> ModuleWriter:
+        if self.__writer is None:
+            raise RuntimeError('The module writer is only available during an export')
+        return self.__writer
+
+    def __render_jinja_template(self,
                                 template_name: str,
                                 target_package: _PythonPackage,
                                 target_name: str,
-                                template_context: dict[str, Any]) -> None:
+                                template_context: dict[str, Any]) -> tuple[Path, str]:
 
         template = self.jj_env.get_template(template_name)
         module_path = target_package.child_module_path(target_name)
 
-        with module_path.open('w', encoding='utf-8') as fp:
-            stream = template.stream(template_context)
-            stream.dump(fp)
+        return module_path, template.render(template_context)
+
+    def __stream_jinja_template(self,
+                                template_name: str,
+                                target_package: _PythonPackage,
+                                target_name: str,
+                                template_context: dict[str, Any]) -> None:
+
+        module_path, content = self.__render_jinja_template(template_name=template_name,
+                                                            target_package=target_package,
+                                                            target_name=target_name,
+                                                            template_context=template_context)
+        self._writer.write_text(path=module_path, content=content)
 
     # pylint: disable-next=too-many-arguments
     def __export_reg_model(self, *,
@@ -299,6 +335,7 @@ class PythonExporter:
                            skip_lib_copy: bool,
                            asyncoutput: bool,
                            legacy_block_access: bool,
+                           lazy_construction: bool,
                            udp_to_include: Optional[list[str]],
                            hide_node_func: HideNodeCallback) -> None:
 
@@ -332,6 +369,8 @@ class PythonExporter:
             'get_field_inv_bitmask_hex_string': get_field_inv_bitmask_hex_string,
             'get_field_max_value_hex_string': get_field_max_value_hex_string,
             'get_reg_max_value_hex_string': get_reg_max_value_hex_string,
+            'get_reg_reset_value_hex_string': get_reg_reset_value_hex_string,
+            'get_reg_reset_mask_hex_string': get_reg_reset_mask_hex_string,
             'get_table_block': get_table_block,
             'get_reg_writable_fields': get_reg_writable_fields,
             'get_reg_readable_fields': get_reg_readable_fields,
@@ -339,12 +378,15 @@ class PythonExporter:
             'get_memory_max_entry_value_hex_string': get_memory_max_entry_value_hex_string,
             'get_memory_width_bytes': get_memory_width_bytes,
             'get_field_default_value': get_field_default_value,
+            'field_has_read_side_effect': field_has_read_side_effect,
+            'field_has_write_side_effect': field_has_write_side_effect,
             'raise_template_error': self._raise_template_error,
             'get_python_path_segments': get_python_path_segments,
             'safe_node_name': safe_node_name,
             'skip_lib_copy': skip_lib_copy,
             'version': __version__,
             'legacy_block_access': legacy_block_access,
+            'lazy_construction': lazy_construction,
             'udp_to_include': udp_to_include,
             'get_properties_to_include': get_properties_to_include,
             'dependent_property_enum':
@@ -387,6 +429,51 @@ class PythonExporter:
                                      target_name=top_block.inst_name + '.py',
                                      template_context=context)
 
+    def __export_fast_api(self, *,
+                          top_block: AddrmapNode,
+                          package: _Package,
+                          skip_lib_copy: bool,
+                          asyncoutput: bool,
+                          hide_node_func: HideNodeCallback) -> None:
+
+        registers = FastAPIRegisters(hide_node_callback=hide_node_func)
+        RDLWalker(unroll=True).walk(top_block, registers, skip_top=False)
+
+        # every register and field has a read and write function in the same namespace, so
+        # names that only differ in how the underscores are placed (e.g. a_b.c and a.b_c)
+        # would clash
+        register_entries: list[tuple[str, RegNode, list[tuple[str, FieldNode]]]] = []
+        names: set[str] = set()
+        for register in registers:
+            register_name = get_fast_api_name(register, top_block)
+            fields = [(get_fast_api_name(field, top_block), field)
+                      for field in get_reg_fields(register, hide_node_func)]
+            for name in chain([register_name], (name for name, _ in fields)):
+                if name in names:
+                    raise RuntimeError(f'The fast API name {name} is used by more than one '
+                                       f'register or field, the python_inst_name property '
+                                       f'can be used to rename one of them')
+                names.add(name)
+            register_entries.append((register_name, register, fields))
+
+        context = {
+            'top_node': top_block,
+            'registers': register_entries,
+            'asyncoutput': asyncoutput,
+            'skip_lib_copy': skip_lib_copy,
+            'version': __version__,
+            'get_field_bitmask_hex_string': get_field_bitmask_hex_string,
+            'get_field_inv_bitmask_hex_string': get_field_inv_bitmask_hex_string,
+            'get_field_max_value_hex_string': get_field_max_value_hex_string,
+        }
+
+        context.update(self.user_template_context)
+
+        self.__stream_jinja_template(template_name="addrmap_fast.py.jinja",
+                                     target_package=package.reg_model,
+                                     target_name=top_block.inst_name + '_fast.py',
+                                     template_context=context)
+
     def __export_example(self, *,
                          top_block: AddrmapNode,
                          package: _Package,
@@ -457,7 +544,8 @@ class PythonExporter:
                        asyncoutput: bool,
                        legacy_block_access: bool,
                        udp_to_include: Optional[list[str]],
-                       hide_node_func: HideNodeCallback) -> None:
+                       hide_node_func: HideNodeCallback,
+                       processes: int) -> None:
         """
 
         Args:
@@ -465,93 +553,125 @@ class PythonExporter:
             package:
             asyncoutput:
             legacy_block_access:
+            processes: number of processes used to render the tests
 
         Returns:
 
         """
-        # pylint: disable=too-many-locals
-
         blocks = AddressMaps(hide_node_callback=hide_node_func)
         # running the walker populated the blocks with all the address maps in within the
         # top block, including the top_block itself
         RDLWalker(unroll=True).walk(top_block, blocks, skip_top=False)
 
-        for block in blocks:
-            owned_elements = OwnedbyAddressMap(hide_node_callback=hide_node_func)
-            # running the walker populated the blocks with all the address maps in within the
-            # top block, including the top_block itself
-            RDLWalker(unroll=True).walk(block, owned_elements, skip_top=True)
-
-            # The code that generates the tests for the register array context managers needs
-            # the arrays rolled up but parents within the address map e.g. a regfile unrolled
-            # I have not found a way to do this with the Walker as the unroll seems to be a
-            # global setting, the following code works but it is not elegant
-            rolled_owned_reg: list[RegNode] = list(block.registers(unroll=False))
-            for regfile in owned_elements.reg_files:
-                rolled_owned_reg += list(regfile.registers(unroll=False))
-            for memory in owned_elements.memories:
-                rolled_owned_reg += list(memory.registers(unroll=False))
-
-            def is_reg_array(item: RegNode) -> bool:
-                return item.is_array and not hide_node_func(item)
-
-            rolled_owned_reg_array = list(filter(is_reg_array, rolled_owned_reg))
-
-            fq_block_name = '_'.join(block.get_path_segments(array_suffix='_{index:d}_'))
-
-            context = {
-                'top_node': top_block,
-                'block': block,
-                'fq_block_name': fq_block_name,
-                'owned_elements': owned_elements,
-                'rolled_owned_reg_array': rolled_owned_reg_array,
-                'systemrdlFieldNode': FieldNode,
-                'systemrdlSignalNode': SignalNode,
-                'systemrdlRegNode': RegNode,
-                'systemrdlMemNode': MemNode,
-                'systemrdlRegfileNode': RegfileNode,
-                'systemrdlAddrmapNode': AddrmapNode,
-                'systemrdlUserEnum': UserEnum,
-                'systemrdlUserStruct': UserStruct,
-                'isinstance': isinstance,
-                'type': type,
-                'str': str,
-                'get_python_path_segments': get_python_path_segments,
-                'safe_node_name': safe_node_name,
-                'uses_memory': (len(owned_elements.memories) > 0),
-                'get_field_bitmask_hex_string': get_field_bitmask_hex_string,
-                'get_field_inv_bitmask_hex_string': get_field_inv_bitmask_hex_string,
-                'get_field_max_value_hex_string': get_field_max_value_hex_string,
-                'get_field_default_value': get_field_default_value,
-                'get_reg_max_value_hex_string': get_reg_max_value_hex_string,
-                'get_reg_writable_fields': get_reg_writable_fields,
-                'get_reg_readable_fields': get_reg_readable_fields,
-                'get_memory_max_entry_value_hex_string': get_memory_max_entry_value_hex_string,
-                'get_enum_values': get_enum_values,
-                'get_memory_width_bytes': get_memory_width_bytes,
-                'asyncoutput': asyncoutput,
-                'uses_enum': uses_enum(block),
-                'skip_lib_copy': skip_lib_copy,
-                'version': __version__,
-                'get_array_typecode': get_array_typecode,
-                'legacy_block_access': legacy_block_access,
-                'udp_to_include': udp_to_include,
-                'get_properties_to_include': get_properties_to_include,
-                'dependent_property_enum':
-                    self._get_dependent_property_enum(node=top_block,
-                                                      udp_to_include=udp_to_include),
-                'hide_node_func': hide_node_func
-            }
-
-            self.__stream_jinja_template(template_name="addrmap_tb.py.jinja",
+        # load the templates before any worker processes are started so that template errors
+        # are reported here and the workers share the compiled templates
+        self.jj_env.get_template("addrmap_tb.py.jinja")
+        self.jj_env.get_template("addrmap_simulation_tb.py.jinja")
+
+        jobs = [partial(self.__render_block_tests, top_block=top_block, block=block,
+                        package=package, skip_lib_copy=skip_lib_copy, asyncoutput=asyncoutput,
+                        legacy_block_access=legacy_block_access, udp_to_include=udp_to_include,
+                        hide_node_func=hide_node_func)
+                for block in blocks]
+
+        run_render_jobs(jobs=jobs, processes=processes, writer=self._writer)
+
+    # pylint: disable-next=too-many-arguments
+    def __render_block_tests(self, *,
+                             top_block: AddrmapNode,
+                             block: AddrmapNode,
+                             package: _Package,
+                             skip_lib_copy: bool,
+                             asyncoutput: bool,
+                             legacy_block_access: bool,
+                             udp_to_include: Optional[list[str]],
+                             hide_node_func: HideNodeCallback) -> list[tuple[Path, str]]:
+        """
+        Render the test modules for a single address map
+
+        Returns:
+            list of the module paths and their content
+        """
+        # pylint: disable=too-many-locals
+
+        owned_elements = OwnedbyAddressMap(hide_node_callback=hide_node_func)
+        # running the walker populated the blocks with all the address maps in within the
+        # top block, including the top_block itself
+        RDLWalker(unroll=True).walk(block, owned_elements, skip_top=True)
+
+        # The code that generates the tests for the register array context managers needs
+        # the arrays rolled up but parents within the address map e.g. a regfile unrolled
+        # I have not found a way to do this with the Walker as the unroll seems to be a
+        # global setting, the following code works but it is not elegant
+        rolled_owned_reg: list[RegNode] = list(block.registers(unroll=False))
+        for regfile in owned_elements.reg_files:
+            rolled_owned_reg += list(regfile.registers(unroll=False))
+        for memory in owned_elements.memories:
+            rolled_owned_reg += list(memory.registers(unroll=False))
+
+        def is_reg_array(item: RegNode) -> bool:
+            return item.is_array and not hide_node_func(item)
+
+        rolled_owned_reg_array = list(filter(is_reg_array, rolled_owned_reg))
+
+        fq_block_name = '_'.join(block.get_path_segments(array_suffix='_{index:d}_'))
+
+        context = {
+            'top_node': top_block,
+            'block': block,
+            'fq_block_name': fq_block_name,
+            'owned_elements': owned_elements,
+            'rolled_owned_reg_array': rolled_owned_reg_array,
+            'systemrdlFieldNode': FieldNode,
+            'systemrdlSignalNode': SignalNode,
+            'systemrdlRegNode': RegNode,
+            'systemrdlMemNode': MemNode,
+            'systemrdlRegfileNode': RegfileNode,
+            'systemrdlAddrmapNode': AddrmapNode,
+            'systemrdlUserEnum': UserEnum,
+            'systemrdlUserStruct': UserStruct,
+            'isinstance': isinstance,
+            'type': type,
+            'str': str,
+            'get_python_path_segments': get_python_path_segments,
+            'safe_node_name': safe_node_name,
+            'uses_memory': (len(owned_elements.memories) > 0),
+            'get_field_bitmask_hex_string': get_field_bitmask_hex_string,
+            'get_field_inv_bitmask_hex_string': get_field_inv_bitmask_hex_string,
+            'get_field_max_value_hex_string': get_field_max_value_hex_string,
+            'get_field_default_value': get_field_default_value,
+            'field_has_read_side_effect': field_has_read_side_effect,
+            'field_has_write_side_effect': field_has_write_side_effect,
+            'get_reg_max_value_hex_string': get_reg_max_value_hex_string,
+            'get_reg_writable_fields': get_reg_writable_fields,
+            'get_reg_readable_fields': get_reg_readable_fields,
+            'get_memory_max_entry_value_hex_string': get_memory_max_entry_value_hex_string,
+            'get_enum_values': get_enum_values,
+            'get_memory_width_bytes': get_memory_width_bytes,
+            'asyncoutput': asyncoutput,
+            'uses_enum': uses_enum(block),
+            'skip_lib_copy': skip_lib_copy,
+            'version': __version__,
+            'get_array_typecode': get_array_typecode,
+            'legacy_block_access': legacy_block_access,
+            'udp_to_include': udp_to_include,
+            'get_properties_to_include': get_properties_to_include,
+            'dependent_property_enum':
+                self._get_dependent_property_enum(node=top_block,
+                                                  udp_to_include=udp_to_include),
+            'hide_node_func': hide_node_func
+        }
+
+        return [
+            self.__render_jinja_template(template_name="addrmap_tb.py.jinja",
                                          target_package=package.tests,
                                          target_name='test_' + fq_block_name + '.py',
-                                         template_context=context)
-
-            self.__stream_jinja_template(template_name="addrmap_simulation_tb.py.jinja",
+                                         template_context=context),
+            self.__render_jinja_template(template_name="addrmap_simulation_tb.py.jinja",
                                          target_package=package.tests,
                                          target_name='test_sim_' + fq_block_name + '.py',
                                          template_context=context)
+        ]
 
     def _validate_udp_to_include(self, udp_to_include: Optional[list[str]]) -> None:
         if udp_to_include is not None:
@@ -570,7 +690,7 @@ class PythonExporter:
                     raise RuntimeError('It is not permitted to expose a property name used to'
                                        ' build the peakrdl-python wrappers: ' + reserved_name)
 
-    # pylint: disable-next=too-many-arguments
+    # pylint: disable-next=too-many-arguments,too-many-locals
     def export(self, node: Union[RootNode, AddrmapNode], path: str, *,
                asyncoutput: bool = False,
                skip_test_case_generation: bool = False,
@@ -579,7 +699,11 @@ class PythonExporter:
                legacy_block_access: bool = True,
                show_hidden: bool = False,
                user_defined_properties_to_include: Optional[list[str]] = None,
-               hidden_inst_name_regex: Optional[str] = None) -> str:
+               hidden_inst_name_regex: Optional[str] = None,
+               lazy_construction: bool = False,
+               incremental: bool = False,
+               processes: int = 1,
+               fast_api: bool = False) -> str:
         """
         Generated Python Code and Testbench
 
@@ -613,6 +737,27 @@ class PythonExporter:
             hidden_inst_name_regex (str) : A regular expression which will hide any fully
                                            qualified instance name that matches, set to None to
                                            for this to have no effect
+            lazy_construction (bool) : By default, building the top level address map builds
+                                       every section, register, field and array element within
+                                       it. Setting this builds each of these when it is first
+                                       accessed instead, which greatly reduces the time and
+                                       memory needed to create very large register models
+            incremental (bool) : Keep a manifest of the content hash of each generated file in
+                                 the package and only rewrite the files whose content has
+                                 changed, this leaves the unchanged modules (and their cached
+                                 bytecode) untouched. Any python files left over from a
+                                 previous export are still removed at the end of the export if
+                                 ``delete_existing_package_content`` is set
+            processes (int) : Number of worker processes used to render the test modules (one
+                              pair per address map), with 1 they are rendered in this process.
+                              This needs the ``fork`` start method of multiprocessing, where it
+                              is not available the test modules are rendered in this process
+            fast_api (bool) : Also generate a module of plain functions to read and write every
+                              register and field (``reg_model/<top>_fast.py``), with the
+                              address, mask and shift of each one inlined as constants. This is
+                              intended for latency critical code such as polling loops, the
+                              functions take the read and write callbacks directly and only
+                              check that the values written to fields are in range
 
 
         Returns:
@@ -629,11 +774,57 @@ class PythonExporter:
 
         if not isinstance(path, str):
             raise TypeError(f'path should be a str but got {type(path)}')
+        if not isinstance(processes, int) or isinstance(processes, bool):
+            raise TypeError(f'processes should be an int but got {type(processes)}')
+        if processes < 1:
+            raise ValueError(f'processes should be at least 1, got {processes:d}')
         package = _Package(path=path,
                            package_name=node.inst_name,
                            include_tests=not skip_test_case_generation,
                            include_libraries=not skip_library_copy)
-        package.create_empty_package(cleanup=delete_existing_package_content)
+        self.__writer = ModuleWriter(root=package.path, incremental=incremental)
+        try:
+            self.__export_package(top_block=top_block, package=package,
+                                  asyncoutput=asyncoutput,
+                                  skip_test_case_generation=skip_test_case_generation,
+                                  delete_existing_package_content=delete_existing_package_content,
+                                  skip_library_copy=skip_library_copy,
+                                  legacy_block_access=legacy_block_access,
+                                  show_hidden=show_hidden,
+                                  user_defined_properties_to_include=
+                                  user_defined_properties_to_include,
+                                  hidden_inst_name_regex=hidden_inst_name_regex,
+                                  lazy_construction=lazy_construction,
+                                  processes=processes,
+                                  fast_api=fast_api)
+        finally:
+            self.__writer = None
+
+        return top_block.inst_name
+
+    # pylint: disable-next=too-many-arguments,too-many-locals
+    def __export_package(self, *,
+                         top_block: AddrmapNode,
+                         package: _Package,
+                         asyncoutput: bool,
+                         skip_test_case_generation: bool,
+                         delete_existing_package_content: bool,
+                         skip_library_copy: bool,
+                         legacy_block_access: bool,
+                         show_hidden: bool,
+                         user_defined_properties_to_include: Optional[list[str]],
+                         hidden_inst_name_regex: Optional[str],
+                         lazy_construction: bool,
+                         processes: int,
+                         fast_api: bool) -> None:
+        """
+        Generate the content of the package, see :meth:`export` for the arguments
+        """
+        # in incremental mode, the existing files are left in place so they can be compared
+        # with the new content, the stale ones are removed at the end instead
+        package.create_empty_package(cleanup=delete_existing_package_content and
+                                     not self._writer.incremental,
+                                     writer=self._writer)
 
         self._validate_udp_to_include(udp_to_include=user_defined_properties_to_include)
 
@@ -667,9 +858,15 @@ class PythonExporter:
         self.__export_reg_model(top_block=top_block, package=package, asyncoutput=asyncoutput,
                                 skip_lib_copy=skip_library_copy,
                                 legacy_block_access=legacy_block_access,
+                                lazy_construction=lazy_construction,
                                 udp_to_include=user_defined_properties_to_include,
                                 hide_node_func=hide_node_func)
 
+        if fast_api:
+            self.__export_fast_api(top_block=top_block, package=package,
+                                   asyncoutput=asyncoutput, skip_lib_copy=skip_library_copy,
+                                   hide_node_func=hide_node_func)
+
         self.__export_simulator(top_block=top_block, package=package, asyncoutput=asyncoutput,
                                 skip_lib_copy=skip_library_copy,
                                 legacy_block_access=legacy_block_access)
@@ -688,9 +885,10 @@ class PythonExporter:
                                 skip_lib_copy=skip_library_copy,
                                 legacy_block_access=legacy_block_access,
                                 udp_to_include=user_defined_properties_to_include,
-                                hide_node_func=hide_node_func)
+                                hide_node_func=hide_node_func,
+                                processes=processes)
 
-        return top_block.inst_name
+        self._writer.finish(remove_stale=delete_existing_package_content)
 
     def _lookup_type_name(self, node: Node) -> str:
         """
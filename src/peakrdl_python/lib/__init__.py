@@ -23,11 +23,18 @@ from .callbacks import ReadCallback
 from .callbacks import ReadBlockCallback
 from .callbacks import WriteCallback
 from .callbacks import WriteBlockCallback
+from .callbacks import ReadBlockIntoCallback, WriteBlockBufferCallback
+from .callbacks import AsyncReadBlockIntoCallback, AsyncWriteBlockBufferCallback
 from .callbacks import NormalCallbackSet, NormalCallbackSetLegacy
 from .callbacks import AsyncCallbackSet, AsyncCallbackSetLegacy
 from .callbacks import CallbackSet
+from .callbacks import BatchCallbackSet, BatchOperation, BatchReadFuture, TransactCallback
+from .instrumentation import CallbackInstrumentation, AccessOperation, AccessStatistics
+from .instrumentation import LATENCY_BUCKETS
 
 from .base import AddressMap
+from .shadow_cache import CachePolicy
+from .snapshot import RegisterSnapshot, RegisterDifference
 from .base import RegFile
 from .base import AddressMapArray
 from .base import RegFileArray
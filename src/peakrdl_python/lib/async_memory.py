@@ -20,13 +20,16 @@ peakrdl-python tool. It provides a set of classes used by the autogenerated code
 memories
 """
 from array import array as Array
-from typing import Union, TYPE_CHECKING
+from typing import Any, Optional, Union, TYPE_CHECKING, cast
 from abc import ABC, abstractmethod
 from collections.abc import Iterator
+from functools import partial
 import sys
 
 from .base import AsyncAddressMap, NodeArray
 from .memory import BaseMemory
+from .utility_functions import gather_with_concurrency, split_bursts
+from .field_columns import decode_field_columns, decode_field_columns_numpy
 
 from .callbacks import AsyncCallbackSet, AsyncCallbackSetLegacy
 
@@ -136,9 +139,12 @@ class _MemoryAsyncReadOnly(AsyncMemory, ABC):
                          inst_name=inst_name,
                          parent=parent)
 
-    # pylint: enable=too-many-arguments
     @property
-    def _callbacks(self) -> Union[AsyncCallbackSet, AsyncCallbackSetLegacy]:
+    def _is_readable(self) -> bool:
+        return True
+
+    # pylint: enable=too-many-arguments
+    def _resolve_callbacks(self) -> Union[AsyncCallbackSet, AsyncCallbackSetLegacy]:
         # pylint: disable=protected-access
         if self.parent is None:
             raise RuntimeError('Parent must be set')
@@ -148,6 +154,58 @@ class _MemoryAsyncReadOnly(AsyncMemory, ABC):
 
         raise TypeError(f'unhandled parent callback type: {type(self.parent._callbacks)}')
 
+    @property
+    def _callbacks(self) -> Union[AsyncCallbackSet, AsyncCallbackSetLegacy]:
+        # This cast is OK because the type is checked when the callbacks are resolved
+        return cast(Union[AsyncCallbackSet, AsyncCallbackSetLegacy], self._cached_callbacks())
+
+    async def __read_block(self, start_entry: int,
+                           number_entries: int) -> Union[list[int], Array]:
+        """
+        Read from the memory using the read block callback, the transfer is split into bursts
+        if the callbacks have a maximum burst length, with up to the callbacks maximum bursts
+        in flight at once. The data is returned in the form provided by the callback set, a
+        list for AsyncCallbackSet and an array for AsyncCallbackSetLegacy
+        """
+        read_block_callback = self._callbacks.read_block_callback
+        if read_block_callback is None:
+            raise RuntimeError('There is no usable callback')
+
+        bursts_read = await gather_with_concurrency(
+            [partial(read_block_callback, addr=self.address_lookup(entry=burst_start),
+                     width=self.width, accesswidth=self.width, length=burst_length)
+             for burst_start, burst_length in split_bursts(
+                start_entry=start_entry, number_entries=number_entries,
+                max_burst_length=self._callbacks.max_burst_length)],
+            concurrency=self._callbacks.max_bursts_in_flight)
+
+        list_bursts: list[list[int]] = []
+        array_bursts: list[Array] = []
+        for data_read in bursts_read:
+            if isinstance(self._callbacks, AsyncCallbackSet):
+                if not isinstance(data_read, list):
+                    raise TypeError('The read block callback is expected to return an List')
+                list_bursts.append(data_read)
+            elif isinstance(self._callbacks, AsyncCallbackSetLegacy):
+                if not isinstance(data_read, Array):
+                    raise TypeError('The read block callback is expected to return an array')
+                array_bursts.append(data_read)
+            else:
+                raise RuntimeError(f'There is no usable callback block callback:'
+                                   f'{read_block_callback}')
+
+        if array_bursts:
+            if len(array_bursts) == 1:
+                return array_bursts[0]
+            data_array = Array(array_bursts[0].typecode)
+            for burst in array_bursts:
+                data_array.extend(burst)
+            return data_array
+
+        if len(list_bursts) == 1:
+            return list_bursts[0]
+        return [entry for burst in list_bursts for entry in burst]
+
     async def _read(self, start_entry: int, number_entries: int) -> list[int]:
         """
         Read from the memory
@@ -178,24 +236,11 @@ class _MemoryAsyncReadOnly(AsyncMemory, ABC):
         read_callback = self._callbacks.read_callback
 
         if read_block_callback is not None:
-            addr = self.address_lookup(entry=start_entry)
-            data_read = \
-                await read_block_callback(addr=addr,
-                                          width=self.width,
-                                          accesswidth=self.width,
-                                          length=number_entries)
-
-            if isinstance(self._callbacks, AsyncCallbackSet):
-                if not isinstance(data_read, list):
-                    raise TypeError('The read block callback is expected to return an List')
-                return data_read
-
-            if isinstance(self._callbacks, AsyncCallbackSetLegacy):
-                if not isinstance(data_read, Array):
-                    raise TypeError('The read block callback is expected to return an array')
+            data_read = await self.__read_block(start_entry=start_entry,
+                                                number_entries=number_entries)
+            if isinstance(data_read, Array):
                 return data_read.tolist()
-
-            raise RuntimeError(f'There is no usable callback block callback:{read_block_callback}')
+            return data_read
 
         if read_callback is not None:
             # there is not read_block_callback defined so we must used individual read
@@ -246,24 +291,11 @@ class _MemoryAsyncReadOnly(AsyncMemory, ABC):
         read_callback = self._callbacks.read_callback
 
         if read_block_callback is not None:
-            addr = self.address_lookup(entry=start_entry)
-            data_read = \
-                await read_block_callback(addr=addr,
-                                          width=self.width,
-                                          accesswidth=self.width,
-                                          length=number_entries)
-
-            if isinstance(self._callbacks, AsyncCallbackSet):
-                if not isinstance(data_read, list):
-                    raise TypeError('The read block callback is expected to return an List')
+            data_read = await self.__read_block(start_entry=start_entry,
+                                                number_entries=number_entries)
+            if isinstance(data_read, list):
                 return Array(self.array_typecode, data_read)
-
-            if isinstance(self._callbacks, AsyncCallbackSetLegacy):
-                if not isinstance(data_read, Array):
-                    raise TypeError('The read block callback is expected to return an array')
-                return data_read
-
-            raise RuntimeError(f'There is no usable callback block callback:{read_block_callback}')
+            return data_read
 
         if read_callback is not None:
             # there is not read_block_callback defined so we must used individual read
@@ -283,6 +315,120 @@ class _MemoryAsyncReadOnly(AsyncMemory, ABC):
                            f'block callback:{read_block_callback}, '
                            f'normal callback:{read_callback}')
 
+    async def read_into(self, buffer: Any, start_entry: int = 0) -> int:
+        """
+        Asynchronously read from the memory directly into a buffer, this avoids building a
+        python int for every entry if the callbacks include a ``read_block_into_callback``. The
+        number of entries read is determined by the size of the buffer, with each entry
+        occupying :attr:`width_in_bytes` bytes in the native byte order.
+
+        Args:
+            buffer: writable object supporting the buffer protocol, e.g. bytearray, memoryview,
+                    array.array or a numpy array
+            start_entry: index in the memory to start from, this is not the address
+
+        Returns: number of entries read
+
+        """
+        view = self._buffer_view(buffer, writable=True)
+        number_entries = view.nbytes // self.width_in_bytes
+        self._check_buffer_range(start_entry=start_entry, number_entries=number_entries)
+
+        read_block_into_callback = self._callbacks.read_block_into_callback
+        if read_block_into_callback is not None:
+            await gather_with_concurrency(
+                [partial(read_block_into_callback,
+                         addr=self.address_lookup(entry=burst_start),
+                         width=self.width,
+                         accesswidth=self.width,
+                         length=burst_length,
+                         buffer=view[(burst_start - start_entry) * self.width_in_bytes:
+                                     (burst_start - start_entry + burst_length) *
+                                     self.width_in_bytes])
+                 for burst_start, burst_length in split_bursts(
+                    start_entry=start_entry, number_entries=number_entries,
+                    max_burst_length=self._callbacks.max_burst_length)],
+                concurrency=self._callbacks.max_bursts_in_flight)
+        elif isinstance(self._callbacks, AsyncCallbackSetLegacy):
+            self._pack_buffer(view, await self._read_legacy(start_entry=start_entry,
+                                                            number_entries=number_entries))
+        else:
+            self._pack_buffer(view, await self._read(start_entry=start_entry,
+                                                     number_entries=number_entries))
+
+        return number_entries
+
+    async def read_buffer(self, start_entry: int, number_entries: int) -> bytearray:
+        """
+        Asynchronously read from the memory into a new buffer, see :meth:`read_into`
+
+        Args:
+            start_entry: index in the memory to start from, this is not the address
+            number_entries: number of entries to read
+
+        Returns: data read from memory, with each entry occupying :attr:`width_in_bytes` bytes
+                 in the native byte order
+
+        """
+        if not isinstance(number_entries, int):
+            raise TypeError(f'number_entries should be an int got {type(number_entries)}')
+        if number_entries < 0:
+            raise ValueError(f'number_entries must be positive but got {number_entries:d}')
+
+        buffer = bytearray(number_entries * self.width_in_bytes)
+        await self.read_into(buffer, start_entry=start_entry)
+        return buffer
+
+    async def read_field_columns(self, reg_template: 'ReadableAsyncRegister',
+                                 start_entry: int = 0,
+                                 number_entries: Optional[int] = None) -> dict[str, list[int]]:
+        """
+        Asynchronously read a range of the memory (with a single block read if the callbacks
+        support it) and decode every entry using the fields of a register, this is much faster
+        than reading the fields of each register in turn. Enumerated fields are returned as
+        their integer values
+
+        Args:
+            reg_template: register whose fields are used to decode every entry, this must be
+                          the same width as the memory
+            start_entry: index in the memory to start from, this is not the address
+            number_entries: number of entries to read, if omitted the read continues to the
+                            end of the memory
+
+        Returns:
+            dictionary keyed by the field name, with a list of the field value of each entry
+        """
+        fields, number_entries = self._column_fields(reg_template=reg_template,
+                                                     start_entry=start_entry,
+                                                     number_entries=number_entries)
+        return decode_field_columns(fields=fields,
+                                    reg_values=await self._read(start_entry=start_entry,
+                                                                number_entries=number_entries))
+
+    async def read_field_columns_numpy(self, reg_template: 'ReadableAsyncRegister',
+                                       start_entry: int = 0,
+                                       number_entries: Optional[int] = None) -> dict[str, Any]:
+        """
+        Same as :meth:`read_field_columns` but the columns are numpy arrays decoded with numpy
+        array operations, this needs numpy to be installed
+
+        Args:
+            reg_template: register whose fields are used to decode every entry, this must be
+                          the same width as the memory
+            start_entry: index in the memory to start from, this is not the address
+            number_entries: number of entries to read, if omitted the read continues to the
+                            end of the memory
+
+        Returns:
+            dictionary keyed by the field name, with a numpy array of the field value of each
+            entry
+        """
+        fields, number_entries = self._column_fields(reg_template=reg_template,
+                                                     start_entry=start_entry,
+                                                     number_entries=number_entries)
+        reg_values = await self._read(start_entry=start_entry, number_entries=number_entries)
+        return decode_field_columns_numpy(fields=fields, reg_values=reg_values, width=self.width)
+
     def get_readable_registers(self, unroll: bool = False) -> \
             Iterator[Union['ReadableAsyncRegister', 'ReadableAsyncRegisterArray']]:
         """
@@ -383,9 +529,12 @@ class _MemoryAsyncWriteOnly(AsyncMemory, ABC):
                          inst_name=inst_name,
                          parent=parent)
 
-    # pylint: enable=too-many-arguments
     @property
-    def _callbacks(self) -> Union[AsyncCallbackSet, AsyncCallbackSetLegacy]:
+    def _is_writeable(self) -> bool:
+        return True
+
+    # pylint: enable=too-many-arguments
+    def _resolve_callbacks(self) -> Union[AsyncCallbackSet, AsyncCallbackSetLegacy]:
         # pylint: disable=protected-access
         if self.parent is None:
             raise RuntimeError('Parent must be set')
@@ -395,6 +544,43 @@ class _MemoryAsyncWriteOnly(AsyncMemory, ABC):
 
         raise TypeError(f'unhandled parent callback type: {type(self.parent._callbacks)}')
 
+    @property
+    def _callbacks(self) -> Union[AsyncCallbackSet, AsyncCallbackSetLegacy]:
+        # This cast is OK because the type is checked when the callbacks are resolved
+        return cast(Union[AsyncCallbackSet, AsyncCallbackSetLegacy], self._cached_callbacks())
+
+    async def __write_block(self, start_entry: int, data: Union[Array, list[int]]) -> None:
+        """
+        Asynchronously write a single burst to the memory using the write block callback
+        """
+        if self._callbacks.write_block_callback is None:
+            raise RuntimeError('No suitable callback')
+        addr = self.address_lookup(entry=start_entry)
+        if isinstance(self._callbacks, AsyncCallbackSet):
+            if isinstance(data, Array):
+                await self._callbacks.write_block_callback(addr=addr,
+                                                           width=self.width,
+                                                           accesswidth=self.width,
+                                                           data=data.tolist())
+            else:
+                await self._callbacks.write_block_callback(addr=addr,
+                                                           width=self.width,
+                                                           accesswidth=self.width,
+                                                           data=data)
+        if isinstance(self._callbacks, AsyncCallbackSetLegacy):
+            if isinstance(data, list):
+                # need to convert the data to an array before calling
+                await self._callbacks.write_block_callback(
+                    addr=addr,
+                    width=self.width,
+                    accesswidth=self.width,
+                    data=Array(self.array_typecode, data))
+            else:
+                await self._callbacks.write_block_callback(addr=addr,
+                                                           width=self.width,
+                                                           accesswidth=self.width,
+                                                           data=data)
+
     async def _write(self, start_entry: int, data: Union[Array, list[int]]) -> None:
         """
         Asynchronously write data to memory
@@ -422,32 +608,14 @@ class _MemoryAsyncWriteOnly(AsyncMemory, ABC):
                              f'but got {len(data):d}')
 
         if self._callbacks.write_block_callback is not None:
-
-            addr = self.address_lookup(entry=start_entry)
-            if isinstance(self._callbacks, AsyncCallbackSet):
-                if isinstance(data, Array):
-                    await self._callbacks.write_block_callback(addr=addr,
-                                                               width=self.width,
-                                                               accesswidth=self.width,
-                                                               data=data.tolist())
-                else:
-                    await self._callbacks.write_block_callback(addr=addr,
-                                                               width=self.width,
-                                                               accesswidth=self.width,
-                                                               data=data)
-            if isinstance(self._callbacks, AsyncCallbackSetLegacy):
-                if isinstance(data, list):
-                    # need to convert the data to an array before calling
-                    await self._callbacks.write_block_callback(
-                        addr=addr,
-                        width=self.width,
-                        accesswidth=self.width,
-                        data=Array(self.array_typecode, data))
-                else:
-                    await self._callbacks.write_block_callback(addr=addr,
-                                                               width=self.width,
-                                                               accesswidth=self.width,
-                                                               data=data)
+            await gather_with_concurrency(
+                [partial(self.__write_block, start_entry=burst_start,
+                         data=data[burst_start - start_entry:
+                                   burst_start - start_entry + burst_length])
+                 for burst_start, burst_length in split_bursts(
+                    start_entry=start_entry, number_entries=len(data),
+                    max_burst_length=self._callbacks.max_burst_length)],
+                concurrency=self._callbacks.max_bursts_in_flight)
 
         elif self._callbacks.write_callback is not None:
             # there is not write_block_callback defined so we must used individual write
@@ -461,6 +629,74 @@ class _MemoryAsyncWriteOnly(AsyncMemory, ABC):
         else:
             raise RuntimeError('No suitable callback')
 
+    async def write_buffer(self, buffer: Any, start_entry: int = 0) -> None:
+        """
+        Asynchronously write data to memory directly from a buffer, this avoids building a
+        python int for every entry if the callbacks include a ``write_block_buffer_callback``.
+        The number of entries written is determined by the size of the buffer, with each entry
+        occupying :attr:`width_in_bytes` bytes in the native byte order.
+
+        Args:
+            buffer: object supporting the buffer protocol, e.g. bytes, bytearray, memoryview,
+                    array.array or a numpy array
+            start_entry: index in the memory to start from, this is not the address
+
+        Returns: None
+
+        """
+        view = self._buffer_view(buffer, writable=False)
+        number_entries = view.nbytes // self.width_in_bytes
+        self._check_buffer_range(start_entry=start_entry, number_entries=number_entries)
+
+        write_block_buffer_callback = self._callbacks.write_block_buffer_callback
+        if write_block_buffer_callback is not None:
+            view = view.toreadonly()
+            await gather_with_concurrency(
+                [partial(write_block_buffer_callback,
+                         addr=self.address_lookup(entry=burst_start),
+                         width=self.width,
+                         accesswidth=self.width,
+                         length=burst_length,
+                         buffer=view[(burst_start - start_entry) * self.width_in_bytes:
+                                     (burst_start - start_entry + burst_length) *
+                                     self.width_in_bytes])
+                 for burst_start, burst_length in split_bursts(
+                    start_entry=start_entry, number_entries=number_entries,
+                    max_burst_length=self._callbacks.max_burst_length)],
+                concurrency=self._callbacks.max_bursts_in_flight)
+        else:
+            await self._write(start_entry=start_entry, data=self._unpack_buffer(view))
+
+    async def write_field_columns(self, reg_template: 'WritableAsyncRegister',
+                                  start_entry: int = 0, **columns: Any) -> None:
+        """
+        Asynchronously write a range of the memory (with a single block write if the callbacks
+        support it) from columns of field values, using the fields of a register to encode
+        every entry. This is much faster than writing the fields of each register in turn.
+
+        Each column can be a sequence of integers or a numpy array, the values of enumerated
+        fields must be given as integers. Any fields that are not included keep their current
+        value if the memory can be read (this needs a block read first), otherwise they are
+        written as zero.
+
+        Args:
+            reg_template: register whose fields are used to encode every entry, this must be
+                          the same width as the memory
+            start_entry: index in the memory to start from, this is not the address
+            **columns: field values keyed by the field name, the number of entries written is
+                       the length of the columns
+        """
+        keep_bitmask, encoded_values = self._encode_field_columns(reg_template=reg_template,
+                                                                  columns=columns)
+        if keep_bitmask != 0 and isinstance(self, _MemoryAsyncReadOnly):
+            # pylint: disable-next=no-member
+            current_values = await self._read(start_entry=start_entry,
+                                              number_entries=len(encoded_values))
+            encoded_values = [(current_value & keep_bitmask) | encoded_value
+                              for current_value, encoded_value in zip(current_values,
+                                                                      encoded_values)]
+        await self._write(start_entry=start_entry, data=encoded_values)
+
     def get_writable_registers(self, unroll: bool = False) -> \
             Iterator[Union['WritableAsyncRegister', 'WriteableAsyncRegisterArray']]:
         """
@@ -20,15 +20,16 @@ peakrdl-python tool. It provides a set of classes used by the autogenerated code
 asynchronous registers and fields
 """
 from enum import Enum
-from typing import Union, Optional, TypeVar, cast
-from collections.abc import AsyncGenerator, Iterator
+from typing import Any, Union, Optional, TypeVar, cast
+from collections.abc import AsyncGenerator, Iterator, Sequence, Mapping
 from abc import ABC, abstractmethod
 from contextlib import asynccontextmanager
 from array import array as Array
 import sys
 from warnings import warn
+from logging import INFO
 
-from .utility_functions import get_array_typecode, swap_msb_lsb_ordering
+from .utility_functions import get_array_typecode
 from .base import AsyncAddressMap, AsyncRegFile
 from .async_memory import  MemoryAsyncReadOnly, MemoryAsyncWriteOnly, MemoryAsyncReadWrite, \
     AsyncMemory, ReadableAsyncMemory, WritableAsyncMemory
@@ -39,6 +40,8 @@ from .callbacks import AsyncCallbackSet, AsyncCallbackSetLegacy
 from .base_register import BaseReg, BaseRegArray, RegisterWriteVerifyError
 from .base_field import FieldEnum, FieldSizeProps, FieldMiscProps, \
     _FieldReadOnlyFramework, _FieldWriteOnlyFramework
+from .field_columns import decode_field_columns, decode_field_columns_numpy, \
+    encode_field_columns
 
 # pylint: disable=duplicate-code
 if sys.version_info >= (3, 11):
@@ -91,8 +94,7 @@ class AsyncReg(BaseReg, ABC):
         super().__init__(address=address, width=width, accesswidth=accesswidth,
                          logger_handle=logger_handle, inst_name=inst_name, parent=parent)
 
-    @property
-    def _callbacks(self) -> Union[AsyncCallbackSet, AsyncCallbackSetLegacy]:
+    def _resolve_callbacks(self) -> Union[AsyncCallbackSet, AsyncCallbackSetLegacy]:
         # pylint: disable=protected-access
         if self.parent is None:
             raise RuntimeError('Parent must be set')
@@ -102,6 +104,11 @@ class AsyncReg(BaseReg, ABC):
 
         raise TypeError(f'unhandled parent callback type: {type(self.parent._callbacks)}')
 
+    @property
+    def _callbacks(self) -> Union[AsyncCallbackSet, AsyncCallbackSetLegacy]:
+        # This cast is OK because the type is checked when the callbacks are resolved
+        return cast(Union[AsyncCallbackSet, AsyncCallbackSetLegacy], self._cached_callbacks())
+
     @property
     @abstractmethod
     def fields(self) -> \
@@ -212,8 +219,12 @@ class RegAsyncReadOnly(AsyncReg, ABC):
         """
         return_dict: dict['str', Union[bool, Enum, int]] = {}
         async with self.single_read() as reg:
+            # the register value is checked once, so that each field can decode it without
+            # repeating the checks
+            reg_value = await reg.read()
+            self._validate_data(data=reg_value)
             for field in reg.readable_fields:
-                return_dict[field.inst_name] = await field.read()
+                return_dict[field.inst_name] = field.decode_read_value(reg_value, checked=False)
 
         return return_dict
 
@@ -265,7 +276,8 @@ class RegAsyncWriteOnly(AsyncReg, ABC):
         self._validate_data(data=data)
 
         # pylint: disable=duplicate-code
-        self._logger.info('Writing data:%X to %X', data, self.address)
+        if self._logger.isEnabledFor(INFO):
+            self._logger.info('Writing data:%X to %X', data, self.address)
         # pylint: enable=duplicate-code
 
         if self._callbacks.write_callback is not None:
@@ -466,8 +478,12 @@ class RegAsyncReadWrite(RegAsyncReadOnly, RegAsyncWriteOnly, ABC):
         """
         return_dict: dict['str', Union[bool, Enum, int]] = {}
         async with self.single_read() as reg:
+            # the register value is checked once, so that each field can decode it without
+            # repeating the checks
+            reg_value = await reg.read()
+            self._validate_data(data=reg_value)
             for field in reg.readable_fields:
-                return_dict[field.inst_name] = await field.read()
+                return_dict[field.inst_name] = field.decode_read_value(reg_value, checked=False)
 
         return return_dict
 
@@ -525,11 +541,11 @@ class AsyncRegArray(BaseRegArray, ABC):
                  address: int,
                  stride: int,
                  dimensions: tuple[int, ...],
-                 elements: Optional[dict[tuple[int, ...], AsyncRegArrayElementType]] = None):
+                 elements: Optional[Mapping[tuple[int, ...], AsyncRegArrayElementType]] = None):
 
         self.__in_context_manager: bool = False
         self.__register_cache: Optional[Union[Array, list[int]]] = None
-        self.__register_address_array: Optional[list[int]] = None
+        self.__register_address_array: Optional[range] = None
 
         if not isinstance(parent._callbacks, (AsyncCallbackSet, AsyncCallbackSetLegacy)):
             raise TypeError(f'callback set type is wrong, got {type(parent._callbacks)}')
@@ -807,16 +823,21 @@ class AsyncRegArray(BaseRegArray, ABC):
             skip_write (bool): skip the write back at the end
 
         """
+        width_in_bytes = self.width >> 3
         self.__register_address_array = \
-            [self.address + (i * (self.width >> 3)) for i in range(self.__number_cache_entries)]
+            range(self.address, self.address + (self.__number_cache_entries * width_in_bytes),
+                  width_in_bytes)
         self.__register_cache = await self.__initialise_cache(skip_initial_read=skip_initial_read)
         self.__in_context_manager = True
+        # the registers in the array use the callbacks of the array, which change to the cache
+        self._invalidate_callbacks()
         # this try/finally is needed to make sure that in the event of an exception
         # the state flags are not left incorrectly set
         try:
             yield self
         finally:
             self.__in_context_manager = False
+            self._invalidate_callbacks()
         if not skip_write:
             if isinstance(self._callbacks, AsyncCallbackSet):
                 if not isinstance(self.__register_cache, list):
@@ -831,12 +852,71 @@ class AsyncRegArray(BaseRegArray, ABC):
         self.__register_address_array = None
         self.__register_cache = None
 
-    @property
-    def _callbacks(self) -> Union[AsyncCallbackSet, AsyncCallbackSetLegacy]:
-        # pylint: disable=protected-access
-        if self.__in_context_manager:
-            return self.__cache_callbacks
+    async def _read_element_values(self) -> tuple[list[_FieldReadOnlyFramework], list[int]]:
+        """
+        Read the whole array with a single block operation (if the callbacks support it)
+
+        Returns:
+            the readable fields of an element of the array, which can be used to decode the
+            values, and the value of each element in the array order
+        """
+        # This code closely resembles the non-async version but is duplicated for clarity
+        async with self._cached_access(verify=False, skip_write=True, skip_initial_read=False):
+            reg_values = self.__register_cache
+        if reg_values is None:
+            raise RuntimeError('The cache array should be initialised')
 
+        # all the elements have the same fields so any one can be used to decode the values
+        fields = [field for field in next(iter(self)).fields
+                  if isinstance(field, _FieldReadOnlyFramework)]
+        return fields, [reg_values[entry] for entry in self.__element_entries()]
+
+    def __element_entries(self) -> Sequence[int]:
+        """
+        Entries of the register cache which hold each element of the array, in the array order
+        """
+        if len(self) == self.__number_cache_entries:
+            # the array is complete and packed so the cache is already in the array order
+            return range(len(self))
+        width_in_bytes = self.width >> 3
+        return [(address - self.address) // width_in_bytes for address in self.addresses()]
+
+    async def _write_field_columns(self, columns: dict[str, Any]) -> None:
+        """
+        Write columns of field values to every element of the array with a single block
+        write (if the callbacks support it), see ``write_field_columns``
+        """
+        if len(columns) == 0:
+            raise ValueError('no columns')
+
+        # all the elements have the same fields so any one can be used to encode the values
+        fields = [field for field in next(iter(self)).fields
+                  if isinstance(field, _FieldWriteOnlyFramework)]
+        written_bitmask, encoded_values = encode_field_columns(
+            fields=fields, columns=columns, number_entries=len(self), width=self.width)
+        keep_bitmask = ((1 << self.width) - 1) ^ written_bitmask
+
+        # the other fields are only preserved if the registers can be read, otherwise they are
+        # written with zero in the same way as a field write to a write only register
+        skip_initial_read = keep_bitmask == 0 or not self._is_readable
+        async with self._cached_access(verify=False, skip_write=False,
+                                       skip_initial_read=skip_initial_read):
+            reg_values = self.__register_cache
+            if reg_values is None:
+                raise RuntimeError('The cache array should be initialised')
+            for entry, encoded_value in zip(self.__element_entries(), encoded_values):
+                reg_values[entry] = (reg_values[entry] & keep_bitmask) | encoded_value
+
+    async def _read_field_columns(self) -> dict[str, list[int]]:
+        fields, reg_values = await self._read_element_values()
+        return decode_field_columns(fields=fields, reg_values=reg_values)
+
+    async def _read_field_columns_numpy(self) -> dict[str, Any]:
+        fields, reg_values = await self._read_element_values()
+        return decode_field_columns_numpy(fields=fields, reg_values=reg_values, width=self.width)
+
+    def _resolve_callbacks(self) -> Union[AsyncCallbackSet, AsyncCallbackSetLegacy]:
+        # pylint: disable=protected-access
         if self.parent is None:
             raise RuntimeError('Parent must be set')
 
@@ -845,6 +925,14 @@ class AsyncRegArray(BaseRegArray, ABC):
 
         raise TypeError(f'unhandled parent callback type: {type(self.parent._callbacks)}')
 
+    @property
+    def _callbacks(self) -> Union[AsyncCallbackSet, AsyncCallbackSetLegacy]:
+        if self.__in_context_manager:
+            return self.__cache_callbacks
+
+        # This cast is OK because the type is checked when the callbacks are resolved
+        return cast(Union[AsyncCallbackSet, AsyncCallbackSetLegacy], self._cached_callbacks())
+
 
 class RegAsyncReadOnlyArray(AsyncRegArray, ABC):
     """
@@ -862,7 +950,7 @@ class RegAsyncReadOnlyArray(AsyncRegArray, ABC):
                  accesswidth: int,
                  stride: int,
                  dimensions: tuple[int, ...],
-                 elements: Optional[dict[tuple[int, ...], RegAsyncReadOnly]] = None):
+                 elements: Optional[Mapping[tuple[int, ...], RegAsyncReadOnly]] = None):
 
         if not isinstance(parent, (AsyncRegFile, AsyncAddressMap,
                                    MemoryAsyncReadOnly, MemoryAsyncReadOnlyLegacy,
@@ -892,6 +980,30 @@ class RegAsyncReadOnlyArray(AsyncRegArray, ABC):
                                        skip_initial_read=False) as reg_array:
             yield reg_array
 
+    async def read_field_columns(self) -> dict[str, list[int]]:
+        """
+        Asynchronously read the whole array (with a single block read if the callbacks support
+        it) and decode the readable fields of every element into columns, this is much faster
+        than reading the fields of each element in turn. Enumerated fields are returned as
+        their integer values
+
+        Returns:
+            dictionary keyed by the field name, with a list of the field value of each element
+            in the array order
+        """
+        return await self._read_field_columns()
+
+    async def read_field_columns_numpy(self) -> dict[str, Any]:
+        """
+        Same as :meth:`read_field_columns` but the columns are numpy arrays decoded with numpy
+        array operations, this needs numpy to be installed
+
+        Returns:
+            dictionary keyed by the field name, with a numpy array of the field value of each
+            element in the array order
+        """
+        return await self._read_field_columns_numpy()
+
     @property
     def _is_readable(self) -> bool:
         return True
@@ -917,7 +1029,7 @@ class RegAsyncWriteOnlyArray(AsyncRegArray, ABC):
                  accesswidth: int,
                  stride: int,
                  dimensions: tuple[int, ...],
-                 elements: Optional[dict[tuple[int, ...], RegAsyncWriteOnly]] = None):
+                 elements: Optional[Mapping[tuple[int, ...], RegAsyncWriteOnly]] = None):
 
         if not isinstance(parent, (AsyncRegFile, AsyncAddressMap,
                                    MemoryAsyncWriteOnly, MemoryAsyncReadWrite,
@@ -947,6 +1059,24 @@ class RegAsyncWriteOnlyArray(AsyncRegArray, ABC):
                                        skip_initial_read=True) as reg_array:
             yield reg_array
 
+    async def write_field_columns(self, **columns: Any) -> None:
+        """
+        Asynchronously write a column of values for one or more fields, with a value for each
+        element of the array in the array order. All the values are checked and encoded before
+        the whole array is written with a single block write (if the callbacks support it), this
+        is much faster than writing the fields of each element in turn.
+
+        Each column can be a sequence of integers or a numpy array, the values of enumerated
+        fields must be given as integers. Any fields that are not included keep their current
+        value if the registers can be read (this needs a block read first), otherwise they are
+        written as zero.
+
+        Args:
+            **columns: field values keyed by the field name
+
+        """
+        await self._write_field_columns(columns)
+
     @property
     def _is_readable(self) -> bool:
         return False
@@ -972,7 +1102,7 @@ class RegAsyncReadWriteArray(AsyncRegArray, ABC):
                  accesswidth: int,
                  stride: int,
                  dimensions: tuple[int, ...],
-                 elements: Optional[dict[tuple[int, ...], RegAsyncReadWrite]] = None):
+                 elements: Optional[Mapping[tuple[int, ...], RegAsyncReadWrite]] = None):
 
         if not isinstance(parent, (AsyncRegFile, AsyncAddressMap,
                                    MemoryAsyncReadWrite, MemoryAsyncReadWriteLegacy)):
@@ -1008,6 +1138,48 @@ class RegAsyncReadWriteArray(AsyncRegArray, ABC):
                                        skip_initial_read=False) as reg_array:
             yield reg_array
 
+    async def write_field_columns(self, **columns: Any) -> None:
+        """
+        Asynchronously write a column of values for one or more fields, with a value for each
+        element of the array in the array order. All the values are checked and encoded before
+        the whole array is written with a single block write (if the callbacks support it), this
+        is much faster than writing the fields of each element in turn.
+
+        Each column can be a sequence of integers or a numpy array, the values of enumerated
+        fields must be given as integers. Any fields that are not included keep their current
+        value if the registers can be read (this needs a block read first), otherwise they are
+        written as zero.
+
+        Args:
+            **columns: field values keyed by the field name
+
+        """
+        await self._write_field_columns(columns)
+
+    async def read_field_columns(self) -> dict[str, list[int]]:
+        """
+        Asynchronously read the whole array (with a single block read if the callbacks support
+        it) and decode the readable fields of every element into columns, this is much faster
+        than reading the fields of each element in turn. Enumerated fields are returned as
+        their integer values
+
+        Returns:
+            dictionary keyed by the field name, with a list of the field value of each element
+            in the array order
+        """
+        return await self._read_field_columns()
+
+    async def read_field_columns_numpy(self) -> dict[str, Any]:
+        """
+        Same as :meth:`read_field_columns` but the columns are numpy arrays decoded with numpy
+        array operations, this needs numpy to be installed
+
+        Returns:
+            dictionary keyed by the field name, with a numpy array of the field value of each
+            element in the array order
+        """
+        return await self._read_field_columns_numpy()
+
     @property
     def _is_readable(self) -> bool:
         return True
@@ -1126,22 +1298,21 @@ class FieldAsyncWriteOnly(_FieldWriteOnlyFramework, ABC):
         # pylint: disable=duplicate-code
         self._write_value_checks(value=value)
 
-        if self.msb0:
-            value = swap_msb_lsb_ordering(value=value, width=self.width)
+        encoded_value = self._size_props.encode(value)
         # pylint: enable=duplicate-code
 
         if (self.high == (self.register_data_width - 1)) and (self.low == 0):
             # special case where the field occupies the whole register,
             # there a straight write can be performed
-            new_reg_value = value
+            new_reg_value = encoded_value
         else:
             # do a read, modify write
             if isinstance(self.parent_register, RegAsyncReadWrite):
                 reg_value = await self.parent_register.read()
                 masked_reg_value = reg_value & self.inverse_bitmask
-                new_reg_value = masked_reg_value | (value << self.low)
+                new_reg_value = masked_reg_value | encoded_value
             elif isinstance(self.parent_register, RegAsyncWriteOnly):
-                new_reg_value = value << self.low
+                new_reg_value = encoded_value
             else:
                 raise TypeError('Unhandled parent type')
 
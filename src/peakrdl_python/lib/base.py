@@ -21,18 +21,27 @@ peakrdl-python tool. It provides a set of base classes used by the autogenerated
 from __future__ import annotations
 import logging
 import warnings
-from typing import Optional, Union, TYPE_CHECKING, TypeVar
-from collections.abc import Iterator, Sequence
+import re
+from typing import Optional, Union, TYPE_CHECKING, TypeVar, cast
+from collections.abc import Iterator, Sequence, Generator, Iterable, Mapping, Callable
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from itertools import product, chain
-from functools import reduce
+from functools import reduce, partial
 from operator import mul
+from bisect import bisect_right
 import sys
 from enum import IntEnum
 
 from .callbacks import CallbackSet, CallbackSetLegacy
 from .callbacks import NormalCallbackSet, AsyncCallbackSet
 from .callbacks import NormalCallbackSetLegacy, AsyncCallbackSetLegacy
+from .callbacks import BatchCallbackSet
+from .shadow_cache import ShadowCache, CachePolicy
+from .snapshot import RegisterSnapshot, RegisterDifference
+from .snapshot import coalesce_runs, read_run, write_run
+from .snapshot import async_read_run, async_write_run
+from .utility_functions import gather_with_concurrency
 
 if sys.version_info >= (3, 10):
     # type guarding was introduced in python 3.10
@@ -40,7 +49,15 @@ if sys.version_info >= (3, 10):
 else:
     from typing_extensions import TypeGuard
 
+# pylint: disable=duplicate-code
+if sys.version_info >= (3, 11):
+    from typing import Self
+else:
+    from typing_extensions import Self
+# pylint: enable=duplicate-code
+
 if TYPE_CHECKING:
+    from .base_field import Field
     from .memory import Memory, MemoryArray
     from .async_memory import AsyncMemory, AsyncMemoryArray
     from .register_and_field import Reg, RegArray
@@ -50,14 +67,37 @@ if TYPE_CHECKING:
     from .register_and_field import ReadableRegisterArray, WriteableRegisterArray
     from .async_register_and_field import ReadableAsyncRegisterArray, WriteableAsyncRegisterArray
 
+# pylint: disable=too-many-lines
+
 UDPStruct = dict[str, 'UDPType']
 UDPType = Union[str, int, bool, IntEnum, UDPStruct]
 
+# a segment of a hierarchical path, the systemRDL name followed by any array indices e.g. reg[3]
+_PATH_SEGMENT = re.compile(r'(?P<name>[^.\[\]]+)(?P<indices>(?:\[\d+\])*)')
+
+class _CallbackBinding:
+    """
+    The callbacks of each node are looked up from its parent the first time they are used and
+    then cached, this is shared by every node in a register model and holds a generation count
+    which is incremented to invalidate all the cached callbacks when any of them change. It also
+    counts the shadow caches in use anywhere in the register model
+    """
+    # pylint: disable=too-few-public-methods
+    __slots__: list[str] = ['generation', 'active_shadow_caches']
+
+    def __init__(self) -> None:
+        self.generation = 0
+        self.active_shadow_caches = 0
+
+
+# pylint: disable-next=too-many-instance-attributes
 class Base(ABC):
     """
     base class of for all types
     """
-    __slots__: list[str] = ['__logger', '__inst_name', '__parent']
+    __slots__: list[str] = ['__logger_handle', '__logger', '__inst_name', '__parent',
+                            '__full_inst_name', '__callback_binding', '__callbacks_cache',
+                            '__callbacks_generation']
 
     def __init__(self, *,
                  logger_handle: str, inst_name: str, parent: Optional[Union['Node', 'NodeArray']]):
@@ -65,8 +105,10 @@ class Base(ABC):
         if not isinstance(logger_handle, str):
             raise TypeError(f'logger_handle should be str but got {type(logger_handle)}')
 
-        self.__logger = logging.getLogger(logger_handle)
-        self._logger.debug('creating instance of %s', self.__class__)
+        self.__logger_handle = logger_handle
+        # the logger is only looked up when it is first used, so that a large register model
+        # does not create a logger for every node
+        self.__logger: Optional[logging.Logger] = None
 
         if not isinstance(inst_name, str):
             raise TypeError(f'inst_name should be str but got {type(inst_name)}')
@@ -76,11 +118,85 @@ class Base(ABC):
             if not isinstance(parent, (Node, NodeArray)):
                 raise TypeError(f'parent should be Node or Node Array but got {type(parent)}')
         self.__parent = parent
+        # the full instance name is built on first use, as the hierarchy does not change
+        self.__full_inst_name: Optional[str] = None
+
+        # the callbacks are resolved on first use, see _cached_callbacks
+        if parent is None:
+            self.__callback_binding = _CallbackBinding()
+        else:
+            # pylint: disable-next=protected-access
+            self.__callback_binding = parent._callback_binding
+        self.__callbacks_cache: Optional[Union[CallbackSet, CallbackSetLegacy]] = None
+        self.__callbacks_generation = 0
+
+    @property
+    def _logger_handle(self) -> str:
+        """
+        name of the logger used for messages from this node, unless it is within a section
+        which shares its logger
+        """
+        return self.__logger_handle
 
     @property
     def _logger(self) -> logging.Logger:
+        if self.__logger is None:
+            self.__logger = self.__resolve_logger()
         return self.__logger
 
+    def __resolve_logger(self) -> logging.Logger:
+        node: Optional[Base] = self
+        while node is not None:
+            # pylint: disable-next=protected-access
+            shared_logger = node._shared_logger
+            if shared_logger is not None:
+                return shared_logger
+            node = node.parent
+        return logging.getLogger(self.__logger_handle)
+
+    @property
+    def _callback_binding(self) -> _CallbackBinding:
+        """
+        generation count of the callbacks, shared by every node in the register model
+        """
+        return self.__callback_binding
+
+    def _invalidate_callbacks(self) -> None:
+        """
+        Discard the cached callbacks of every node in the register model, this must be called
+        whenever the callbacks of any node change
+        """
+        self.__callback_binding.generation += 1
+
+    def _cached_callbacks(self) -> Union[CallbackSet, CallbackSetLegacy]:
+        """
+        callbacks of the node, these are only resolved (which walks up the parents) on first
+        use and again after they have been invalidated
+        """
+        callbacks = self.__callbacks_cache
+        generation = self.__callback_binding.generation
+        if callbacks is None or self.__callbacks_generation != generation:
+            callbacks = self._resolve_callbacks()
+            self.__callbacks_cache = callbacks
+            self.__callbacks_generation = generation
+        return callbacks
+
+    def _resolve_callbacks(self) -> Union[CallbackSet, CallbackSetLegacy]:
+        """
+        look up the callbacks of the node, by default these are the callbacks of the parent
+        """
+        if self.parent is None:
+            raise RuntimeError('Parent must be set')
+        # pylint: disable-next=protected-access
+        return self.parent._callbacks
+
+    @property
+    def _shared_logger(self) -> Optional[logging.Logger]:
+        """
+        logger used by this node and everything within it, if one has been set
+        """
+        return None
+
     @property
     def inst_name(self) -> str:
         """
@@ -100,6 +216,11 @@ class Base(ABC):
         """
         The full hierarchical systemRDL name of the instance
         """
+        if self.__full_inst_name is None:
+            self.__full_inst_name = self.__build_full_inst_name()
+        return self.__full_inst_name
+
+    def __build_full_inst_name(self) -> str:
         if self.parent is not None:
             if isinstance(self.parent, NodeArray):
                 if self.parent.parent is None:
@@ -156,13 +277,14 @@ class Node(Base, ABC):
 
     @property
     @abstractmethod
-    def systemrdl_python_child_name_map(self) -> dict[str, str]:
+    def systemrdl_python_child_name_map(self) -> Mapping[str, str]:
         """
-        In some cases systemRDL names need to be converted make them python safe, this dictionary
+        In some cases systemRDL names need to be converted make them python safe, this mapping
         is used to map the original systemRDL names to the names of the python attributes of this
         class
 
-        Returns: dictionary whose key is the systemRDL names and value it the property name
+        Returns: read only mapping whose key is the systemRDL names and value it the property
+            name
         """
 
     def get_child_by_system_rdl_name(self, name: str) -> Base:
@@ -184,11 +306,115 @@ class Node(Base, ABC):
         Total Number of bytes of address the node occupies
         """
 
+    # pylint: disable-next=unused-argument
+    def _child_at(self, address: int) -> Optional[Union['Node', 'NodeArray']]:
+        """
+        Child of the node which occupies an address, this is overridden by the nodes which
+        have children that are located by address (sections and memories)
+
+        Args:
+            address: address to look up
+
+        Returns:
+            The child or None if no child occupies the address
+        """
+        return None
+
+    # pylint: disable-next=unused-argument
+    def _field_at(self, bit: int) -> Optional['Field']:
+        """
+        Field of the node which occupies a bit, this is overridden by the registers
+
+        Args:
+            bit: bit position within the register
+
+        Returns:
+            The field or None if no field occupies the bit
+        """
+        return None
+
+    # pylint: disable-next=unused-argument
+    def _decode_fields(self, value: int) -> dict[str, int]:
+        """
+        Value of each field of the node, this is overridden by the registers
+
+        Args:
+            value: value of the register
+
+        Returns:
+            field values keyed by the field instance name
+        """
+        return {}
+
 
 # pylint: disable-next=invalid-name
 NodeArrayElementType = TypeVar('NodeArrayElementType', bound=Node)
 
 
+class _ArrayIndexView(Mapping[tuple[int, ...], NodeArrayElementType]):
+    """
+    Elements of a slice of an array, this only holds the range of indices selected in each
+    dimension, the elements themselves are looked up in the original array when they are
+    accessed so that slicing does not depend on the size of the array
+
+    Args:
+        element: function to look up (and build if needed) an element of the original array
+        ranges: indices selected in each dimension of the array, in ascending order
+    """
+    __slots__: list[str] = ['__element', '__ranges']
+
+    def __init__(self, element: Callable[[tuple[int, ...]], Optional[NodeArrayElementType]],
+                 ranges: tuple[range, ...]):
+        self.__element = element
+        self.__ranges = ranges
+
+    @property
+    def ranges(self) -> tuple[range, ...]:
+        """
+        indices selected in each dimension of the array
+        """
+        return self.__ranges
+
+    def select(self, ranges: tuple[range, ...]) -> _ArrayIndexView[NodeArrayElementType]:
+        """
+        Make a view of the elements which are in both this view and a further set of ranges,
+        this is used when a slice of an array is itself sliced
+        """
+        return _ArrayIndexView(element=self.__element,
+                               ranges=tuple(self.__intersect(existing, new)
+                                            for existing, new in zip(self.__ranges, ranges)))
+
+    @staticmethod
+    def __intersect(first: range, second: range) -> range:
+        # the intersection of two arithmetic progressions is also an arithmetic progression so
+        # it can be described with a range from its first two items
+        common = [index for index in second if index in first]
+        if not common:
+            return range(0)
+        if len(common) == 1:
+            return range(common[0], common[0] + 1)
+        return range(common[0], common[-1] + 1, common[1] - common[0])
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, tuple) or len(key) != len(self.__ranges):
+            return False
+        return all(index in index_range for index, index_range in zip(key, self.__ranges))
+
+    def __getitem__(self, key: tuple[int, ...]) -> NodeArrayElementType:
+        if key not in self:
+            raise KeyError(key)
+        element = self.__element(key)
+        if element is None:
+            raise KeyError(key)
+        return element
+
+    def __len__(self) -> int:
+        return reduce(mul, (len(index_range) for index_range in self.__ranges), 1)
+
+    def __iter__(self) -> Iterator[tuple[int, ...]]:
+        return product(*self.__ranges)
+
+
 class NodeArray(Base, Sequence[NodeArrayElementType]):
     """
     base class of for all array types
@@ -196,7 +422,8 @@ class NodeArray(Base, Sequence[NodeArrayElementType]):
 
     # pylint: disable=too-few-public-methods
     __slots__: list[str] = ['__elements', '__address',
-                            '__stride', '__dimensions']
+                            '__stride', '__dimensions', '__all_elements_built',
+                            '__strides', '__index_ranges']
 
     # pylint: disable-next=too-many-arguments
     def __init__(self, *, logger_handle: str,
@@ -205,7 +432,7 @@ class NodeArray(Base, Sequence[NodeArrayElementType]):
                  address: int,
                  stride: int,
                  dimensions: tuple[int, ...],
-                 elements: Optional[dict[tuple[int, ...], NodeArrayElementType]] = None):
+                 elements: Optional[Mapping[tuple[int, ...], NodeArrayElementType]] = None):
 
         super().__init__(logger_handle=logger_handle, inst_name=inst_name, parent=parent)
 
@@ -222,21 +449,87 @@ class NodeArray(Base, Sequence[NodeArrayElementType]):
             if not isinstance(dimension, int):
                 raise TypeError(f'dimension should be a int but got {type(dimension)}')
         self.__dimensions = dimensions
+        # address step of each dimension (in row-major order), so that the address of any
+        # element can be calculated directly from its indices
+        strides = [stride]
+        for dimension in reversed(dimensions[1:]):
+            strides.append(strides[-1] * dimension)
+        self.__strides = tuple(reversed(strides))
+
+        # indices present in each dimension, this is None if the array was made from an
+        # arbitrary set of elements
+        self.__index_ranges: Optional[tuple[range, ...]] = \
+            tuple(range(dimension) for dimension in dimensions)
 
         # There are two use cases for this class:
-        # 1. Initial creation - elements is None in which case the data is populated
+        # 1. Initial creation - elements is None in which case the data is populated, unless the
+        #    lazy construction is used in which case each element is built on first access
         # 2. Creating a recursive version of itself, this happens when it is sliced by the parent
-        #    in which case a subset of the elements is presented and a new instance
+        #    in which case a subset of the elements is presented and a new instance, normally
+        #    this is a view of the elements of the original array
 
-        if elements is not None:
+        self.__elements: Union[dict[tuple[int, ...], NodeArrayElementType],
+                               _ArrayIndexView[NodeArrayElementType]]
+        if isinstance(elements, _ArrayIndexView):
+            self.__check_init_view(elements)
+            self.__elements = elements
+            self.__all_elements_built = True
+            self.__index_ranges = elements.ranges
+        elif elements is not None:
+            if not isinstance(elements, dict):
+                raise TypeError(f'elements should be a dictionary but got {type(elements)}')
             self.__check_init_element(elements)
             self.__elements = elements
+            self.__all_elements_built = True
+            self.__index_ranges = None
+        elif self._lazy_construction:
+            self.__elements = {}
+            self.__all_elements_built = False
         else:
             new_elements: dict[tuple[int, ...], NodeArrayElementType] = {}
             for indices in product(*[range(dim) for dim in self.dimensions]):
                 new_elements[indices] = self._build_element(indices=indices)
 
             self.__elements = new_elements
+            self.__all_elements_built = True
+
+    @property
+    def _lazy_construction(self) -> bool:
+        """
+        If True the elements of the array are only built when they are first accessed, rather
+        than all being built when the array is initialised. This is overridden in the generated
+        code when it is built with the lazy option
+        """
+        return False
+
+    def __element(self, indices: tuple[int, ...]) -> Optional[NodeArrayElementType]:
+        """
+        Look up an element of the array, building it if it has not been built yet
+
+        Args:
+            indices: element index
+
+        Returns:
+            element or None if the index is not part of this array
+        """
+        elements = self.__elements
+        element = elements.get(indices)
+        if element is not None or self.__all_elements_built or \
+                not isinstance(elements, dict):
+            return element
+
+        if len(indices) != len(self.dimensions) or \
+                not all(0 <= index < dim for index, dim in zip(indices, self.dimensions)):
+            return None
+
+        element = self._build_element(indices=indices)
+        elements[indices] = element
+        if len(elements) == len(self):
+            # once everything is built, put the elements in index order so that they can be
+            # iterated directly
+            self.__elements = dict(sorted(elements.items()))
+            self.__all_elements_built = True
+        return element
 
     def _build_element(self, indices: tuple[int, ...]) -> NodeArrayElementType:
 
@@ -255,7 +548,7 @@ class NodeArray(Base, Sequence[NodeArrayElementType]):
 
         Returns:
         """
-        return self._logger.name + '[' + ','.join([str(item) for item in indices]) + ']'
+        return self._logger_handle + '[' + ','.join([str(item) for item in indices]) + ']'
 
     def _build_element_inst_name(self, indices: tuple[int, ...]) -> str:
         """
@@ -277,9 +570,6 @@ class NodeArray(Base, Sequence[NodeArrayElementType]):
         Returns:
 
         """
-        if not isinstance(elements, dict):
-            raise TypeError(f'elements should be a dictionary but got {type(elements)}')
-
         for index, item in elements.items():
             if not isinstance(index, tuple):
                 raise TypeError(f'element index should be a tuple but got {type(index)}')
@@ -299,35 +589,104 @@ class NodeArray(Base, Sequence[NodeArrayElementType]):
                 raise TypeError(f'elements should be a {self._element_datatype} '
                                 f'but got {type(item)}')
 
+    def __check_init_view(self, view: _ArrayIndexView[NodeArrayElementType]) -> None:
+        """
+        Used in the __init__ to check that a view of the elements of another array is valid,
+        only the ranges are checked as the elements are taken from an array of the same type
+        """
+        if len(view.ranges) != len(self.dimensions):
+            raise ValueError(f'size of index does not match index length = {len(view.ranges)}')
+
+        for index_range, dimension in zip(view.ranges, self.dimensions):
+            if len(index_range) > 0 and not (0 <= index_range[0] and
+                                             index_range[-1] < dimension):
+                raise ValueError('index outside of range of dimensions')
+
     def _address_calculator(self, indices: tuple[int, ...]) -> int:
-        def cal_addr(dimensions: tuple[int,...], indices: tuple[int, ...], base_address: int,
-                     stride: int) -> int:
-            """
-            Calculates the address of an register within an array
-
-            :param dimensions: list of the array dimensions
-            :param indices: list of the array indices (length must match the dimensions)
-            :param base_address: base address of the array
-            :param stride: address stride of of the array
-            :return: address of the register
-            """
-            if len(dimensions) == 1:
-                return (indices[0] * stride) + base_address
-
-            outer_offset = reduce(mul, dimensions[1::], 1) * stride * indices[0]
-            return outer_offset + cal_addr(dimensions=dimensions[1::],
-                                           indices=indices[1::],
-                                           stride=self.stride,
-                                           base_address=self.address)
-
-        return cal_addr(self.dimensions, base_address=self.address,
-                        stride=self.stride, indices=indices)
-
-    def _sub_instance(self, elements: dict[tuple[int, ...], NodeArrayElementType]) -> \
+        """
+        Calculates the address of an element within the array
+
+        Args:
+            indices: element index (length must match the dimensions)
+
+        Returns:
+            address of the element
+        """
+        return self.address + sum(map(mul, indices, self.__strides))
+
+    def addresses(self) -> Sequence[int]:
+        """
+        Address of each element of the array, in the same order as the elements are iterated.
+        These are calculated from the array indices rather than the elements, so no elements
+        are built when the lazy construction is used
+
+        Returns:
+            a range if the addresses are evenly spaced (for example a complete array or a
+            slice in one dimension), otherwise a list of the addresses
+        """
+        if self.__index_ranges is None:
+            return [element.address for element in self]
+
+        # address offsets of the selected indices in each dimension
+        offsets = [range(index_range.start * stride, index_range.stop * stride,
+                         index_range.step * stride)
+                   for index_range, stride in zip(self.__index_ranges, self.__strides)]
+        if any(len(axis_offsets) == 0 for axis_offsets in offsets):
+            return range(0)
+
+        # working from the innermost dimension, each dimension can be merged into a single
+        # range as long as it steps over exactly the addresses of the inner dimensions
+        combined = range(self.address, self.address + 1)
+        for axis_offsets in reversed(offsets):
+            if len(axis_offsets) == 1:
+                combined = range(combined.start + axis_offsets[0],
+                                 combined.stop + axis_offsets[0], combined.step)
+            elif len(combined) == 1:
+                combined = range(combined.start + axis_offsets.start,
+                                 combined.start + axis_offsets.stop, axis_offsets.step)
+            elif axis_offsets.step == len(combined) * combined.step:
+                combined = range(combined.start + axis_offsets.start,
+                                 combined.start + axis_offsets.start +
+                                 len(axis_offsets) * axis_offsets.step,
+                                 combined.step)
+            else:
+                return [self.address + sum(element_offsets)
+                        for element_offsets in product(*offsets)]
+        return combined
+
+    def _element_at(self, address: int) -> Optional[NodeArrayElementType]:
+        """
+        Element of the array which occupies an address, this is calculated from the address
+        and stride of the array rather than searching the elements, so only the element found
+        is built when the lazy construction is used
+
+        Args:
+            address: address to look up
+
+        Returns:
+            The element or None if the address is not occupied by an element of the array
+        """
+        offset = address - self.address
+        if not 0 <= offset < self.size:
+            return None
+
+        flat_index = offset // self.stride
+        indices: list[int] = []
+        for dimension in reversed(self.dimensions):
+            flat_index, index = divmod(flat_index, dimension)
+            indices.append(index)
+        element = self.__element(tuple(reversed(indices)))
+
+        # the element may be smaller than the stride of the array, leaving a gap between elements
+        if element is None or address >= element.address + element.size:
+            return None
+        return element
+
+    def _sub_instance(self, elements: Mapping[tuple[int, ...], NodeArrayElementType]) -> \
             NodeArray[NodeArrayElementType]:
         if not isinstance(self.parent, Node):
             raise RuntimeError('Parent of a Node Array must be Node')
-        return self.__class__(logger_handle=self._logger.name,
+        return self.__class__(logger_handle=self._logger_handle,
                               inst_name=self.inst_name,
                               parent=self.parent,
                               address=self.address,
@@ -345,19 +704,14 @@ class NodeArray(Base, Sequence[NodeArrayElementType]):
 
         if isinstance(item, slice):
 
-            valid_items = [(i,) for i in range(*item.indices(self.dimensions[0]))]
-            def filter_1d_func(to_filter:tuple[tuple[int, ...], NodeArrayElementType]) -> bool:
-                index, _ = to_filter
-                if index in valid_items:
-                    return True
-                return False
-
-            return self._sub_instance(elements=dict(filter(filter_1d_func, self.items())))
+            return self._sub_instance(
+                elements=self.__select_elements((range(*item.indices(self.dimensions[0])),)))
 
         if isinstance(item, int):
-            if (item, ) not in self.__elements:
+            element = self.__element((item, ))
+            if element is None:
                 raise IndexError(f'{item:d} in in the array')
-            return self.__elements[(item, )]
+            return element
 
         raise TypeError(f'Array index must either being an int or a slice, got {type(item)}')
 
@@ -372,17 +726,18 @@ class NodeArray(Base, Sequence[NodeArrayElementType]):
 
             if all(isinstance(i, int) for i in item):
                 # single item access
-                if item not in self.__elements:
+                element = self.__element(item)
+                if element is None:
                     msg = 'index[' + ','.join([str(i) for i in item]) + '] not in array'
                     raise IndexError(msg)
-                return self.__elements[item]
+                return element
 
-            unpack_index_set = []
+            unpack_index_set: list[range] = []
             for axis, sub_index in enumerate(item):
                 if isinstance(sub_index, int):
                     if not 0 <= sub_index < self.dimensions[axis]:
                         raise IndexError(f'{sub_index:d} out of range for dimension {axis}')
-                    unpack_index_set.append((sub_index,))
+                    unpack_index_set.append(range(sub_index, sub_index + 1))
                     continue
 
                 if isinstance(sub_index, slice):
@@ -391,30 +746,49 @@ class NodeArray(Base, Sequence[NodeArrayElementType]):
 
                 raise TypeError(f'unhandle index of {type(sub_index)} in position {axis:d}')
 
-            valid_items = tuple(product(*unpack_index_set))
-
-            def filter_nd_func(to_filter: tuple[tuple[int, ...], NodeArrayElementType]) -> bool:
-                index, _ = to_filter
-                if index in valid_items:
-                    return True
-                return False
-
-            return self._sub_instance(elements=dict(filter(filter_nd_func, self.items())))
+            return self._sub_instance(elements=self.__select_elements(tuple(unpack_index_set)))
 
         raise IndexError('attempting a single dimensional array access on a multidimension'
                          ' array')
 
+    def __select_elements(self, ranges: tuple[range, ...]) -> \
+            _ArrayIndexView[NodeArrayElementType]:
+        """
+        View of the elements for a slice of the array, none of the elements are built until
+        they are accessed
+
+        Args:
+            ranges: indices selected in each dimension
+        """
+        # put the ranges in ascending order, so the elements are in the same order as the array
+        ranges = tuple(index_range if index_range.step > 0 else index_range[::-1]
+                       for index_range in ranges)
+        if isinstance(self.__elements, _ArrayIndexView):
+            return self.__elements.select(ranges)
+        return _ArrayIndexView(element=self.__element, ranges=ranges)
+
     def __len__(self) -> int:
-        return len(self.__elements)
+        if self.__all_elements_built:
+            return len(self.__elements)
+        return reduce(mul, self.dimensions, 1)
 
     def __iter__(self) -> Iterator[NodeArrayElementType]:
-        yield from self.__elements.values()
+        for _, element in self.items():
+            yield element
 
     def items(self) -> Iterator[tuple[tuple[int, ...], NodeArrayElementType]]:
         """
         iterate through all the items in an array but also return the index of the array
         """
-        yield from self.__elements.items()
+        if self.__all_elements_built:
+            yield from self.__elements.items()
+            return
+
+        for indices in product(*[range(dim) for dim in self.dimensions]):
+            element = self.__element(indices)
+            if element is None:
+                raise RuntimeError(f'failed to build element {indices}')
+            yield indices, element
 
     @property
     def dimensions(self) -> Union[tuple[int, ...], tuple[int]]:
@@ -444,10 +818,7 @@ class NodeArray(Base, Sequence[NodeArrayElementType]):
 
     @property
     def _callbacks(self) -> Union[CallbackSet, CallbackSetLegacy]:
-        if self.parent is None:
-            raise RuntimeError('Parent must be set')
-        # pylint: disable-next=protected-access
-        return self.parent._callbacks
+        return self._cached_callbacks()
 
     @property
     def size(self) -> int:
@@ -457,6 +828,40 @@ class NodeArray(Base, Sequence[NodeArrayElementType]):
         return reduce(mul, self.dimensions, 1) * self.stride
 
 
+class AddressIndex:
+    """
+    Index of a set of nodes sorted by address, this is used to find the node which occupies an
+    address with a binary search rather than checking each node in turn
+
+    Args:
+        nodes: nodes to be indexed, these must not overlap
+    """
+    # pylint: disable=too-few-public-methods
+    __slots__: list[str] = ['__starts', '__nodes']
+
+    def __init__(self, nodes: Iterable[Union[Node, NodeArray]]):
+        self.__nodes = sorted(nodes, key=lambda node: node.address)
+        self.__starts = [node.address for node in self.__nodes]
+
+    def node_at(self, address: int) -> Optional[Union[Node, NodeArray]]:
+        """
+        Find the node which occupies an address
+
+        Args:
+            address: address to look up
+
+        Returns:
+            The node or None if the address is not occupied by any of the nodes
+        """
+        position = bisect_right(self.__starts, address) - 1
+        if position < 0:
+            return None
+        node = self.__nodes[position]
+        if address >= node.address + node.size:
+            return None
+        return node
+
+
 class BaseSection(Node, ABC):
     """
     base class of non-async and sync sections (AddressMaps and RegFile)
@@ -465,7 +870,198 @@ class BaseSection(Node, ABC):
         It is not expected that this class will be instantiated under normal
         circumstances however, it is useful for type checking
     """
-    __slots__: list[str] = []
+    __slots__: list[str] = ['__address_index', '__path_cache', '__shared_logger']
+
+    def __init__(self, *,
+                 address: int,
+                 logger_handle: str,
+                 inst_name: str,
+                 parent: Optional[Union['Node', 'NodeArray']]):
+        super().__init__(address=address, logger_handle=logger_handle, inst_name=inst_name,
+                         parent=parent)
+        # the index of the children is only built when it is first needed
+        self.__address_index: Optional[AddressIndex] = None
+        self.__path_cache: dict[str, Base] = {}
+        self.__shared_logger: Optional[logging.Logger] = None
+
+    @property
+    def _shared_logger(self) -> Optional[logging.Logger]:
+        return self.__shared_logger
+
+    def share_logger(self, logger: Optional[logging.Logger] = None) -> None:
+        """
+        Use a single logger for this section and everything within it, rather than a logger for
+        each node. Each node keeps the logger it first uses, so this should be called before
+        anything in the section logs a message, normally straight after the register model is
+        built
+
+        Args:
+            logger: logger to use, if this is not provided the logger of the section is used
+        """
+        if logger is None:
+            logger = logging.getLogger(self._logger_handle)
+        if not isinstance(logger, logging.Logger):
+            raise TypeError(f'logger should be a Logger but got {type(logger)}')
+        self.__shared_logger = logger
+
+    def _child_at(self, address: int) -> Optional[Union[Node, NodeArray]]:
+        if self.__address_index is None:
+            self.__address_index = AddressIndex(self.get_children(unroll=False))
+        return self.__address_index.node_at(address)
+
+    def node_at(self, address: int) -> Optional[Node]:
+        """
+        Find the register which occupies an address, for example to decode an address from a
+        bus trace. Any arrays on the way down are resolved from their address and stride, so
+        the lookup does not depend on the number of elements in them
+
+        Args:
+            address: address to look up, this can be any address within the register
+
+        Returns:
+            The register which occupies the address, if the address is within a memory but not
+            one of its registers, the memory is returned. None is returned if nothing occupies
+            the address
+
+        Raises:
+            TypeError: if the address is not an int
+        """
+        if not isinstance(address, int):
+            raise TypeError(f'address should be an int, got {type(address)}')
+        if not self.address <= address < self.address + self.size:
+            return None
+
+        node: Node = self
+        while True:
+            # pylint: disable=protected-access
+            child = node._child_at(address)
+            if isinstance(child, NodeArray):
+                child = child._element_at(address)
+            # pylint: enable=protected-access
+            if child is None:
+                # an address in a gap between the children of a section is not occupied,
+                # whereas the remainder of a memory is occupied by the memory itself
+                return None if isinstance(node, BaseSection) else node
+            node = child
+
+    def field_at(self, address: int, bit: int) -> Optional[Field]:
+        """
+        Find the field which occupies a bit of the register at an address
+
+        Args:
+            address: address to look up, this can be any address within the register
+            bit: bit position within the register, counted from the least significant bit of
+                 the register
+
+        Returns:
+            The field or None if the address is not occupied by a register or the bit is not
+            occupied by a field
+
+        Raises:
+            TypeError: if the address or bit is not an int
+            ValueError: if the bit is outside the register at the address
+        """
+        if not isinstance(bit, int):
+            raise TypeError(f'bit should be an int, got {type(bit)}')
+        node = self.node_at(address)
+        if node is None:
+            return None
+        # pylint: disable-next=protected-access
+        return node._field_at(bit)
+
+    def diff(self, snapshot_a: RegisterSnapshot,
+             snapshot_b: RegisterSnapshot) -> list[RegisterDifference]:
+        """
+        Compare two snapshots, for example a golden state with the state observed in a test.
+        The snapshots are compared in bulk (see :meth:`RegisterSnapshot.diff`), then only the
+        words which differ are decoded into the register at the address and its fields, so the
+        comparison of a large device does not read or decode every field.
+
+        Args:
+            snapshot_a: first snapshot, e.g. the golden state
+            snapshot_b: second snapshot, e.g. the observed state
+
+        Returns:
+            The words which differ, in address order. The field values are the raw values,
+            enumerated fields are not converted to their enumeration.
+        """
+        if not isinstance(snapshot_a, RegisterSnapshot):
+            raise TypeError(f'snapshot_a should be a RegisterSnapshot, got {type(snapshot_a)}')
+
+        differences: list[RegisterDifference] = []
+        for address, width, value_a, value_b in snapshot_a.diff(snapshot_b):
+            node = self.node_at(address)
+            fields: dict[str, tuple[Optional[int], Optional[int]]] = {}
+            if node is not None:
+                # pylint: disable=protected-access
+                fields_a = {} if value_a is None else node._decode_fields(value_a)
+                fields_b = {} if value_b is None else node._decode_fields(value_b)
+                # pylint: enable=protected-access
+                for field_name in fields_a or fields_b:
+                    field_values = (fields_a.get(field_name), fields_b.get(field_name))
+                    if field_values[0] != field_values[1]:
+                        fields[field_name] = field_values
+            differences.append(RegisterDifference(
+                address=address, width=width, values=(value_a, value_b),
+                node_name=None if node is None else node.full_inst_name, fields=fields))
+        return differences
+
+    def find(self, path: str) -> Base:
+        """
+        Find a node, array or field from its hierarchical systemRDL name, the result is cached
+        so repeated lookups of the same path are a single dictionary lookup
+
+        Args:
+            path: either the full instance name as given by ``full_inst_name``, for example
+                  ``top.blk[3].reg.field`` or a path relative to this section, for example
+                  ``blk[3].reg.field``. Elements of multidimensional arrays are given with all
+                  the indices e.g. ``reg[1][2]``
+
+        Returns:
+            The node, array or field
+
+        Raises:
+            ValueError: if the path is not valid
+            KeyError: if a name in the path does not exist
+            IndexError: if an array index is out of range
+        """
+        if not isinstance(path, str):
+            raise TypeError(f'path should be a str, got {type(path)}')
+
+        found = self.__path_cache.get(path)
+        if found is None:
+            if path == self.full_inst_name:
+                found = self
+            elif path.startswith(self.full_inst_name + '.'):
+                found = self.__resolve_path(path[len(self.full_inst_name) + 1:])
+            else:
+                found = self.__resolve_path(path)
+            self.__path_cache[path] = found
+        return found
+
+    def __resolve_path(self, path: str) -> Base:
+        node: Base = self
+        for segment in path.split('.'):
+            match = _PATH_SEGMENT.fullmatch(segment)
+            if match is None:
+                raise ValueError(f'{segment!r} is not a valid segment of a path in {path!r}')
+            if isinstance(node, NodeArray):
+                raise ValueError(f'{node.full_inst_name} is an array, an index is needed')
+            if not isinstance(node, Node):
+                raise KeyError(f'{node.full_inst_name} has no children')
+            try:
+                node = node.get_child_by_system_rdl_name(match.group('name'))
+            except KeyError:
+                raise KeyError(f'{match.group("name")} is not a child of '
+                               f'{node.full_inst_name}') from None
+
+            if match.group('indices'):
+                if not isinstance(node, NodeArray):
+                    raise ValueError(f'{node.full_inst_name} is not an array')
+                indices = tuple(int(index) for index in
+                                match.group('indices')[1:-1].split(']['))
+                node = node[indices[0]] if len(indices) == 1 else node[indices]
+        return node
 
     @abstractmethod
     def get_children(self, unroll: bool = False) -> Iterator[Union[Node, NodeArray]]:
@@ -527,6 +1123,54 @@ class Section(BaseSection, ABC):
             unroll: Whether to unroll child array or not
         """
 
+    @abstractmethod
+    def get_sections(self, unroll: bool = False) -> \
+            Iterator[Union[AddressMap, RegFile, AddressMapArray, RegFileArray]]:
+        """
+        generator that produces all the AddressMap and RegFile children of this node
+
+        Args:
+            unroll: Whether to unroll child array or not
+
+        Returns:
+
+        """
+
+    def _get_all_registers(self) -> Iterator[Reg]:
+        """
+        generator that produces every register in this section and all the sections within it,
+        with all the arrays unrolled. Registers within memories are not included.
+        """
+        # the unrolled generators do not produce arrays
+        yield from cast(Iterator['Reg'], self.get_registers(unroll=True))
+        for section in self.get_sections(unroll=True):
+            # pylint: disable-next=protected-access
+            yield from cast(Section, section)._get_all_registers()
+
+
+def _reset_differences(registers: Sequence[Union[Reg, AsyncReg]],
+                       values: Sequence[int]) -> list[RegisterDifference]:
+    """
+    Compare the value read from each register with its reset value, using the reset mask
+    so only the fields with a known reset value are checked
+    """
+    differences: list[RegisterDifference] = []
+    for register, value in zip(registers, values):
+        reset_value = register.reset_value
+        difference = (value ^ reset_value) & register.reset_mask
+        if difference == 0:
+            continue
+        # pylint: disable=protected-access
+        fields: dict[str, tuple[Optional[int], Optional[int]]] = {
+            field.inst_name: (field._size_props.decode(reset_value),
+                              field._size_props.decode(value))
+            for field in register.fields if field.bitmask & difference}
+        # pylint: enable=protected-access
+        differences.append(RegisterDifference(
+            address=register.address, width=register.width, values=(reset_value, value),
+            node_name=register.full_inst_name, fields=fields))
+    return differences
+
 
 class AddressMap(Section, ABC):
     """
@@ -536,7 +1180,7 @@ class AddressMap(Section, ABC):
         It is not expected that this class will be instantiated under normal
         circumstances however, it is useful for type checking
     """
-    __slots__: list[str] = ['__callbacks']
+    __slots__: list[str] = ['__callbacks', '__shadow_cache']
 
     def __init__(self, *,
                  callbacks: Optional[Union[NormalCallbackSet, NormalCallbackSetLegacy]],
@@ -545,16 +1189,12 @@ class AddressMap(Section, ABC):
                  inst_name: str,
                  parent: Optional['AddressMap']):
 
+        self.__shadow_cache: Optional[ShadowCache] = None
+
         # only the top-level address map should have callbacks assigned, everything else should
         # use its parent callback
         if parent is None:
-            if not isinstance(callbacks, (NormalCallbackSet, NormalCallbackSetLegacy)):
-                raise TypeError(f'callback type wrong, got {type(callbacks)}')
-            if isinstance(callbacks, NormalCallbackSetLegacy):
-                warnings.warn('Support for the legacy callback using the array types will be '
-                              'withdrawn in the future, please consider changing to the list '
-                              'versions', category=DeprecationWarning)
-            self.__callbacks = callbacks
+            self.__callbacks = self.__check_callbacks(callbacks)
         else:
             if not callbacks is None:
                 raise RuntimeError('Callbacks must be None when a parent is set')
@@ -597,9 +1237,230 @@ class AddressMap(Section, ABC):
                      self.get_sections(unroll=unroll),
                      self.get_memories(unroll=unroll))
 
-    @property
-    def _callbacks(self) -> Union[NormalCallbackSet, NormalCallbackSetLegacy]:
+    @contextmanager
+    def batch(self) -> Generator[Self]:
+        """
+        Context manager to group the register accesses made within it into a single transaction,
+        this requires the address map to have been built with a ``BatchCallbackSet``.
+
+        Within the context manager, register writes are queued and reads can be queued using
+        ``read_deferred`` which returns a future holding the value. The queued operations are
+        issued when the outermost context manager exits. If an exception occurs within the
+        context manager, the operations it queued are discarded; in a nested batch the operations
+        queued by the enclosing batch are kept. Operations which have already been issued, for
+        example by a read that needed its value immediately, can not be withdrawn.
+        """
+        callbacks = self._callbacks
+        if not isinstance(callbacks, BatchCallbackSet):
+            raise TypeError(f'batched access requires a BatchCallbackSet, got {type(callbacks)}')
+
+        # pylint: disable=protected-access
+        callbacks._open_batch()
+        try:
+            yield self
+        except BaseException:
+            callbacks._close_batch(flush=False)
+            raise
+        callbacks._close_batch(flush=True)
+
+    @contextmanager
+    def cached(self, policy: CachePolicy = CachePolicy.WRITE_BACK) -> Generator[Self]:
+        """
+        Context manager to access the address map through a shadow cache of the registers.
+
+        Every register within the address map which does not have a volatile (hardware
+        writable) field or a field with an access side effect is shadowed, so each is only read
+        from the hardware once. In write-back mode, writes to these registers are held and
+        repeated writes to the same register are collapsed. The held writes are issued in
+        address order when the context manager exits, with contiguous registers written in a
+        single block operation if the callbacks support it. If an exception occurs within the
+        context manager, the held writes are discarded.
+
+        Any access to a register with a volatile field, a field with a read or write side
+        effect (for example rclr or singlepulse) or any other address which is not cached is
+        always made to the hardware, after issuing any held writes.
+
+        Args:
+            policy: write policy for the cache
+        """
+        if self.__shadow_cache is not None:
+            raise RuntimeError('The address map is already being accessed through a cache')
+
+        cacheable: dict[int, tuple[int, int]] = {}
+        for register in self._get_all_registers():
+            if not any(field.is_volatile or field.has_read_side_effect or
+                       field.has_write_side_effect for field in register.fields):
+                cacheable[register.address] = (register.width, register.accesswidth)
+
+        shadow_cache = ShadowCache(callbacks=self._callbacks, policy=policy, cacheable=cacheable)
+        self.__shadow_cache = shadow_cache
+        self._callback_binding.active_shadow_caches += 1
+        self._invalidate_callbacks()
+        # this try/finally is needed to make sure that in the event of an exception
+        # the cache is removed
+        try:
+            yield self
+        finally:
+            self.__shadow_cache = None
+            self._callback_binding.active_shadow_caches -= 1
+            self._invalidate_callbacks()
+        shadow_cache.flush()
+
+    def _get_all_memories(self) -> Iterator[Memory]:
+        """
+        generator that produces every memory in this address map and all the address maps
+        within it, with all the arrays unrolled
+        """
+        # the unrolled generators do not produce arrays
+        yield from cast(Iterator['Memory'], self.get_memories(unroll=True))
+        for section in self.get_sections(unroll=True):
+            if isinstance(section, AddressMap):
+                # pylint: disable-next=protected-access
+                yield from section._get_all_memories()
+
+    def __access_items(self, writable: bool) -> list[tuple[int, int, int, int]]:
+        """
+        address, width, accesswidth and number of words of every readable (or writable)
+        register and memory in the address map
+        """
+        # pylint: disable=protected-access
+        items = [(register.address, register.width, register.accesswidth, 1)
+                 for register in self._get_all_registers()
+                 if (register._is_writeable if writable else register._is_readable)]
+        # the memories are accessed with their width as the accesswidth
+        items += [(memory.address, memory.width, memory.width, memory.entries)
+                  for memory in self._get_all_memories()
+                  if (memory._is_writeable if writable else memory._is_readable)]
+        # pylint: enable=protected-access
+        return items
+
+    def snapshot(self) -> RegisterSnapshot:
+        """
+        Read the state of every readable register and memory in the address map (including
+        those in the sections within it).
+
+        The registers and memories are grouped into runs of contiguous addresses, each run is
+        read with the block read callback (split into bursts if the callbacks have a maximum
+        burst length) so a large device is captured in a small number of operations. Take care
+        with registers where a read has a side effect, as every readable register is read.
+
+        Returns:
+            The state, which can be written back with :meth:`restore` or saved with
+            :meth:`RegisterSnapshot.to_bytes`
+        """
+        callbacks = self._callbacks
+        return RegisterSnapshot(
+            (address, width, accesswidth,
+             read_run(callbacks, addr=address, width=width, accesswidth=accesswidth,
+                      length=length))
+            for address, width, accesswidth, length in coalesce_runs(
+                self.__access_items(writable=False)))
+
+    def restore(self, snapshot: RegisterSnapshot) -> None:
+        """
+        Write the state from a snapshot back to every writable register and memory in the
+        address map, grouped into runs of contiguous addresses in the same way as
+        :meth:`snapshot`. The snapshot holds absolute addresses, any register or memory
+        which is not in the snapshot is left untouched.
+
+        Args:
+            snapshot: state made by :meth:`snapshot`
+        """
+        if not isinstance(snapshot, RegisterSnapshot):
+            raise TypeError(f'snapshot should be a RegisterSnapshot, got {type(snapshot)}')
+
+        callbacks = self._callbacks
+        for address, width, accesswidth, length in coalesce_runs(
+                item for item in self.__access_items(writable=True)
+                if snapshot.values(address=item[0], width=item[1], length=item[3]) is not None):
+            write_run(callbacks, addr=address, width=width, accesswidth=accesswidth,
+                      data=cast(list[int], snapshot.values(address=address, width=width,
+                                                           length=length)))
+
+    def __reset_registers(self) -> list[Reg]:
+        """
+        every readable register in the address map with at least one field with a known
+        reset value and no fields where a read has a side effect, in address order
+        """
+        registers = [register for register in self._get_all_registers()
+                     # pylint: disable-next=protected-access
+                     if register._is_readable and register.reset_mask != 0 and
+                     not any(field.has_read_side_effect for field in register.fields)]
+        return sorted(registers, key=lambda register: register.address)
+
+    def verify_reset(self) -> list[RegisterDifference]:
+        """
+        Check every readable register in the address map (including those in
+        the sections within it) is at its reset value.
+
+        The registers are grouped into runs of contiguous addresses which are read with the
+        block read callback in the same way as :meth:`snapshot`, then each register is checked
+        with a single masked compare against the ``reset_value`` and ``reset_mask``
+        precomputed by the exporter. Volatile fields and fields without a known reset value
+        are not checked, a register with none to check is not read. Registers with a field
+        where a read has a side effect (e.g. rclr or rset) are not read, so that checking the
+        reset does not change the state of the device. Take care with any other reads that
+        have a side effect on the hardware, as every other register with a reset value is read.
+
+        Returns:
+            The registers which are not at reset, in address order. The reset value is given
+            as ``value_a`` and the value read as ``value_b``, the fields are those checked
+            which are not at reset.
+        """
+        registers = self.__reset_registers()
+        callbacks = self._callbacks
+        values = [value for address, width, accesswidth, length in coalesce_runs(
+                      (register.address, register.width, register.accesswidth, 1)
+                      for register in registers)
+                  for value in read_run(callbacks, addr=address, width=width,
+                                        accesswidth=accesswidth, length=length)]
+        return _reset_differences(registers, values)
+
+    def rebind_callbacks(self,
+                         callbacks: Union[NormalCallbackSet, NormalCallbackSetLegacy]) -> None:
+        """
+        Replace the callbacks used to access the hardware, for example to change the
+        transport, without rebuilding the register model. This can only be done on the top
+        level address map and the new callbacks are used by everything within it.
+
+        This can not be used within any of the context managers which access the registers
+        in a different way, i.e. :meth:`batch` or :meth:`cached` on this or any address map
+        within it.
+
+        Args:
+            callbacks: callbacks to use from now on
+
+        Raises:
+            RuntimeError: if the address map is not the top level, any part of it is being
+                accessed through a shadow cache or a batch is open
+            TypeError: if the callbacks are not of a supported type
+        """
+        if self.parent is not None:
+            raise RuntimeError('Callbacks can only be rebound on the top level address map')
+        if self._callback_binding.active_shadow_caches > 0:
+            raise RuntimeError('Callbacks can not be rebound while the address map is being '
+                               'accessed through a cache')
+        if isinstance(self.__callbacks, BatchCallbackSet) and self.__callbacks.batch_active:
+            raise RuntimeError('Callbacks can not be rebound while a batch is open')
+        self.__callbacks = self.__check_callbacks(callbacks)
+        self._invalidate_callbacks()
+
+    @staticmethod
+    def __check_callbacks(callbacks: Optional[Union[NormalCallbackSet, NormalCallbackSetLegacy]]
+                          ) -> Union[NormalCallbackSet, NormalCallbackSetLegacy]:
+        if not isinstance(callbacks, (NormalCallbackSet, NormalCallbackSetLegacy)):
+            raise TypeError(f'callback type wrong, got {type(callbacks)}')
+        if isinstance(callbacks, NormalCallbackSetLegacy):
+            warnings.warn('Support for the legacy callback using the array types will be '
+                          'withdrawn in the future, please consider changing to the list '
+                          'versions', category=DeprecationWarning)
+        return callbacks
+
+    def _resolve_callbacks(self) -> Union[NormalCallbackSet, NormalCallbackSetLegacy]:
         # pylint: disable=protected-access
+        if self.__shadow_cache is not None:
+            return self.__shadow_cache.callbacks
+
         if self.parent is None:
             return self.__callbacks
 
@@ -608,6 +1469,11 @@ class AddressMap(Section, ABC):
 
         raise TypeError(f'unhandled parent callback type: {type(self.parent._callbacks)}')
 
+    @property
+    def _callbacks(self) -> Union[NormalCallbackSet, NormalCallbackSetLegacy]:
+        # This cast is OK because the type is checked when the callbacks are resolved
+        return cast(Union[NormalCallbackSet, NormalCallbackSetLegacy], self._cached_callbacks())
+
 
 class AsyncSection(BaseSection, ABC):
     """
@@ -660,6 +1526,85 @@ class AsyncSection(BaseSection, ABC):
             unroll: Whether to unroll child array or not
         """
 
+    @abstractmethod
+    def get_sections(self, unroll: bool = False) -> \
+            Iterator[Union[AsyncAddressMap, AsyncRegFile, AsyncAddressMapArray,
+                           AsyncRegFileArray]]:
+        """
+        generator that produces all the AddressMap and RegFile children of this node
+
+        Args:
+            unroll: Whether to unroll child array or not
+
+        Returns:
+
+        """
+
+    def _get_all_registers(self) -> Iterator[AsyncReg]:
+        """
+        generator that produces every register in this section and all the sections within it,
+        with all the arrays unrolled. Registers within memories are not included.
+        """
+        # the unrolled generators do not produce arrays
+        yield from cast(Iterator['AsyncReg'], self.get_registers(unroll=True))
+        for section in self.get_sections(unroll=True):
+            # pylint: disable-next=protected-access
+            yield from cast(AsyncSection, section)._get_all_registers()
+
+    async def read_all(self, concurrency: int = 1) -> dict[str, int]:
+        """
+        Asynchronously read every readable register in this section and all the sections within
+        it, with up to ``concurrency`` register reads in progress at once. This allows the
+        latency of a remote connection to be overlapped. Registers within memories are not
+        included.
+
+        Args:
+            concurrency: maximum number of register reads in progress at once
+
+        Returns:
+            register values keyed by the full instance name of the register
+        """
+        # pylint: disable=protected-access
+        registers = [cast('ReadableAsyncRegister', register)
+                     for register in self._get_all_registers() if register._is_readable]
+        # pylint: enable=protected-access
+        values = await gather_with_concurrency([register.read for register in registers],
+                                               concurrency=concurrency)
+        return {register.full_inst_name: value for register, value in zip(registers, values)}
+
+    async def write_all(self, data: dict[str, int], concurrency: int = 1) -> None:
+        """
+        Asynchronously write a set of registers in this section (and the sections within it),
+        with up to ``concurrency`` register writes in progress at once. The order of the writes
+        is not guaranteed, so this should not be used where the hardware is sensitive to it.
+
+        Args:
+            data: register values keyed by the full instance name of the register, in the same
+                  form as returned by :meth:`read_all`
+            concurrency: maximum number of register writes in progress at once
+        """
+        if not isinstance(data, dict):
+            raise TypeError(f'data should be a dict, got {type(data)}')
+
+        # pylint: disable=protected-access
+        registers = {register.full_inst_name: cast('WritableAsyncRegister', register)
+                     for register in self._get_all_registers() if register._is_writeable}
+        # pylint: enable=protected-access
+
+        # check all the register names before any writes are started
+        for register_name, register_value in data.items():
+            if register_name not in registers:
+                raise ValueError(f'{register_name} is not a writable register in '
+                                 f'{self.full_inst_name}')
+            if not isinstance(register_value, int):
+                raise TypeError(f'value for {register_name} should be an int, '
+                                f'got {type(register_value)}')
+
+        await gather_with_concurrency(
+            [partial(registers[register_name].write, data=register_value)
+             for register_name, register_value in data.items()],
+            concurrency=concurrency)
+
     @property
     @abstractmethod
     def _callbacks(self) -> Union[AsyncCallbackSet, AsyncCallbackSetLegacy]:
@@ -687,13 +1632,7 @@ class AsyncAddressMap(AsyncSection, ABC):
         # only the top-level address map should have callbacks assigned, everything else should
         # use its parent callback
         if parent is None:
-            if not isinstance(callbacks, (AsyncCallbackSet, AsyncCallbackSetLegacy)):
-                raise TypeError(f'callback type wrong, got {type(callbacks)}')
-            if isinstance(callbacks, AsyncCallbackSetLegacy):
-                warnings.warn('Support for the legacy callback using the array types will be '
-                              'withdrawn in the future, please consider changing to the list '
-                              'versions', category=DeprecationWarning)
-            self.__callbacks = callbacks
+            self.__callbacks = self.__check_callbacks(callbacks)
         else:
             if not callbacks is None:
                 raise RuntimeError('Callbacks must be None when a parent is set')
@@ -732,8 +1671,39 @@ class AsyncAddressMap(AsyncSection, ABC):
 
         """
 
-    @property
-    def _callbacks(self) -> Union[AsyncCallbackSet, AsyncCallbackSetLegacy]:
+    def rebind_callbacks(self,
+                         callbacks: Union[AsyncCallbackSet, AsyncCallbackSetLegacy]) -> None:
+        """
+        Replace the callbacks used to access the hardware, for example to change the
+        transport, without rebuilding the register model. This can only be done on the top
+        level address map and the new callbacks are used by everything within it.
+
+        This should not be used while any accesses to the registers are in progress.
+
+        Args:
+            callbacks: callbacks to use from now on
+
+        Raises:
+            RuntimeError: if the address map is not the top level
+            TypeError: if the callbacks are not of a supported type
+        """
+        if self.parent is not None:
+            raise RuntimeError('Callbacks can only be rebound on the top level address map')
+        self.__callbacks = self.__check_callbacks(callbacks)
+        self._invalidate_callbacks()
+
+    @staticmethod
+    def __check_callbacks(callbacks: Optional[Union[AsyncCallbackSet, AsyncCallbackSetLegacy]]
+                          ) -> Union[AsyncCallbackSet, AsyncCallbackSetLegacy]:
+        if not isinstance(callbacks, (AsyncCallbackSet, AsyncCallbackSetLegacy)):
+            raise TypeError(f'callback type wrong, got {type(callbacks)}')
+        if isinstance(callbacks, AsyncCallbackSetLegacy):
+            warnings.warn('Support for the legacy callback using the array types will be '
+                          'withdrawn in the future, please consider changing to the list '
+                          'versions', category=DeprecationWarning)
+        return callbacks
+
+    def _resolve_callbacks(self) -> Union[AsyncCallbackSet, AsyncCallbackSetLegacy]:
         # pylint: disable=protected-access
         if self.parent is None:
             return self.__callbacks
@@ -743,10 +1713,128 @@ class AsyncAddressMap(AsyncSection, ABC):
 
         raise TypeError(f'unhandled parent callback type: {type(self.parent._callbacks)}')
 
+    @property
+    def _callbacks(self) -> Union[AsyncCallbackSet, AsyncCallbackSetLegacy]:
+        # This cast is OK because the type is checked when the callbacks are resolved
+        return cast(Union[AsyncCallbackSet, AsyncCallbackSetLegacy], self._cached_callbacks())
+
     def get_children(self, unroll: bool = False) -> Iterator[Union[Node, NodeArray]]:
         return chain(self.get_registers(unroll=unroll), self.get_sections(unroll=unroll),
                      self.get_memories(unroll=unroll))
 
+    def _get_all_memories(self) -> Iterator[AsyncMemory]:
+        """
+        generator that produces every memory in this address map and all the address maps
+        within it, with all the arrays unrolled
+        """
+        # the unrolled generators do not produce arrays
+        yield from cast(Iterator['AsyncMemory'], self.get_memories(unroll=True))
+        for section in self.get_sections(unroll=True):
+            if isinstance(section, AsyncAddressMap):
+                # pylint: disable-next=protected-access
+                yield from section._get_all_memories()
+
+    def __access_items(self, writable: bool) -> list[tuple[int, int, int, int]]:
+        """
+        address, width, accesswidth and number of words of every readable (or writable)
+        register and memory in the address map
+        """
+        # pylint: disable=protected-access
+        items = [(register.address, register.width, register.accesswidth, 1)
+                 for register in self._get_all_registers()
+                 if (register._is_writeable if writable else register._is_readable)]
+        # the memories are accessed with their width as the accesswidth
+        items += [(memory.address, memory.width, memory.width, memory.entries)
+                  for memory in self._get_all_memories()
+                  if (memory._is_writeable if writable else memory._is_readable)]
+        # pylint: enable=protected-access
+        return items
+
+    async def snapshot(self) -> RegisterSnapshot:
+        """
+        Asynchronously read the state of every readable register and memory in the address map
+        (including those in the sections within it).
+
+        The registers and memories are grouped into runs of contiguous addresses, each run is
+        read with the block read callback (split into bursts if the callbacks have a maximum
+        burst length, with up to the callbacks maximum bursts in flight at once). Take care
+        with registers where a read has a side effect, as every readable register is read.
+
+        Returns:
+            The state, which can be written back with :meth:`restore` or saved with
+            :meth:`RegisterSnapshot.to_bytes`
+        """
+        callbacks = self._callbacks
+        runs: list[tuple[int, int, int, list[int]]] = []
+        for address, width, accesswidth, length in coalesce_runs(
+                self.__access_items(writable=False)):
+            runs.append((address, width, accesswidth,
+                         await async_read_run(callbacks, addr=address, width=width,
+                                              accesswidth=accesswidth, length=length)))
+        return RegisterSnapshot(runs)
+
+    async def restore(self, snapshot: RegisterSnapshot) -> None:
+        """
+        Asynchronously write the state from a snapshot back to every writable register and
+        memory in the address map, grouped into runs of contiguous addresses in the same way as
+        :meth:`snapshot`. The snapshot holds absolute addresses, any register or memory
+        which is not in the snapshot is left untouched.
+
+        Args:
+            snapshot: state made by :meth:`snapshot`
+        """
+        if not isinstance(snapshot, RegisterSnapshot):
+            raise TypeError(f'snapshot should be a RegisterSnapshot, got {type(snapshot)}')
+
+        callbacks = self._callbacks
+        for address, width, accesswidth, length in coalesce_runs(
+                item for item in self.__access_items(writable=True)
+                if snapshot.values(address=item[0], width=item[1], length=item[3]) is not None):
+            await async_write_run(callbacks, addr=address, width=width, accesswidth=accesswidth,
+                                  data=cast(list[int], snapshot.values(address=address,
+                                                                       width=width,
+                                                                       length=length)))
+
+    def __reset_registers(self) -> list[AsyncReg]:
+        """
+        every readable register in the address map with at least one field with a known
+        reset value and no fields where a read has a side effect, in address order
+        """
+        registers = [register for register in self._get_all_registers()
+                     # pylint: disable-next=protected-access
+                     if register._is_readable and register.reset_mask != 0 and
+                     not any(field.has_read_side_effect for field in register.fields)]
+        return sorted(registers, key=lambda register: register.address)
+
+    async def verify_reset(self) -> list[RegisterDifference]:
+        """
+        Asynchronously check every readable register in the address map (including those in
+        the sections within it) is at its reset value.
+
+        The registers are grouped into runs of contiguous addresses which are read with the
+        block read callback in the same way as :meth:`snapshot`, then each register is checked
+        with a single masked compare against the ``reset_value`` and ``reset_mask``
+        precomputed by the exporter. Volatile fields and fields without a known reset value
+        are not checked, a register with none to check is not read. Registers with a field
+        where a read has a side effect (e.g. rclr or rset) are not read, so that checking the
+        reset does not change the state of the device. Take care with any other reads that
+        have a side effect on the hardware, as every other register with a reset value is read.
+
+        Returns:
+            The registers which are not at reset, in address order. The reset value is given
+            as ``value_a`` and the value read as ``value_b``, the fields are those checked
+            which are not at reset.
+        """
+        registers = self.__reset_registers()
+        callbacks = self._callbacks
+        values: list[int] = []
+        for address, width, accesswidth, length in coalesce_runs(
+                (register.address, register.width, register.accesswidth, 1)
+                for register in registers):
+            values += await async_read_run(callbacks, addr=address, width=width,
+                                           accesswidth=accesswidth, length=length)
+        return _reset_differences(registers, values)
+
 
 class AddressMapArray(NodeArray, ABC):
     """
@@ -821,8 +1909,7 @@ class RegFile(Section, ABC):
 
         """
 
-    @property
-    def _callbacks(self) -> Union[NormalCallbackSet, NormalCallbackSetLegacy]:
+    def _resolve_callbacks(self) -> Union[NormalCallbackSet, NormalCallbackSetLegacy]:
         # pylint: disable=protected-access
         if self.parent is None:
             raise RuntimeError('Parent must be set')
@@ -832,6 +1919,11 @@ class RegFile(Section, ABC):
 
         raise TypeError(f'unhandled parent callback type: {type(self.parent._callbacks)}')
 
+    @property
+    def _callbacks(self) -> Union[NormalCallbackSet, NormalCallbackSetLegacy]:
+        # This cast is OK because the type is checked when the callbacks are resolved
+        return cast(Union[NormalCallbackSet, NormalCallbackSetLegacy], self._cached_callbacks())
+
     def get_children(self, unroll: bool = False) -> Iterator[Union[Node, NodeArray]]:
         return chain(self.get_registers(unroll=unroll), self.get_sections(unroll=unroll))
 
@@ -876,8 +1968,7 @@ class AsyncRegFile(AsyncSection, ABC):
     def get_children(self, unroll: bool = False) -> Iterator[Union[Node, NodeArray]]:
         return chain(self.get_registers(unroll=unroll), self.get_sections(unroll=unroll))
 
-    @property
-    def _callbacks(self) -> Union[AsyncCallbackSet, AsyncCallbackSetLegacy]:
+    def _resolve_callbacks(self) -> Union[AsyncCallbackSet, AsyncCallbackSetLegacy]:
         # pylint: disable=protected-access
         if self.parent is None:
             raise RuntimeError('Parent must be set')
@@ -887,6 +1978,11 @@ class AsyncRegFile(AsyncSection, ABC):
 
         raise TypeError(f'unhandled parent callback type: {type(self.parent._callbacks)}')
 
+    @property
+    def _callbacks(self) -> Union[AsyncCallbackSet, AsyncCallbackSetLegacy]:
+        # This cast is OK because the type is checked when the callbacks are resolved
+        return cast(Union[AsyncCallbackSet, AsyncCallbackSetLegacy], self._cached_callbacks())
+
 
 class RegFileArray(NodeArray, ABC):
     """
@@ -21,6 +21,7 @@ fields
 """
 from enum import EnumMeta
 from typing import cast, Optional
+from collections.abc import Iterable
 from abc import ABC, abstractmethod
 
 from .base import Base
@@ -28,11 +29,20 @@ from .utility_functions import swap_msb_lsb_ordering
 from .base_register import BaseReg
 
 
+# pylint: disable-next=too-many-instance-attributes
 class FieldSizeProps:
     """
     class to hold the key attributes of a field
+
+    The mask, shift and (for msb0 fields) bit reversal needed to encode and decode the field
+    are precomputed when the object is constructed, so that they do not need to be worked out
+    on every access
     """
-    __slots__ = ['__msb', '__lsb', '__width', '__high', '__low']
+    __slots__ = ['__msb', '__lsb', '__width', '__high', '__low',
+                 '__bitmask', '__max_value', '__msb0', '__reverse_table']
+
+    # fields up to this width have their bit reversal held in a lookup table
+    _REVERSE_TABLE_MAX_WIDTH = 8
 
     # pylint: disable-next=too-many-arguments
     def __init__(self, *, width: int, msb: int, lsb: int, high: int, low: int):
@@ -52,6 +62,16 @@ class FieldSizeProps:
         if self.lsb < 0:
             raise ValueError('field low bit position cannot be less than zero')
 
+        self.__max_value = (1 << width) - 1
+        self.__bitmask = self.__max_value << low
+        self.__msb0 = not ((msb == high) and (lsb == low))
+        self.__reverse_table: Optional[tuple[int, ...]]
+        if self.__msb0 and width <= self._REVERSE_TABLE_MAX_WIDTH:
+            self.__reverse_table = tuple(swap_msb_lsb_ordering(width=width, value=value)
+                                         for value in range(1 << width))
+        else:
+            self.__reverse_table = None
+
     @property
     def lsb(self) -> int:
         """
@@ -92,7 +112,7 @@ class FieldSizeProps:
         * 32-bit field returns 0xFFFF_FFFF (4294967295)
 
         """
-        return (2 ** self.width) - 1
+        return self.__max_value
 
     @property
     def high(self) -> int:
@@ -116,17 +136,110 @@ class FieldSizeProps:
         """
         return self.__low
 
+    @property
+    def bitmask(self) -> int:
+        """
+        The bit mask needed to extract the field from its register
+        """
+        return self.__bitmask
+
+    @property
+    def msb0(self) -> bool:
+        """
+        True if the field is defined with its most significant bit in the lowest bit position
+        """
+        return self.__msb0
+
+    def decode(self, reg_value: int) -> int:
+        """
+        Extract the field value from a register value, no checks are made on the register
+        value so this should only be used with values that are known to be legal
+
+        Args:
+            reg_value: register value
+
+        Returns:
+            field value
+        """
+        value = (reg_value & self.__bitmask) >> self.__low
+        if not self.__msb0:
+            return value
+        if self.__reverse_table is not None:
+            return self.__reverse_table[value]
+        return swap_msb_lsb_ordering(width=self.__width, value=value)
+
+    def decode_column(self, reg_values: Iterable[int]) -> list[int]:
+        """
+        Extract the field value from each of a sequence of register values, no checks are made
+        on the register values
+
+        Args:
+            reg_values: register values
+
+        Returns:
+            field values
+        """
+        bitmask = self.__bitmask
+        low = self.__low
+        if not self.__msb0:
+            return [(reg_value & bitmask) >> low for reg_value in reg_values]
+        if self.__reverse_table is not None:
+            reverse_table = self.__reverse_table
+            return [reverse_table[(reg_value & bitmask) >> low] for reg_value in reg_values]
+        return [self.decode(reg_value) for reg_value in reg_values]
+
+    def encode(self, value: int) -> int:
+        """
+        Position a field value in the register, no checks are made on the field value so this
+        should only be used with values that are known to be legal
+
+        Args:
+            value: field value
+
+        Returns:
+            value which can be applied to the register to update the field
+        """
+        if self.__msb0:
+            if self.__reverse_table is not None:
+                value = self.__reverse_table[value]
+            else:
+                value = swap_msb_lsb_ordering(width=self.__width, value=value)
+        return value << self.__low
+
+    def encode_column(self, values: Iterable[int]) -> list[int]:
+        """
+        Position each of a sequence of field values in the register, no checks are made on the
+        field values
+
+        Args:
+            values: field values
+
+        Returns:
+            values which can be applied to the register to update the field
+        """
+        low = self.__low
+        if not self.__msb0:
+            return [value << low for value in values]
+        if self.__reverse_table is not None:
+            reverse_table = self.__reverse_table
+            return [reverse_table[value] << low for value in values]
+        return [self.encode(value) for value in values]
+
 
 class FieldMiscProps:
     """
     Class to hold additional attributes of a field
     """
 
-    __slots__ = ['__default', '__is_volatile']
+    __slots__ = ['__default', '__is_volatile', '__has_read_side_effect',
+                 '__has_write_side_effect']
 
-    def __init__(self, default:Optional[int], is_volatile:bool):
+    def __init__(self, default:Optional[int], is_volatile:bool,
+                 has_read_side_effect: bool = False, has_write_side_effect: bool = False):
         self.__default = default
         self.__is_volatile = is_volatile
+        self.__has_read_side_effect = has_read_side_effect
+        self.__has_write_side_effect = has_write_side_effect
 
     @property
     def default(self) -> Optional[int]:
@@ -146,6 +259,22 @@ class FieldMiscProps:
         """
         return self.__is_volatile
 
+    @property
+    def has_read_side_effect(self) -> bool:
+        """
+        True if a software read changes the field, e.g. clear on read (rclr) or set on
+        read (rset)
+        """
+        return self.__has_read_side_effect
+
+    @property
+    def has_write_side_effect(self) -> bool:
+        """
+        True if a software write does more than store the value, e.g. write one to clear
+        (woclr) or a single pulse (singlepulse)
+        """
+        return self.__has_write_side_effect
+
 
 class Field(Base, ABC):
     """
@@ -157,7 +286,7 @@ class Field(Base, ABC):
     """
 
     __slots__ = ['__size_props', '__misc_props',
-                 '__bitmask', '__msb0', '__lsb0']
+                 '__msb0', '__lsb0', '__inverse_bitmask']
 
     def __init__(self, *,
                  parent_register: BaseReg, size_props: FieldSizeProps, misc_props: FieldMiscProps,
@@ -204,9 +333,7 @@ class Field(Base, ABC):
         else:
             raise ValueError('msb/lsb are inconsistent with low/high')
 
-        self.__bitmask = 0
-        for bit_position in range(self.low, self.high+1):
-            self.__bitmask |= (1 << bit_position)
+        self.__inverse_bitmask = self.__parent_register.max_value ^ self.bitmask
 
     @property
     def lsb(self) -> int:
@@ -248,7 +375,7 @@ class Field(Base, ABC):
         * 32-bit field returns 0xFFFF_FFFF (4294967295)
 
         """
-        return (2 ** self.width) - 1
+        return self.__size_props.max_value
 
     @property
     def high(self) -> int:
@@ -280,7 +407,7 @@ class Field(Base, ABC):
         For example a register field occupying bits 7 to 4 in a 16-bit register
         will have a bit mask of 0x00F0
         """
-        return self.__bitmask
+        return self.__size_props.bitmask
 
     @property
     def register_data_width(self) -> int:
@@ -298,7 +425,7 @@ class Field(Base, ABC):
         For example a register field occupying bits 7 to 4 in a 16-bit register
         will have a inverse bit mask of 0xFF0F
         """
-        return self.__parent_register.max_value ^ self.bitmask
+        return self.__inverse_bitmask
 
     @property
     def msb0(self) -> bool:
@@ -338,6 +465,40 @@ class Field(Base, ABC):
         """
         return self.__misc_props.is_volatile
 
+    @property
+    def has_read_side_effect(self) -> bool:
+        """
+        True if a software read changes the field, e.g. clear on read
+        """
+        return self.__misc_props.has_read_side_effect
+
+    @property
+    def has_write_side_effect(self) -> bool:
+        """
+        True if a software write does more than store the value, e.g. write one to clear
+        """
+        return self.__misc_props.has_write_side_effect
+
+    @property
+    def _size_props(self) -> FieldSizeProps:
+        """
+        size properties of the field, these include the precomputed encode and decode
+        """
+        return self.__size_props
+
+    @property
+    def _misc_props(self) -> FieldMiscProps:
+        """
+        miscellaneous properties of the field, unlike :attr:`default` the default of these is
+        always the integer reset value
+        """
+        return self.__misc_props
+
+    @property
+    def _is_readable(self) -> bool:
+        # overridden in the readable fields
+        return False
+
     @property
     def __parent_register(self) -> BaseReg:
         """
@@ -360,35 +521,37 @@ class _FieldReadOnlyFramework(Field, ABC):
     """
     __slots__ : list[str] = []
 
-    def decode_read_value(self, value: int) -> int:
+    def decode_read_value(self, value: int, *, checked: bool = True) -> int:
         """
         extracts the field value from a register value, by applying the bit
         mask and shift needed
 
         Args:
             value: value to decode, normally read from a register
+            checked: set to False to skip the checks on the value, this should only be used
+                     for values that are known to be legal, for example a register value that
+                     has already been checked
 
         Returns:
             field value
         """
-        if not isinstance(value, int):
-            raise TypeError(f'value must be an int but got {type(value)}')
+        if checked:
+            if not isinstance(value, int):
+                raise TypeError(f'value must be an int but got {type(value)}')
 
-        if value < 0:
-            raise ValueError('value to be decoded must be greater '
-                             'than or equal to 0')
+            if value < 0:
+                raise ValueError('value to be decoded must be greater '
+                                 'than or equal to 0')
 
-        if value > self.__parent_register.max_value:
-            raise ValueError(f'value to bede coded must be less than or equal '
-                             f'to {self.__parent_register.max_value:d}')
+            if value > self.__parent_register.max_value:
+                raise ValueError(f'value to bede coded must be less than or equal '
+                                 f'to {self.__parent_register.max_value:d}')
 
-        if self.msb0 is False:
-            return_value = (value & self.bitmask) >> self.low
-        else:
-            return_value = swap_msb_lsb_ordering(value=(value & self.bitmask) >> self.low,
-                                                 width=self.width)
+        return self._size_props.decode(value)
 
-        return return_value
+    @property
+    def _is_readable(self) -> bool:
+        return True
 
     @property
     def __parent_register(self) -> BaseReg:
@@ -430,26 +593,24 @@ class _FieldWriteOnlyFramework(Field, ABC):
             raise ValueError(f'value to be written to register must be less '
                              f'than or equal to {self.max_value:d}')
 
-    def encode_write_value(self, value: int) -> int:
+    def encode_write_value(self, value: int, *, checked: bool = True) -> int:
         """
         Check that a value is legal for the field and then encode it in preparation to be written
         to the register
 
         Args:
             value: field value
+            checked: set to False to skip the checks on the value, this should only be used
+                     for values that are known to be legal
 
         Returns:
             value which can be applied to the register to update the field
 
         """
-        self._write_value_checks(value=value)
-
-        if self.msb0 is False:
-            return_value = value << self.low
-        else:
-            return_value = swap_msb_lsb_ordering(value=value,  width=self.width) << self.low
+        if checked:
+            self._write_value_checks(value=value)
 
-        return return_value
+        return self._size_props.encode(value)
 
 
 class FieldEnum(Field, ABC):
@@ -19,7 +19,8 @@ This module is intended to distributed as part of automatically generated code b
 peakrdl-python tool. It provides a set of classes used by the autogenerated code to represent
 registers
 """
-from typing import Union, Optional, TypeVar
+from typing import Union, Optional, TypeVar, TYPE_CHECKING
+from collections.abc import Iterator, Mapping
 from abc import ABC, abstractmethod
 
 
@@ -28,6 +29,9 @@ from .utility_functions import legal_register_width
 from .base import AsyncAddressMap, AsyncRegFile
 from .memory import BaseMemory
 
+if TYPE_CHECKING:
+    from .base_field import Field
+
 
 class RegisterWriteVerifyError(Exception):
     """
@@ -44,7 +48,7 @@ class BaseReg(Node, ABC):
         circumstances however, it is useful for type checking
     """
 
-    __slots__: list[str] = ['__width', '__accesswidth']
+    __slots__: list[str] = ['__width', '__accesswidth', '__max_value']
 
     # pylint: disable=too-many-arguments,duplicate-code
     def __init__(self, *,
@@ -65,6 +69,7 @@ class BaseReg(Node, ABC):
         if not legal_register_width(width_in_bits=width):
             raise ValueError(f'Unsupported register width {width:d}')
         self.__width = width
+        self.__max_value = (1 << width) - 1
         if not isinstance(accesswidth, int):
             raise TypeError(f'accesswidth should be int but got {(type(accesswidth))}')
         if not legal_register_width(width_in_bits=accesswidth):
@@ -84,7 +89,7 @@ class BaseReg(Node, ABC):
         * 32-bit register returns 0xFFFF_FFFF (4294967295)
 
         """
-        return (2 ** self.width) - 1
+        return self.__max_value
 
     def _validate_data(self, data: int) -> None:
         """
@@ -130,6 +135,64 @@ class BaseReg(Node, ABC):
     def _is_writeable(self) -> bool:
         ...
 
+    @property
+    @abstractmethod
+    def fields(self) -> Iterator['Field']:
+        """
+        generator that produces has all the fields within the register
+        """
+
+    def _field_at(self, bit: int) -> Optional['Field']:
+        if not 0 <= bit < self.width:
+            raise ValueError(f'bit {bit:d} is outside the {self.width:d} bit register')
+        for field in self.fields:
+            if field.low <= bit <= field.high:
+                return field
+        return None
+
+    @property
+    def reset_value(self) -> int:
+        """
+        Value of the register after reset, built from the default of every readable field
+        which is not volatile and has a known reset value. The bits of other fields are zero,
+        see :attr:`reset_mask`
+        """
+        return self._reset_value_and_mask[0]
+
+    @property
+    def reset_mask(self) -> int:
+        """
+        Bitmask of the fields which are included in :attr:`reset_value`, so a value read from
+        the register is at reset if ``(value ^ reset_value) & reset_mask`` is zero
+        """
+        return self._reset_value_and_mask[1]
+
+    @property
+    def _reset_value_and_mask(self) -> tuple[int, int]:
+        # the generated registers override this with the values precomputed by the exporter
+        return self._reset_value_and_mask_from_fields()
+
+    def _reset_value_and_mask_from_fields(self) -> tuple[int, int]:
+        """
+        reset value and mask built from the properties of each field, the generated tests use
+        this to check the values precomputed by the exporter
+        """
+        reset_value = 0
+        reset_mask = 0
+        # pylint: disable=protected-access
+        for field in self.fields:
+            misc_props = field._misc_props
+            if field._is_readable and not misc_props.is_volatile and \
+                    misc_props.default is not None:
+                reset_value |= field._size_props.encode(misc_props.default)
+                reset_mask |= field.bitmask
+        # pylint: enable=protected-access
+        return reset_value, reset_mask
+
+    def _decode_fields(self, value: int) -> dict[str, int]:
+        # pylint: disable-next=protected-access
+        return {field.inst_name: field._size_props.decode(value) for field in self.fields}
+
 # pylint: disable-next=invalid-name
 BaseRegArrayElementType= TypeVar('BaseRegArrayElementType', bound=BaseReg)
 
@@ -154,7 +217,7 @@ class BaseRegArray(NodeArray[BaseRegArrayElementType], ABC):
                  address: int,
                  stride: int,
                  dimensions: tuple[int, ...],
-                 elements: Optional[dict[tuple[int, ...], BaseRegArrayElementType]] = None):
+                 elements: Optional[Mapping[tuple[int, ...], BaseRegArrayElementType]] = None):
 
         if not isinstance(width, int):
             raise TypeError(f'width should be int but got {(type(width))}')
@@ -198,12 +261,12 @@ class BaseRegArray(NodeArray[BaseRegArrayElementType], ABC):
             accesswidth=self.accesswidth,
             parent=self)
 
-    def _sub_instance(self, elements: dict[tuple[int, ...], BaseRegArrayElementType]) ->\
+    def _sub_instance(self, elements: Mapping[tuple[int, ...], BaseRegArrayElementType]) ->\
             NodeArray[BaseRegArrayElementType]:
         if not isinstance(self.parent, (AddressMap, AsyncAddressMap, RegFile,
                                         AsyncRegFile, BaseMemory)):
             raise RuntimeError('Parent of a Node Array must be Node')
-        return self.__class__(logger_handle=self._logger.name,
+        return self.__class__(logger_handle=self._logger_handle,
                               inst_name=self.inst_name,
                               parent=self.parent,
                               address=self.address,
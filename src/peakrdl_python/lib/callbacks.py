@@ -20,8 +20,9 @@ peakrdl-python tool.  It provides a set of types used by the autogenerated code
 """
 from array import array as Array
 
-from typing import Optional, Union
+from typing import Optional, Union, Generic, TypeVar, cast
 from typing import Protocol
+from collections.abc import Callable
 
 
 class ReadCallback(Protocol):
@@ -77,6 +78,30 @@ class WriteBlockLegacyCallback(Protocol):
         pass
 
 
+class ReadBlockIntoCallback(Protocol):
+    """
+    Callback definition for a block read operation that places the data read directly into a
+    buffer. The buffer is a writable byte memoryview, with each of the ``length`` entries
+    occupying the width rounded up to a power of two bytes in the native byte order
+    """
+    # pylint: disable=too-few-public-methods
+    def __call__(self, addr: int, width: int, accesswidth: int, length: int,
+                 buffer: memoryview) -> None:
+        pass
+
+
+class WriteBlockBufferCallback(Protocol):
+    """
+    Callback definition for a block write operation that takes the data to write directly from
+    a buffer. The buffer is a read-only byte memoryview, with each of the ``length`` entries
+    occupying the width rounded up to a power of two bytes in the native byte order
+    """
+    # pylint: disable=too-few-public-methods
+    def __call__(self, addr: int, width: int, accesswidth: int, length: int,
+                 buffer: memoryview) -> None:
+        pass
+
+
 class AsyncReadCallback(Protocol):
     """
     Callback definition for a single register async read operation
@@ -129,20 +154,215 @@ class AsyncWriteBlockLegacyCallback(Protocol):
         pass
 
 
+class AsyncReadBlockIntoCallback(Protocol):
+    """
+    Callback definition for an async block read operation that places the data read directly
+    into a buffer, see :class:`ReadBlockIntoCallback`
+    """
+    # pylint: disable=too-few-public-methods,unexpected-special-method-signature
+    async def __call__(self, addr: int, width: int, accesswidth: int, length: int,
+                       buffer: memoryview) -> None:
+        pass
+
+
+class AsyncWriteBlockBufferCallback(Protocol):
+    """
+    Callback definition for an async block write operation that takes the data to write
+    directly from a buffer, see :class:`WriteBlockBufferCallback`
+    """
+    # pylint: disable=too-few-public-methods,unexpected-special-method-signature
+    async def __call__(self, addr: int, width: int, accesswidth: int, length: int,
+                       buffer: memoryview) -> None:
+        pass
+
+
+class BatchOperation:
+    """
+    A single register access that has been queued as part of a batch, these are passed to the
+    ``transact_callback`` of a :class:`BatchCallbackSet` when the batch is flushed
+
+    Args:
+        addr: Address of the register access
+        width: Width of the register in bits
+        accesswidth: Minimum access width of the register in bits
+        data: value to be written, this is None for a read operation
+    """
+
+    __slots__ = ['__addr', '__width', '__accesswidth', '__data']
+
+    def __init__(self, *, addr: int, width: int, accesswidth: int, data: Optional[int] = None):
+        self.__addr = addr
+        self.__width = width
+        self.__accesswidth = accesswidth
+        self.__data = data
+
+    @property
+    def addr(self) -> int:
+        """
+        Address of the register access
+        """
+        return self.__addr
+
+    @property
+    def width(self) -> int:
+        """
+        Width of the register in bits
+        """
+        return self.__width
+
+    @property
+    def accesswidth(self) -> int:
+        """
+        Minimum access width of the register in bits
+        """
+        return self.__accesswidth
+
+    @property
+    def data(self) -> Optional[int]:
+        """
+        Value to be written, this is None for a read operation
+        """
+        return self.__data
+
+    @property
+    def is_read(self) -> bool:
+        """
+        True if the operation is a read
+        """
+        return self.__data is None
+
+    def __repr__(self) -> str:
+        if self.is_read:
+            return f'BatchOperation(read, addr=0x{self.addr:X})'
+        return f'BatchOperation(write, addr=0x{self.addr:X}, data=0x{self.__data:X})'
+
+
+class TransactCallback(Protocol):
+    """
+    Callback definition for a batch of register operations issued as a single transaction
+
+    The callback must return a list with one entry per operation, this is the value read for a read
+    operation and None for a write operation
+    """
+    # pylint: disable=too-few-public-methods
+    def __call__(self, ops: list[BatchOperation]) -> list[Optional[int]]:
+        pass
+
+
+# pylint: disable-next=invalid-name
+BatchResultType = TypeVar('BatchResultType')
+# pylint: disable-next=invalid-name
+DerivedResultType = TypeVar('DerivedResultType')
+
+
+class BatchReadFuture(Generic[BatchResultType]):
+    """
+    Placeholder for the result of a read that has been queued as part of a batch, the value is
+    available once the batch has been flushed
+
+    Args:
+        source: future holding the raw register value, this is only used for a derived future
+                (see :meth:`then`)
+        decoder: function applied to the raw register value of the source
+    """
+
+    __slots__ = ['__value', '__done', '__source', '__decoder']
+
+    def __init__(self, source: Optional['BatchReadFuture[int]'] = None,
+                 decoder: Optional[Callable[[int], BatchResultType]] = None) -> None:
+        if (source is None) != (decoder is None):
+            raise ValueError('A derived future needs both a source and a decoder')
+        self.__value: Optional[int] = None
+        self.__done: bool = False
+        self.__source = source
+        self.__decoder = decoder
+
+    def done(self) -> bool:
+        """
+        True once the value is available
+        """
+        if self.__source is not None:
+            return self.__source.done()
+        return self.__done
+
+    def set_result(self, value: int) -> None:
+        """
+        Set the value read, this is used by the :class:`BatchCallbackSet` when the batch is flushed
+
+        Args:
+            value: value read from the register
+        """
+        if self.__source is not None:
+            raise RuntimeError('The result can not be set on a derived future')
+        if self.__done:
+            raise RuntimeError('The result of the future has already been set')
+        if not isinstance(value, int):
+            raise TypeError(f'value must be an int but got {type(value)}')
+        self.__value = value
+        self.__done = True
+
+    def then(self, decoder: Callable[[int], DerivedResultType]) -> \
+            'BatchReadFuture[DerivedResultType]':
+        """
+        Create a new future whose value is determined by applying a function to the value of this
+        one, for example to decode a field from a register value
+
+        Args:
+            decoder: function applied to the raw register value
+
+        Returns:
+            the derived future
+        """
+        if self.__source is not None:
+            raise RuntimeError('A derived future can not be used as the source of another')
+        # this cast is OK because a future which is not derived always holds the register value
+        return BatchReadFuture(source=cast(BatchReadFuture[int], self), decoder=decoder)
+
+    def result(self) -> BatchResultType:
+        """
+        Value of the read
+
+        Raises:
+            RuntimeError: if the batch containing the read has not been flushed
+        """
+        if self.__source is not None and self.__decoder is not None:
+            return self.__decoder(self.__source.result())
+
+        if not self.__done or self.__value is None:
+            raise RuntimeError('The value is not available until the batch has been flushed')
+        # this cast is OK because a future which is not derived always holds the register value
+        return cast(BatchResultType, self.__value)
+
+
 class _NormalCallbackSetBase:
     """
     Class to hold a set of callbacks, this reduces the number of callback that need to be passed
     around
     """
 
-    __slots__ = ['__write_callback', '__read_callback']
+    __slots__ = ['__write_callback', '__read_callback',
+                 '__read_block_into_callback', '__write_block_buffer_callback',
+                 '__max_burst_length']
 
     def __init__(self,
                  write_callback: Optional[WriteCallback] = None,
-                 read_callback: Optional[ReadCallback] = None):
+                 read_callback: Optional[ReadCallback] = None,
+                 *,
+                 read_block_into_callback: Optional[ReadBlockIntoCallback] = None,
+                 write_block_buffer_callback: Optional[WriteBlockBufferCallback] = None,
+                 max_burst_length: Optional[int] = None):
 
         self.__read_callback = read_callback
         self.__write_callback = write_callback
+        self.__read_block_into_callback = read_block_into_callback
+        self.__write_block_buffer_callback = write_block_buffer_callback
+
+        if max_burst_length is not None:
+            if not isinstance(max_burst_length, int):
+                raise TypeError(f'max_burst_length should be an int, got {type(max_burst_length)}')
+            if max_burst_length < 1:
+                raise ValueError(f'max_burst_length must be at least 1, got {max_burst_length:d}')
+        self.__max_burst_length = max_burst_length
 
     @property
     def read_callback(self) -> Optional[ReadCallback]:
@@ -164,6 +384,37 @@ class _NormalCallbackSetBase:
         """
         return self.__write_callback
 
+    @property
+    def read_block_into_callback(self) -> Optional[ReadBlockIntoCallback]:
+        """
+        block read callback function, which reads directly into a buffer
+
+        Returns: call back function
+
+        """
+        return self.__read_block_into_callback
+
+    @property
+    def write_block_buffer_callback(self) -> Optional[WriteBlockBufferCallback]:
+        """
+        block write callback function, which writes directly from a buffer
+
+        Returns: call back function
+
+        """
+        return self.__write_block_buffer_callback
+
+    @property
+    def max_burst_length(self) -> Optional[int]:
+        """
+        The maximum number of entries in a single block operation, longer memory transfers are
+        split into bursts of this length. None if there is no limit
+
+        Returns: maximum burst length
+
+        """
+        return self.__max_burst_length
+
 
 class NormalCallbackSet(_NormalCallbackSetBase):
     """
@@ -173,13 +424,21 @@ class NormalCallbackSet(_NormalCallbackSetBase):
 
     __slots__ = ['__write_block_callback', '__read_block_callback']
 
+    # pylint: disable-next=too-many-arguments
     def __init__(self,
                  write_callback: Optional[WriteCallback] = None,
                  read_callback: Optional[ReadCallback] = None,
                  write_block_callback: Optional[WriteBlockCallback] = None,
-                 read_block_callback: Optional[ReadBlockCallback] = None):
+                 read_block_callback: Optional[ReadBlockCallback] = None,
+                 *,
+                 read_block_into_callback: Optional[ReadBlockIntoCallback] = None,
+                 write_block_buffer_callback: Optional[WriteBlockBufferCallback] = None,
+                 max_burst_length: Optional[int] = None):
 
-        super().__init__(read_callback=read_callback, write_callback=write_callback)
+        super().__init__(read_callback=read_callback, write_callback=write_callback,
+                         read_block_into_callback=read_block_into_callback,
+                         write_block_buffer_callback=write_block_buffer_callback,
+                         max_burst_length=max_burst_length)
 
         self.__read_block_callback = read_block_callback
         self.__write_block_callback = write_block_callback
@@ -205,6 +464,276 @@ class NormalCallbackSet(_NormalCallbackSetBase):
         return self.__write_block_callback
 
 
+class BatchCallbackSet(NormalCallbackSet):
+    """
+    Callback set that allows register accesses to be grouped into a single transaction, this is
+    used with the ``batch`` context manager of an AddressMap.
+
+    Whilst a batch is open, register writes are queued rather than being issued immediately. Reads
+    requested with ``read_deferred`` are also queued and return a :class:`BatchReadFuture`. The
+    queue is issued with a single call to the ``transact_callback`` when the batch is flushed.
+    Any other read (for example as part of a read-modify-write) causes the queue to be flushed
+    first so that the order of operations is always preserved.
+
+    Outside a batch, the single access callbacks are used if provided, otherwise each access is
+    issued as a transaction of one operation.
+
+    Args:
+        transact_callback: callback to issue a list of operations as a single transaction
+        write_callback: single write callback
+        read_callback: single read callback
+        write_block_callback: block write callback
+        read_block_callback: block read callback
+        read_block_into_callback: block read callback which reads directly into a buffer, within
+                                  a batch this flushes the queue before it is called
+        write_block_buffer_callback: block write callback which writes directly from a buffer,
+                                     within a batch this flushes the queue before it is called
+        max_burst_length: maximum number of entries in a single block operation
+    """
+
+    __slots__ = ['__transact_callback', '__pending', '__batch_marks']
+
+    # pylint: disable-next=too-many-arguments
+    def __init__(self,
+                 transact_callback: TransactCallback,
+                 write_callback: Optional[WriteCallback] = None,
+                 read_callback: Optional[ReadCallback] = None,
+                 write_block_callback: Optional[WriteBlockCallback] = None,
+                 read_block_callback: Optional[ReadBlockCallback] = None,
+                 *,
+                 read_block_into_callback: Optional[ReadBlockIntoCallback] = None,
+                 write_block_buffer_callback: Optional[WriteBlockBufferCallback] = None,
+                 max_burst_length: Optional[int] = None):
+
+        super().__init__(write_callback=write_callback, read_callback=read_callback,
+                         write_block_callback=write_block_callback,
+                         read_block_callback=read_block_callback,
+                         read_block_into_callback=read_block_into_callback,
+                         write_block_buffer_callback=write_block_buffer_callback,
+                         max_burst_length=max_burst_length)
+
+        if not callable(transact_callback):
+            raise TypeError(f'transact_callback must be callable, got {type(transact_callback)}')
+        self.__transact_callback = transact_callback
+        self.__pending: list[tuple[BatchOperation, Optional[BatchReadFuture[int]]]] = []
+        # position in the pending queue at which each open batch started, so that an abandoned
+        # inner batch only discards its own operations
+        self.__batch_marks: list[int] = []
+
+    @property
+    def transact_callback(self) -> TransactCallback:
+        """
+        transaction callback function
+
+        Returns: call back function
+
+        """
+        return self.__transact_callback
+
+    @property
+    def batch_active(self) -> bool:
+        """
+        True if a batch is currently open
+        """
+        return len(self.__batch_marks) > 0
+
+    @property
+    def pending_operations(self) -> int:
+        """
+        Number of operations waiting to be flushed
+        """
+        return len(self.__pending)
+
+    @property
+    def read_callback(self) -> Optional[ReadCallback]:
+        if self.batch_active:
+            return self.__batched_read
+        read_callback = super().read_callback
+        if read_callback is not None:
+            return read_callback
+        return self.__transact_read
+
+    @property
+    def write_callback(self) -> Optional[WriteCallback]:
+        if self.batch_active:
+            return self.__batched_write
+        write_callback = super().write_callback
+        if write_callback is not None:
+            return write_callback
+        return self.__transact_write
+
+    @property
+    def read_block_callback(self) -> Optional[ReadBlockCallback]:
+        if self.batch_active:
+            return self.__batched_read_block
+        return super().read_block_callback
+
+    @property
+    def write_block_callback(self) -> Optional[WriteBlockCallback]:
+        if self.batch_active:
+            return self.__batched_write_block
+        return super().write_block_callback
+
+    @property
+    def read_block_into_callback(self) -> Optional[ReadBlockIntoCallback]:
+        if self.batch_active and super().read_block_into_callback is not None:
+            return self.__batched_read_block_into
+        return super().read_block_into_callback
+
+    @property
+    def write_block_buffer_callback(self) -> Optional[WriteBlockBufferCallback]:
+        if self.batch_active and super().write_block_buffer_callback is not None:
+            return self.__batched_write_block_buffer
+        return super().write_block_buffer_callback
+
+    def enqueue_read(self, addr: int, width: int, accesswidth: int) -> BatchReadFuture[int]:
+        """
+        Queue a read, if there is no open batch the read is performed immediately
+
+        Args:
+            addr: Address to read from
+            width: Width of the register in bits
+            accesswidth: Minimum access width of the register in bits
+
+        Returns:
+            future which holds the value read once the batch is flushed
+        """
+        future: BatchReadFuture[int] = BatchReadFuture()
+        self.__pending.append((BatchOperation(addr=addr, width=width, accesswidth=accesswidth),
+                               future))
+        if not self.batch_active:
+            self.flush()
+        return future
+
+    def enqueue_write(self, addr: int, width: int, accesswidth: int, data: int) -> None:
+        """
+        Queue a write, if there is no open batch the write is performed immediately
+
+        Args:
+            addr: Address to write to
+            width: Width of the register in bits
+            accesswidth: Minimum access width of the register in bits
+            data: value to be written to the register
+        """
+        if not isinstance(data, int):
+            raise TypeError(f'data must be an int but got {type(data)}')
+        self.__pending.append((BatchOperation(addr=addr, width=width, accesswidth=accesswidth,
+                                              data=data), None))
+        if not self.batch_active:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Issue all the queued operations as a single transaction
+        """
+        if len(self.__pending) == 0:
+            return
+
+        pending = self.__pending
+        self.__pending = []
+        # everything queued by the open batches has now been issued
+        self.__batch_marks = [0] * len(self.__batch_marks)
+        results = self.__transact_callback(ops=[operation for operation, _ in pending])
+
+        if not isinstance(results, list):
+            raise TypeError(f'The transact callback is expected to return a list, '
+                            f'got {type(results)}')
+        if len(results) != len(pending):
+            raise ValueError(f'The transact callback returned {len(results):d} results for '
+                             f'{len(pending):d} operations')
+
+        for (_, future), result in zip(pending, results):
+            if future is not None:
+                if result is None:
+                    raise TypeError('The transact callback returned None for a read operation')
+                future.set_result(result)
+
+    def _open_batch(self) -> None:
+        """
+        Start a batch, batches may be nested in which case the operations are only issued when
+        the outermost batch is closed
+        """
+        self.__batch_marks.append(len(self.__pending))
+
+    def _close_batch(self, flush: bool) -> None:
+        """
+        Close a batch
+
+        Args:
+            flush: if True, the queued operations are issued when this is the outermost batch
+                   (otherwise they are left for the enclosing batch). If False, the operations
+                   queued since this batch was opened, that have not already been issued, are
+                   discarded
+        """
+        if len(self.__batch_marks) < 1:
+            raise RuntimeError('There is no open batch to close')
+        mark = self.__batch_marks.pop()
+        if not flush:
+            del self.__pending[mark:]
+        elif not self.batch_active:
+            self.flush()
+
+    def __batched_read(self, addr: int, width: int, accesswidth: int) -> int:
+        # a read whose value is needed immediately acts as a barrier, everything queued before
+        # it is issued along with the read itself
+        future = self.enqueue_read(addr=addr, width=width, accesswidth=accesswidth)
+        self.flush()
+        return future.result()
+
+    def __batched_write(self, addr: int, width: int, accesswidth: int, data: int) -> None:
+        self.enqueue_write(addr=addr, width=width, accesswidth=accesswidth, data=data)
+
+    def __batched_read_block(self, addr: int, width: int, accesswidth: int,
+                             length: int) -> list[int]:
+        read_block_callback = super().read_block_callback
+        if read_block_callback is not None:
+            self.flush()
+            return read_block_callback(addr=addr, width=width, accesswidth=accesswidth,
+                                       length=length)
+        futures = [self.enqueue_read(addr=addr + (entry * (width >> 3)), width=width,
+                                     accesswidth=accesswidth) for entry in range(length)]
+        self.flush()
+        return [future.result() for future in futures]
+
+    def __batched_write_block(self, addr: int, width: int, accesswidth: int,
+                              data: list[int]) -> None:
+        write_block_callback = super().write_block_callback
+        if write_block_callback is not None:
+            self.flush()
+            write_block_callback(addr=addr, width=width, accesswidth=accesswidth, data=data)
+            return
+        for entry, entry_data in enumerate(data):
+            self.enqueue_write(addr=addr + (entry * (width >> 3)), width=width,
+                               accesswidth=accesswidth, data=entry_data)
+
+    # pylint: disable-next=too-many-arguments
+    def __batched_read_block_into(self, addr: int, width: int, accesswidth: int, length: int,
+                                  buffer: memoryview) -> None:
+        # buffer transfers can not be queued so act as a barrier, like an immediate read
+        read_block_into_callback = super().read_block_into_callback
+        if read_block_into_callback is None:
+            raise RuntimeError('There is no usable callback')
+        self.flush()
+        read_block_into_callback(addr=addr, width=width, accesswidth=accesswidth,
+                                 length=length, buffer=buffer)
+
+    # pylint: disable-next=too-many-arguments
+    def __batched_write_block_buffer(self, addr: int, width: int, accesswidth: int,
+                                     length: int, buffer: memoryview) -> None:
+        write_block_buffer_callback = super().write_block_buffer_callback
+        if write_block_buffer_callback is None:
+            raise RuntimeError('There is no usable callback')
+        self.flush()
+        write_block_buffer_callback(addr=addr, width=width, accesswidth=accesswidth,
+                                    length=length, buffer=buffer)
+
+    def __transact_read(self, addr: int, width: int, accesswidth: int) -> int:
+        return self.enqueue_read(addr=addr, width=width, accesswidth=accesswidth).result()
+
+    def __transact_write(self, addr: int, width: int, accesswidth: int, data: int) -> None:
+        self.enqueue_write(addr=addr, width=width, accesswidth=accesswidth, data=data)
+
+
 class NormalCallbackSetLegacy(_NormalCallbackSetBase):
     """
     Class to hold a set of callbacks, this reduces the number of callback that need to be passed
@@ -213,13 +742,21 @@ class NormalCallbackSetLegacy(_NormalCallbackSetBase):
 
     __slots__ = ['__write_block_callback', '__read_block_callback']
 
+    # pylint: disable-next=too-many-arguments
     def __init__(self,
                  write_callback: Optional[WriteCallback] = None,
                  read_callback: Optional[ReadCallback] = None,
                  write_block_callback: Optional[WriteBlockLegacyCallback] = None,
-                 read_block_callback: Optional[ReadBlockLegacyCallback] = None):
+                 read_block_callback: Optional[ReadBlockLegacyCallback] = None,
+                 *,
+                 read_block_into_callback: Optional[ReadBlockIntoCallback] = None,
+                 write_block_buffer_callback: Optional[WriteBlockBufferCallback] = None,
+                 max_burst_length: Optional[int] = None):
 
-        super().__init__(read_callback=read_callback, write_callback=write_callback)
+        super().__init__(read_callback=read_callback, write_callback=write_callback,
+                         read_block_into_callback=read_block_into_callback,
+                         write_block_buffer_callback=write_block_buffer_callback,
+                         max_burst_length=max_burst_length)
 
         self.__read_block_callback = read_block_callback
         self.__write_block_callback = write_block_callback
@@ -250,14 +787,39 @@ class _AsyncCallbackSetBase:
     around
     """
 
-    __slots__ = ['__write_callback', '__read_callback']
+    __slots__ = ['__write_callback', '__read_callback',
+                 '__read_block_into_callback', '__write_block_buffer_callback',
+                 '__max_burst_length', '__max_bursts_in_flight']
 
+    # pylint: disable-next=too-many-arguments
     def __init__(self,
                  write_callback: Optional[AsyncWriteCallback] = None,
-                 read_callback: Optional[AsyncReadCallback] = None):
+                 read_callback: Optional[AsyncReadCallback] = None,
+                 *,
+                 read_block_into_callback: Optional[AsyncReadBlockIntoCallback] = None,
+                 write_block_buffer_callback: Optional[AsyncWriteBlockBufferCallback] = None,
+                 max_burst_length: Optional[int] = None,
+                 max_bursts_in_flight: int = 1):
 
         self.__read_callback = read_callback
         self.__write_callback = write_callback
+        self.__read_block_into_callback = read_block_into_callback
+        self.__write_block_buffer_callback = write_block_buffer_callback
+
+        if max_burst_length is not None:
+            if not isinstance(max_burst_length, int):
+                raise TypeError(f'max_burst_length should be an int, got {type(max_burst_length)}')
+            if max_burst_length < 1:
+                raise ValueError(f'max_burst_length must be at least 1, got {max_burst_length:d}')
+        self.__max_burst_length = max_burst_length
+
+        if not isinstance(max_bursts_in_flight, int):
+            raise TypeError(f'max_bursts_in_flight should be an int, '
+                            f'got {type(max_bursts_in_flight)}')
+        if max_bursts_in_flight < 1:
+            raise ValueError(f'max_bursts_in_flight must be at least 1, '
+                             f'got {max_bursts_in_flight:d}')
+        self.__max_bursts_in_flight = max_bursts_in_flight
 
     @property
     def read_callback(self) -> Optional[AsyncReadCallback]:
@@ -279,6 +841,48 @@ class _AsyncCallbackSetBase:
         """
         return self.__write_callback
 
+    @property
+    def read_block_into_callback(self) -> Optional[AsyncReadBlockIntoCallback]:
+        """
+        block read callback function, which reads directly into a buffer
+
+        Returns: call back function
+
+        """
+        return self.__read_block_into_callback
+
+    @property
+    def write_block_buffer_callback(self) -> Optional[AsyncWriteBlockBufferCallback]:
+        """
+        block write callback function, which writes directly from a buffer
+
+        Returns: call back function
+
+        """
+        return self.__write_block_buffer_callback
+
+    @property
+    def max_burst_length(self) -> Optional[int]:
+        """
+        The maximum number of entries in a single block operation, longer memory transfers are
+        split into bursts of this length. None if there is no limit
+
+        Returns: maximum burst length
+
+        """
+        return self.__max_burst_length
+
+    @property
+    def max_bursts_in_flight(self) -> int:
+        """
+        The maximum number of bursts of a memory transfer that are allowed to be in progress
+        concurrently
+
+        Returns: maximum bursts in flight
+
+        """
+        return self.__max_bursts_in_flight
+
 
 class AsyncCallbackSet(_AsyncCallbackSetBase):
     """
@@ -288,13 +892,23 @@ class AsyncCallbackSet(_AsyncCallbackSetBase):
 
     __slots__ = ['__write_block_callback', '__read_block_callback']
 
+    # pylint: disable-next=too-many-arguments
     def __init__(self,
                  write_callback: Optional[AsyncWriteCallback] = None,
                  read_callback: Optional[AsyncReadCallback] = None,
                  write_block_callback: Optional[AsyncWriteBlockCallback] = None,
-                 read_block_callback: Optional[AsyncReadBlockCallback] = None):
-
-        super().__init__(read_callback=read_callback, write_callback=write_callback)
+                 read_block_callback: Optional[AsyncReadBlockCallback] = None,
+                 *,
+                 read_block_into_callback: Optional[AsyncReadBlockIntoCallback] = None,
+                 write_block_buffer_callback: Optional[AsyncWriteBlockBufferCallback] = None,
+                 max_burst_length: Optional[int] = None,
+                 max_bursts_in_flight: int = 1):
+
+        super().__init__(read_callback=read_callback, write_callback=write_callback,
+                         read_block_into_callback=read_block_into_callback,
+                         write_block_buffer_callback=write_block_buffer_callback,
+                         max_burst_length=max_burst_length,
+                         max_bursts_in_flight=max_bursts_in_flight)
 
         self.__read_block_callback = read_block_callback
         self.__write_block_callback = write_block_callback
@@ -328,12 +942,22 @@ class AsyncCallbackSetLegacy(_AsyncCallbackSetBase):
 
     __slots__ = ['__write_block_callback', '__read_block_callback']
 
+    # pylint: disable-next=too-many-arguments
     def __init__(self,
                  write_callback: Optional[AsyncWriteCallback] = None,
                  read_callback: Optional[AsyncReadCallback] = None,
                  write_block_callback: Optional[AsyncWriteBlockLegacyCallback] = None,
-                 read_block_callback: Optional[AsyncReadBlockLegacyCallback] = None):
-        super().__init__(read_callback=read_callback, write_callback=write_callback)
+                 read_block_callback: Optional[AsyncReadBlockLegacyCallback] = None,
+                 *,
+                 read_block_into_callback: Optional[AsyncReadBlockIntoCallback] = None,
+                 write_block_buffer_callback: Optional[AsyncWriteBlockBufferCallback] = None,
+                 max_burst_length: Optional[int] = None,
+                 max_bursts_in_flight: int = 1):
+        super().__init__(read_callback=read_callback, write_callback=write_callback,
+                         read_block_into_callback=read_block_into_callback,
+                         write_block_buffer_callback=write_block_buffer_callback,
+                         max_burst_length=max_burst_length,
+                         max_bursts_in_flight=max_bursts_in_flight)
 
         self.__read_block_callback = read_block_callback
         self.__write_block_callback = write_block_callback
@@ -0,0 +1,192 @@
+"""
+peakrdl-python is a tool to generate Python Register Access Layer (RAL) from SystemRDL
+Copyright (C) 2021 - 2023
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+This module is intended to distributed as part of automatically generated code by the
+peakrdl-python tool. It provides the decoding of the fields from a block of register values
+into columns, one per field, either as lists or as numpy arrays (numpy is optional and only
+needs to be installed if the numpy columns are used) and the encoding of columns back into
+register values
+"""
+from importlib import import_module
+from typing import Any, Optional, TYPE_CHECKING
+from collections.abc import Iterable, Mapping, Sequence
+
+if TYPE_CHECKING:
+    from .base_field import Field
+
+#: numpy does not have an integer type wider than this
+NUMPY_MAX_WIDTH = 64
+
+
+def _import_numpy() -> Any:
+    """
+    Import numpy, which is an optional dependency
+    """
+    try:
+        return import_module('numpy')
+    except ImportError as exc:
+        raise RuntimeError('numpy must be installed to use the numpy field columns') from exc
+
+
+def decode_field_columns(fields: Iterable['Field'],
+                         reg_values: Sequence[int]) -> dict[str, list[int]]:
+    """
+    Decode a set of fields from each of a block of register values, enumerated fields are
+    returned as their integer values. No checks are made on the register values
+
+    Args:
+        fields: fields to decode, normally the readable fields of a register
+        reg_values: register values
+
+    Returns:
+        dictionary of the field values, keyed by the field name
+    """
+    # pylint: disable-next=protected-access
+    return {field.inst_name: field._size_props.decode_column(reg_values)
+            for field in fields}
+
+
+def _is_numpy_array(column: Any) -> bool:
+    # numpy is only imported if it is needed, so the arrays are recognised by their attributes
+    return hasattr(column, 'dtype') and hasattr(column, 'tolist')
+
+
+def _numpy_bit_reverse(numpy: Any, column: Any, width: int) -> Any:
+    reversed_column = numpy.zeros_like(column)
+    for bit in range(width):
+        reversed_column |= ((column >> numpy.uint64(bit)) & numpy.uint64(1)) << \
+                           numpy.uint64(width - 1 - bit)
+    return reversed_column
+
+
+def _numpy_dtype(numpy: Any, width: int) -> Any:
+    for dtype_width, dtype in [(8, numpy.uint8), (16, numpy.uint16), (32, numpy.uint32)]:
+        if width <= dtype_width:
+            return dtype
+    return numpy.uint64
+
+
+def decode_field_columns_numpy(fields: Iterable['Field'], reg_values: Sequence[int],
+                               width: int) -> dict[str, Any]:
+    """
+    Decode a set of fields from each of a block of register values, with each column being
+    computed with numpy array operations. Each column uses the smallest unsigned integer type
+    which fits the field, unless the register is wider than 64 bit in which case the decode is
+    done in python and the columns are numpy object arrays
+
+    Args:
+        fields: fields to decode, normally the readable fields of a register
+        reg_values: register values
+        width: width of the register in bits
+
+    Returns:
+        dictionary of the field values as numpy arrays, keyed by the field name
+    """
+    numpy = _import_numpy()
+    if width > NUMPY_MAX_WIDTH:
+        return {name: numpy.array(column, dtype=object)
+                for name, column in decode_field_columns(fields, reg_values).items()}
+
+    raw_values = numpy.asarray(reg_values, dtype=numpy.uint64)
+    columns: dict[str, Any] = {}
+    for field in fields:
+        column = (raw_values & numpy.uint64(field.bitmask)) >> numpy.uint64(field.low)
+        if field.msb0:
+            column = _numpy_bit_reverse(numpy, column, field.width)
+        columns[field.inst_name] = column.astype(_numpy_dtype(numpy, field.width))
+    return columns
+
+
+def _encode_numpy_column(field: 'Field', column: Any) -> Any:
+    """
+    Check and encode a numpy column of field values with numpy array operations
+    """
+    numpy = _import_numpy()
+    if column.dtype.kind not in 'ui':
+        raise TypeError(f'{field.inst_name} values must be integers, got {column.dtype}')
+    if len(column) > 0 and (column.min() < 0 or column.max() > field.max_value):
+        raise ValueError(f'{field.inst_name} values must be in the range 0 to '
+                         f'{field.max_value:d}')
+    encoded = column.astype(numpy.uint64)
+    if field.msb0:
+        encoded = _numpy_bit_reverse(numpy, encoded, field.width)
+    return encoded << numpy.uint64(field.low)
+
+
+def _encode_list_column(field: 'Field', column: Sequence[int]) -> list[int]:
+    """
+    Check and encode a column of field values
+    """
+    if not all(isinstance(value, int) for value in column):
+        raise TypeError(f'{field.inst_name} values must be integers')
+    if len(column) > 0 and (min(column) < 0 or max(column) > field.max_value):
+        raise ValueError(f'{field.inst_name} values must be in the range 0 to '
+                         f'{field.max_value:d}')
+    # pylint: disable-next=protected-access
+    return field._size_props.encode_column(column)
+
+
+def encode_field_columns(fields: Iterable['Field'], columns: Mapping[str, Any],
+                         number_entries: int, width: int) -> tuple[int, list[int]]:
+    """
+    Check and encode columns of field values into register values, with the same checks as
+    the ``encode_write_value`` method of the field. Each column can either be a sequence of
+    integers or a numpy array, in which case the checks and encoding are done with numpy array
+    operations
+
+    Args:
+        fields: fields which can be written, normally the writable fields of a register
+        columns: field values keyed by the field name, each column must have one value for
+                 each entry
+        number_entries: number of register values to encode
+        width: width of the register in bits
+
+    Returns:
+        the bit mask of the fields that have been encoded and the register values with the
+        encoded fields (all other bits are zero)
+    """
+    fields_by_name = {field.inst_name: field for field in fields}
+    written_bitmask = 0
+    list_total: Optional[list[int]] = None
+    numpy_total: Any = None
+    for name, column in columns.items():
+        if name not in fields_by_name:
+            raise ValueError(f'{name} is not a writable field of the register')
+        field = fields_by_name[name]
+        if len(column) != number_entries:
+            raise ValueError(f'{name} has {len(column):d} values but {number_entries:d} are '
+                             f'needed')
+        written_bitmask |= field.bitmask
+
+        if _is_numpy_array(column) and width <= NUMPY_MAX_WIDTH:
+            encoded_array = _encode_numpy_column(field, column)
+            numpy_total = encoded_array if numpy_total is None else numpy_total | encoded_array
+            continue
+
+        encoded = _encode_list_column(field, column.tolist() if _is_numpy_array(column)
+                                      else column)
+        list_total = encoded if list_total is None else \
+            [total | value for total, value in zip(list_total, encoded)]
+
+    if numpy_total is not None:
+        numpy_values: list[int] = numpy_total.tolist()
+        list_total = numpy_values if list_total is None else \
+            [total | value for total, value in zip(list_total, numpy_values)]
+    if list_total is None:
+        list_total = [0] * number_entries
+
+    return written_bitmask, list_total
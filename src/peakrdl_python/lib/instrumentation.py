@@ -0,0 +1,487 @@
+"""
+peakrdl-python is a tool to generate Python Register Access Layer (RAL) from SystemRDL
+Copyright (C) 2021 - 2023
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+This module is intended to distributed as part of automatically generated code by the
+peakrdl-python tool. It provides the instrumentation of a callback set, which records how often
+each address is accessed and how long the callbacks take
+"""
+import os
+import json
+from enum import Enum
+from bisect import bisect_left
+from time import perf_counter
+from typing import Any, Optional, Union, Generic, TypeVar, TYPE_CHECKING
+from collections.abc import Sequence
+
+from .callbacks import NormalCallbackSet, NormalCallbackSetLegacy
+from .callbacks import AsyncCallbackSet, AsyncCallbackSetLegacy
+from .callbacks import BatchCallbackSet
+
+if TYPE_CHECKING:
+    from .base import BaseSection
+
+InstrumentedCallbackSet = TypeVar('InstrumentedCallbackSet', NormalCallbackSet,
+                                  NormalCallbackSetLegacy, AsyncCallbackSet,
+                                  AsyncCallbackSetLegacy)
+
+#: upper bound of each bucket of the latency histograms in seconds, there is a final bucket for
+#: anything slower
+LATENCY_BUCKETS = (1E-6, 1E-5, 1E-4, 1E-3, 1E-2, 1E-1, 1.0)
+
+
+class AccessOperation(Enum):
+    """
+    Type of callback operation
+    """
+    READ = 'read'
+    WRITE = 'write'
+    READ_BLOCK = 'read_block'
+    WRITE_BLOCK = 'write_block'
+
+
+class AccessStatistics:
+    """
+    Statistics of the callback operations of one type to one address, block operations are
+    split over the addresses of the entries they cover, each entry counting as one operation
+    with an equal share of the time taken
+
+    Args:
+        number_buckets: number of buckets in the latency histogram
+    """
+
+    __slots__ = ['__count', '__bytes', '__total_seconds', '__histogram']
+
+    def __init__(self, number_buckets: int):
+        self.__count = 0
+        self.__bytes = 0
+        self.__total_seconds = 0.0
+        self.__histogram = [0] * number_buckets
+
+    def _record(self, number_bytes: int, seconds: float, bucket: int) -> None:
+        self.__count += 1
+        self.__bytes += number_bytes
+        self.__total_seconds += seconds
+        self.__histogram[bucket] += 1
+
+    @property
+    def count(self) -> int:
+        """
+        Number of operations
+        """
+        return self.__count
+
+    @property
+    def bytes(self) -> int:
+        """
+        Number of bytes read or written
+        """
+        return self.__bytes
+
+    @property
+    def total_seconds(self) -> float:
+        """
+        Total time spent in the callbacks
+        """
+        return self.__total_seconds
+
+    @property
+    def histogram(self) -> list[int]:
+        """
+        Number of operations in each latency bucket, the last entry is the number of operations
+        slower than the upper bound of every bucket
+        """
+        return list(self.__histogram)
+
+
+class CallbackInstrumentation(Generic[InstrumentedCallbackSet]):
+    """
+    Instrumentation of a callback set, this wraps each of the callbacks recording the number of
+    operations, number of bytes moved and a histogram of the time taken by the callback, for
+    each type of operation to each address. The register model is built with (or used through)
+    ``callbacks`` of this class, in place of the original callback set, which is of the same
+    type as the original. Block operations are split over the addresses of the entries they
+    cover.
+
+    When it is disabled, each callback is passed straight through to the original with only the
+    check of the ``enabled`` flag.
+
+    Args:
+        callbacks: callbacks used to access the hardware, the batch callback set is not
+                   supported
+        latency_buckets: upper bound of each bucket of the latency histograms in seconds, in
+                         ascending order
+        enabled: whether the statistics are being recorded
+    """
+
+    __slots__ = ['__callbacks', '__instrumented_callbacks', '__latency_buckets', '__enabled',
+                 '__statistics']
+
+    def __init__(self, callbacks: InstrumentedCallbackSet, *,
+                 latency_buckets: Sequence[float] = LATENCY_BUCKETS,
+                 enabled: bool = True):
+
+        if isinstance(callbacks, BatchCallbackSet):
+            raise TypeError('the batch callback set can not be instrumented')
+        if not isinstance(callbacks, (NormalCallbackSet, NormalCallbackSetLegacy,
+                                      AsyncCallbackSet, AsyncCallbackSetLegacy)):
+            raise TypeError(f'callback set type is wrong, got {type(callbacks)}')
+        if list(latency_buckets) != sorted(latency_buckets) or len(latency_buckets) == 0:
+            raise ValueError('latency_buckets must be in ascending order')
+
+        self.__callbacks: InstrumentedCallbackSet = callbacks
+        self.__latency_buckets = tuple(latency_buckets)
+        self.__enabled = enabled
+        self.__statistics: dict[tuple[AccessOperation, int], AccessStatistics] = {}
+        self.__instrumented_callbacks: InstrumentedCallbackSet = self.__build_callbacks(callbacks)
+
+    def __build_callbacks(self, callbacks: InstrumentedCallbackSet) -> InstrumentedCallbackSet:
+        # only the callbacks that exist are wrapped, so the register model makes the same choice
+        # of operations as it would with the original callbacks
+        if isinstance(callbacks, (NormalCallbackSet, NormalCallbackSetLegacy)):
+            normal_callbacks: dict[str, Any] = {
+                'read_callback': self.__read if callbacks.read_callback else None,
+                'write_callback': self.__write if callbacks.write_callback else None,
+                'read_block_callback':
+                    self.__read_block if callbacks.read_block_callback else None,
+                'write_block_callback':
+                    self.__write_block if callbacks.write_block_callback else None,
+                'read_block_into_callback':
+                    self.__read_block_into if callbacks.read_block_into_callback else None,
+                'write_block_buffer_callback':
+                    self.__write_block_buffer if callbacks.write_block_buffer_callback else None,
+            }
+            return type(callbacks)(max_burst_length=callbacks.max_burst_length,
+                                   **normal_callbacks)
+
+        async_callbacks: dict[str, Any] = {
+            'read_callback': self.__async_read if callbacks.read_callback else None,
+            'write_callback': self.__async_write if callbacks.write_callback else None,
+            'read_block_callback':
+                self.__async_read_block if callbacks.read_block_callback else None,
+            'write_block_callback':
+                self.__async_write_block if callbacks.write_block_callback else None,
+            'read_block_into_callback':
+                self.__async_read_block_into if callbacks.read_block_into_callback else None,
+            'write_block_buffer_callback':
+                self.__async_write_block_buffer if callbacks.write_block_buffer_callback
+                else None,
+        }
+        return type(callbacks)(max_burst_length=callbacks.max_burst_length,
+                               max_bursts_in_flight=callbacks.max_bursts_in_flight,
+                               **async_callbacks)
+
+    @property
+    def callbacks(self) -> InstrumentedCallbackSet:
+        """
+        Callbacks to be used by the register model, these are the same type as the original
+        callback set
+        """
+        return self.__instrumented_callbacks
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Whether the statistics are being recorded
+        """
+        return self.__enabled
+
+    @enabled.setter
+    def enabled(self, value: bool) -> None:
+        if not isinstance(value, bool):
+            raise TypeError(f'enabled should be a bool, got {type(value)}')
+        self.__enabled = value
+
+    @property
+    def latency_buckets(self) -> tuple[float, ...]:
+        """
+        upper bound of each bucket of the latency histograms in seconds
+        """
+        return self.__latency_buckets
+
+    @property
+    def statistics(self) -> dict[tuple[AccessOperation, int], AccessStatistics]:
+        """
+        Statistics recorded so far, keyed by the operation and address
+        """
+        return dict(self.__statistics)
+
+    def reset(self) -> None:
+        """
+        Clear all the statistics recorded so far
+        """
+        self.__statistics.clear()
+
+    # pylint: disable-next=too-many-arguments
+    def __record(self, operation: AccessOperation, addr: int, number_bytes: int,
+                 seconds: float, length: int = 1) -> None:
+        """
+        Record an operation, a block operation of ``length`` entries is split equally over the
+        addresses of its entries. The latency bucket is that of the whole operation
+        """
+        bucket = bisect_left(self.__latency_buckets, seconds)
+        length = max(1, length)
+        entry_bytes = number_bytes // length
+        for entry in range(length):
+            entry_addr = addr + (entry * entry_bytes)
+            statistics = self.__statistics.get((operation, entry_addr))
+            if statistics is None:
+                statistics = AccessStatistics(number_buckets=len(self.__latency_buckets) + 1)
+                self.__statistics[(operation, entry_addr)] = statistics
+            # pylint: disable-next=protected-access
+            statistics._record(number_bytes=entry_bytes, seconds=seconds / length,
+                               bucket=bucket)
+
+    # the wrapped callbacks, the block versions are used for both the list and legacy array
+    # callback sets
+
+    def __read(self, addr: int, width: int, accesswidth: int) -> int:
+        callback: Any = self.__callbacks.read_callback
+        if not self.__enabled:
+            return callback(addr=addr, width=width, accesswidth=accesswidth)
+        start = perf_counter()
+        data = callback(addr=addr, width=width, accesswidth=accesswidth)
+        self.__record(AccessOperation.READ, addr, width >> 3, perf_counter() - start)
+        return data
+
+    def __write(self, addr: int, width: int, accesswidth: int, data: int) -> None:
+        callback: Any = self.__callbacks.write_callback
+        if not self.__enabled:
+            callback(addr=addr, width=width, accesswidth=accesswidth, data=data)
+            return
+        start = perf_counter()
+        callback(addr=addr, width=width, accesswidth=accesswidth, data=data)
+        self.__record(AccessOperation.WRITE, addr, width >> 3, perf_counter() - start)
+
+    def __read_block(self, addr: int, width: int, accesswidth: int, length: int) -> Any:
+        callback: Any = self.__callbacks.read_block_callback
+        if not self.__enabled:
+            return callback(addr=addr, width=width, accesswidth=accesswidth, length=length)
+        start = perf_counter()
+        data = callback(addr=addr, width=width, accesswidth=accesswidth, length=length)
+        self.__record(AccessOperation.READ_BLOCK, addr, (width >> 3) * length,
+                      perf_counter() - start, length)
+        return data
+
+    def __write_block(self, addr: int, width: int, accesswidth: int, data: Any) -> None:
+        callback: Any = self.__callbacks.write_block_callback
+        if not self.__enabled:
+            callback(addr=addr, width=width, accesswidth=accesswidth, data=data)
+            return
+        start = perf_counter()
+        callback(addr=addr, width=width, accesswidth=accesswidth, data=data)
+        self.__record(AccessOperation.WRITE_BLOCK, addr, (width >> 3) * len(data),
+                      perf_counter() - start, len(data))
+
+    # pylint: disable-next=too-many-arguments
+    def __read_block_into(self, addr: int, width: int, accesswidth: int, length: int,
+                          buffer: memoryview) -> None:
+        callback: Any = self.__callbacks.read_block_into_callback
+        if not self.__enabled:
+            callback(addr=addr, width=width, accesswidth=accesswidth, length=length, buffer=buffer)
+            return
+        start = perf_counter()
+        callback(addr=addr, width=width, accesswidth=accesswidth, length=length, buffer=buffer)
+        self.__record(AccessOperation.READ_BLOCK, addr, buffer.nbytes, perf_counter() - start,
+                      length)
+
+    # pylint: disable-next=too-many-arguments
+    def __write_block_buffer(self, addr: int, width: int, accesswidth: int, length: int,
+                             buffer: memoryview) -> None:
+        callback: Any = self.__callbacks.write_block_buffer_callback
+        if not self.__enabled:
+            callback(addr=addr, width=width, accesswidth=accesswidth, length=length, buffer=buffer)
+            return
+        start = perf_counter()
+        callback(addr=addr, width=width, accesswidth=accesswidth, length=length, buffer=buffer)
+        self.__record(AccessOperation.WRITE_BLOCK, addr, buffer.nbytes, perf_counter() - start,
+                      length)
+
+    async def __async_read(self, addr: int, width: int, accesswidth: int) -> int:
+        callback: Any = self.__callbacks.read_callback
+        if not self.__enabled:
+            return await callback(addr=addr, width=width, accesswidth=accesswidth)
+        start = perf_counter()
+        data = await callback(addr=addr, width=width, accesswidth=accesswidth)
+        self.__record(AccessOperation.READ, addr, width >> 3, perf_counter() - start)
+        return data
+
+    async def __async_write(self, addr: int, width: int, accesswidth: int, data: int) -> None:
+        callback: Any = self.__callbacks.write_callback
+        if not self.__enabled:
+            await callback(addr=addr, width=width, accesswidth=accesswidth, data=data)
+            return
+        start = perf_counter()
+        await callback(addr=addr, width=width, accesswidth=accesswidth, data=data)
+        self.__record(AccessOperation.WRITE, addr, width >> 3, perf_counter() - start)
+
+    async def __async_read_block(self, addr: int, width: int, accesswidth: int,
+                                 length: int) -> Any:
+        callback: Any = self.__callbacks.read_block_callback
+        if not self.__enabled:
+            return await callback(addr=addr, width=width, accesswidth=accesswidth, length=length)
+        start = perf_counter()
+        data = await callback(addr=addr, width=width, accesswidth=accesswidth, length=length)
+        self.__record(AccessOperation.READ_BLOCK, addr, (width >> 3) * length,
+                      perf_counter() - start, length)
+        return data
+
+    async def __async_write_block(self, addr: int, width: int, accesswidth: int,
+                                  data: Any) -> None:
+        callback: Any = self.__callbacks.write_block_callback
+        if not self.__enabled:
+            await callback(addr=addr, width=width, accesswidth=accesswidth, data=data)
+            return
+        start = perf_counter()
+        await callback(addr=addr, width=width, accesswidth=accesswidth, data=data)
+        self.__record(AccessOperation.WRITE_BLOCK, addr, (width >> 3) * len(data),
+                      perf_counter() - start, len(data))
+
+    # pylint: disable-next=too-many-arguments
+    async def __async_read_block_into(self, addr: int, width: int, accesswidth: int,
+                                      length: int, buffer: memoryview) -> None:
+        callback: Any = self.__callbacks.read_block_into_callback
+        if not self.__enabled:
+            await callback(addr=addr, width=width, accesswidth=accesswidth,
+                           length=length, buffer=buffer)
+            return
+        start = perf_counter()
+        await callback(addr=addr, width=width, accesswidth=accesswidth,
+                       length=length, buffer=buffer)
+        self.__record(AccessOperation.READ_BLOCK, addr, buffer.nbytes, perf_counter() - start,
+                      length)
+
+    # pylint: disable-next=too-many-arguments
+    async def __async_write_block_buffer(self, addr: int, width: int, accesswidth: int,
+                                         length: int, buffer: memoryview) -> None:
+        callback: Any = self.__callbacks.write_block_buffer_callback
+        if not self.__enabled:
+            await callback(addr=addr, width=width, accesswidth=accesswidth,
+                           length=length, buffer=buffer)
+            return
+        start = perf_counter()
+        await callback(addr=addr, width=width, accesswidth=accesswidth,
+                       length=length, buffer=buffer)
+        self.__record(AccessOperation.WRITE_BLOCK, addr, buffer.nbytes, perf_counter() - start,
+                      length)
+
+    # export of the statistics
+
+    @staticmethod
+    def __node_names(addresses: set[int],
+                     address_map: Optional['BaseSection']) -> dict[int, Optional[str]]:
+        """
+        Full instance name of the node (normally a register or memory) at each address
+        """
+        names: dict[int, Optional[str]] = {}
+        for address in addresses:
+            node = None if address_map is None else address_map.node_at(address)
+            names[address] = None if node is None else node.full_inst_name
+        return names
+
+    def to_dict(self, address_map: Optional['BaseSection'] = None) -> dict[str, Any]:
+        """
+        Statistics recorded so far, in a form which can be converted to JSON
+
+        Args:
+            address_map: if this is provided, each address is labelled with the full instance
+                         name of the register (or memory) at that address
+
+        Returns:
+            dictionary with the upper bound of each latency bucket and a list with an entry
+            for each operation type and address
+        """
+        statistics = self.statistics
+        names = self.__node_names({address for _, address in statistics}, address_map)
+        accesses = []
+        for (operation, address), entry in sorted(statistics.items(),
+                                                  key=lambda item: (item[0][1],
+                                                                    item[0][0].value)):
+            accesses.append({'operation': operation.value,
+                             'address': address,
+                             'node': names[address],
+                             'count': entry.count,
+                             'bytes': entry.bytes,
+                             'total_seconds': entry.total_seconds,
+                             'latency_histogram': entry.histogram})
+        return {'latency_buckets': list(self.__latency_buckets), 'accesses': accesses}
+
+    def to_json(self, address_map: Optional['BaseSection'] = None) -> str:
+        """
+        Statistics recorded so far as a JSON string, see ``to_dict``
+        """
+        return json.dumps(self.to_dict(address_map=address_map), indent=2)
+
+    def to_prometheus(self, address_map: Optional['BaseSection'] = None,
+                      prefix: str = 'peakrdl') -> str:
+        """
+        Statistics recorded so far in the Prometheus text exposition format, with a counter of
+        the operations and bytes and a histogram of the latency for each operation type and
+        address
+
+        Args:
+            address_map: if this is provided, each address is labelled with the full instance
+                         name of the register (or memory) at that address
+            prefix: prefix of the metric names
+
+        Returns:
+            metrics as a string
+        """
+        count_lines = [f'# HELP {prefix}_accesses_total Number of callback operations',
+                       f'# TYPE {prefix}_accesses_total counter']
+        bytes_lines = [f'# HELP {prefix}_bytes_total Number of bytes read or written',
+                       f'# TYPE {prefix}_bytes_total counter']
+        latency_lines = [f'# HELP {prefix}_latency_seconds Time taken by the callbacks',
+                         f'# TYPE {prefix}_latency_seconds histogram']
+
+        for access in self.to_dict(address_map=address_map)['accesses']:
+            labels = f'operation="{access["operation"]}",address="0x{access["address"]:X}"'
+            if access['node'] is not None:
+                labels += f',node="{access["node"]}"'
+            count_lines.append(f'{prefix}_accesses_total{{{labels}}} {access["count"]:d}')
+            bytes_lines.append(f'{prefix}_bytes_total{{{labels}}} {access["bytes"]:d}')
+            cumulative = 0
+            for upper_bound, bucket_count in zip(
+                    [repr(bound) for bound in self.__latency_buckets] + ['+Inf'],
+                    access['latency_histogram']):
+                cumulative += bucket_count
+                latency_lines.append(f'{prefix}_latency_seconds_bucket{{{labels},'
+                                     f'le="{upper_bound}"}} {cumulative:d}')
+            latency_lines.append(f'{prefix}_latency_seconds_sum{{{labels}}} '
+                                 f'{access["total_seconds"]!r}')
+            latency_lines.append(f'{prefix}_latency_seconds_count{{{labels}}} '
+                                 f'{access["count"]:d}')
+
+        return '\n'.join(count_lines + bytes_lines + latency_lines) + '\n'
+
+    def write_prometheus(self, path: Union[str, os.PathLike],
+                         address_map: Optional['BaseSection'] = None,
+                         prefix: str = 'peakrdl') -> None:
+        """
+        Write the statistics to a file in the Prometheus text exposition format, for example
+        for the textfile collector of the node exporter. The file is written under a temporary
+        name then renamed, so a partly written file is never collected
+
+        Args:
+            path: file to write
+            address_map: if this is provided, each address is labelled with the full instance
+                         name of the register (or memory) at that address
+            prefix: prefix of the metric names
+        """
+        temporary_path = f'{os.fspath(path)}.tmp'
+        with open(temporary_path, 'w', encoding='utf-8') as fid:
+            fid.write(self.to_prometheus(address_map=address_map, prefix=prefix))
+        os.replace(temporary_path, path)
@@ -20,15 +20,17 @@ peakrdl-python tool. It provides a set of classes used by the autogenerated code
 memories
 """
 from array import array as Array
-from typing import Union, TYPE_CHECKING
+from typing import Any, Optional, Union, TYPE_CHECKING, cast
 from collections.abc import Iterator
 from abc import ABC, abstractmethod
 import sys
 
-from .base import Node, AddressMap, AsyncAddressMap, NodeArray
-from .utility_functions import get_array_typecode
+from .base import Node, AddressMap, AsyncAddressMap, NodeArray, AddressIndex
+from .utility_functions import get_array_typecode, get_buffer_format, split_bursts
 
 from .callbacks import NormalCallbackSet, NormalCallbackSetLegacy
+from .field_columns import decode_field_columns, decode_field_columns_numpy, \
+    encode_field_columns
 
 # same bit of code exists in base so flags as duplicate
 # pylint: disable=duplicate-code
@@ -41,12 +43,15 @@ else:
 
 
 if TYPE_CHECKING:
+    from .base_field import Field
+    from .base_register import BaseReg, BaseRegArray
+    from .async_register_and_field import ReadableAsyncRegister, WritableAsyncRegister
     from .register_and_field import Reg, RegArray
     from .register_and_field import ReadableRegister, WritableRegister
     from .register_and_field import ReadableRegisterArray, WriteableRegisterArray
     from .async_memory import AsyncMemoryArray
 
-# pylint: disable=duplicate-code
+# pylint: disable=duplicate-code,too-many-lines
 
 
 class BaseMemory(Node, ABC):
@@ -58,7 +63,7 @@ class BaseMemory(Node, ABC):
         circumstances however, it is useful for type checking
     """
 
-    __slots__: list[str] = ['__memwidth', '__entries', '__accesswidth']
+    __slots__: list[str] = ['__memwidth', '__entries', '__accesswidth', '__address_index']
 
     # pylint: disable=too-many-arguments
     def __init__(self, *,
@@ -86,8 +91,25 @@ class BaseMemory(Node, ABC):
         self.__memwidth = width
         self.__entries = entries
         self.__accesswidth = accesswidth
+        # the index of the registers in the memory is only built when it is first needed
+        self.__address_index: Optional[AddressIndex] = None
     # pylint: enable=too-many-arguments
 
+    @abstractmethod
+    def get_registers(self, unroll: bool = False) -> \
+            Iterator[Union['BaseReg', 'BaseRegArray']]:
+        """
+        generator that produces all the registers of this node
+
+        Args:
+            unroll: Whether to unroll child array or not
+        """
+
+    def _child_at(self, address: int) -> Optional[Union[Node, NodeArray]]:
+        if self.__address_index is None:
+            self.__address_index = AddressIndex(self.get_registers(unroll=False))
+        return self.__address_index.node_at(address)
+
     @property
     def width(self) -> int:
         """
@@ -139,6 +161,134 @@ class BaseMemory(Node, ABC):
         """
         return self.entries * self.width_in_bytes
 
+    @property
+    def _is_readable(self) -> bool:
+        # overridden in the readable memories
+        return False
+
+    @property
+    def _is_writeable(self) -> bool:
+        # overridden in the writable memories
+        return False
+
+    def _buffer_view(self, buffer: Any, writable: bool) -> memoryview:
+        """
+        Make a byte view of a buffer used with the buffer based block access methods
+
+        Args:
+            buffer: any object supporting the buffer protocol, e.g. bytearray, memoryview,
+                    array.array or a numpy array
+            writable: whether the buffer needs to be written to
+
+        Returns: byte memoryview of the buffer
+        """
+        try:
+            view = memoryview(buffer)
+        except TypeError as exc:
+            raise TypeError(f'buffer must support the buffer protocol, got {type(buffer)}') \
+                from exc
+
+        if writable and view.readonly:
+            raise TypeError('buffer must be writable')
+
+        if not view.c_contiguous:
+            raise ValueError('buffer must be contiguous')
+
+        view = view.cast('B')
+        if view.nbytes % self.width_in_bytes != 0:
+            raise ValueError(f'buffer size ({view.nbytes:d} bytes) must be a multiple of the '
+                             f'memory width ({self.width_in_bytes:d} bytes)')
+
+        return view
+
+    def _check_buffer_range(self, start_entry: int, number_entries: int) -> None:
+        """
+        Check the range of entries accessed by the buffer based block access methods
+        """
+        if not isinstance(start_entry, int):
+            raise TypeError(f'start_entry should be an int got {type(start_entry)}')
+
+        if start_entry not in range(0, self.entries):
+            raise ValueError(f'entry must be in range 0 to {self.entries - 1:d} '
+                             f'but got {start_entry:d}')
+
+        if number_entries not in range(0, self.entries - start_entry + 1):
+            raise ValueError(f'buffer size must be in range 0 to'
+                             f' {self.entries - start_entry:d} entries but got '
+                             f'{number_entries:d}')
+
+    def _column_fields(self, reg_template: Union['ReadableRegister', 'ReadableAsyncRegister'],
+                       start_entry: int, number_entries: Optional[int]) -> \
+            tuple[list['Field'], int]:
+        """
+        Check the arguments of the field column read methods
+
+        Returns:
+            the readable fields of the template register and the number of entries to read
+        """
+        if not isinstance(reg_template, Node) or not hasattr(reg_template, 'readable_fields'):
+            raise TypeError(f'reg_template should be a readable register, '
+                            f'got {type(reg_template)}')
+        if reg_template.width != self.width:
+            raise ValueError(f'reg_template width ({reg_template.width:d}) must match the '
+                             f'memory width ({self.width:d})')
+        if number_entries is None:
+            if not isinstance(start_entry, int):
+                raise TypeError(f'start_entry should be an int got {type(start_entry)}')
+            number_entries = self.entries - start_entry
+        return list(reg_template.readable_fields), number_entries
+
+    def _encode_field_columns(self,
+                              reg_template: Union['WritableRegister', 'WritableAsyncRegister'],
+                              columns: dict[str, Any]) -> tuple[int, list[int]]:
+        """
+        Check and encode the columns of the field column write methods
+
+        Returns:
+            bit mask of the bits in each entry which are not written and the encoded entries
+        """
+        if not isinstance(reg_template, Node) or not hasattr(reg_template, 'writable_fields'):
+            raise TypeError(f'reg_template should be a writable register, '
+                            f'got {type(reg_template)}')
+        if reg_template.width != self.width:
+            raise ValueError(f'reg_template width ({reg_template.width:d}) must match the '
+                             f'memory width ({self.width:d})')
+        if len(columns) == 0:
+            raise ValueError('no columns')
+        number_entries = len(next(iter(columns.values())))
+        written_bitmask, encoded_values = encode_field_columns(
+            fields=reg_template.writable_fields, columns=columns, number_entries=number_entries,
+            width=self.width)
+        return ((1 << self.width) - 1) ^ written_bitmask, encoded_values
+
+    def _pack_buffer(self, view: memoryview, data: Union[list[int], Array]) -> None:
+        """
+        Place memory entries in a byte view of a buffer, in the native byte order
+        """
+        buffer_format = get_buffer_format(self.width_in_bytes)
+        if buffer_format is not None:
+            if isinstance(data, Array) and data.typecode == buffer_format:
+                view[:] = memoryview(data).cast('B')
+            else:
+                view.cast(buffer_format)[:] = Array(buffer_format, data)  # type: ignore[call-overload]
+            return
+
+        for entry, entry_data in enumerate(data):
+            offset = entry * self.width_in_bytes
+            view[offset:offset + self.width_in_bytes] = \
+                entry_data.to_bytes(self.width_in_bytes, sys.byteorder)
+
+    def _unpack_buffer(self, view: memoryview) -> list[int]:
+        """
+        Extract memory entries from a byte view of a buffer, in the native byte order
+        """
+        buffer_format = get_buffer_format(self.width_in_bytes)
+        if buffer_format is not None:
+            return view.cast(buffer_format).tolist()  # type: ignore[call-overload,no-any-return]
+
+        return [int.from_bytes(view[offset:offset + self.width_in_bytes], sys.byteorder)
+                for offset in range(0, view.nbytes, self.width_in_bytes)]
+
     def address_lookup(self, entry: int) -> int:
         """
         provides the address for an entry in the memory.
@@ -262,9 +412,12 @@ class _MemoryReadOnly(Memory, ABC):
                          inst_name=inst_name,
                          parent=parent)
 
-    # pylint: enable=too-many-arguments
     @property
-    def _callbacks(self) -> Union[NormalCallbackSet, NormalCallbackSetLegacy]:
+    def _is_readable(self) -> bool:
+        return True
+
+    # pylint: enable=too-many-arguments
+    def _resolve_callbacks(self) -> Union[NormalCallbackSet, NormalCallbackSetLegacy]:
         # pylint: disable=protected-access
         if self.parent is None:
             raise RuntimeError('Parent must be set')
@@ -274,6 +427,61 @@ class _MemoryReadOnly(Memory, ABC):
 
         raise TypeError(f'unhandled parent callback type: {type(self.parent._callbacks)}')
 
+    @property
+    def _callbacks(self) -> Union[NormalCallbackSet, NormalCallbackSetLegacy]:
+        # This cast is OK because the type is checked when the callbacks are resolved
+        return cast(Union[NormalCallbackSet, NormalCallbackSetLegacy], self._cached_callbacks())
+
+    def __read_block(self, start_entry: int, number_entries: int) -> Union[list[int], Array]:
+        """
+        Read from the memory using the read block callback, the transfer is split into bursts
+        if the callbacks have a maximum burst length. The data is returned in the form provided
+        by the callback set, a list for NormalCallbackSet and an array for
+        NormalCallbackSetLegacy
+        """
+        read_block_callback = self._callbacks.read_block_callback
+        list_bursts: list[list[int]] = []
+        array_bursts: list[Array] = []
+
+        for burst_start, burst_length in split_bursts(
+                start_entry=start_entry, number_entries=number_entries,
+                max_burst_length=self._callbacks.max_burst_length):
+            if read_block_callback is None:
+                raise RuntimeError('There is no usable callback')
+            data_read = read_block_callback(addr=self.address_lookup(entry=burst_start),
+                                            width=self.width,
+                                            accesswidth=self.width,
+                                            length=burst_length)
+
+            if isinstance(self._callbacks, NormalCallbackSet):
+                if not isinstance(data_read, list):
+                    if isinstance(data_read, Array):
+                        raise TypeError(
+                            'The read block callback is expected to return an list, this '
+                            'is likely to happen if you are using legacy callbacks without '
+                            'NormalCallbackSetLegacy')
+                    raise TypeError('The read block callback is expected to return an List')
+                list_bursts.append(data_read)
+            elif isinstance(self._callbacks, NormalCallbackSetLegacy):
+                if not isinstance(data_read, Array):
+                    raise TypeError('The read block callback is expected to return an array')
+                array_bursts.append(data_read)
+            else:
+                raise RuntimeError(f'There is no usable callback block callback:'
+                                   f'{read_block_callback}')
+
+        if array_bursts:
+            if len(array_bursts) == 1:
+                return array_bursts[0]
+            data_array = Array(array_bursts[0].typecode)
+            for burst in array_bursts:
+                data_array.extend(burst)
+            return data_array
+
+        if len(list_bursts) == 1:
+            return list_bursts[0]
+        return [entry for burst in list_bursts for entry in burst]
+
     def _read(self, start_entry: int, number_entries: int) -> list[int]:
         """
         Read from the memory
@@ -304,29 +512,10 @@ class _MemoryReadOnly(Memory, ABC):
         read_callback = self._callbacks.read_callback
 
         if read_block_callback is not None:
-            addr = self.address_lookup(entry=start_entry)
-            data_read = \
-                read_block_callback(addr=addr,
-                                    width=self.width,
-                                    accesswidth=self.width,
-                                    length=number_entries)
-
-            if isinstance(self._callbacks, NormalCallbackSet):
-                if not isinstance(data_read, list):
-                    if isinstance(data_read, Array):
-                        raise TypeError(
-                            'The read block callback is expected to return an list, this '
-                            'is likely to happen if you are using legacy callbacks without '
-                            'NormalCallbackSetLegacy')
-                    raise TypeError('The read block callback is expected to return an List')
-                return data_read
-
-            if isinstance(self._callbacks, NormalCallbackSetLegacy):
-                if not isinstance(data_read, Array):
-                    raise TypeError('The read block callback is expected to return an array')
+            data_read = self.__read_block(start_entry=start_entry, number_entries=number_entries)
+            if isinstance(data_read, Array):
                 return data_read.tolist()
-
-            raise RuntimeError(f'There is no usable callback block callback:{read_block_callback}')
+            return data_read
 
         if read_callback is not None:
             # there is not read_block_callback defined so we must used individual read
@@ -376,29 +565,10 @@ class _MemoryReadOnly(Memory, ABC):
         read_callback = self._callbacks.read_callback
 
         if read_block_callback is not None:
-            addr = self.address_lookup(entry=start_entry)
-            data_read = \
-                read_block_callback(addr=addr,
-                                    width=self.width,
-                                    accesswidth=self.width,
-                                    length=number_entries)
-
-            if isinstance(self._callbacks, NormalCallbackSet):
-                if not isinstance(data_read, list):
-                    if isinstance(data_read, Array):
-                        raise TypeError(
-                            'The read block callback is expected to return an list, this '
-                            'is likely to happen if you are using legacy callbacks without '
-                            'NormalCallbackSetLegacy')
-                    raise TypeError('The read block callback is expected to return an List')
+            data_read = self.__read_block(start_entry=start_entry, number_entries=number_entries)
+            if isinstance(data_read, list):
                 return Array(self.array_typecode, data_read)
-
-            if isinstance(self._callbacks, NormalCallbackSetLegacy):
-                if not isinstance(data_read, Array):
-                    raise TypeError('The read block callback is expected to return an array')
-                return data_read
-
-            raise RuntimeError(f'There is no usable callback block callback:{read_block_callback}')
+            return data_read
 
         if read_callback is not None:
             # there is not read_block_callback defined so we must used individual read
@@ -418,6 +588,116 @@ class _MemoryReadOnly(Memory, ABC):
                            f'block callback:{read_block_callback}, '
                            f'normal callback:{read_callback}')
 
+    def read_into(self, buffer: Any, start_entry: int = 0) -> int:
+        """
+        Read from the memory directly into a buffer, this avoids building a python int for
+        every entry if the callbacks include a ``read_block_into_callback``. The number of
+        entries read is determined by the size of the buffer, with each entry occupying
+        :attr:`width_in_bytes` bytes in the native byte order.
+
+        Args:
+            buffer: writable object supporting the buffer protocol, e.g. bytearray, memoryview,
+                    array.array or a numpy array
+            start_entry: index in the memory to start from, this is not the address
+
+        Returns: number of entries read
+
+        """
+        view = self._buffer_view(buffer, writable=True)
+        number_entries = view.nbytes // self.width_in_bytes
+        self._check_buffer_range(start_entry=start_entry, number_entries=number_entries)
+
+        read_block_into_callback = self._callbacks.read_block_into_callback
+        if read_block_into_callback is not None:
+            for burst_start, burst_length in split_bursts(
+                    start_entry=start_entry, number_entries=number_entries,
+                    max_burst_length=self._callbacks.max_burst_length):
+                offset = (burst_start - start_entry) * self.width_in_bytes
+                read_block_into_callback(addr=self.address_lookup(entry=burst_start),
+                                         width=self.width,
+                                         accesswidth=self.width,
+                                         length=burst_length,
+                                         buffer=view[offset:offset +
+                                                     (burst_length * self.width_in_bytes)])
+        elif isinstance(self._callbacks, NormalCallbackSetLegacy):
+            self._pack_buffer(view, self._read_legacy(start_entry=start_entry,
+                                                      number_entries=number_entries))
+        else:
+            self._pack_buffer(view, self._read(start_entry=start_entry,
+                                               number_entries=number_entries))
+
+        return number_entries
+
+    def read_buffer(self, start_entry: int, number_entries: int) -> bytearray:
+        """
+        Read from the memory into a new buffer, see :meth:`read_into`
+
+        Args:
+            start_entry: index in the memory to start from, this is not the address
+            number_entries: number of entries to read
+
+        Returns: data read from memory, with each entry occupying :attr:`width_in_bytes` bytes
+                 in the native byte order
+
+        """
+        if not isinstance(number_entries, int):
+            raise TypeError(f'number_entries should be an int got {type(number_entries)}')
+        if number_entries < 0:
+            raise ValueError(f'number_entries must be positive but got {number_entries:d}')
+
+        buffer = bytearray(number_entries * self.width_in_bytes)
+        self.read_into(buffer, start_entry=start_entry)
+        return buffer
+
+    def read_field_columns(self, reg_template: 'ReadableRegister', start_entry: int = 0,
+                           number_entries: Optional[int] = None) -> dict[str, list[int]]:
+        """
+        Read a range of the memory (with a single block read if the callbacks support it) and
+        decode every entry using the fields of a register, this is much faster than reading the
+        fields of each register in turn. Enumerated fields are returned as their integer values
+
+        Args:
+            reg_template: register whose fields are used to decode every entry, this must be
+                          the same width as the memory
+            start_entry: index in the memory to start from, this is not the address
+            number_entries: number of entries to read, if omitted the read continues to the
+                            end of the memory
+
+        Returns:
+            dictionary keyed by the field name, with a list of the field value of each entry
+        """
+        fields, number_entries = self._column_fields(reg_template=reg_template,
+                                                     start_entry=start_entry,
+                                                     number_entries=number_entries)
+        return decode_field_columns(fields=fields,
+                                    reg_values=self._read(start_entry=start_entry,
+                                                          number_entries=number_entries))
+
+    def read_field_columns_numpy(self, reg_template: 'ReadableRegister', start_entry: int = 0,
+                                 number_entries: Optional[int] = None) -> dict[str, Any]:
+        """
+        Same as :meth:`read_field_columns` but the columns are numpy arrays decoded with numpy
+        array operations, this needs numpy to be installed
+
+        Args:
+            reg_template: register whose fields are used to decode every entry, this must be
+                          the same width as the memory
+            start_entry: index in the memory to start from, this is not the address
+            number_entries: number of entries to read, if omitted the read continues to the
+                            end of the memory
+
+        Returns:
+            dictionary keyed by the field name, with a numpy array of the field value of each
+            entry
+        """
+        fields, number_entries = self._column_fields(reg_template=reg_template,
+                                                     start_entry=start_entry,
+                                                     number_entries=number_entries)
+        return decode_field_columns_numpy(fields=fields,
+                                          reg_values=self._read(start_entry=start_entry,
+                                                                number_entries=number_entries),
+                                          width=self.width)
+
     def get_readable_registers(self, unroll: bool = False) -> \
             Iterator[Union['ReadableRegister', 'ReadableRegisterArray']]:
         """
@@ -519,9 +799,12 @@ class _MemoryWriteOnly(Memory, ABC):
                          inst_name=inst_name,
                          parent=parent)
 
-    # pylint: enable=too-many-arguments
     @property
-    def _callbacks(self) -> Union[NormalCallbackSet, NormalCallbackSetLegacy]:
+    def _is_writeable(self) -> bool:
+        return True
+
+    # pylint: enable=too-many-arguments
+    def _resolve_callbacks(self) -> Union[NormalCallbackSet, NormalCallbackSetLegacy]:
         # pylint: disable=protected-access
         if self.parent is None:
             raise RuntimeError('Parent must be set')
@@ -531,6 +814,42 @@ class _MemoryWriteOnly(Memory, ABC):
 
         raise TypeError(f'unhandled parent callback type: {type(self.parent._callbacks)}')
 
+    @property
+    def _callbacks(self) -> Union[NormalCallbackSet, NormalCallbackSetLegacy]:
+        # This cast is OK because the type is checked when the callbacks are resolved
+        return cast(Union[NormalCallbackSet, NormalCallbackSetLegacy], self._cached_callbacks())
+
+    def __write_block(self, start_entry: int, data: Union[Array, list[int]]) -> None:
+        """
+        Write a single burst to the memory using the write block callback
+        """
+        if self._callbacks.write_block_callback is None:
+            raise RuntimeError('No suitable callback')
+        addr = self.address_lookup(entry=start_entry)
+        if isinstance(self._callbacks, NormalCallbackSet):
+            if isinstance(data, Array):
+                self._callbacks.write_block_callback(addr=addr,
+                                                     width=self.width,
+                                                     accesswidth=self.width,
+                                                     data=data.tolist())
+            else:
+                self._callbacks.write_block_callback(addr=addr,
+                                                     width=self.width,
+                                                     accesswidth=self.width,
+                                                     data=data)
+        if isinstance(self._callbacks, NormalCallbackSetLegacy):
+            if isinstance(data, list):
+                # need to convert the data to an array before calling
+                self._callbacks.write_block_callback(addr=addr,
+                                                     width=self.width,
+                                                     accesswidth=self.width,
+                                                     data=Array(self.array_typecode, data))
+            else:
+                self._callbacks.write_block_callback(addr=addr,
+                                                     width=self.width,
+                                                     accesswidth=self.width,
+                                                     data=data)
+
     def _write(self, start_entry: int, data: Union[Array, list[int]]) -> None:
         """
         Write data to memory
@@ -558,30 +877,12 @@ class _MemoryWriteOnly(Memory, ABC):
                              f'but got {len(data):d}')
 
         if self._callbacks.write_block_callback is not None:
-            addr = self.address_lookup(entry=start_entry)
-            if isinstance(self._callbacks, NormalCallbackSet):
-                if isinstance(data, Array):
-                    self._callbacks.write_block_callback(addr=addr,
-                                                         width=self.width,
-                                                         accesswidth=self.width,
-                                                         data=data.tolist())
-                else:
-                    self._callbacks.write_block_callback(addr=addr,
-                                                         width=self.width,
-                                                         accesswidth=self.width,
-                                                         data=data)
-            if isinstance(self._callbacks, NormalCallbackSetLegacy):
-                if isinstance(data, list):
-                    # need to convert the data to an array before calling
-                    self._callbacks.write_block_callback(addr=addr,
-                                                         width=self.width,
-                                                         accesswidth=self.width,
-                                                         data=Array(self.array_typecode, data))
-                else:
-                    self._callbacks.write_block_callback(addr=addr,
-                                                         width=self.width,
-                                                         accesswidth=self.width,
-                                                         data=data)
+            for burst_start, burst_length in split_bursts(
+                    start_entry=start_entry, number_entries=len(data),
+                    max_burst_length=self._callbacks.max_burst_length):
+                offset = burst_start - start_entry
+                self.__write_block(start_entry=burst_start,
+                                   data=data[offset:offset + burst_length])
 
         elif self._callbacks.write_callback is not None:
             # there is not write_block_callback defined so we must used individual write
@@ -595,6 +896,71 @@ class _MemoryWriteOnly(Memory, ABC):
         else:
             raise RuntimeError('No suitable callback')
 
+    def write_buffer(self, buffer: Any, start_entry: int = 0) -> None:
+        """
+        Write data to memory directly from a buffer, this avoids building a python int for
+        every entry if the callbacks include a ``write_block_buffer_callback``. The number of
+        entries written is determined by the size of the buffer, with each entry occupying
+        :attr:`width_in_bytes` bytes in the native byte order.
+
+        Args:
+            buffer: object supporting the buffer protocol, e.g. bytes, bytearray, memoryview,
+                    array.array or a numpy array
+            start_entry: index in the memory to start from, this is not the address
+
+        Returns: None
+
+        """
+        view = self._buffer_view(buffer, writable=False)
+        number_entries = view.nbytes // self.width_in_bytes
+        self._check_buffer_range(start_entry=start_entry, number_entries=number_entries)
+
+        write_block_buffer_callback = self._callbacks.write_block_buffer_callback
+        if write_block_buffer_callback is not None:
+            view = view.toreadonly()
+            for burst_start, burst_length in split_bursts(
+                    start_entry=start_entry, number_entries=number_entries,
+                    max_burst_length=self._callbacks.max_burst_length):
+                offset = (burst_start - start_entry) * self.width_in_bytes
+                write_block_buffer_callback(addr=self.address_lookup(entry=burst_start),
+                                            width=self.width,
+                                            accesswidth=self.width,
+                                            length=burst_length,
+                                            buffer=view[offset:offset +
+                                                        (burst_length * self.width_in_bytes)])
+        else:
+            self._write(start_entry=start_entry, data=self._unpack_buffer(view))
+
+    def write_field_columns(self, reg_template: 'WritableRegister', start_entry: int = 0,
+                            **columns: Any) -> None:
+        """
+        Write a range of the memory (with a single block write if the callbacks support it)
+        from columns of field values, using the fields of a register to encode every entry.
+        This is much faster than writing the fields of each register in turn.
+
+        Each column can be a sequence of integers or a numpy array, the values of enumerated
+        fields must be given as integers. Any fields that are not included keep their current
+        value if the memory can be read (this needs a block read first), otherwise they are
+        written as zero.
+
+        Args:
+            reg_template: register whose fields are used to encode every entry, this must be
+                          the same width as the memory
+            start_entry: index in the memory to start from, this is not the address
+            **columns: field values keyed by the field name, the number of entries written is
+                       the length of the columns
+        """
+        keep_bitmask, encoded_values = self._encode_field_columns(reg_template=reg_template,
+                                                                  columns=columns)
+        if keep_bitmask != 0 and isinstance(self, _MemoryReadOnly):
+            # pylint: disable-next=no-member
+            current_values = self._read(start_entry=start_entry,
+                                        number_entries=len(encoded_values))
+            encoded_values = [(current_value & keep_bitmask) | encoded_value
+                              for current_value, encoded_value in zip(current_values,
+                                                                      encoded_values)]
+        self._write(start_entry=start_entry, data=encoded_values)
+
     def get_writable_registers(self, unroll: bool = False) -> \
             Iterator[Union['WritableRegister', 'WriteableRegisterArray']]:
         """
@@ -20,25 +20,28 @@ peakrdl-python tool. It provides a set of classes used by the autogenerated code
 registers and fields
 """
 from enum import Enum
-from typing import Union, cast, Optional, TypeVar
-from collections.abc import Generator, Iterator
+from typing import Any, Union, cast, Optional, TypeVar
+from collections.abc import Generator, Iterator, Sequence, Mapping
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
 from array import array as Array
 import sys
 from warnings import warn
+from logging import INFO
 
 from .base import AddressMap, RegFile
 from .utility_functions import get_array_typecode
-from .utility_functions import swap_msb_lsb_ordering
 from .memory import  MemoryReadOnly, MemoryWriteOnly, MemoryReadWrite, Memory, \
     ReadableMemory, WritableMemory
 from .memory import MemoryReadOnlyLegacy, MemoryWriteOnlyLegacy, MemoryReadWriteLegacy
 from .memory import ReadableMemoryLegacy, WritableMemoryLegacy
 from .callbacks import NormalCallbackSet, NormalCallbackSetLegacy
+from .callbacks import BatchCallbackSet, BatchReadFuture
 from .base_register import BaseReg, BaseRegArray, RegisterWriteVerifyError
 from .base_field import FieldEnum, FieldSizeProps, FieldMiscProps, \
     _FieldReadOnlyFramework, _FieldWriteOnlyFramework
+from .field_columns import decode_field_columns, decode_field_columns_numpy, \
+    encode_field_columns
 
 # pylint: disable=duplicate-code
 if sys.version_info >= (3, 11):
@@ -90,8 +93,7 @@ class Reg(BaseReg, ABC):
         super().__init__(address=address, width=width, accesswidth=accesswidth,
                          logger_handle=logger_handle, inst_name=inst_name, parent=parent)
 
-    @property
-    def _callbacks(self) -> Union[NormalCallbackSet, NormalCallbackSetLegacy]:
+    def _resolve_callbacks(self) -> Union[NormalCallbackSet, NormalCallbackSetLegacy]:
         # pylint: disable=protected-access
         if self.parent is None:
             raise RuntimeError('Parent must be set')
@@ -101,6 +103,11 @@ class Reg(BaseReg, ABC):
 
         raise TypeError(f'unhandled parent callback type: {type(self.parent._callbacks)}')
 
+    @property
+    def _callbacks(self) -> Union[NormalCallbackSet, NormalCallbackSetLegacy]:
+        # This cast is OK because the type is checked when the callbacks are resolved
+        return cast(Union[NormalCallbackSet, NormalCallbackSetLegacy], self._cached_callbacks())
+
     @property
     @abstractmethod
     def fields(self) -> Iterator[Union['FieldReadOnly', 'FieldWriteOnly', 'FieldReadWrite']]:
@@ -134,11 +141,11 @@ class RegArray(BaseRegArray, ABC):
                  address: int,
                  stride: int,
                  dimensions: tuple[int, ...],
-                 elements: Optional[dict[tuple[int, ...], RegArrayElementType]] = None):
+                 elements: Optional[Mapping[tuple[int, ...], RegArrayElementType]] = None):
 
         self.__in_context_manager: bool = False
         self.__register_cache: Optional[Union[Array, list[int]]] = None
-        self.__register_address_array: Optional[list[int]] = None
+        self.__register_address_array: Optional[range] = None
 
         if not isinstance(parent._callbacks, (NormalCallbackSet, NormalCallbackSetLegacy)):
             raise TypeError(f'callback set type is wrong, got {type(parent._callbacks)}')
@@ -416,16 +423,21 @@ class RegArray(BaseRegArray, ABC):
             verify (bool): very the write with a read afterwards
             skip_write (bool): skip the write back at the end
         """
+        width_in_bytes = self.width >> 3
         self.__register_address_array = \
-            [self.address + (i * (self.width >> 3)) for i in range(self.__number_cache_entries)]
+            range(self.address, self.address + (self.__number_cache_entries * width_in_bytes),
+                  width_in_bytes)
         self.__register_cache = self.__initialise_cache(skip_initial_read=skip_initial_read)
         self.__in_context_manager = True
+        # the registers in the array use the callbacks of the array, which change to the cache
+        self._invalidate_callbacks()
         # this try/finally is needed to make sure that in the event of an exception
         # the state flags are not left incorrectly set
         try:
             yield self
         finally:
             self.__in_context_manager = False
+            self._invalidate_callbacks()
         if not skip_write:
             if isinstance(self._callbacks, NormalCallbackSet):
                 if not isinstance(self.__register_cache, list):
@@ -440,17 +452,76 @@ class RegArray(BaseRegArray, ABC):
         self.__register_address_array = None
         self.__register_cache = None
 
+    def _read_element_values(self) -> tuple[list[_FieldReadOnlyFramework], list[int]]:
+        """
+        Read the whole array with a single block operation (if the callbacks support it)
+
+        Returns:
+            the readable fields of an element of the array, which can be used to decode the
+            values, and the value of each element in the array order
+        """
+        with self._cached_access(verify=False, skip_write=True, skip_initial_read=False):
+            reg_values = self.__register_cache
+        if reg_values is None:
+            raise RuntimeError('The cache array should be initialised')
+
+        # all the elements have the same fields so any one can be used to decode the values
+        fields = [field for field in next(iter(self)).fields
+                  if isinstance(field, _FieldReadOnlyFramework)]
+        return fields, [reg_values[entry] for entry in self.__element_entries()]
+
+    def __element_entries(self) -> Sequence[int]:
+        """
+        Entries of the register cache which hold each element of the array, in the array order
+        """
+        if len(self) == self.__number_cache_entries:
+            # the array is complete and packed so the cache is already in the array order
+            return range(len(self))
+        width_in_bytes = self.width >> 3
+        return [(address - self.address) // width_in_bytes for address in self.addresses()]
+
+    def _write_field_columns(self, columns: dict[str, Any]) -> None:
+        """
+        Write columns of field values to every element of the array with a single block
+        write (if the callbacks support it), see ``write_field_columns``
+        """
+        if len(columns) == 0:
+            raise ValueError('no columns')
+
+        # all the elements have the same fields so any one can be used to encode the values
+        fields = [field for field in next(iter(self)).fields
+                  if isinstance(field, _FieldWriteOnlyFramework)]
+        written_bitmask, encoded_values = encode_field_columns(
+            fields=fields, columns=columns, number_entries=len(self), width=self.width)
+        keep_bitmask = ((1 << self.width) - 1) ^ written_bitmask
+
+        # the other fields are only preserved if the registers can be read, otherwise they are
+        # written with zero in the same way as a field write to a write only register
+        skip_initial_read = keep_bitmask == 0 or not self._is_readable
+        with self._cached_access(verify=False, skip_write=False,
+                                 skip_initial_read=skip_initial_read):
+            reg_values = self.__register_cache
+            if reg_values is None:
+                raise RuntimeError('The cache array should be initialised')
+            for entry, encoded_value in zip(self.__element_entries(), encoded_values):
+                reg_values[entry] = (reg_values[entry] & keep_bitmask) | encoded_value
+
+    def _read_field_columns(self) -> dict[str, list[int]]:
+        fields, reg_values = self._read_element_values()
+        return decode_field_columns(fields=fields, reg_values=reg_values)
+
+    def _read_field_columns_numpy(self) -> dict[str, Any]:
+        fields, reg_values = self._read_element_values()
+        return decode_field_columns_numpy(fields=fields, reg_values=reg_values, width=self.width)
+
     @property
     def _callbacks(self) -> NormalCallbackSet:
 
         if self.__in_context_manager:
             return self.__cache_callbacks
 
-        if self.parent is None:
-            raise RuntimeError('Parent must be set')
         # This cast is OK because the type was checked in the __init__
-        # pylint: disable-next=protected-access
-        return cast(NormalCallbackSet, self.parent._callbacks)
+        return cast(NormalCallbackSet, self._cached_callbacks())
 
 
 class RegReadOnly(Reg, ABC):
@@ -525,6 +596,32 @@ class RegReadOnly(Reg, ABC):
 
         raise RuntimeError('This function does not have a useable callback')
 
+    def read_deferred(self) -> BatchReadFuture[int]:
+        """
+        Read the register as part of a batch (see the ``batch`` context manager of the
+        AddressMap), the read is queued and the value is available from the returned future
+        once the batch has been flushed.
+
+        If there is no open batch the read is performed immediately
+
+        Returns:
+            future holding the register value
+        """
+        if self.__in_context_manager:
+            future: BatchReadFuture[int] = BatchReadFuture()
+            future.set_result(self.__register_state)
+            return future
+
+        callbacks = self._callbacks
+        if isinstance(callbacks, BatchCallbackSet):
+            return callbacks.enqueue_read(addr=self.address,
+                                          width=self.width,
+                                          accesswidth=self.accesswidth)
+
+        future = BatchReadFuture()
+        future.set_result(self.read())
+        return future
+
     @property
     def readable_fields(self) -> Iterator[Union['FieldReadOnly', 'FieldReadWrite']]:
         """
@@ -542,8 +639,12 @@ class RegReadOnly(Reg, ABC):
         """
         return_dict: dict['str', Union[bool, Enum, int]] = {}
         with self.single_read() as reg:
+            # the register value is checked once, so that each field can decode it without
+            # repeating the checks
+            reg_value = reg.read()
+            self._validate_data(data=reg_value)
             for field in reg.readable_fields:
-                return_dict[field.inst_name] = field.read()
+                return_dict[field.inst_name] = field.decode_read_value(reg_value, checked=False)
 
         return return_dict
 
@@ -594,7 +695,8 @@ class RegWriteOnly(Reg, ABC):
         # this method check the types and range checks the data
         self._validate_data(data=data)
 
-        self._logger.info('Writing data:%X to %X', data, self.address)
+        if self._logger.isEnabledFor(INFO):
+            self._logger.info('Writing data:%X to %X', data, self.address)
 
         if self._callbacks.write_callback is not None:
             self._callbacks.write_callback(addr=self.address,
@@ -774,6 +876,24 @@ class RegReadWrite(RegReadOnly, RegWriteOnly, ABC):
 
         return super().read()
 
+    def read_deferred(self) -> BatchReadFuture[int]:
+        """
+        Read the register as part of a batch (see the ``batch`` context manager of the
+        AddressMap), the read is queued and the value is available from the returned future
+        once the batch has been flushed.
+
+        If there is no open batch the read is performed immediately
+
+        Returns:
+            future holding the register value
+        """
+        if self.__in_read_write_context_manager:
+            future: BatchReadFuture[int] = BatchReadFuture()
+            future.set_result(self.read())
+            return future
+
+        return super().read_deferred()
+
     def write_fields(self, **kwargs) -> None:  # type: ignore[no-untyped-def]
         """
         Do a read-modify-write to the register, updating any field included in
@@ -796,8 +916,12 @@ class RegReadWrite(RegReadOnly, RegWriteOnly, ABC):
         """
         return_dict: dict['str', Union[bool, Enum, int]] = {}
         with self.single_read() as reg:
+            # the register value is checked once, so that each field can decode it without
+            # repeating the checks
+            reg_value = reg.read()
+            self._validate_data(data=reg_value)
             for field in reg.readable_fields:
-                return_dict[field.inst_name] = field.read()
+                return_dict[field.inst_name] = field.decode_read_value(reg_value, checked=False)
 
         return return_dict
 
@@ -831,7 +955,7 @@ class RegReadOnlyArray(RegArray, ABC):
                  accesswidth: int,
                  stride: int,
                  dimensions: tuple[int, ...],
-                 elements: Optional[dict[tuple[int, ...], RegReadOnly]] = None):
+                 elements: Optional[Mapping[tuple[int, ...], RegReadOnly]] = None):
 
         if not isinstance(parent, (RegFile, AddressMap, MemoryReadOnly, MemoryReadWrite,
                                    MemoryReadOnlyLegacy, MemoryReadWriteLegacy)):
@@ -858,6 +982,30 @@ class RegReadOnlyArray(RegArray, ABC):
                                  skip_initial_read=False) as reg_array:
             yield reg_array
 
+    def read_field_columns(self) -> dict[str, list[int]]:
+        """
+        Read the whole array (with a single block read if the callbacks support it) and decode
+        the readable fields of every element into columns, this is much faster than reading
+        the fields of each element in turn. Enumerated fields are returned as their integer
+        values
+
+        Returns:
+            dictionary keyed by the field name, with a list of the field value of each element
+            in the array order
+        """
+        return self._read_field_columns()
+
+    def read_field_columns_numpy(self) -> dict[str, Any]:
+        """
+        Same as :meth:`read_field_columns` but the columns are numpy arrays decoded with numpy
+        array operations, this needs numpy to be installed
+
+        Returns:
+            dictionary keyed by the field name, with a numpy array of the field value of each
+            element in the array order
+        """
+        return self._read_field_columns_numpy()
+
     @property
     def _is_readable(self) -> bool:
         # pylint: disable=duplicate-code
@@ -884,7 +1032,7 @@ class RegWriteOnlyArray(RegArray, ABC):
                  accesswidth: int,
                  stride: int,
                  dimensions: tuple[int, ...],
-                 elements: Optional[dict[tuple[int, ...], RegWriteOnly]] = None):
+                 elements: Optional[Mapping[tuple[int, ...], RegWriteOnly]] = None):
 
         if not isinstance(parent, (RegFile, AddressMap, MemoryWriteOnly, MemoryReadWrite,
                                    MemoryWriteOnlyLegacy, MemoryReadWriteLegacy)):
@@ -911,6 +1059,24 @@ class RegWriteOnlyArray(RegArray, ABC):
                                  skip_initial_read=True) as reg_array:
             yield reg_array
 
+    def write_field_columns(self, **columns: Any) -> None:
+        """
+        Write a column of values for one or more fields, with a value for each element of
+        the array in the array order. All the values are checked and encoded before the whole
+        array is written with a single block write (if the callbacks support it), this is much
+        faster than writing the fields of each element in turn.
+
+        Each column can be a sequence of integers or a numpy array, the values of enumerated
+        fields must be given as integers. Any fields that are not included keep their current
+        value if the registers can be read (this needs a block read first), otherwise they are
+        written as zero.
+
+        Args:
+            **columns: field values keyed by the field name
+
+        """
+        self._write_field_columns(columns)
+
     @property
     def _is_readable(self) -> bool:
         # pylint: disable=duplicate-code
@@ -937,7 +1103,7 @@ class RegReadWriteArray(RegArray, ABC):
                  accesswidth: int,
                  stride: int,
                  dimensions: tuple[int, ...],
-                 elements: Optional[dict[tuple[int, ...], RegReadWrite]] = None):
+                 elements: Optional[Mapping[tuple[int, ...], RegReadWrite]] = None):
 
         if not isinstance(parent, (RegFile, AddressMap, MemoryReadWrite, MemoryReadWriteLegacy)):
             raise TypeError('parent should be either RegFile, AddressMap, MemoryReadWrite '
@@ -967,6 +1133,48 @@ class RegReadWriteArray(RegArray, ABC):
                                  skip_initial_read=False) as reg_array:
             yield reg_array
 
+    def write_field_columns(self, **columns: Any) -> None:
+        """
+        Write a column of values for one or more fields, with a value for each element of
+        the array in the array order. All the values are checked and encoded before the whole
+        array is written with a single block write (if the callbacks support it), this is much
+        faster than writing the fields of each element in turn.
+
+        Each column can be a sequence of integers or a numpy array, the values of enumerated
+        fields must be given as integers. Any fields that are not included keep their current
+        value if the registers can be read (this needs a block read first), otherwise they are
+        written as zero.
+
+        Args:
+            **columns: field values keyed by the field name
+
+        """
+        self._write_field_columns(columns)
+
+    def read_field_columns(self) -> dict[str, list[int]]:
+        """
+        Read the whole array (with a single block read if the callbacks support it) and decode
+        the readable fields of every element into columns, this is much faster than reading
+        the fields of each element in turn. Enumerated fields are returned as their integer
+        values
+
+        Returns:
+            dictionary keyed by the field name, with a list of the field value of each element
+            in the array order
+        """
+        return self._read_field_columns()
+
+    def read_field_columns_numpy(self) -> dict[str, Any]:
+        """
+        Same as :meth:`read_field_columns` but the columns are numpy arrays decoded with numpy
+        array operations, this needs numpy to be installed
+
+        Returns:
+            dictionary keyed by the field name, with a numpy array of the field value of each
+            element in the array order
+        """
+        return self._read_field_columns_numpy()
+
     @property
     def _is_readable(self) -> bool:
         # pylint: disable=duplicate-code
@@ -1025,6 +1233,19 @@ class FieldReadOnly(_FieldReadOnlyFramework, ABC):
         """
         return self.decode_read_value(self.parent_register.read())
 
+    def read_deferred(self) -> BatchReadFuture[int]:
+        """
+        Read the field as part of a batch (see the ``batch`` context manager of the
+        AddressMap), the read of the register is queued and the field value is available from
+        the returned future once the batch has been flushed.
+
+        If there is no open batch the read is performed immediately
+
+        Returns:
+            future holding the field value
+        """
+        return self.parent_register.read_deferred().then(self.decode_read_value)
+
     @property
     def parent_register(self) -> ReadableRegister:
         """
@@ -1084,21 +1305,20 @@ class FieldWriteOnly(_FieldWriteOnlyFramework, ABC):
         """
         self._write_value_checks(value=value)
 
-        if self.msb0:
-            value = swap_msb_lsb_ordering(value=value, width=self.width)
+        encoded_value = self._size_props.encode(value)
 
         if (self.high == (self.register_data_width - 1)) and (self.low == 0):
             # special case where the field occupies the whole register,
             # there a straight write can be performed
-            new_reg_value = value
+            new_reg_value = encoded_value
         else:
             # do a read, modify write
             if isinstance(self.parent_register, RegReadWrite):
                 reg_value = self.parent_register.read()
                 masked_reg_value = reg_value & self.inverse_bitmask
-                new_reg_value = masked_reg_value | (value << self.low)
+                new_reg_value = masked_reg_value | encoded_value
             elif isinstance(self.parent_register, RegWriteOnly):
-                new_reg_value = value << self.low
+                new_reg_value = encoded_value
             else:
                 raise TypeError('Unhandled parent type')
 
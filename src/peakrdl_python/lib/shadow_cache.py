@@ -0,0 +1,291 @@
+"""
+peakrdl-python is a tool to generate Python Register Access Layer (RAL) from SystemRDL
+Copyright (C) 2021 - 2023
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+This module is intended to distributed as part of automatically generated code by the
+peakrdl-python tool. It provides the shadow register cache used by the ``cached`` context
+manager of an AddressMap
+"""
+from enum import Enum, auto
+from array import array as Array
+from typing import Union
+
+from .callbacks import NormalCallbackSet, NormalCallbackSetLegacy
+from .snapshot import write_run
+
+
+class CachePolicy(Enum):
+    """
+    Policy for handling writes to registers held in the shadow cache
+    """
+    #: writes update the shadow and are held until the cache is flushed, repeated writes to the
+    #: same register are collapsed into a single write
+    WRITE_BACK = auto()
+    #: writes update the shadow and are issued immediately, the shadow is only used for reads
+    WRITE_THROUGH = auto()
+
+
+class ShadowCache:
+    """
+    Shadow of the registers in an address map, this sits between the register model and the
+    callbacks, serving reads of cached registers from the shadow and (in write-back mode)
+    holding writes until the cache is flushed.
+
+    Only registers without any volatile (hardware writable) fields or fields with read or write
+    side effects should be cached, any access
+    to an address which is not cached goes straight to the callbacks. However, before it does
+    any held writes are flushed so that the order of the operations seen by the hardware is
+    preserved around accesses to volatile registers.
+
+    Args:
+        callbacks: callbacks used to access the hardware
+        policy: write policy for the cache
+        cacheable: dictionary of the registers which can be cached, keyed by address with the
+                   width and accesswidth as the value
+    """
+
+    __slots__ = ['__callbacks', '__policy', '__cacheable', '__shadow', '__dirty',
+                 '__cache_callbacks']
+
+    def __init__(self, *,
+                 callbacks: Union[NormalCallbackSet, NormalCallbackSetLegacy],
+                 policy: CachePolicy,
+                 cacheable: dict[int, tuple[int, int]]):
+
+        if not isinstance(callbacks, (NormalCallbackSet, NormalCallbackSetLegacy)):
+            raise TypeError(f'callback set type is wrong, got {type(callbacks)}')
+        if not isinstance(policy, CachePolicy):
+            raise TypeError(f'policy should be a CachePolicy, got {type(policy)}')
+
+        self.__callbacks = callbacks
+        self.__policy = policy
+        self.__cacheable = cacheable
+        self.__shadow: dict[int, int] = {}
+        self.__dirty: set[int] = set()
+
+        self.__cache_callbacks: Union[NormalCallbackSet, NormalCallbackSetLegacy]
+        if isinstance(callbacks, NormalCallbackSetLegacy):
+            self.__cache_callbacks = NormalCallbackSetLegacy(
+                read_callback=self.__read,
+                write_callback=self.__write,
+                read_block_callback=self.__read_block_legacy
+                if callbacks.read_block_callback is not None else None,
+                write_block_callback=self.__write_block_legacy
+                if callbacks.write_block_callback is not None else None,
+                read_block_into_callback=self.__read_block_into
+                if callbacks.read_block_into_callback is not None else None,
+                write_block_buffer_callback=self.__write_block_buffer
+                if callbacks.write_block_buffer_callback is not None else None,
+                max_burst_length=callbacks.max_burst_length)
+        else:
+            self.__cache_callbacks = NormalCallbackSet(
+                read_callback=self.__read,
+                write_callback=self.__write,
+                read_block_callback=self.__read_block
+                if callbacks.read_block_callback is not None else None,
+                write_block_callback=self.__write_block
+                if callbacks.write_block_callback is not None else None,
+                read_block_into_callback=self.__read_block_into
+                if callbacks.read_block_into_callback is not None else None,
+                write_block_buffer_callback=self.__write_block_buffer
+                if callbacks.write_block_buffer_callback is not None else None,
+                max_burst_length=callbacks.max_burst_length)
+
+    @property
+    def callbacks(self) -> Union[NormalCallbackSet, NormalCallbackSetLegacy]:
+        """
+        Callbacks to be used by the register model whilst the cache is in use
+        """
+        return self.__cache_callbacks
+
+    @property
+    def policy(self) -> CachePolicy:
+        """
+        Write policy of the cache
+        """
+        return self.__policy
+
+    @property
+    def dirty_addresses(self) -> list[int]:
+        """
+        Addresses of the registers with writes that have not been flushed, in address order
+        """
+        return sorted(self.__dirty)
+
+    def flush(self) -> None:
+        """
+        Write all the dirty registers to the hardware in address order, contiguous runs of
+        registers are written with a single block write if the callbacks support it (split into
+        bursts if the callbacks have a maximum burst length)
+        """
+        for run_start, run_width, run_accesswidth, run_data in self.__dirty_runs(
+                sorted(self.__dirty)):
+            self.__bus_write_run(addr=run_start, width=run_width, accesswidth=run_accesswidth,
+                                 data=run_data)
+        self.__dirty.clear()
+
+    def __dirty_runs(self, addresses: list[int]) -> list[tuple[int, int, int, list[int]]]:
+        """
+        Group a sorted list of dirty addresses into runs of contiguous registers of the same
+        size
+        """
+        runs: list[tuple[int, int, int, list[int]]] = []
+        next_address = None
+        for address in addresses:
+            width, accesswidth = self.__cacheable[address]
+            if runs and address == next_address and runs[-1][1:3] == (width, accesswidth):
+                runs[-1][3].append(self.__shadow[address])
+            else:
+                runs.append((address, width, accesswidth, [self.__shadow[address]]))
+            next_address = address + (width >> 3)
+        return runs
+
+    def __flush_range(self, addr: int, length_in_bytes: int) -> None:
+        """
+        Flush any dirty registers within an address range
+        """
+        in_range = sorted(address for address in self.__dirty
+                          if addr <= address < addr + length_in_bytes)
+        for run_start, run_width, run_accesswidth, run_data in self.__dirty_runs(in_range):
+            self.__bus_write_run(addr=run_start, width=run_width, accesswidth=run_accesswidth,
+                                 data=run_data)
+        self.__dirty.difference_update(in_range)
+
+    def __discard_range(self, addr: int, length_in_bytes: int) -> None:
+        """
+        Discard any held writes within an address range, this is used when a block write is
+        going to overwrite them
+        """
+        self.__dirty = {address for address in self.__dirty
+                        if not addr <= address < addr + length_in_bytes}
+
+    def __forget_range(self, addr: int, length_in_bytes: int) -> None:
+        """
+        Remove the shadow of any registers within an address range, this is used after a buffer
+        transfer so that they are read again from the hardware when next needed
+        """
+        self.__shadow = {address: data for address, data in self.__shadow.items()
+                         if not addr <= address < addr + length_in_bytes}
+
+    def __bus_read(self, addr: int, width: int, accesswidth: int) -> int:
+        read_callback = self.__callbacks.read_callback
+        if read_callback is not None:
+            return read_callback(addr=addr, width=width, accesswidth=accesswidth)
+
+        read_block_callback = self.__callbacks.read_block_callback
+        if read_block_callback is not None:
+            return read_block_callback(addr=addr, width=width, accesswidth=accesswidth,
+                                       length=1)[0]
+
+        raise RuntimeError('There is no usable callback')
+
+    def __bus_write_run(self, addr: int, width: int, accesswidth: int, data: list[int]) -> None:
+        # the run is split into bursts if the callbacks have a maximum burst length
+        write_run(self.__callbacks, addr=addr, width=width, accesswidth=accesswidth, data=data)
+
+    def __read(self, addr: int, width: int, accesswidth: int) -> int:
+        if addr not in self.__cacheable:
+            self.flush()
+            return self.__bus_read(addr=addr, width=width, accesswidth=accesswidth)
+
+        if addr not in self.__shadow:
+            self.__shadow[addr] = self.__bus_read(addr=addr, width=width,
+                                                  accesswidth=accesswidth)
+        return self.__shadow[addr]
+
+    def __write(self, addr: int, width: int, accesswidth: int, data: int) -> None:
+        if not isinstance(data, int):
+            raise TypeError(f'Data should be an int but got {type(data)}')
+
+        if addr not in self.__cacheable:
+            self.flush()
+            self.__bus_write_run(addr=addr, width=width, accesswidth=accesswidth, data=[data])
+            return
+
+        self.__shadow[addr] = data
+        if self.__policy is CachePolicy.WRITE_BACK:
+            self.__dirty.add(addr)
+        else:
+            self.__bus_write_run(addr=addr, width=width, accesswidth=accesswidth, data=[data])
+
+    def __update_shadow_from_block(self, addr: int, width: int,
+                                   data: Union[list[int], Array]) -> None:
+        """
+        Update the shadow with data from a block transfer, so that the shadow remains coherent
+        """
+        for entry, entry_data in enumerate(data):
+            entry_address = addr + (entry * (width >> 3))
+            if entry_address in self.__cacheable and self.__cacheable[entry_address][0] == width:
+                self.__shadow[entry_address] = entry_data
+
+    def __read_block(self, addr: int, width: int, accesswidth: int, length: int) -> list[int]:
+        if not isinstance(self.__callbacks, NormalCallbackSet) or \
+                self.__callbacks.read_block_callback is None:
+            raise RuntimeError('There is no usable callback')
+        self.__flush_range(addr=addr, length_in_bytes=length * (width >> 3))
+        data = self.__callbacks.read_block_callback(addr=addr, width=width,
+                                                    accesswidth=accesswidth, length=length)
+        self.__update_shadow_from_block(addr=addr, width=width, data=data)
+        return data
+
+    def __read_block_legacy(self, addr: int, width: int, accesswidth: int, length: int) -> Array:
+        if not isinstance(self.__callbacks, NormalCallbackSetLegacy) or \
+                self.__callbacks.read_block_callback is None:
+            raise RuntimeError('There is no usable callback')
+        self.__flush_range(addr=addr, length_in_bytes=length * (width >> 3))
+        data = self.__callbacks.read_block_callback(addr=addr, width=width,
+                                                    accesswidth=accesswidth, length=length)
+        self.__update_shadow_from_block(addr=addr, width=width, data=data)
+        return data
+
+    def __write_block(self, addr: int, width: int, accesswidth: int, data: list[int]) -> None:
+        if not isinstance(self.__callbacks, NormalCallbackSet) or \
+                self.__callbacks.write_block_callback is None:
+            raise RuntimeError('There is no usable callback')
+        self.__discard_range(addr=addr, length_in_bytes=len(data) * (width >> 3))
+        self.__callbacks.write_block_callback(addr=addr, width=width, accesswidth=accesswidth,
+                                              data=data)
+        self.__update_shadow_from_block(addr=addr, width=width, data=data)
+
+    def __write_block_legacy(self, addr: int, width: int, accesswidth: int, data: Array) -> None:
+        if not isinstance(self.__callbacks, NormalCallbackSetLegacy) or \
+                self.__callbacks.write_block_callback is None:
+            raise RuntimeError('There is no usable callback')
+        self.__discard_range(addr=addr, length_in_bytes=len(data) * (width >> 3))
+        self.__callbacks.write_block_callback(addr=addr, width=width, accesswidth=accesswidth,
+                                              data=data)
+        self.__update_shadow_from_block(addr=addr, width=width, data=data)
+
+    # pylint: disable-next=too-many-arguments
+    def __read_block_into(self, addr: int, width: int, accesswidth: int, length: int,
+                          buffer: memoryview) -> None:
+        read_block_into_callback = self.__callbacks.read_block_into_callback
+        if read_block_into_callback is None:
+            raise RuntimeError('There is no usable callback')
+        self.__flush_range(addr=addr, length_in_bytes=buffer.nbytes)
+        read_block_into_callback(addr=addr, width=width, accesswidth=accesswidth, length=length,
+                                 buffer=buffer)
+
+    # pylint: disable-next=too-many-arguments
+    def __write_block_buffer(self, addr: int, width: int, accesswidth: int, length: int,
+                             buffer: memoryview) -> None:
+        write_block_buffer_callback = self.__callbacks.write_block_buffer_callback
+        if write_block_buffer_callback is None:
+            raise RuntimeError('There is no usable callback')
+        self.__discard_range(addr=addr, length_in_bytes=buffer.nbytes)
+        write_block_buffer_callback(addr=addr, width=width, accesswidth=accesswidth,
+                                    length=length, buffer=buffer)
+        self.__forget_range(addr=addr, length_in_bytes=buffer.nbytes)
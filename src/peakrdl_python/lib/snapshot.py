@@ -0,0 +1,531 @@
+"""
+peakrdl-python is a tool to generate Python Register Access Layer (RAL) from SystemRDL
+Copyright (C) 2021 - 2023
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+This module is intended to distributed as part of automatically generated code by the
+peakrdl-python tool. It provides the register state snapshot used by the ``snapshot`` and
+``restore`` methods of an AddressMap, along with the grouping of the registers and memories into
+runs of contiguous addresses that are accessed with block operations
+"""
+import sys
+import json
+import struct
+from array import array as Array
+from bisect import bisect_right
+from functools import partial
+from typing import Any, Optional, Union
+from collections.abc import Iterable, Sequence, Callable, Awaitable
+
+from .callbacks import NormalCallbackSet, NormalCallbackSetLegacy
+from .callbacks import AsyncCallbackSet, AsyncCallbackSetLegacy
+from .utility_functions import get_array_typecode, get_buffer_format
+from .utility_functions import gather_with_concurrency, split_bursts
+
+# binary format, a header followed by each run as a run header and the packed words of the run,
+# all the values are little endian and each word occupies the same number of bytes as its
+# address stride, i.e. the width rounded up to a power of two bytes
+_MAGIC = b'PRSN'
+_VERSION = 1
+_HEADER = struct.Struct('<4sHI')
+_RUN_HEADER = struct.Struct('<QHHI')
+
+# number of words compared at once when looking for the differences between two runs
+_DIFF_CHUNK = 64
+
+
+class RegisterSnapshot:
+    """
+    State of the registers and memories of an address map, held as runs of contiguous
+    addresses. Each run is a tuple of the start address, width (in bits), accesswidth and the
+    value of each word in the run.
+
+    Args:
+        runs: runs of contiguous words, these must not overlap
+    """
+
+    __slots__ = ['__runs', '__starts', '__packed']
+
+    def __init__(self, runs: Iterable[tuple[int, int, int, Sequence[int]]]):
+        self.__runs: list[tuple[int, int, int, list[int]]] = []
+        for address, width, accesswidth, data in sorted(runs, key=lambda run: run[0]):
+            if not isinstance(address, int) or address < 0:
+                raise ValueError(f'run address should be a non-negative int, got {address}')
+            if not isinstance(width, int) or width < 1:
+                raise ValueError(f'run width should be a positive int, got {width}')
+            if self.__runs and address < self.__run_end(self.__runs[-1]):
+                raise ValueError(f'run at 0x{address:X} overlaps the previous run')
+            self.__runs.append((address, width, accesswidth, list(data)))
+        self.__starts = [run[0] for run in self.__runs]
+        # the packed form of each run is only made when it is first needed
+        self.__packed: list[Optional[bytes]] = [None] * len(self.__runs)
+
+    @staticmethod
+    def __run_end(run: tuple[int, int, int, list[int]]) -> int:
+        address, width, _, data = run
+        return address + (len(data) * _word_stride(width))
+
+    @property
+    def runs(self) -> list[tuple[int, int, int, list[int]]]:
+        """
+        Runs of contiguous words in address order
+        """
+        return [(address, width, accesswidth, list(data))
+                for address, width, accesswidth, data in self.__runs]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, RegisterSnapshot):
+            return NotImplemented
+        # pylint: disable-next=protected-access
+        return self.__runs == other.__runs
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def values(self, address: int, width: int, length: int = 1) -> Optional[list[int]]:
+        """
+        Values of a contiguous set of words in the snapshot, these may span more than one run
+
+        Args:
+            address: address of the first word
+            width: width of each word in bits
+            length: number of words
+
+        Returns:
+            The values or None if any of the words is not in the snapshot (or is held with a
+            different width)
+        """
+        values: list[int] = []
+        while len(values) < length:
+            position = bisect_right(self.__starts, address) - 1
+            if position < 0:
+                return None
+            run_address, run_width, _, run_data = self.__runs[position]
+            offset, misalignment = divmod(address - run_address, _word_stride(width))
+            if run_width != width or misalignment != 0 or offset >= len(run_data):
+                return None
+            taken = run_data[offset:offset + length - len(values)]
+            values += taken
+            address += len(taken) * _word_stride(width)
+        return values
+
+    def to_bytes(self) -> bytes:
+        """
+        Compact binary form of the snapshot
+        """
+        chunks = [_HEADER.pack(_MAGIC, _VERSION, len(self.__runs))]
+        for index, (address, width, accesswidth, data) in enumerate(self.__runs):
+            chunks.append(_RUN_HEADER.pack(address, width, accesswidth, len(data)))
+            chunks.append(self.__packed_run(index))
+        return b''.join(chunks)
+
+    def __packed_run(self, index: int) -> bytes:
+        packed = self.__packed[index]
+        if packed is None:
+            _, width, _, data = self.__runs[index]
+            packed = _pack_words(data, width_in_bytes=_word_stride(width))
+            self.__packed[index] = packed
+        return packed
+
+    def diff(self, other: 'RegisterSnapshot') -> \
+            list[tuple[int, int, Optional[int], Optional[int]]]:
+        """
+        Find the words which differ between this snapshot and another. Runs that occupy the
+        same addresses in both are compared in their packed form, a chunk at a time, so only
+        the chunks which differ are decoded into individual words.
+
+        Args:
+            other: snapshot to compare with
+
+        Returns:
+            address, width, value in this snapshot and value in the other snapshot of each
+            word which differs, in address order. The value is None for a word which is only
+            in one of the snapshots
+        """
+        if not isinstance(other, RegisterSnapshot):
+            raise TypeError(f'other should be a RegisterSnapshot, got {type(other)}')
+
+        # pylint: disable=protected-access
+        other_runs = {(address, width, len(data)): index
+                      for index, (address, width, _, data) in enumerate(other.__runs)}
+        matched: set[int] = set()
+        differences: list[tuple[int, int, Optional[int], Optional[int]]] = []
+
+        for index, (address, width, _, data) in enumerate(self.__runs):
+            other_index = other_runs.get((address, width, len(data)))
+            if other_index is None:
+                differences += self.__unmatched_differences(index, other, reverse=False)
+                continue
+            matched.add(other_index)
+            packed = self.__packed_run(index)
+            other_packed = other.__packed_run(other_index)
+            if packed != other_packed:
+                differences += _run_differences(address=address, width=width,
+                                                data=(data, other.__runs[other_index][3]),
+                                                packed=(packed, other_packed))
+
+        for other_index in range(len(other.__runs)):
+            if other_index not in matched:
+                differences += other.__unmatched_differences(other_index, self, reverse=True)
+        # pylint: enable=protected-access
+
+        return sorted(differences, key=lambda difference: difference[0])
+
+    def __unmatched_differences(self, index: int, other: 'RegisterSnapshot', reverse: bool) -> \
+            list[tuple[int, int, Optional[int], Optional[int]]]:
+        """
+        Compare a run, which has no counterpart in the other snapshot, a word at a time
+        """
+        address, width, _, data = self.__runs[index]
+        differences: list[tuple[int, int, Optional[int], Optional[int]]] = []
+        for offset, value in enumerate(data):
+            word_address = address + (offset * _word_stride(width))
+            other_values = other.values(address=word_address, width=width)
+            other_value = None if other_values is None else other_values[0]
+            if reverse:
+                # words which are in both snapshots have already been compared
+                if other_value is None:
+                    differences.append((word_address, width, None, value))
+            elif other_value != value:
+                differences.append((word_address, width, value, other_value))
+        return differences
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'RegisterSnapshot':
+        """
+        Build a snapshot from the binary form made by :meth:`to_bytes`
+        """
+        view = memoryview(data)
+        if len(view) < _HEADER.size:
+            raise ValueError('data is too short to be a register snapshot')
+        magic, version, number_runs = _HEADER.unpack_from(view, 0)
+        if magic != _MAGIC:
+            raise ValueError('data is not a register snapshot')
+        if version != _VERSION:
+            raise ValueError(f'unsupported register snapshot version {version:d}')
+
+        offset = _HEADER.size
+        runs: list[tuple[int, int, int, list[int]]] = []
+        packed: list[bytes] = []
+        for _ in range(number_runs):
+            if len(view) < offset + _RUN_HEADER.size:
+                raise ValueError('register snapshot is truncated')
+            address, width, accesswidth, length = _RUN_HEADER.unpack_from(view, offset)
+            offset += _RUN_HEADER.size
+            number_bytes = length * _word_stride(width)
+            if len(view) < offset + number_bytes:
+                raise ValueError('register snapshot is truncated')
+            packed.append(bytes(view[offset:offset + number_bytes]))
+            runs.append((address, width, accesswidth,
+                         _unpack_words(view[offset:offset + number_bytes],
+                                       width_in_bytes=_word_stride(width))))
+            offset += number_bytes
+        if offset != len(view):
+            raise ValueError('register snapshot has unexpected data after the last run')
+        snapshot = cls(runs)
+        # the packed form is kept, unless the runs were reordered when the snapshot was built
+        if [run[0] for run in runs] == snapshot.__starts:
+            # pylint: disable-next=protected-access,unused-private-member
+            snapshot.__packed = list(packed)
+        return snapshot
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Snapshot in a form which can be converted to JSON
+        """
+        return {'runs': [{'address': address, 'width': width, 'accesswidth': accesswidth,
+                          'data': list(data)}
+                         for address, width, accesswidth, data in self.__runs]}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> 'RegisterSnapshot':
+        """
+        Build a snapshot from the form made by :meth:`to_dict`
+        """
+        return cls((run['address'], run['width'], run['accesswidth'], run['data'])
+                   for run in data['runs'])
+
+    def to_json(self) -> str:
+        """
+        Snapshot as a JSON string, see :meth:`to_dict`
+        """
+        return json.dumps(self.to_dict())
+
+
+class RegisterDifference:
+    """
+    A word which differs between two snapshots, decoded into the register (or memory) which
+    occupies the address and the fields of it which differ
+
+    Args:
+        address: address of the word
+        width: width of the word in bits
+        values: value of the word in each snapshot, None if the word is not in the snapshot
+        node_name: full instance name of the register (or memory) at the address, None if
+                   the address is not occupied
+        fields: values of the fields which differ in each snapshot, keyed by the field
+                instance name
+    """
+
+    __slots__ = ['__address', '__width', '__values', '__node_name', '__fields']
+
+    # pylint: disable-next=too-many-arguments
+    def __init__(self, *, address: int, width: int,
+                 values: tuple[Optional[int], Optional[int]],
+                 node_name: Optional[str],
+                 fields: dict[str, tuple[Optional[int], Optional[int]]]):
+        self.__address = address
+        self.__width = width
+        self.__values = values
+        self.__node_name = node_name
+        self.__fields = fields
+
+    @property
+    def address(self) -> int:
+        """
+        Address of the word
+        """
+        return self.__address
+
+    @property
+    def width(self) -> int:
+        """
+        Width of the word in bits
+        """
+        return self.__width
+
+    @property
+    def value_a(self) -> Optional[int]:
+        """
+        Value in the first snapshot, None if the word is not in it
+        """
+        return self.__values[0]
+
+    @property
+    def value_b(self) -> Optional[int]:
+        """
+        Value in the second snapshot, None if the word is not in it
+        """
+        return self.__values[1]
+
+    @property
+    def node_name(self) -> Optional[str]:
+        """
+        Full instance name of the register (or memory) which occupies the address
+        """
+        return self.__node_name
+
+    @property
+    def fields(self) -> dict[str, tuple[Optional[int], Optional[int]]]:
+        """
+        Value in each snapshot of the fields which differ, keyed by the field instance name
+        """
+        return dict(self.__fields)
+
+    def __repr__(self) -> str:
+        def format_value(value: Optional[int]) -> str:
+            return 'None' if value is None else f'0x{value:X}'
+
+        return (f'{self.__class__.__name__}({self.__node_name} @ 0x{self.__address:X}: '
+                f'{format_value(self.value_a)} -> {format_value(self.value_b)})')
+
+
+def _run_differences(address: int, width: int, data: tuple[list[int], list[int]],
+                     packed: tuple[bytes, bytes]) -> \
+        list[tuple[int, int, Optional[int], Optional[int]]]:
+    """
+    Find the words which differ between two versions of the same run, the packed forms are
+    compared a chunk at a time so that only the words in the chunks which differ are compared
+    individually
+    """
+    differences: list[tuple[int, int, Optional[int], Optional[int]]] = []
+    chunk_bytes = _DIFF_CHUNK * _word_stride(width)
+    for chunk_start in range(0, len(data[0]), _DIFF_CHUNK):
+        chunk_offset = chunk_start * _word_stride(width)
+        if packed[0][chunk_offset:chunk_offset + chunk_bytes] == \
+                packed[1][chunk_offset:chunk_offset + chunk_bytes]:
+            continue
+        for offset in range(chunk_start, min(chunk_start + _DIFF_CHUNK, len(data[0]))):
+            if data[0][offset] != data[1][offset]:
+                differences.append((address + (offset * _word_stride(width)), width,
+                                    data[0][offset], data[1][offset]))
+    return differences
+
+
+def _word_stride(width: int) -> int:
+    """
+    Address increment between the words of a run, the words of a memory whose width is not a
+    power of two occupy the next power of two bytes (and at least one byte)
+    """
+    return max(1, (1 << (width - 1).bit_length()) >> 3)
+
+
+def _pack_words(data: list[int], width_in_bytes: int) -> bytes:
+    buffer_format = get_buffer_format(width_in_bytes)
+    if buffer_format is None:
+        return b''.join(word.to_bytes(width_in_bytes, 'little') for word in data)
+    words = Array(buffer_format, data)
+    if sys.byteorder == 'big':
+        words.byteswap()
+    return words.tobytes()
+
+
+def _unpack_words(data: memoryview, width_in_bytes: int) -> list[int]:
+    buffer_format = get_buffer_format(width_in_bytes)
+    if buffer_format is None:
+        return [int.from_bytes(data[offset:offset + width_in_bytes], 'little')
+                for offset in range(0, len(data), width_in_bytes)]
+    words = Array(buffer_format)
+    words.frombytes(data)
+    if sys.byteorder == 'big':
+        words.byteswap()
+    return words.tolist()
+
+
+def coalesce_runs(items: Iterable[tuple[int, int, int, int]]) -> list[tuple[int, int, int, int]]:
+    """
+    Group registers and memories into runs of contiguous words of the same size
+
+    Args:
+        items: address, width, accesswidth and number of words of each register or memory
+
+    Returns:
+        address, width, accesswidth and number of words of each run, in address order
+    """
+    runs: list[tuple[int, int, int, int]] = []
+    next_address = None
+    for address, width, accesswidth, length in sorted(items):
+        if runs and address == next_address and runs[-1][1:3] == (width, accesswidth):
+            run_address, _, _, run_length = runs[-1]
+            runs[-1] = (run_address, width, accesswidth, run_length + length)
+        else:
+            runs.append((address, width, accesswidth, length))
+        next_address = address + (length * _word_stride(width))
+    return runs
+
+
+def read_run(callbacks: Union[NormalCallbackSet, NormalCallbackSetLegacy],
+             addr: int, width: int, accesswidth: int, length: int) -> list[int]:
+    """
+    Read a run of contiguous words, with the block read callback if there is more than one
+    word (split into bursts if the callbacks have a maximum burst length)
+    """
+    read_callback = callbacks.read_callback
+    read_block_callback = callbacks.read_block_callback
+    if read_block_callback is not None and (length > 1 or read_callback is None):
+        data: list[int] = []
+        for burst_start, burst_length in split_bursts(0, length, callbacks.max_burst_length):
+            data.extend(read_block_callback(addr=addr + (burst_start * _word_stride(width)),
+                                            width=width, accesswidth=accesswidth,
+                                            length=burst_length))
+        return data
+
+    if read_callback is None:
+        raise RuntimeError('There is no usable callback')
+    return [read_callback(addr=addr + (entry * _word_stride(width)), width=width,
+                          accesswidth=accesswidth)
+            for entry in range(length)]
+
+
+def write_run(callbacks: Union[NormalCallbackSet, NormalCallbackSetLegacy],
+              addr: int, width: int, accesswidth: int, data: list[int]) -> None:
+    """
+    Write a run of contiguous words, with the block write callback if there is more than one
+    word (split into bursts if the callbacks have a maximum burst length)
+    """
+    write_callback = callbacks.write_callback
+    if callbacks.write_block_callback is not None and (len(data) > 1 or write_callback is None):
+        for burst_start, burst_length in split_bursts(0, len(data), callbacks.max_burst_length):
+            burst_addr = addr + (burst_start * _word_stride(width))
+            burst_data = data[burst_start:burst_start + burst_length]
+            if isinstance(callbacks, NormalCallbackSetLegacy):
+                legacy_write_block_callback = callbacks.write_block_callback
+                if legacy_write_block_callback is not None:
+                    legacy_write_block_callback(addr=burst_addr, width=width,
+                                                accesswidth=accesswidth,
+                                                data=Array(get_array_typecode(width),
+                                                           burst_data))
+            else:
+                write_block_callback = callbacks.write_block_callback
+                if write_block_callback is not None:
+                    write_block_callback(addr=burst_addr, width=width, accesswidth=accesswidth,
+                                         data=burst_data)
+        return
+
+    if write_callback is None:
+        raise RuntimeError('There is no usable callback')
+    for entry, entry_data in enumerate(data):
+        write_callback(addr=addr + (entry * _word_stride(width)), width=width,
+                       accesswidth=accesswidth, data=entry_data)
+
+
+async def async_read_run(callbacks: Union[AsyncCallbackSet, AsyncCallbackSetLegacy],
+                         addr: int, width: int, accesswidth: int, length: int) -> list[int]:
+    """
+    Asynchronous version of :func:`read_run`, with up to the callbacks maximum bursts in
+    flight at once
+    """
+    read_callback = callbacks.read_callback
+    read_block_callback = callbacks.read_block_callback
+    if read_block_callback is not None and (length > 1 or read_callback is None):
+        bursts_read = await gather_with_concurrency(
+            [partial(read_block_callback, addr=addr + (burst_start * _word_stride(width)),
+                     width=width, accesswidth=accesswidth, length=burst_length)
+             for burst_start, burst_length in split_bursts(0, length, callbacks.max_burst_length)],
+            concurrency=callbacks.max_bursts_in_flight)
+        data: list[int] = []
+        for burst_read in bursts_read:
+            data.extend(burst_read)
+        return data
+
+    if read_callback is None:
+        raise RuntimeError('There is no usable callback')
+    return [await read_callback(addr=addr + (entry * _word_stride(width)), width=width,
+                                accesswidth=accesswidth)
+            for entry in range(length)]
+
+
+async def async_write_run(callbacks: Union[AsyncCallbackSet, AsyncCallbackSetLegacy],
+                          addr: int, width: int, accesswidth: int, data: list[int]) -> None:
+    """
+    Asynchronous version of :func:`write_run`, with up to the callbacks maximum bursts in
+    flight at once
+    """
+    write_callback = callbacks.write_callback
+    if callbacks.write_block_callback is not None and (len(data) > 1 or write_callback is None):
+        operations: list[Callable[[], Awaitable[None]]] = []
+        for burst_start, burst_length in split_bursts(0, len(data), callbacks.max_burst_length):
+            burst_addr = addr + (burst_start * _word_stride(width))
+            burst_data = data[burst_start:burst_start + burst_length]
+            if isinstance(callbacks, AsyncCallbackSetLegacy):
+                legacy_write_block_callback = callbacks.write_block_callback
+                if legacy_write_block_callback is not None:
+                    operations.append(partial(legacy_write_block_callback, addr=burst_addr,
+                                              width=width, accesswidth=accesswidth,
+                                              data=Array(get_array_typecode(width),
+                                                         burst_data)))
+            else:
+                write_block_callback = callbacks.write_block_callback
+                if write_block_callback is not None:
+                    operations.append(partial(write_block_callback, addr=burst_addr,
+                                              width=width, accesswidth=accesswidth,
+                                              data=burst_data))
+        await gather_with_concurrency(operations, concurrency=callbacks.max_bursts_in_flight)
+        return
+
+    if write_callback is None:
+        raise RuntimeError('There is no usable callback')
+    for entry, entry_data in enumerate(data):
+        await write_callback(addr=addr + (entry * _word_stride(width)), width=width,
+                             accesswidth=accesswidth, data=entry_data)
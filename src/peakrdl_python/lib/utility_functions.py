@@ -18,6 +18,16 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 This module is intended to distributed as part of automatically generated code by the
 peakrdl-python tool. It provides a set of base classes used by the autogenerated code
 """
+from array import array as Array
+from typing import Optional, TypeVar
+from collections.abc import Awaitable, Callable, Iterator, Sequence
+import asyncio
+
+_T = TypeVar('_T')
+
+
+# table to reverse the order of the bits in a byte, in the form needed by bytes.translate
+_BYTE_BIT_REVERSAL_TABLE = bytes(int(f'{byte:08b}'[::-1], 2) for byte in range(256))
 
 
 def swap_msb_lsb_ordering(width: int, value: int) -> int:
@@ -27,12 +37,13 @@ def swap_msb_lsb_ordering(width: int, value: int) -> int:
     Returns:
         swapped value
     """
-    value_to_return = 0
-    for bit_positions in zip(range(0, width), range(width-1, -1, -1)):
-        bit_value = (value >> bit_positions[0]) & 0x1
-        value_to_return |= bit_value << bit_positions[1]
-
-    return value_to_return
+    # the bits are reversed a byte at a time using a lookup table, reversing the order of the
+    # bytes at the same time, then the result is shifted down to remove the padding bits in the
+    # last byte
+    number_bytes = (width + 7) >> 3
+    value_bytes = (value & ((1 << width) - 1)).to_bytes(number_bytes, 'little')
+    value_to_return = int.from_bytes(value_bytes.translate(_BYTE_BIT_REVERSAL_TABLE), 'big')
+    return value_to_return >> ((number_bytes << 3) - width)
 
 
 class UnsupportedWidthError(Exception):
@@ -68,6 +79,25 @@ def get_array_typecode(width: int) -> str:
                                 f'based API and callbacks rather than the legacy Array versions')
 
 
+# unlike the typecodes from get_array_typecode, these are picked to match the entry size, the
+# sizes of 'L' vary between platforms so it is placed first to be overridden by 'I' or 'Q'
+_BUFFER_FORMATS = {Array(typecode).itemsize: typecode for typecode in 'LBHIQ'}
+
+
+def get_buffer_format(width_in_bytes: int) -> Optional[str]:
+    """
+    memoryview (and array) format to access a buffer of memory entries as integers in the
+    native byte order
+
+    Args:
+        width_in_bytes: size of each entry in the buffer
+
+    Returns:
+        format string or None if there is no integer format of that size
+    """
+    return _BUFFER_FORMATS.get(width_in_bytes)
+
+
 def is_power_two(value: int) -> bool:
     """
     efficient algorithm for checking if something is a power of two
@@ -81,3 +111,55 @@ def legal_register_width(width_in_bits: int) -> bool:
     must be a power of 2 and greater than 8
     """
     return (width_in_bits >= 8) and is_power_two(width_in_bits)
+
+
+def split_bursts(start_entry: int, number_entries: int,
+                 max_burst_length: Optional[int]) -> Iterator[tuple[int, int]]:
+    """
+    Split a block transfer into bursts of no more than the maximum burst length, at least
+    one burst is always produced so that a zero length transfer is still issued
+
+    Args:
+        start_entry: index of the first entry of the transfer
+        number_entries: number of entries in the transfer
+        max_burst_length: maximum number of entries in a burst, None for no limit
+
+    Returns: start entry and number of entries for each burst
+
+    """
+    if max_burst_length is None or number_entries <= max_burst_length:
+        yield start_entry, number_entries
+        return
+
+    for burst_start in range(start_entry, start_entry + number_entries, max_burst_length):
+        yield burst_start, min(max_burst_length, start_entry + number_entries - burst_start)
+
+
+async def gather_with_concurrency(operations: Sequence[Callable[[], Awaitable[_T]]],
+                                  concurrency: int) -> list[_T]:
+    """
+    run a set of asynchronous operations, keeping up to ``concurrency`` of them in progress at
+    once, the operations are only started once there is space for them
+
+    Args:
+        operations: callables that start each operation
+        concurrency: maximum number of operations in progress at once
+
+    Returns:
+        results of the operations, in the same order as the operations
+    """
+    if not isinstance(concurrency, int):
+        raise TypeError(f'concurrency should be an int, got {type(concurrency)}')
+    if concurrency < 1:
+        raise ValueError(f'concurrency must be at least 1, got {concurrency:d}')
+
+    if len(operations) == 1:
+        return [await operations[0]()]
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run_operation(operation: Callable[[], Awaitable[_T]]) -> _T:
+        async with semaphore:
+            return await operation()
+
+    return list(await asyncio.gather(*(run_operation(operation) for operation in operations)))
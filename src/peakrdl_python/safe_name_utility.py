@@ -29,6 +29,7 @@ from systemrdl.node import RegfileNode
 from systemrdl.node import MemNode
 from systemrdl.node import RootNode
 from systemrdl.node import Node
+from systemrdl.node import AddressableNode
 
 from .lib import RegReadOnly
 from .lib import RegWriteOnly
@@ -401,3 +402,34 @@ def get_python_path_segments(node: Union[RegNode,
         return node_segment(child_node.parent, child_list=child_list)
 
     return node_segment(node, [])
+
+
+def get_fast_api_name(node: Union[RegNode, FieldNode], top_node: AddrmapNode) -> str:
+    """
+    Name used for the functions of a register or field in the fast API module, made from the
+    safe names of the node and its parents below the top node joined with underscores. The
+    index of each element of an array is added to its name, e.g. ``blk_3_reg_field``
+
+    Args:
+        node: an unrolled register or field from the compiled systemRDL
+        top_node: address map the fast API module is generated for
+
+    Returns: name to use after the ``read_`` or ``write_`` prefix
+    """
+    segments: list[str] = []
+    child_node: Node = node
+    for _ in range(len(node.get_path_segments()) - len(top_node.get_path_segments())):
+        if not isinstance(child_node, (RegNode, FieldNode, RegfileNode, AddrmapNode)):
+            raise TypeError(f'child_node not a handled type, got {type(child_node)}')
+        # the safe name of an unrolled array element ends with its indices in brackets, these
+        # are replaced with ones that can be used in a python name
+        segment = safe_node_name(child_node).partition('[')[0]
+        if isinstance(child_node, AddressableNode) and child_node.is_array:
+            if child_node.current_idx is None:
+                raise RuntimeError('The fast API needs the arrays to be unrolled')
+            segment += ''.join(f'_{index:d}' for index in child_node.current_idx)
+        segments.insert(0, segment)
+        if child_node.parent is None:
+            raise RuntimeError('parent node is None')
+        child_node = child_node.parent
+    return '_'.join(segments)
@@ -18,53 +18,233 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 This module is intended to distributed as part of automatically generated code by the
 peakrdl-python tool. It provides a set of base classes used by the autogenerated code
 """
-from typing import Optional
+from typing import Any, Optional, Union
+from collections.abc import Sequence
+from array import array as Array
+from abc import ABC, abstractmethod
+from enum import Enum, auto
+import os
+import sys
 
 from .base import Base
 from ._callbacks import MemoryReadCallback, MemoryWriteCallback
 
+from ..lib.utility_functions import get_buffer_format
 
-class _MemoryContent:
 
-    __slots__ = ['__value', '__default_value', '__length']
+class MemoryStorage(Enum):
+    """
+    Backing storage used to hold the content of a simulated memory
+    """
+    #: dictionary holding only the entries that have been written, this suits large memories
+    #: which are mostly empty
+    SPARSE = auto()
+    #: contiguous array holding every entry, this suits memories which are mostly written and
+    #: is only available for memories up to 64 bit wide
+    DENSE = auto()
+    #: dense storage for memories up to 64 bit wide and no larger than
+    #: :data:`DENSE_STORAGE_AUTO_LIMIT`, otherwise sparse storage
+    AUTO = auto()
+
+
+#: largest memory size (in bytes) to use dense storage for when :attr:`MemoryStorage.AUTO` is
+#: selected, larger memories need to select dense storage explicitly
+DENSE_STORAGE_AUTO_LIMIT = 1 << 16
+
+
+class _MemoryContent(ABC):
+    """
+    Content of a simulated memory, the bulk load and dump use bytes with each entry occupying
+    the width rounded up to a power of two bytes, in little endian order
+    """
+
+    __slots__ = ['__default_value', '__width_in_bytes']
 
     def __init__(self, *,
-                 default_value: int):
-        self.__value:dict[int, int] = {}
+                 default_value: int,
+                 width_in_bytes: int):
         self.__default_value = default_value
+        self.__width_in_bytes = width_in_bytes
+
+    @property
+    def _default_value(self) -> int:
+        return self.__default_value
+
+    @property
+    def _width_in_bytes(self) -> int:
+        return self.__width_in_bytes
+
+    @abstractmethod
+    def __getitem__(self, item: int) -> int:
+        ...
+
+    @abstractmethod
+    def __setitem__(self, key: int, value: int) -> None:
+        ...
+
+    @abstractmethod
+    def read_block(self, start: int, length: int) -> list[int]:
+        """
+        Read a contiguous block of entries
+        """
+
+    @abstractmethod
+    def write_block(self, start: int, data: Sequence[int]) -> None:
+        """
+        Write a contiguous block of entries
+        """
+
+    def load(self, start: int, data: memoryview) -> None:
+        """
+        Write a contiguous block of entries from bytes
+        """
+        width_in_bytes = self.__width_in_bytes
+        self.write_block(start, [int.from_bytes(data[offset:offset + width_in_bytes], 'little')
+                                 for offset in range(0, data.nbytes, width_in_bytes)])
+
+    def dump(self, start: int, length: int) -> bytes:
+        """
+        Read a contiguous block of entries as bytes
+        """
+        width_in_bytes = self.__width_in_bytes
+        return b''.join(entry.to_bytes(width_in_bytes, 'little')
+                        for entry in self.read_block(start, length))
+
+
+class _SparseMemoryContent(_MemoryContent):
+
+    __slots__ = ['__value']
+
+    def __init__(self, *,
+                 default_value: int,
+                 width_in_bytes: int):
+        super().__init__(default_value=default_value, width_in_bytes=width_in_bytes)
+        self.__value:dict[int, int] = {}
 
     def __getitem__(self, item: int) -> int:
         if item in self.__value:
             return self.__value[item]
 
-        return self.__default_value
+        return self._default_value
 
     def __setitem__(self, key: int, value: int) -> None:
         self.__value[key] = value
 
+    def read_block(self, start: int, length: int) -> list[int]:
+        value = self.__value
+        default_value = self._default_value
+        return [value.get(item, default_value) for item in range(start, start + length)]
+
+    def write_block(self, start: int, data: Sequence[int]) -> None:
+        self.__value.update(zip(range(start, start + len(data)), data))
+
+
+class _DenseMemoryContent(_MemoryContent):
+
+    __slots__ = ['__value']
+
+    def __init__(self, *,
+                 default_value: int,
+                 width_in_bytes: int,
+                 length: int):
+        super().__init__(default_value=default_value, width_in_bytes=width_in_bytes)
+        typecode = get_buffer_format(width_in_bytes)
+        if typecode is None:
+            raise ValueError(f'dense storage is not supported for memories of '
+                             f'{width_in_bytes:d} bytes wide')
+        self.__value = Array(typecode, [default_value]) * length
+
+    def __getitem__(self, item: int) -> int:
+        return self.__value[item]
+
+    def __setitem__(self, key: int, value: int) -> None:
+        self.__value[key] = value
+
+    def read_block(self, start: int, length: int) -> list[int]:
+        return self.__value[start:start + length].tolist()
+
+    def write_block(self, start: int, data: Sequence[int]) -> None:
+        self.__value[start:start + len(data)] = Array(self.__value.typecode, data)
+
+    def load(self, start: int, data: memoryview) -> None:
+        entries = Array(self.__value.typecode)
+        entries.frombytes(data)
+        if sys.byteorder != 'little':
+            entries.byteswap()
+        self.__value[start:start + len(entries)] = entries
+
+    def dump(self, start: int, length: int) -> bytes:
+        entries = self.__value[start:start + length]
+        if sys.byteorder != 'little':
+            entries.byteswap()
+        return entries.tobytes()
+
 
 class Memory(Base):
     """
-    Simulation of a memory, this is implemented using a sparse approach to avoid the simulator
-    storing every possible entry in a register map, which could be very big.
+    Simulation of a memory, by default small memories are held in a contiguous array and larger
+    ones use a sparse approach to avoid the simulator storing every possible entry in a
+    register map, which could be very big. See :class:`MemoryStorage`.
     """
-    __slots__ = ['__value', '__width', '__length',
+    __slots__ = ['__value', '__width', '__length', '__default_value', '__storage',
                  '__read_callback', '__write_callback']
 
+    # pylint: disable-next=too-many-arguments
     def __init__(self, *,
                  width: int,
                  length: int,
                  default_value: int,
-                 full_inst_name: str):
+                 full_inst_name: str,
+                 storage: MemoryStorage = MemoryStorage.AUTO):
 
         super().__init__(full_inst_name=full_inst_name)
 
-        self.__value = _MemoryContent(default_value=default_value)
         self.__width = width
         self.__length = length
+        self.__default_value = default_value
+        self.__storage = self.__resolve_storage(storage)
+        self.__value = self.__build_content(self.__storage)
         self.__read_callback: Optional[MemoryReadCallback] = None
         self.__write_callback: Optional[MemoryWriteCallback] = None
 
+    def __resolve_storage(self, storage: MemoryStorage) -> MemoryStorage:
+        if not isinstance(storage, MemoryStorage):
+            raise TypeError(f'storage should be a MemoryStorage, got {type(storage)}')
+
+        if storage is not MemoryStorage.AUTO:
+            return storage
+
+        if get_buffer_format(self._width_in_bytes) is not None and \
+                self.__length * self._width_in_bytes <= DENSE_STORAGE_AUTO_LIMIT:
+            return MemoryStorage.DENSE
+        return MemoryStorage.SPARSE
+
+    def __build_content(self, storage: MemoryStorage) -> _MemoryContent:
+        if storage is MemoryStorage.DENSE:
+            return _DenseMemoryContent(default_value=self.__default_value,
+                                       width_in_bytes=self._width_in_bytes,
+                                       length=self.__length)
+        return _SparseMemoryContent(default_value=self.__default_value,
+                                    width_in_bytes=self._width_in_bytes)
+
+    @property
+    def storage(self) -> MemoryStorage:
+        """
+        Backing storage used for the memory content, this can be changed at any time with the
+        existing content being retained
+        """
+        return self.__storage
+
+    @storage.setter
+    def storage(self, storage: MemoryStorage) -> None:
+        storage = self.__resolve_storage(storage)
+        if storage is self.__storage:
+            return
+        content = self.__build_content(storage)
+        content.write_block(0, self.__value.read_block(0, self.__length))
+        self.__value = content
+        self.__storage = storage
+
     @property
     def read_callback(self) -> Optional[MemoryReadCallback]:
         """
@@ -127,6 +307,119 @@ class Memory(Base):
             self.write_callback(offset=offset, value=data)
         self.value[offset] = data
 
+    def read_block(self, offset: int, length: int) -> list[int]:
+        """
+        Read a block of memory words as a single operation on the memory content, unless a
+        read callback is attached in which case each word is read in turn
+
+        Args:
+            offset (int): Word offset in the memory of the first word
+            length (int): Number of words to read
+
+        Returns:
+            memory word content
+
+        """
+        self.__block_range_check(offset, length)
+        if self.read_callback is not None:
+            # the callback may change the memory content so each word must be read in turn
+            return [self.read(word_offset) for word_offset in range(offset, offset + length)]
+        return self.value.read_block(offset, length)
+
+    def write_block(self, offset: int, data: Union[list[int], Array]) -> None:
+        """
+        Write a block of memory words as a single operation on the memory content, unless a
+        write callback is attached in which case each word is written in turn
+
+        Args:
+            offset: (int): Word offset in the memory of the first word
+            data: data words
+
+        Returns:
+            None
+
+        """
+        self.__block_range_check(offset, len(data))
+        if self.write_callback is not None:
+            for word_offset, word_data in enumerate(data, start=offset):
+                self.write(offset=word_offset, data=word_data)
+        else:
+            self.value.write_block(offset, data)
+
+    def load(self, data: Any, offset: int = 0) -> None:
+        """
+        Load the memory content from bytes, bypassing the callbacks. Each word occupies the
+        memory width rounded up to a power of two bytes, in little endian order.
+
+        Args:
+            data: object supporting the buffer protocol, e.g. bytes, bytearray or a numpy array
+            offset: Word offset in the memory of the first word
+
+        Returns:
+            None
+
+        """
+        try:
+            view = memoryview(data).cast('B')
+        except TypeError as exc:
+            raise TypeError(f'data must be a contiguous object supporting the buffer protocol, '
+                            f'got {type(data)}') from exc
+        if view.nbytes % self._width_in_bytes != 0:
+            raise ValueError(f'data size ({view.nbytes:d} bytes) must be a multiple of the '
+                             f'memory width ({self._width_in_bytes:d} bytes)')
+        self.__block_range_check(offset, view.nbytes // self._width_in_bytes)
+        self.value.load(offset, view)
+
+    def dump(self, offset: int = 0, length: Optional[int] = None) -> bytes:
+        """
+        Dump the memory content to bytes, bypassing the callbacks, in the same form as
+        :meth:`load`
+
+        Args:
+            offset: Word offset in the memory of the first word
+            length: Number of words, defaults to the rest of the memory
+
+        Returns:
+            memory content
+
+        """
+        if length is None:
+            length = self.__length - offset
+        self.__block_range_check(offset, length)
+        return self.value.dump(offset, length)
+
+    def load_file(self, path: Union[str, os.PathLike], offset: int = 0) -> None:
+        """
+        Load the memory content from a binary file, see :meth:`load`
+
+        Args:
+            path: file to load
+            offset: Word offset in the memory of the first word
+
+        Returns:
+            None
+
+        """
+        with open(path, 'rb') as file:
+            self.load(file.read(), offset=offset)
+
+    def dump_file(self, path: Union[str, os.PathLike], offset: int = 0,
+                  length: Optional[int] = None) -> None:
+        """
+        Dump the memory content to a binary file, see :meth:`dump`
+
+        Args:
+            path: file to write
+            offset: Word offset in the memory of the first word
+            length: Number of words, defaults to the rest of the memory
+
+        Returns:
+            None
+
+        """
+        with open(path, 'wb') as file:
+            file.write(self.dump(offset=offset, length=length))
+
     @property
     def _width_in_bytes(self) -> int:
         def roundup_pow2(x: int) -> int:
@@ -157,3 +450,9 @@ class Memory(Base):
     def __offset_range_check(self, offset: int) -> None:
         if not 0 <= offset < self.__length:
             raise IndexError(f'offset must in in range 0 to {self.__length-1}, got {offset:d}')
+
+    def __block_range_check(self, offset: int, length: int) -> None:
+        self.__offset_range_check(offset)
+        if not 0 <= length <= self.__length - offset:
+            raise IndexError(f'length must in in range 0 to {self.__length - offset}, '
+                             f'got {length:d}')
@@ -22,6 +22,7 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Optional, Union
 from array import array as Array
+from bisect import bisect_left, bisect_right
 import asyncio
 
 from .register import Register, MemoryRegister
@@ -77,9 +78,33 @@ class BaseSimulator(ABC):
 
         # it is important to build the memories first as some registers may be within memories
         self._memories = self._build_memories()
+        self.__memory_starts, self.__memory_index = self.__build_memory_index(self._memories)
         self._registers = self._build_registers()
+        self.__register_addresses = sorted(self._registers)
         self.address = address
 
+    @staticmethod
+    def __build_memory_index(memories: list[MemoryEntry]) -> \
+            tuple[list[int], list[MemoryEntry]]:
+        """
+        Sort the memories by address so that the memory for an address can be found with a
+        binary search, this also checks that none of the memories overlap
+
+        Args:
+            memories: memories in the simulator
+
+        Returns: start addresses of the memories and the memory entries, both in address order
+        """
+        memory_index = sorted(memories, key=lambda entry: entry.start_address)
+        for previous_entry, entry in zip(memory_index, memory_index[1:]):
+            if entry.start_address <= previous_entry.end_address:
+                raise RuntimeError(f'memory {entry.memory.full_inst_name} at '
+                                   f'0x{entry.start_address:X} overlaps memory '
+                                   f'{previous_entry.memory.full_inst_name} which ends at '
+                                   f'0x{previous_entry.end_address:X}')
+
+        return [entry.start_address for entry in memory_index], memory_index
+
     @abstractmethod
     def _build_registers(self) -> dict[int, Union[MemoryRegister, Register]]:
         """
@@ -106,14 +131,15 @@ class BaseSimulator(ABC):
 
         """
 
-        memory_subset = list(filter(lambda x : x.address_in_memory(address=address),
-                                    self._memories))
-
-        if len(memory_subset) > 1:
-            raise RuntimeError(f'multiple memory matches on address 0x{address:X}({address:d})')
+        # find the last memory that starts at or before the address, as the memories do not
+        # overlap this is the only one that could contain it
+        position = bisect_right(self.__memory_starts, address)
+        if position == 0:
+            return None
 
-        if len(memory_subset) == 1:
-            return memory_subset[0]
+        memory_entry = self.__memory_index[position - 1]
+        if memory_entry.address_in_memory(address=address):
+            return memory_entry
 
         return None
 
@@ -171,13 +197,46 @@ class BaseSimulator(ABC):
                 potential_memory.memory.write(offset=potential_memory.memory_offset(addr),
                                               data=data)
 
+    def __block_memory(self, addr: int, width: int, length: int) -> Optional[MemoryEntry]:
+        """
+        Determine if a block access can be served as a single operation on a memory, this is
+        the case if the whole block is within one memory, uses the memory width and there are
+        no registers within the block (which must be accessed individually)
+
+        Args:
+            addr: start byte address
+            width: word width
+            length: number of word in the block
+
+        Returns: the memory entry to use, or None if the block must be accessed word by word
+        """
+        if length == 0:
+            return None
+
+        memory_entry = self.memory_for_address(address=addr)
+        if memory_entry is None:
+            return None
+
+        addresses = self._block_access_addresses(start_address=addr, width=width, length=length)
+        # pylint: disable-next=protected-access
+        matches_memory = addresses.step == memory_entry.memory._width_in_bytes and \
+            (addr - memory_entry.start_address) % addresses.step == 0 and \
+            addresses[-1] <= memory_entry.end_address
+        contains_register = bisect_left(self.__register_addresses, addr) != \
+            bisect_left(self.__register_addresses, addresses.stop)
+
+        if matches_memory and not contains_register:
+            return memory_entry
+
+        return None
+
     def _read_block_legacy(self, addr: int, width: int, accesswidth: int, length: int) -> Array:
         """
         function to simulate a device block read, this needs to match the protocol for the
         callbacks
 
-        This currently uses a simplified implementation of converting all the block operations
-        to discrete operations, a future enhancement could be to access slices of memories
+        Blocks entirely within a memory are read as a single operation on the memory, otherwise
+        the block is converted to discrete operations
         """
         return Array(get_array_typecode(width),self._read_block(addr=addr,
                                                                 width=width,
@@ -189,9 +248,14 @@ class BaseSimulator(ABC):
         function to simulate a device block read, this needs to match the protocol for the
         callbacks
 
-        This currently uses a simplified implementation of converting all the block operations
-        to discrete operations, a future enhancement could be to access slices of memories
+        Blocks entirely within a memory are read as a single operation on the memory, otherwise
+        the block is converted to discrete operations
         """
+        memory_entry = self.__block_memory(addr=addr, width=width, length=length)
+        if memory_entry is not None:
+            return memory_entry.memory.read_block(offset=memory_entry.memory_offset(addr),
+                                                  length=length)
+
         addresses = self._block_access_addresses(start_address=addr, width=width, length=length)
         return [self._read(element_addr,
                            width=width,
@@ -203,9 +267,14 @@ class BaseSimulator(ABC):
         function to simulate a device block write, this needs to match the protocol for the
         callbacks
 
-        This currently uses a simplified implementation of converting all the block operations
-        to discrete operations, a future enhancement could be to access slices of memories
+        Blocks entirely within a memory are written as a single operation on the memory,
+        otherwise the block is converted to discrete operations
         """
+        memory_entry = self.__block_memory(addr=addr, width=width, length=len(data))
+        if memory_entry is not None:
+            memory_entry.memory.write_block(offset=memory_entry.memory_offset(addr), data=data)
+            return
+
         addresses = self._block_access_addresses(start_address=addr,
                                                   width=width,
                                                   length=len(data))
@@ -317,8 +386,8 @@ class Simulator(BaseSimulator, ABC):
         function to simulate a device block read, this needs to match the protocol for the
         callbacks
 
-        This currently uses a simplified implementation of converting all the block operations
-        to discrete operations, a future enhancement could be to access slices of memories
+        Blocks entirely within a memory are accessed as a single operation on the memory,
+        otherwise the block is converted to discrete operations
         """
         return self._read_block(addr, width, accesswidth, length)
 
@@ -327,8 +396,8 @@ class Simulator(BaseSimulator, ABC):
         function to simulate a device block write, this needs to match the protocol for the
         callbacks
 
-        This currently uses a simplified implementation of converting all the block operations
-        to discrete operations, a future enhancement could be to access slices of memories
+        Blocks entirely within a memory are accessed as a single operation on the memory,
+        otherwise the block is converted to discrete operations
         """
         return self._write_block(addr, width, accesswidth, data)
 
@@ -358,8 +427,8 @@ class SimulatorLegacy(BaseSimulator, ABC):
         function to simulate a device block read, this needs to match the protocol for the
         callbacks
 
-        This currently uses a simplified implementation of converting all the block operations
-        to discrete operations, a future enhancement could be to access slices of memories
+        Blocks entirely within a memory are accessed as a single operation on the memory,
+        otherwise the block is converted to discrete operations
         """
         return self._read_block_legacy(addr, width, accesswidth, length)
 
@@ -368,8 +437,8 @@ class SimulatorLegacy(BaseSimulator, ABC):
         function to simulate a device block write, this needs to match the protocol for the
         callbacks
 
-        This currently uses a simplified implementation of converting all the block operations
-        to discrete operations, a future enhancement could be to access slices of memories
+        Blocks entirely within a memory are accessed as a single operation on the memory,
+        otherwise the block is converted to discrete operations
         """
         return self._write_block(addr, width, accesswidth, data)
 
@@ -401,8 +470,8 @@ class AsyncSimulator(BaseSimulator, ABC):
         function to simulate a device block read, this needs to match the protocol for the
         callbacks
 
-        This currently uses a simplified implementation of converting all the block operations
-        to discrete operations, a future enhancement could be to access slices of memories
+        Blocks entirely within a memory are accessed as a single operation on the memory,
+        otherwise the block is converted to discrete operations
         """
         await asyncio.sleep(0)
         return self._read_block(addr, width, accesswidth, length)
@@ -412,8 +481,8 @@ class AsyncSimulator(BaseSimulator, ABC):
         function to simulate a device block write, this needs to match the protocol for the
         callbacks
 
-        This currently uses a simplified implementation of converting all the block operations
-        to discrete operations, a future enhancement could be to access slices of memories
+        Blocks entirely within a memory are accessed as a single operation on the memory,
+        otherwise the block is converted to discrete operations
         """
         await asyncio.sleep(0)
         return self._write_block(addr, width, accesswidth, data)
@@ -446,8 +515,8 @@ class AsyncSimulatorLegacy(BaseSimulator, ABC):
         function to simulate a device block read, this needs to match the protocol for the
         callbacks
 
-        This currently uses a simplified implementation of converting all the block operations
-        to discrete operations, a future enhancement could be to access slices of memories
+        Blocks entirely within a memory are accessed as a single operation on the memory,
+        otherwise the block is converted to discrete operations
         """
         await asyncio.sleep(0)
         return self._read_block_legacy(addr, width, accesswidth, length)
@@ -457,8 +526,8 @@ class AsyncSimulatorLegacy(BaseSimulator, ABC):
         function to simulate a device block write, this needs to match the protocol for the
         callbacks
 
-        This currently uses a simplified implementation of converting all the block operations
-        to discrete operations, a future enhancement could be to access slices of memories
+        Blocks entirely within a memory are accessed as a single operation on the memory,
+        otherwise the block is converted to discrete operations
         """
         await asyncio.sleep(0)
         return self._write_block(addr, width, accesswidth, data)
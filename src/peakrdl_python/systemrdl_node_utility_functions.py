@@ -331,6 +331,67 @@ def get_reg_max_value_hex_string(node: RegNode) -> str:
     max_value = ((2 ** (node.size * 8)) - 1)
     return f'0x{max_value:X}'
 
+def get_reg_reset_value_and_mask(node: RegNode) -> tuple[int, int]:
+    """
+    Reset value of a register and the bitmask of the fields it includes. Only fields which
+    are readable, not volatile (hardware writable) and have a known reset value are
+    included, the other bits of the reset value are zero
+
+    Args:
+        node: node to be analysed
+
+    Returns:
+        reset value and bitmask
+
+    """
+    if not isinstance(node, RegNode):
+        raise TypeError(f'node is not a {type(RegNode)} got {type(node)}')
+
+    reset_value = 0
+    reset_mask = 0
+    for field in node.fields():
+        default = get_field_default_value(field)
+        if default is None or field.is_hw_writable or not field.is_sw_readable:
+            continue
+        if field.msb != field.high:
+            # msb0 field, the bit order of the value is reversed in the register
+            default = int(f'{default:0{field.width}b}'[::-1], 2)
+        reset_value |= default << field.low
+        reset_mask |= get_field_bitmask_int(field)
+
+    return reset_value, reset_mask
+
+
+def get_reg_reset_value_hex_string(node: RegNode) -> str:
+    """
+    Hexadecimal for the reset value of a register, see :func:`get_reg_reset_value_and_mask`
+
+    Args:
+        node: node to be analysed
+
+    Returns:
+        reset value as a string prefixed by 0x
+
+    """
+    reset_value, _ = get_reg_reset_value_and_mask(node)
+    return f'0x{reset_value:X}'
+
+
+def get_reg_reset_mask_hex_string(node: RegNode) -> str:
+    """
+    Hexadecimal for the bitmask of the fields included in the reset value of a register, see
+    :func:`get_reg_reset_value_and_mask`
+
+    Args:
+        node: node to be analysed
+
+    Returns:
+        bitmask as a string prefixed by 0x
+
+    """
+    _, reset_mask = get_reg_reset_value_and_mask(node)
+    return f'0x{reset_mask:X}'
+
 def get_reg_fields(node: RegNode, hide_node_callback: HideNodeCallback) -> Iterable[FieldNode]:
     """
     Iterable that yields all the fields from the reg node
@@ -443,6 +504,28 @@ def get_memory_width_bytes(node: MemNode) -> int:
     return node.size // node.get_property('mementries')
 
 
+def field_has_read_side_effect(node: FieldNode) -> bool:
+    """
+    True if a software read changes the value of the field, for example clear on read (rclr)
+    or set on read (rset)
+    """
+    if not isinstance(node, FieldNode):
+        raise TypeError(f'node is not a {type(FieldNode)} got {type(node)}')
+
+    return node.get_property('onread') is not None
+
+
+def field_has_write_side_effect(node: FieldNode) -> bool:
+    """
+    True if a software write does more than store the value written in the field, for example
+    write one to clear (woclr) or a single pulse (singlepulse)
+    """
+    if not isinstance(node, FieldNode):
+        raise TypeError(f'node is not a {type(FieldNode)} got {type(node)}')
+
+    return node.get_property('onwrite') is not None or bool(node.get_property('singlepulse'))
+
+
 def get_field_default_value(node: FieldNode) -> Optional[int]:
     """
     Default (reset) value of the field.
@@ -4,20 +4,28 @@ Components to use in unit tests
 import unittest
 from unittest.mock import NonCallableMagicMock
 from collections.abc import Iterator
-from typing import Any, Union
+from typing import Any, Optional, Union
 from abc import ABC
+import asyncio
 import logging
 
 # pylint: disable-next=unused-wildcard-import, wildcard-import
 from peakrdl_python.lib import *
 
-# pylint: disable=logging-not-lazy,logging-fstring-interpolation
+# pylint: disable=logging-not-lazy,logging-fstring-interpolation,too-many-lines
 
 class ReadOnlyRegisterToTest(RegReadOnly):
     """
     Class to represent a register in the register model
     """
     __slots__: list[str] = ['__field']
+    # set to True in a subclass to make the field hardware writable
+    field_is_volatile = False
+    # set in a subclass to give the field a reset value
+    field_default: Optional[int] = None
+    # set to True in a subclass to give the field a read or write side effect
+    field_has_read_side_effect = False
+    field_has_write_side_effect = False
 
     class FieldToTest(FieldReadOnly):
         """
@@ -50,8 +58,10 @@ class ReadOnlyRegisterToTest(RegReadOnly):
                 low=0,
                 high=0),
             misc_props=FieldMiscProps(
-                default=None,
-                is_volatile=False),
+                default=self.field_default,
+                is_volatile=self.field_is_volatile,
+                has_read_side_effect=self.field_has_read_side_effect,
+                has_write_side_effect=self.field_has_write_side_effect),
             logger_handle=logger_handle + '.field',
             inst_name='field')
 
@@ -96,6 +106,13 @@ class WriteOnlyRegisterToTest(RegWriteOnly):
     Class to represent a register in the register model
     """
     __slots__: list[str] = ['__field']
+    # set to True in a subclass to make the field hardware writable
+    field_is_volatile = False
+    # set in a subclass to give the field a reset value
+    field_default: Optional[int] = None
+    # set to True in a subclass to give the field a read or write side effect
+    field_has_read_side_effect = False
+    field_has_write_side_effect = False
 
     # pylint: disable=duplicate-code,too-many-arguments
     class FieldToTest(FieldWriteOnly):
@@ -128,8 +145,10 @@ class WriteOnlyRegisterToTest(RegWriteOnly):
                 low=0,
                 high=0),
             misc_props=FieldMiscProps(
-                default=None,
-                is_volatile=False),
+                default=self.field_default,
+                is_volatile=self.field_is_volatile,
+                has_read_side_effect=self.field_has_read_side_effect,
+                has_write_side_effect=self.field_has_write_side_effect),
             logger_handle=logger_handle + '.field',
             inst_name='field')
 
@@ -177,6 +196,13 @@ class ReadWriteRegisterToTest(RegReadWrite):
     Class to represent a register in the register model
     """
     __slots__: list[str] = ['__field']
+    # set to True in a subclass to make the field hardware writable
+    field_is_volatile = False
+    # set in a subclass to give the field a reset value
+    field_default: Optional[int] = None
+    # set to True in a subclass to give the field a read or write side effect
+    field_has_read_side_effect = False
+    field_has_write_side_effect = False
 
     # pylint: disable=duplicate-code,too-many-arguments
     class FieldToTest(FieldReadWrite):
@@ -209,8 +235,10 @@ class ReadWriteRegisterToTest(RegReadWrite):
                 low=0,
                 high=0),
             misc_props=FieldMiscProps(
-                default=None,
-                is_volatile=False),
+                default=self.field_default,
+                is_volatile=self.field_is_volatile,
+                has_read_side_effect=self.field_has_read_side_effect,
+                has_write_side_effect=self.field_has_write_side_effect),
             logger_handle=logger_handle + '.field',
             inst_name='field')
 
@@ -260,6 +288,44 @@ class ReadWriteRegisterToTest(RegReadWrite):
         }
 
 
+class VolatileReadOnlyRegisterToTest(ReadOnlyRegisterToTest):
+    """
+    Read only register with a hardware writable field, e.g. a status register
+    """
+    __slots__: list[str] = []
+    field_is_volatile = True
+    field_default = 0
+
+
+# write_fields raises NotImplementedError in the parent so pylint sees it as abstract
+# pylint: disable-next=abstract-method
+class ResetReadWriteRegisterToTest(ReadWriteRegisterToTest):
+    """
+    Read/write register with a field which resets to 1
+    """
+    __slots__: list[str] = []
+    field_default = 1
+
+
+class ClearOnReadRegisterToTest(ReadOnlyRegisterToTest):
+    """
+    Read only register with a field which is cleared when it is read (rclr)
+    """
+    __slots__: list[str] = []
+    field_has_read_side_effect = True
+    field_default = 0
+
+
+# write_fields raises NotImplementedError in the parent so pylint sees it as abstract
+# pylint: disable-next=abstract-method
+class SinglePulseRegisterToTest(WriteOnlyRegisterToTest):
+    """
+    Write only register with a field which pulses for a single cycle when written (singlepulse)
+    """
+    __slots__: list[str] = []
+    field_has_write_side_effect = True
+
+
 class ReadOnlyRegisterArrayToTest(RegReadOnlyArray):
     """
     Class to represent a register array in the register model
@@ -271,6 +337,18 @@ class ReadOnlyRegisterArrayToTest(RegReadOnlyArray):
         return ReadOnlyRegisterToTest
 
 
+class LazyReadOnlyRegisterArrayToTest(ReadOnlyRegisterArrayToTest):
+    """
+    Class to represent a register array in the register model, which builds its elements on
+    first access
+    """
+    __slots__: list[str] = []
+
+    @property
+    def _lazy_construction(self) -> bool:
+        return True
+
+
 class WriteOnlyRegisterArrayToTest(RegWriteOnlyArray):
     """
     Class to represent a register array in the register model
@@ -387,3 +465,597 @@ class CallBackTestWrapper(unittest.TestCase, ABC):
         mocked_callback_set.configure_mock(**attrs)
         self.callbacks = mocked_callback_set
         self.logger = logging.Logger('test case')
+
+
+class AddressMapToTest(AddressMap):
+    """
+    Address map with a small set of registers to use in tests that need more than one register
+
+    ======  ==========  ======
+    offset  register    access
+    ======  ==========  ======
+    0x0     reg_rw_a    rw
+    0x4     reg_rw_b    rw (resets to 1)
+    0x8     reg_ro      r (volatile)
+    0xC     reg_wo      w
+    ======  ==========  ======
+
+    A parent can be given to use it as an address map within another one, in which case the
+    callbacks must be None
+    """
+    __slots__: list[str] = ['__reg_rw_a', '__reg_rw_b', '__reg_ro', '__reg_wo']
+
+    def __init__(self, *, callbacks: Optional[NormalCallbackSet], address: int = 0,
+                 parent: Optional[AddressMap] = None):
+        super().__init__(callbacks=callbacks, address=address, logger_handle='dut_wrapper',
+                         inst_name='dut_wrapper', parent=parent)
+
+        self.__reg_rw_a = ReadWriteRegisterToTest(logger_handle='dut_wrapper.reg_rw_a',
+                                                  inst_name='reg_rw_a', parent=self,
+                                                  width=32, accesswidth=32, address=address)
+        self.__reg_rw_b = ResetReadWriteRegisterToTest(logger_handle='dut_wrapper.reg_rw_b',
+                                                       inst_name='reg_rw_b', parent=self,
+                                                       width=32, accesswidth=32,
+                                                       address=address + 4)
+        self.__reg_ro = VolatileReadOnlyRegisterToTest(logger_handle='dut_wrapper.reg_ro',
+                                                       inst_name='reg_ro', parent=self,
+                                                       width=32, accesswidth=32,
+                                                       address=address + 8)
+        self.__reg_wo = WriteOnlyRegisterToTest(logger_handle='dut_wrapper.reg_wo',
+                                                inst_name='reg_wo', parent=self,
+                                                width=32, accesswidth=32, address=address + 12)
+
+    def get_memories(self, unroll: bool = False) -> Iterator[Union[Memory, MemoryArray]]:
+        yield from []
+
+    def get_sections(self, unroll: bool = False) -> \
+            Iterator[Union[AddressMap, RegFile, AddressMapArray, RegFileArray]]:
+        yield from []
+
+    def get_registers(self, unroll: bool = False) -> Iterator[Union[Reg, RegArray]]:
+        yield self.reg_rw_a
+        yield self.reg_rw_b
+        yield self.reg_ro
+        yield self.reg_wo
+
+    @property
+    def systemrdl_python_child_name_map(self) -> dict[str, str]:
+        return {
+            'reg_rw_a': 'reg_rw_a',
+            'reg_rw_b': 'reg_rw_b',
+            'reg_ro': 'reg_ro',
+            'reg_wo': 'reg_wo',
+        }
+
+    @property
+    def reg_rw_a(self) -> ReadWriteRegisterToTest:
+        """
+        read/write register at offset 0x0
+        """
+        return self.__reg_rw_a
+
+    @property
+    def reg_rw_b(self) -> ResetReadWriteRegisterToTest:
+        """
+        read/write register at offset 0x4, which resets to 1
+        """
+        return self.__reg_rw_b
+
+    @property
+    def reg_ro(self) -> VolatileReadOnlyRegisterToTest:
+        """
+        read only register with a volatile field at offset 0x8
+        """
+        return self.__reg_ro
+
+    @property
+    def reg_wo(self) -> WriteOnlyRegisterToTest:
+        """
+        write only register at offset 0xC
+        """
+        return self.__reg_wo
+
+    @property
+    def size(self) -> int:
+        return 16
+
+
+class SideEffectAddressMapToTest(AddressMap):
+    """
+    Address map with registers whose fields have access side effects
+
+    ======  ==========  ==================
+    offset  register    access
+    ======  ==========  ==================
+    0x0     reg_rclr    r (clear on read)
+    0x4     reg_pulse   w (single pulse)
+    ======  ==========  ==================
+    """
+    __slots__: list[str] = ['__reg_rclr', '__reg_pulse']
+
+    def __init__(self, *, callbacks: Optional[NormalCallbackSet], address: int = 0):
+        super().__init__(callbacks=callbacks, address=address, logger_handle='dut_wrapper',
+                         inst_name='dut_wrapper', parent=None)
+
+        self.__reg_rclr = ClearOnReadRegisterToTest(logger_handle='dut_wrapper.reg_rclr',
+                                                    inst_name='reg_rclr', parent=self,
+                                                    width=32, accesswidth=32, address=address)
+        self.__reg_pulse = SinglePulseRegisterToTest(logger_handle='dut_wrapper.reg_pulse',
+                                                     inst_name='reg_pulse', parent=self,
+                                                     width=32, accesswidth=32,
+                                                     address=address + 4)
+
+    def get_memories(self, unroll: bool = False) -> Iterator[Union[Memory, MemoryArray]]:
+        yield from []
+
+    def get_sections(self, unroll: bool = False) -> \
+            Iterator[Union[AddressMap, RegFile, AddressMapArray, RegFileArray]]:
+        yield from []
+
+    def get_registers(self, unroll: bool = False) -> Iterator[Union[Reg, RegArray]]:
+        yield self.reg_rclr
+        yield self.reg_pulse
+
+    @property
+    def systemrdl_python_child_name_map(self) -> dict[str, str]:
+        return {
+            'reg_rclr': 'reg_rclr',
+            'reg_pulse': 'reg_pulse',
+        }
+
+    @property
+    def reg_rclr(self) -> ClearOnReadRegisterToTest:
+        """
+        read only register with a clear on read field at offset 0x0
+        """
+        return self.__reg_rclr
+
+    @property
+    def reg_pulse(self) -> SinglePulseRegisterToTest:
+        """
+        write only register with a single pulse field at offset 0x4
+        """
+        return self.__reg_pulse
+
+    @property
+    def size(self) -> int:
+        return 8
+
+
+class ReadWriteMemoryToTest(MemoryReadWrite):
+    """
+    Memory with no registers to use in tests
+    """
+    __slots__: list[str] = []
+
+    # pylint: disable-next=too-many-arguments
+    def __init__(self, *, address: int, width: int, entries: int, logger_handle: str,
+                 inst_name: str, parent: AddressMap):
+        super().__init__(address=address, width=width, accesswidth=width, entries=entries,
+                         logger_handle=logger_handle, inst_name=inst_name, parent=parent)
+
+    def get_registers(self, unroll: bool = False) -> Iterator[Union[Reg, RegArray]]:
+        yield from []
+
+    @property
+    def systemrdl_python_child_name_map(self) -> dict[str, str]:
+        return {}
+
+
+class ReadWriteMemoryLegacyToTest(MemoryReadWriteLegacy):
+    """
+    Memory with no registers and the legacy array based API to use in tests
+    """
+    __slots__: list[str] = []
+
+    # pylint: disable-next=too-many-arguments
+    def __init__(self, *, address: int, width: int, entries: int, logger_handle: str,
+                 inst_name: str, parent: AddressMap):
+        super().__init__(address=address, width=width, accesswidth=width, entries=entries,
+                         logger_handle=logger_handle, inst_name=inst_name, parent=parent)
+
+    def get_registers(self, unroll: bool = False) -> Iterator[Union[Reg, RegArray]]:
+        yield from []
+
+    @property
+    def systemrdl_python_child_name_map(self) -> dict[str, str]:
+        return {}
+
+
+class MemoryAddressMapToTest(AddressMap):
+    """
+    Address map with a single memory (``mem``) at offset 0, the legacy version of the memory is
+    used if the callbacks are legacy
+    """
+    __slots__: list[str] = ['__mem']
+
+    def __init__(self, *, callbacks: Union[NormalCallbackSet, NormalCallbackSetLegacy],
+                 width: int = 32, entries: int = 16):
+        super().__init__(callbacks=callbacks, address=0, logger_handle='dut_wrapper',
+                         inst_name='dut_wrapper', parent=None)
+
+        memory_cls: Union[type[ReadWriteMemoryToTest], type[ReadWriteMemoryLegacyToTest]]
+        if isinstance(callbacks, NormalCallbackSetLegacy):
+            memory_cls = ReadWriteMemoryLegacyToTest
+        else:
+            memory_cls = ReadWriteMemoryToTest
+        self.__mem = memory_cls(address=0, width=width, entries=entries,
+                                logger_handle='dut_wrapper.mem', inst_name='mem', parent=self)
+
+    def get_memories(self, unroll: bool = False) -> Iterator[Union[Memory, MemoryArray]]:
+        yield self.mem
+
+    def get_sections(self, unroll: bool = False) -> \
+            Iterator[Union[AddressMap, RegFile, AddressMapArray, RegFileArray]]:
+        yield from []
+
+    def get_registers(self, unroll: bool = False) -> Iterator[Union[Reg, RegArray]]:
+        yield from []
+
+    @property
+    def systemrdl_python_child_name_map(self) -> dict[str, str]:
+        return {'mem': 'mem'}
+
+    @property
+    def mem(self) -> Union[ReadWriteMemoryToTest, ReadWriteMemoryLegacyToTest]:
+        """
+        memory at offset 0x0
+        """
+        return self.__mem
+
+    @property
+    def size(self) -> int:
+        return self.mem.size
+
+
+class AsyncReadWriteMemoryToTest(MemoryAsyncReadWrite):
+    """
+    Asynchronous memory with no registers to use in tests
+    """
+    __slots__: list[str] = []
+
+    # pylint: disable-next=too-many-arguments
+    def __init__(self, *, address: int, width: int, entries: int, logger_handle: str,
+                 inst_name: str, parent: AsyncAddressMap):
+        super().__init__(address=address, width=width, accesswidth=width, entries=entries,
+                         logger_handle=logger_handle, inst_name=inst_name, parent=parent)
+
+    def get_registers(self, unroll: bool = False) -> Iterator[Union[AsyncReg, AsyncRegArray]]:
+        yield from []
+
+    @property
+    def systemrdl_python_child_name_map(self) -> dict[str, str]:
+        return {}
+
+
+class AsyncMemoryAddressMapToTest(AsyncAddressMap):
+    """
+    Asynchronous address map with a single memory (``mem``) at offset 0
+    """
+    __slots__: list[str] = ['__mem']
+
+    def __init__(self, *, callbacks: AsyncCallbackSet, width: int = 32, entries: int = 16):
+        super().__init__(callbacks=callbacks, address=0, logger_handle='dut_wrapper',
+                         inst_name='dut_wrapper', parent=None)
+        self.__mem = AsyncReadWriteMemoryToTest(address=0, width=width, entries=entries,
+                                                logger_handle='dut_wrapper.mem', inst_name='mem',
+                                                parent=self)
+
+    def get_memories(self, unroll: bool = False) -> \
+            Iterator[Union[AsyncMemory, AsyncMemoryArray]]:
+        yield self.mem
+
+    def get_sections(self, unroll: bool = False) -> \
+            Iterator[Union[AsyncAddressMap, AsyncRegFile, AsyncAddressMapArray,
+                           AsyncRegFileArray]]:
+        yield from []
+
+    def get_registers(self, unroll: bool = False) -> Iterator[Union[AsyncReg, AsyncRegArray]]:
+        yield from []
+
+    @property
+    def systemrdl_python_child_name_map(self) -> dict[str, str]:
+        return {'mem': 'mem'}
+
+    @property
+    def mem(self) -> AsyncReadWriteMemoryToTest:
+        """
+        memory at offset 0x0
+        """
+        return self.__mem
+
+    @property
+    def size(self) -> int:
+        return self.mem.size
+
+
+class AsyncReadWriteRegisterToTest(RegAsyncReadWrite):
+    """
+    Asynchronous read/write register with no fields to use in tests
+    """
+    __slots__: list[str] = []
+
+    @property
+    def fields(self) -> Iterator[Union[FieldAsyncReadOnly, FieldAsyncWriteOnly,
+                                       FieldAsyncReadWrite]]:
+        yield from []
+
+    @property
+    def writable_fields(self) -> Iterator[Union[FieldAsyncWriteOnly, FieldAsyncReadWrite]]:
+        yield from []
+
+    async def write_fields(self, **kwargs: Any) -> None:
+        raise NotImplementedError('Not implemented for the purpose of tests')
+
+    @property
+    def systemrdl_python_child_name_map(self) -> dict[str, str]:
+        return {}
+
+
+# write_fields raises NotImplementedError in the parent so pylint sees it as abstract
+# pylint: disable-next=abstract-method
+class AsyncResetReadWriteRegisterToTest(AsyncReadWriteRegisterToTest):
+    """
+    Asynchronous read/write register with a reset value set in the same way as the generated
+    registers, in place of fields
+    """
+    __slots__: list[str] = []
+
+    @property
+    def _reset_value_and_mask(self) -> tuple[int, int]:
+        return 0x5, 0xF
+
+
+class AsyncReadOnlyRegisterToTest(RegAsyncReadOnly):
+    """
+    Asynchronous read only register with no fields to use in tests
+    """
+    __slots__: list[str] = []
+
+    @property
+    def fields(self) -> Iterator[Union[FieldAsyncReadOnly, FieldAsyncWriteOnly,
+                                       FieldAsyncReadWrite]]:
+        yield from []
+
+    @property
+    def systemrdl_python_child_name_map(self) -> dict[str, str]:
+        return {}
+
+
+class AsyncWriteOnlyRegisterToTest(RegAsyncWriteOnly):
+    """
+    Asynchronous write only register with no fields to use in tests
+    """
+    __slots__: list[str] = []
+
+    @property
+    def fields(self) -> Iterator[Union[FieldAsyncReadOnly, FieldAsyncWriteOnly,
+                                       FieldAsyncReadWrite]]:
+        yield from []
+
+    async def write_fields(self, **kwargs: Any) -> None:
+        raise NotImplementedError('Not implemented for the purpose of tests')
+
+    @property
+    def systemrdl_python_child_name_map(self) -> dict[str, str]:
+        return {}
+
+
+class AsyncAddressMapToTest(AsyncAddressMap):
+    """
+    Asynchronous address map with a set of registers to use in tests, laid out in the same
+    way as :class:`AddressMapToTest` with an additional block of read/write registers
+
+    ======  ==========  ======
+    offset  register    access
+    ======  ==========  ======
+    0x0     reg_rw_a    rw
+    0x4     reg_rw_b    rw
+    0x8     reg_ro      r
+    0xC     reg_wo      w
+    0x10    reg_rw_c    rw (resets to 0x5)
+    0x14    reg_rw_d    rw (resets to 0x5)
+    ======  ==========  ======
+    """
+    __slots__: list[str] = ['__registers']
+
+    def __init__(self, *, callbacks: AsyncCallbackSet):
+        super().__init__(callbacks=callbacks, address=0, logger_handle='dut_wrapper',
+                         inst_name='dut_wrapper', parent=None)
+
+        register_types: dict[str, type[AsyncReg]] = {
+            'reg_rw_a': AsyncReadWriteRegisterToTest,
+            'reg_rw_b': AsyncReadWriteRegisterToTest,
+            'reg_ro': AsyncReadOnlyRegisterToTest,
+            'reg_wo': AsyncWriteOnlyRegisterToTest,
+            'reg_rw_c': AsyncResetReadWriteRegisterToTest,
+            'reg_rw_d': AsyncResetReadWriteRegisterToTest}
+        self.__registers = {
+            inst_name: register_type(  # type: ignore[call-arg]
+                logger_handle=f'dut_wrapper.{inst_name}', inst_name=inst_name, parent=self,
+                width=32, accesswidth=32, address=index * 4)
+            for index, (inst_name, register_type) in enumerate(register_types.items())}
+
+    def get_memories(self, unroll: bool = False) -> \
+            Iterator[Union[AsyncMemory, AsyncMemoryArray]]:
+        yield from []
+
+    def get_sections(self, unroll: bool = False) -> \
+            Iterator[Union[AsyncAddressMap, AsyncRegFile, AsyncAddressMapArray,
+                           AsyncRegFileArray]]:
+        yield from []
+
+    def get_registers(self, unroll: bool = False) -> Iterator[Union[AsyncReg, AsyncRegArray]]:
+        yield from self.__registers.values()
+
+    @property
+    def systemrdl_python_child_name_map(self) -> dict[str, str]:
+        return {inst_name: inst_name for inst_name in self.__registers}
+
+    @property
+    def size(self) -> int:
+        return 4 * len(self.__registers)
+
+
+class BusLatencyModel:
+    """
+    Asynchronous context manager to be used around the accesses in async test callbacks, it
+    models the latency of a bus and records the peak number of accesses in progress at once
+    """
+    def __init__(self, latency: float = 0.01):
+        self.latency = latency
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def __aenter__(self) -> None:
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        await asyncio.sleep(self.latency)
+
+    async def __aexit__(self, *args: Any) -> None:
+        self.in_flight -= 1
+
+
+class MultiFieldRegisterToTest(RegReadWrite):
+    """
+    Register with a mix of lsb0 and msb0 fields
+
+    ===========  =======  =====
+    field        bits     order
+    ===========  =======  =====
+    field_lsb0   [7:0]    lsb0
+    field_msb0   [8:11]   msb0
+    field_wide   [12:31]  msb0
+    ===========  =======  =====
+    """
+    __slots__: list[str] = ['__field_lsb0', '__field_msb0', '__field_wide']
+
+    class FieldToTest(FieldReadWrite):
+        """
+        Class to represent a register field in the register model
+        """
+        __slots__: list[str] = []
+
+    # pylint: disable-next=too-many-arguments
+    def __init__(self, *, address: int, accesswidth: int, width: int, logger_handle: str,
+                 inst_name: str, parent: Union[AddressMap, RegReadWriteArray, MemoryReadWrite]):
+        super().__init__(address=address, accesswidth=accesswidth, width=width,
+                         logger_handle=logger_handle, inst_name=inst_name, parent=parent)
+
+        def build_field(name: str, low: int, high: int, msb0: bool) -> FieldReadWrite:
+            return self.FieldToTest(
+                parent_register=self,
+                size_props=FieldSizeProps(width=high - low + 1,
+                                          lsb=high if msb0 else low,
+                                          msb=low if msb0 else high,
+                                          low=low, high=high),
+                misc_props=FieldMiscProps(default=None, is_volatile=False),
+                logger_handle=logger_handle + '.' + name,
+                inst_name=name)
+
+        self.__field_lsb0 = build_field('field_lsb0', low=0, high=7, msb0=False)
+        self.__field_msb0 = build_field('field_msb0', low=8, high=11, msb0=True)
+        self.__field_wide = build_field('field_wide', low=12, high=31, msb0=True)
+
+    @property
+    def fields(self) -> Iterator[FieldReadWrite]:
+        yield self.__field_lsb0
+        yield self.__field_msb0
+        yield self.__field_wide
+
+    @property
+    def readable_fields(self) -> Iterator[FieldReadWrite]:
+        return self.fields
+
+    @property
+    def writable_fields(self) -> Iterator[FieldReadWrite]:
+        return self.fields
+
+    @property
+    def field_lsb0(self) -> FieldReadWrite:
+        """
+        lsb0 field in bits [7:0]
+        """
+        return self.__field_lsb0
+
+    @property
+    def field_msb0(self) -> FieldReadWrite:
+        """
+        msb0 field in bits [8:11]
+        """
+        return self.__field_msb0
+
+    @property
+    def field_wide(self) -> FieldReadWrite:
+        """
+        msb0 field in bits [12:31], this is wider than the bit reversal lookup table
+        """
+        return self.__field_wide
+
+    @property
+    def systemrdl_python_child_name_map(self) -> dict[str, str]:
+        return {name: name for name in ['field_lsb0', 'field_msb0', 'field_wide']}
+
+
+class MultiFieldRegisterArrayToTest(RegReadWriteArray):
+    """
+    Array of registers with a mix of lsb0 and msb0 fields
+    """
+    __slots__: list[str] = []
+
+    @property
+    def _element_datatype(self) -> type[Node]:
+        return MultiFieldRegisterToTest
+
+
+class ArrayAddressMapToTest(AddressMap):
+    """
+    Address map with a 4x4 array of registers (``reg_array``) at offset 0 and a 16 entry
+    memory (``mem``) at offset 0x100
+    """
+    __slots__: list[str] = ['__reg_array', '__mem']
+
+    def __init__(self, *, callbacks: NormalCallbackSet, stride: int = 4):
+        super().__init__(callbacks=callbacks, address=0, logger_handle='dut_wrapper',
+                         inst_name='dut_wrapper', parent=None)
+        self.__reg_array = MultiFieldRegisterArrayToTest(
+            logger_handle='dut_wrapper.reg_array', inst_name='reg_array', parent=self,
+            address=0, width=32, accesswidth=32, stride=stride, dimensions=(4, 4))
+        self.__mem = ReadWriteMemoryToTest(address=0x100, width=32, entries=16,
+                                           logger_handle='dut_wrapper.mem', inst_name='mem',
+                                           parent=self)
+
+    def get_memories(self, unroll: bool = False) -> Iterator[Union[Memory, MemoryArray]]:
+        yield self.mem
+
+    def get_sections(self, unroll: bool = False) -> \
+            Iterator[Union[AddressMap, RegFile, AddressMapArray, RegFileArray]]:
+        yield from []
+
+    def get_registers(self, unroll: bool = False) -> Iterator[Union[Reg, RegArray]]:
+        if unroll:
+            yield from self.reg_array
+        else:
+            yield self.reg_array
+
+    @property
+    def systemrdl_python_child_name_map(self) -> dict[str, str]:
+        return {'reg_array': 'reg_array', 'mem': 'mem'}
+
+    @property
+    def reg_array(self) -> MultiFieldRegisterArrayToTest:
+        """
+        register array at offset 0x0
+        """
+        return self.__reg_array
+
+    @property
+    def mem(self) -> ReadWriteMemoryToTest:
+        """
+        memory at offset 0x100
+        """
+        return self.__mem
+
+    @property
+    def size(self) -> int:
+        return 0x100 + self.mem.size
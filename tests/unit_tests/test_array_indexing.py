@@ -7,11 +7,13 @@ from typing import Optional, Union
 from collections.abc import Iterator
 from abc import ABC, abstractmethod
 from itertools import product
+from unittest.mock import patch
 
 # pylint: disable-next=unused-wildcard-import, wildcard-import
 from peakrdl_python.lib import *
 
 from .simple_components import ReadOnlyRegisterArrayToTest, CallBackTestWrapper
+from .simple_components import LazyReadOnlyRegisterArrayToTest
 
 # pylint: disable=logging-not-lazy,logging-fstring-interpolation
 
@@ -20,6 +22,8 @@ class ArrayBase(CallBackTestWrapper, ABC):
     Base of the Array indexing tests
     """
 
+    array_cls: type[ReadOnlyRegisterArrayToTest] = ReadOnlyRegisterArrayToTest
+
     @property
     @abstractmethod
     def dimensions(self) -> tuple[int, ...]:
@@ -56,6 +60,8 @@ class ArrayBase(CallBackTestWrapper, ABC):
 
     def setUp(self) -> None:
 
+        array_cls = self.array_cls
+
         class DUTWrapper(AddressMap):
             """
             Address map to to wrap the register array being tested
@@ -73,14 +79,14 @@ class ArrayBase(CallBackTestWrapper, ABC):
                 super().__init__(callbacks=callbacks, address=address, logger_handle=logger_handle,
                                  inst_name=inst_name, parent=None )
 
-                self.__dut = ReadOnlyRegisterArrayToTest(logger_handle='dut',
-                                                         inst_name='dut',
-                                                         parent=self,
-                                                         address=address,
-                                                         width=32,
-                                                         accesswidth=32,
-                                                         stride=dut_stride,
-                                                         dimensions=dut_dimensions)
+                self.__dut = array_cls(logger_handle='dut',
+                                       inst_name='dut',
+                                       parent=self,
+                                       address=address,
+                                       width=32,
+                                       accesswidth=32,
+                                       stride=dut_stride,
+                                       dimensions=dut_dimensions)
 
             def get_memories(self, unroll: bool = False) -> \
                     Iterator[Union[Memory, tuple[Memory, ...]]]:
@@ -186,6 +192,33 @@ class Test1DArray(ArrayBase):
                 with self.assertRaises(IndexError):
                     _ = subset_slice[index]
 
+    def test_slice_of_slice(self) -> None:
+        """
+        Test slicing a slice of the array, including slices with a negative step
+        """
+        for first, second in [(slice(None, None, 2), slice(2, None, 3)),
+                              (slice(1, -1), slice(None, None, -3)),
+                              (slice(None, None, -1), slice(None, None, 4)),
+                              (slice(2, 4), slice(5, None))]:
+            with self.subTest(first=first, second=second):
+                expected = sorted(set(range(*first.indices(self.dimensions[0]))) &
+                                  set(range(*second.indices(self.dimensions[0]))))
+                chunk = self.dut[first][second]
+                self.assertEqual(len(chunk), len(expected))
+                self.assertEqual([entry.address for entry in chunk],
+                                 [self.calculate_address((index,)) for index in expected])
+                for index in expected:
+                    self.assertIs(chunk[index], self.dut[index])
+
+    def test_addresses(self) -> None:
+        """
+        Test the addresses of all the elements are calculated as a range
+        """
+        for chunk in [self.dut, self.dut[::2], self.dut[::-3], self.dut[2:-2], self.dut[4:2]]:
+            addresses = chunk.addresses()
+            self.assertIsInstance(addresses, range)
+            self.assertEqual(list(addresses), [entry.address for entry in chunk])
+
 
 class Test2DArray(ArrayBase):
     """
@@ -254,9 +287,84 @@ class Test2DArray(ArrayBase):
         """
 
         chunk = self.dut[2:-2, 3:-3]
+        self.assertEqual(len(chunk), 36)
         for index, entry in zip(product(range(2,8), range(3,9)), chunk):
             self.assertEqual(entry.address, self.calculate_address(index))
 
+        sub_chunk = chunk[::2, 5]
+        self.assertEqual([index for index, _ in sub_chunk.items()],
+                         [(2, 5), (4, 5), (6, 5)])
+        with self.assertRaises(IndexError):
+            _ = sub_chunk[2, 4]
+
+    def test_addresses(self) -> None:
+        """
+        Test the addresses of all the elements, these are a range unless there are gaps
+        between the rows of the slice
+        """
+        for chunk, is_range in [(self.dut, True), (self.dut[:, 0], True),
+                                (self.dut[3, 1::2], True), (self.dut[2:4, :], True),
+                                (self.dut[::3, ::4], False), (self.dut[2:-2, 3:-3], False)]:
+            addresses = chunk.addresses()
+            self.assertEqual(isinstance(addresses, range), is_range)
+            self.assertEqual(list(addresses), [entry.address for entry in chunk])
+
+
+class TestLazy1DArray(Test1DArray):
+    """
+    Test for 1D arrays where the elements are built on first access
+    """
+    array_cls = LazyReadOnlyRegisterArrayToTest
+
+    def test_elements_built_on_demand(self) -> None:
+        """
+        Check the elements are only built when they are accessed and are then reused
+        """
+        # pylint: disable-next=protected-access
+        build_element = ReadOnlyRegisterArrayToTest._build_element
+        with patch.object(self.array_cls, '_build_element', autospec=True,
+                          side_effect=build_element) as build:
+            self.assertEqual(len(self.dut), self.dimensions[0])
+            build.assert_not_called()
+
+            element = self.dut[3]
+            self.assertIs(self.dut[3], element)
+            build.assert_called_once()
+
+            # slicing does not build any elements, only accessing them does
+            chunk = self.dut[5:7]
+            self.assertEqual(len(chunk), 2)
+            build.assert_called_once()
+            self.assertIs(chunk[5], self.dut[5])
+            self.assertEqual(build.call_count, 2)
+
+            self.assertEqual(list(self.dut.addresses()),
+                             [self.calculate_address((index,))
+                              for index in range(self.dimensions[0])])
+            self.assertEqual(build.call_count, 2)
+
+            self.assertEqual([entry.address for entry in self.dut],
+                             [self.calculate_address((index,))
+                              for index in range(self.dimensions[0])])
+            self.assertEqual(build.call_count, self.dimensions[0])
+
+
+class TestLazy2DArray(Test2DArray):
+    """
+    Test for 2D arrays where the elements are built on first access
+    """
+    array_cls = LazyReadOnlyRegisterArrayToTest
+
+    def test_elements_built_on_demand(self) -> None:
+        """
+        Check the elements are iterated in index order, regardless of the order they were first
+        built
+        """
+        _ = self.dut[9, 11]
+        _ = self.dut[0, 0]
+        self.assertEqual([index for index, _ in self.dut.items()],
+                         list(product(*[range(dim) for dim in self.dimensions])))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,89 @@
+"""
+Test for the concurrent read_all and write_all methods of an async section
+"""
+import unittest
+
+# pylint: disable-next=unused-wildcard-import,wildcard-import
+from peakrdl_python.lib import *
+
+from .simple_components import AsyncAddressMapToTest, BusLatencyModel
+
+
+class TestAsyncSectionReadWriteAll(unittest.IsolatedAsyncioTestCase):
+    """
+    Tests for the read_all and write_all methods of an async section
+    """
+
+    async def asyncSetUp(self) -> None:
+        self.memory = {addr: addr + 1 for addr in range(0, 24, 4)}
+        self.bus = BusLatencyModel()
+        self.dut = AsyncAddressMapToTest(callbacks=AsyncCallbackSet(
+            read_callback=self.read, write_callback=self.write))
+
+    async def read(self, addr: int, width: int, accesswidth: int) -> int:
+        """
+        read callback which models a simple address space with some latency
+        """
+        assert width == accesswidth == 32
+        async with self.bus:
+            return self.memory[addr]
+
+    async def write(self, addr: int, width: int, accesswidth: int, data: int) -> None:
+        """
+        write callback which models a simple address space with some latency
+        """
+        assert width == accesswidth == 32
+        async with self.bus:
+            self.memory[addr] = data
+
+    async def test_read_all(self) -> None:
+        """
+        Check all the readable registers are read, with the concurrency limited
+        """
+        for concurrency in [1, 3, 10]:
+            with self.subTest(concurrency=concurrency):
+                self.bus = BusLatencyModel()
+                self.assertEqual(await self.dut.read_all(concurrency=concurrency),
+                                 {'dut_wrapper.reg_rw_a': 0x1,
+                                  'dut_wrapper.reg_rw_b': 0x5,
+                                  'dut_wrapper.reg_ro': 0x9,
+                                  'dut_wrapper.reg_rw_c': 0x11,
+                                  'dut_wrapper.reg_rw_d': 0x15})
+                self.assertEqual(self.bus.peak_in_flight, min(concurrency, 5))
+
+    async def test_write_all(self) -> None:
+        """
+        Check the registers are written, with the concurrency limited
+        """
+        await self.dut.write_all({'dut_wrapper.reg_rw_a': 0xA,
+                                  'dut_wrapper.reg_wo': 0xB,
+                                  'dut_wrapper.reg_rw_d': 0xC}, concurrency=2)
+        self.assertEqual(self.bus.peak_in_flight, 2)
+        self.assertEqual(self.memory, {0x0: 0xA, 0x4: 0x5, 0x8: 0x9, 0xC: 0xB, 0x10: 0x11,
+                                       0x14: 0xC})
+
+        # the result of read_all can be written back, once the read only registers are removed
+        register_values = await self.dut.read_all(concurrency=4)
+        del register_values['dut_wrapper.reg_ro']
+        self.memory[0x0] = 0x0
+        await self.dut.write_all(register_values, concurrency=4)
+        self.assertEqual(self.memory[0x0], 0xA)
+
+    async def test_write_all_bad_data(self) -> None:
+        """
+        Check the data is validated before anything is written
+        """
+        with self.assertRaises(ValueError):
+            # the read only register can not be written
+            await self.dut.write_all({'dut_wrapper.reg_rw_a': 0x0, 'dut_wrapper.reg_ro': 0x0})
+        with self.assertRaises(ValueError):
+            await self.dut.write_all({'dut_wrapper.reg_rw_a': 0x0, 'reg_rw_b': 0x0})
+        with self.assertRaises(TypeError):
+            await self.dut.write_all({'dut_wrapper.reg_rw_a': 0.0})  # type: ignore[dict-item]
+        with self.assertRaises(ValueError):
+            await self.dut.read_all(concurrency=0)
+        self.assertEqual(self.bus.peak_in_flight, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,192 @@
+"""
+Test for batched register access
+"""
+import unittest
+from typing import Optional
+from unittest.mock import Mock
+
+# pylint: disable-next=unused-wildcard-import,wildcard-import
+from peakrdl_python.lib import *
+
+from .simple_components import AddressMapToTest, ArrayAddressMapToTest
+
+
+class TestBatchCallbackSet(unittest.TestCase):
+    """
+    Tests for the batch context manager of the address map
+    """
+
+    def transact(self, ops: list[BatchOperation]) -> list[Optional[int]]:
+        """
+        Transaction callback which models a simple address space
+        """
+        results: list[Optional[int]] = []
+        for operation in ops:
+            if operation.is_read:
+                results.append(self.memory.get(operation.addr, 0))
+            else:
+                self.memory[operation.addr] = operation.data
+                results.append(None)
+        return results
+
+    def setUp(self) -> None:
+        self.memory: dict[int, Optional[int]] = {}
+        self.transact_callback = Mock(side_effect=self.transact)
+        self.callbacks = BatchCallbackSet(transact_callback=self.transact_callback)
+        self.dut = AddressMapToTest(callbacks=self.callbacks)
+
+    def test_writes_issued_in_one_transaction(self) -> None:
+        """
+        Check that writes within the batch are deferred until the end of the batch and then
+        issued in order
+        """
+        with self.dut.batch():
+            self.dut.reg_rw_a.write(0x1)
+            self.dut.reg_rw_b.write(0x2)
+            self.dut.reg_wo.write(0x3)
+            self.transact_callback.assert_not_called()
+            self.assertEqual(self.callbacks.pending_operations, 3)
+
+        self.transact_callback.assert_called_once()
+        ops = self.transact_callback.call_args.kwargs['ops']
+        self.assertEqual([operation.addr for operation in ops], [0x0, 0x4, 0xC])
+        self.assertEqual([operation.data for operation in ops], [0x1, 0x2, 0x3])
+        self.assertEqual(self.memory, {0x0: 0x1, 0x4: 0x2, 0xC: 0x3})
+
+    def test_deferred_reads(self) -> None:
+        """
+        Check that deferred reads return futures which are resolved at the end of the batch
+        """
+        self.memory.update({0x0: 0x1, 0x4: 0x0, 0x8: 0x1})
+        with self.dut.batch():
+            reg_a = self.dut.reg_rw_a.read_deferred()
+            reg_b = self.dut.reg_rw_b.field.read_deferred()
+            reg_ro = self.dut.reg_ro.read_deferred()
+            self.assertFalse(reg_a.done())
+            self.assertFalse(reg_b.done())
+            with self.assertRaises(RuntimeError):
+                _ = reg_a.result()
+
+        self.transact_callback.assert_called_once()
+        self.assertEqual(reg_a.result(), 0x1)
+        self.assertEqual(reg_b.result(), 0x0)
+        self.assertEqual(reg_ro.result(), 0x1)
+
+    def test_read_acts_as_barrier(self) -> None:
+        """
+        A read that needs its value immediately flushes everything queued before it so that
+        the order of operations is preserved
+        """
+        with self.dut.batch():
+            self.dut.reg_rw_a.write(0x1)
+            self.assertEqual(self.dut.reg_rw_a.read(), 0x1)
+            self.transact_callback.assert_called_once()
+            self.dut.reg_rw_b.field.write(1)
+
+        self.assertEqual(self.transact_callback.call_count, 3)
+        self.assertEqual(self.memory[0x4], 0x1)
+
+    def test_exception_discards_operations(self) -> None:
+        """
+        Check that queued operations are discarded if an exception occurs in the batch
+        """
+        with self.assertRaises(ValueError):
+            with self.dut.batch():
+                self.dut.reg_rw_a.write(0x1)
+                raise ValueError('abandon the batch')
+
+        self.transact_callback.assert_not_called()
+        self.assertFalse(self.callbacks.batch_active)
+        self.assertEqual(self.callbacks.pending_operations, 0)
+
+    def test_nested_batch(self) -> None:
+        """
+        Check that a nested batch is only issued when the outer batch closes
+        """
+        with self.dut.batch():
+            self.dut.reg_rw_a.write(0x1)
+            with self.dut.batch():
+                self.dut.reg_rw_b.write(0x1)
+            self.transact_callback.assert_not_called()
+
+        self.transact_callback.assert_called_once()
+        self.assertEqual(len(self.transact_callback.call_args.kwargs['ops']), 2)
+
+    def test_nested_batch_exception(self) -> None:
+        """
+        Check that an exception in a nested batch only discards the operations queued by the
+        nested batch
+        """
+        with self.dut.batch():
+            self.dut.reg_rw_a.write(0x1)
+            with self.assertRaises(ValueError):
+                with self.dut.batch():
+                    self.dut.reg_rw_b.write(0x1)
+                    raise ValueError('abandon the nested batch')
+            self.assertEqual(self.callbacks.pending_operations, 1)
+            self.dut.reg_wo.write(0x3)
+
+        self.transact_callback.assert_called_once()
+        ops = self.transact_callback.call_args.kwargs['ops']
+        self.assertEqual([operation.addr for operation in ops], [0x0, 0xC])
+        self.assertEqual(self.memory, {0x0: 0x1, 0xC: 0x3})
+
+    def test_buffer_callbacks(self) -> None:
+        """
+        Check the buffer callbacks and burst length are used by the memories and that a buffer
+        transfer within a batch issues the queued operations first
+        """
+        read_block_into_callback = Mock()
+        write_block_buffer_callback = Mock()
+        callbacks = BatchCallbackSet(transact_callback=self.transact_callback,
+                                     read_block_into_callback=read_block_into_callback,
+                                     write_block_buffer_callback=write_block_buffer_callback,
+                                     max_burst_length=2)
+        self.assertEqual(callbacks.max_burst_length, 2)
+        dut = ArrayAddressMapToTest(callbacks=callbacks)
+        with dut.batch():
+            dut.reg_array[0, 0].write(0x1)
+            dut.mem.read_into(bytearray(16))
+            self.transact_callback.assert_called_once()
+            dut.reg_array[0, 1].write(0x2)
+            dut.mem.write_buffer(bytes(16))
+            self.assertEqual(self.transact_callback.call_count, 2)
+
+        self.assertEqual([call.kwargs['addr'] for call in read_block_into_callback.call_args_list],
+                         [0x100, 0x108])
+        self.assertEqual([call.kwargs['addr'] for call in
+                          write_block_buffer_callback.call_args_list], [0x100, 0x108])
+        self.assertEqual(self.memory, {0x0: 0x1, 0x4: 0x2})
+
+    def test_access_outside_batch(self) -> None:
+        """
+        Outside a batch each access is a single transaction
+        """
+        self.dut.reg_rw_a.write(0x1)
+        self.assertEqual(self.dut.reg_rw_a.read(), 0x1)
+        future = self.dut.reg_rw_a.read_deferred()
+        self.assertTrue(future.done())
+        self.assertEqual(future.result(), 0x1)
+        self.assertEqual(self.transact_callback.call_count, 3)
+
+    def test_bad_transaction_result(self) -> None:
+        """
+        Check the results returned by the transact callback are checked
+        """
+        self.transact_callback.side_effect = lambda ops: []
+        with self.assertRaises(ValueError):
+            with self.dut.batch():
+                _ = self.dut.reg_rw_a.read_deferred()
+
+    def test_batch_needs_batch_callbacks(self) -> None:
+        """
+        The batch context manager can only be used with the BatchCallbackSet
+        """
+        dut = AddressMapToTest(callbacks=NormalCallbackSet())
+        with self.assertRaises(TypeError):
+            with dut.batch():
+                pass
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,10 +6,14 @@ Test exporting this tests a couple of different things:
 """
 import unittest
 import os
+import importlib
+import inspect
+import random
 import tempfile
 import sys
 import re
 from itertools import chain, permutations, product
+from functools import partial
 from pathlib import Path
 from array import array as Array
 
@@ -23,7 +27,7 @@ from peakrdl_python import PythonExporter
 from peakrdl_python import compiler_with_udp_registers
 from peakrdl_python.__about__ import __version__ as peakrdl_version
 from peakrdl_python.__peakrdl__ import Exporter as PeakRDLPythonExported
-from peakrdl_python.lib.utility_functions import get_array_typecode
+from peakrdl_python.lib.utility_functions import get_array_typecode, swap_msb_lsb_ordering
 
 if sys.version_info[0:2] < (3, 11):
     # Prior to py3.11, tomllib is a 3rd party package
@@ -36,6 +40,8 @@ else:
 test_path = Path(__file__).parent.parent
 test_cases = test_path / 'testcases'
 
+# pylint: disable=too-many-lines
+
 
 class TestExportHidden(unittest.TestCase):
     """
@@ -589,6 +595,182 @@ class TestAlternativeTemplates(unittest.TestCase):
         self.assertEqual('"""' + doc_string + '"""',result)
 
 
+class TestLazyConstruction(unittest.TestCase):
+    """
+    Test class for the export with lazy construction of the register model
+    """
+
+    test_case_path = test_cases
+    test_case_name = 'regfile_and_arrays.rdl'
+    test_case_top_level = 'regfile_and_arrays'
+    test_case_reg_model_cls = test_case_top_level + '_cls'
+
+    @contextmanager
+    def build_python_wrappers_and_make_instance(self, lazy_construction):
+        """
+        Context manager to build the python wrappers for a value of lazy_construction, then
+        import them and clean up afterwards
+        """
+
+        # compile the code for the test
+        rdlc = compiler_with_udp_registers()
+        rdlc.compile_file(os.path.join(self.test_case_path, self.test_case_name))
+        spec = rdlc.elaborate(top_def_name=self.test_case_top_level).top
+
+        exporter = PythonExporter()
+
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            # the temporary package, within which the real package is placed is needed to ensure
+            # that there are two separate entries in the python import cache and this avoids the
+            # test failing for strange reasons
+            if lazy_construction:
+                temp_package_name = 'lazy_construction'
+            else:
+                temp_package_name = 'eager_construction'
+            fq_package_path = os.path.join(tmpdirname, temp_package_name)
+            os.makedirs(fq_package_path)
+            with open(os.path.join(fq_package_path, '__init__.py'), 'w', encoding='utf-8') as fid:
+                fid.write('pass\n')
+
+            exporter.export(node=spec,
+                            path=fq_package_path,
+                            asyncoutput=False,
+                            delete_existing_package_content=False,
+                            skip_library_copy=False,
+                            skip_test_case_generation=True,
+                            legacy_block_access=False,
+                            lazy_construction=lazy_construction)
+
+            # add the temp directory to the python path so that it can be imported from
+            sys.path.append(tmpdirname)
+
+            reg_model_module = __import__(temp_package_name + '.' + self.test_case_top_level +
+                                          '.reg_model.' + self.test_case_top_level,
+                                          globals(), locals(), [self.test_case_reg_model_cls], 0)
+            dut_cls = getattr(reg_model_module, self.test_case_reg_model_cls)
+            peakrdl_python_package = __import__(temp_package_name + '.' +
+                                                self.test_case_top_level + '.lib',
+                globals(), locals(), ['CallbackSet'], 0)
+            callbackset_cls = getattr(peakrdl_python_package, 'NormalCallbackSet')
+
+            # no read/write are attempted so this can yield out a version with no callbacks
+            # configured
+            yield dut_cls(callbacks=callbackset_cls())
+
+            sys.path.remove(tmpdirname)
+
+    @classmethod
+    def walk(cls, section):
+        """
+        produce the name and address of every section, register and field
+        """
+        yield section.full_inst_name, section.address
+        for register in section.get_registers(unroll=True):
+            yield register.full_inst_name, register.address
+            for field in register.fields:
+                yield field.full_inst_name, field.lsb
+        for child_section in section.get_sections(unroll=True):
+            yield from cls.walk(child_section)
+
+    def test_lazy_matches_eager(self):
+        """
+        Check the lazily constructed register model has the same content as the normal one
+        """
+        with self.build_python_wrappers_and_make_instance(lazy_construction=False) as dut:
+            eager_content = list(self.walk(dut))
+
+        with self.build_python_wrappers_and_make_instance(lazy_construction=True) as dut:
+            self.assertIs(dut.layer0_reg_a, dut.layer0_reg_a)
+            self.assertIs(dut.layer0_reg_a[1], dut.layer0_reg_a[1])
+            self.assertIs(dut.layer0_reg_a[1].basicfield_a, dut.layer0_reg_a[1].basicfield_a)
+            lazy_content = list(self.walk(dut))
+
+        self.assertEqual(eager_content, lazy_content)
+        self.assertGreater(len(eager_content), 0)
+
+
+class TestIncrementalAndParallelExport(unittest.TestCase):
+    """
+    Test class for the incremental and parallel export options
+    """
+
+    test_case_path = test_cases
+    test_case_name = 'addr_map.rdl'
+    test_case_top_level = 'addr_map'
+
+    def setUp(self):
+        rdlc = compiler_with_udp_registers()
+        rdlc.compile_file(os.path.join(self.test_case_path, self.test_case_name))
+        self.spec = rdlc.elaborate(top_def_name=self.test_case_top_level).top
+
+    @staticmethod
+    def package_files(path):
+        """
+        content and modification time of all the python files in a generated package
+        """
+        return {file.relative_to(path): (file.read_text(encoding='utf-8'),
+                                         file.stat().st_mtime_ns)
+                for file in Path(path).rglob('*.py')}
+
+    def test_incremental(self):
+        """
+        Check that an incremental export only rewrites the files that have changed and removes
+        the ones that are no longer generated
+        """
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            PythonExporter().export(node=self.spec, path=tmpdirname, incremental=True)
+            package_path = Path(tmpdirname) / self.test_case_top_level
+            self.assertTrue((package_path / '.peakrdl_python_manifest.json').exists())
+            first_export = self.package_files(package_path)
+
+            # a stale python file left in one of the generated packages is removed, edit one of
+            # the generated files so that it has to be rewritten
+            stale_module = package_path / 'reg_model' / 'stale.py'
+            stale_module.write_text('pass\n', encoding='utf-8')
+            edited_module = package_path / 'example.py'
+            edited_module.write_text('pass\n', encoding='utf-8')
+
+            PythonExporter().export(node=self.spec, path=tmpdirname, incremental=True)
+            second_export = self.package_files(package_path)
+
+            self.assertFalse(stale_module.exists())
+            self.assertEqual(first_export.keys(), second_export.keys())
+            for file, (content, mtime) in second_export.items():
+                self.assertEqual(content, first_export[file][0])
+                if file == edited_module.relative_to(package_path):
+                    continue
+                self.assertEqual(mtime, first_export[file][1], msg=f'{file} was rewritten')
+
+    def test_parallel_matches_sequential(self):
+        """
+        Check rendering the tests in worker processes generates the same package
+        """
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            sequential_path = os.path.join(tmpdirname, 'sequential')
+            parallel_path = os.path.join(tmpdirname, 'parallel')
+            PythonExporter().export(node=self.spec, path=sequential_path)
+            PythonExporter().export(node=self.spec, path=parallel_path, processes=3)
+
+            sequential_export = self.package_files(sequential_path)
+            parallel_export = self.package_files(parallel_path)
+
+        self.assertEqual(sequential_export.keys(), parallel_export.keys())
+        self.assertGreater(len([file for file in sequential_export
+                                if file.name.startswith('test_sim_')]), 1)
+        for file, (content, _) in sequential_export.items():
+            self.assertEqual(content, parallel_export[file][0])
+
+    def test_bad_processes(self):
+        """
+        Check the processes argument is validated
+        """
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            with self.assertRaises(TypeError):
+                PythonExporter().export(node=self.spec, path=tmpdirname, processes=2.0)
+            with self.assertRaises(ValueError):
+                PythonExporter().export(node=self.spec, path=tmpdirname, processes=0)
+
+
 class TestCallbackAndLegacyTemplates(unittest.TestCase):
     """
     Test class for the export of hidden and force not hidden (show hidden)
@@ -723,6 +905,174 @@ class TestCallbackAndLegacyTemplates(unittest.TestCase):
                     dut.simple_memory_a.write(0, [0, 0, 0, 0])
 
 
+class TestFastAPI(unittest.TestCase):
+    """
+    Test class for the export of the fast API module
+    """
+
+    test_case_path = test_cases
+
+    @contextmanager
+    def build_python_wrappers(self, test_case_name, test_case_top_level):
+        """
+        Context manager to build the python wrappers with the fast API, then import the register
+        model class, the fast API module and the callback set class
+        """
+
+        # compile the code for the test
+        rdlc = compiler_with_udp_registers()
+        rdlc.compile_file(os.path.join(self.test_case_path, test_case_name))
+        spec = rdlc.elaborate(top_def_name=test_case_top_level).top
+
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            temp_package_name = 'fast_api'
+            fq_package_path = os.path.join(tmpdirname, temp_package_name)
+            os.makedirs(fq_package_path)
+            with open(os.path.join(fq_package_path, '__init__.py'), 'w', encoding='utf-8') as fid:
+                fid.write('pass\n')
+
+            PythonExporter().export(node=spec, path=fq_package_path,
+                                    skip_test_case_generation=True, fast_api=True)
+
+            sys.path.append(tmpdirname)
+            package_name = temp_package_name + '.' + test_case_top_level
+            reg_model_module = importlib.import_module(package_name + '.reg_model.' +
+                                                       test_case_top_level)
+            fast_module = importlib.import_module(package_name + '.reg_model.' +
+                                                  test_case_top_level + '_fast')
+            lib_module = importlib.import_module(package_name + '.lib')
+
+            yield (getattr(reg_model_module, test_case_top_level + '_cls'), fast_module,
+                   getattr(lib_module, 'NormalCallbackSet'))
+
+            sys.path.remove(tmpdirname)
+            for module_name in list(sys.modules):
+                if module_name.startswith(temp_package_name):
+                    del sys.modules[module_name]
+
+    @classmethod
+    def walk(cls, section):
+        """
+        produce every register of the section and the sections within it
+        """
+        yield from section.get_registers(unroll=True)
+        for child_section in section.get_sections(unroll=True):
+            yield from cls.walk(child_section)
+
+    @staticmethod
+    def field_value(field, reg_value):
+        """
+        value of a field in a register value, decoded with the properties of the field in the
+        register model (this avoids converting enumerated fields to their enumeration)
+        """
+        value = (reg_value & field.bitmask) >> field.low
+        if field.msb0:
+            return swap_msb_lsb_ordering(width=field.width, value=value)
+        return value
+
+    def test_matches_reg_model(self):
+        """
+        Check the fast API functions read and write the registers and fields at the addresses
+        and bit positions of the register model
+        """
+        # pylint: disable=too-many-locals
+        memory = {}
+
+        def read(addr, width, accesswidth):
+            self.assertEqual(width, accesswidth)
+            return memory.get(addr, 0)
+
+        # pylint: disable-next=unused-argument
+        def write(addr, width, accesswidth, data):
+            memory[addr] = data
+
+        rng = random.Random(0)
+        for test_case_name, test_case_top_level in [('regfile_and_arrays.rdl',
+                                                     'regfile_and_arrays'),
+                                                    ('msb0_and_lsb0.rdl', 'msb0_and_lsb0')]:
+            with self.build_python_wrappers(test_case_name, test_case_top_level) as \
+                    (dut_cls, fast_module, callbackset_cls):
+                # the register model is only used for the addresses and field positions
+                dut = dut_cls(callbacks=callbackset_cls())
+                for register in self.walk(dut):
+                    # the names of the test cases are python safe, so only the array indices
+                    # need converting
+                    name = re.sub(r'\[(\d+)\]', r'_\1',
+                                  register.full_inst_name[len(dut.full_inst_name) + 1:])
+                    name = name.replace('.', '_')
+                    with self.subTest(register=register.full_inst_name):
+                        memory[register.address] = rng.getrandbits(register.width)
+                        self.assertEqual(getattr(fast_module, 'read_' + name)(read),
+                                         memory[register.address])
+                        for field in register.fields:
+                            self.assertEqual(
+                                getattr(fast_module, f'read_{name}_{field.inst_name}')(read),
+                                self.field_value(field, memory[register.address]))
+                            write_field = getattr(fast_module,
+                                                  f'write_{name}_{field.inst_name}', None)
+                            if write_field is None:
+                                continue
+                            if 'read_callback' in inspect.signature(write_field).parameters:
+                                write_field = partial(write_field, read_callback=read)
+                            value = rng.getrandbits(field.width)
+                            reg_value = memory[register.address]
+                            write_field(write_callback=write, value=value)
+                            self.assertEqual(self.field_value(field, memory[register.address]),
+                                             value)
+                            self.assertEqual(memory[register.address] & field.inverse_bitmask,
+                                             reg_value & field.inverse_bitmask)
+                            # values outside the range of the field are rejected and
+                            # nothing is written
+                            reg_value = memory[register.address]
+                            for bad_value in [-1, 1 << field.width]:
+                                with self.assertRaises(ValueError):
+                                    write_field(write_callback=write, value=bad_value)
+                            self.assertEqual(memory[register.address], reg_value)
+
+    def test_msb0_field_write(self):
+        """
+        Check a write to an msb0 field reverses the bits of the value and only changes the bits
+        of the field
+        """
+        memory = {0x8: 0x12345678}
+
+        def read(addr, width, accesswidth):
+            self.assertEqual(width, accesswidth)
+            return memory[addr]
+
+        # pylint: disable-next=unused-argument
+        def write(addr, width, accesswidth, data):
+            memory[addr] = data
+
+        with self.build_python_wrappers('msb0_and_lsb0.rdl', 'msb0_and_lsb0') as \
+                (_, fast_module, _):
+            fast_module.write_msb0_addrmap_reg_c_field_b(read_callback=read, write_callback=write,
+                                                         value=0x1)
+            self.assertEqual(memory[0x8], 0x12348678)
+            self.assertEqual(fast_module.read_msb0_addrmap_reg_c_field_b(read), 0x1)
+            with self.assertRaises(ValueError):
+                fast_module.write_msb0_addrmap_reg_c_field_b(read_callback=read,
+                                                             write_callback=write, value=0x10)
+            self.assertEqual(memory[0x8], 0x12348678)
+
+    def test_name_clash(self):
+        """
+        Check names which would give the same function name are rejected
+        """
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            rdl_file = os.path.join(tmpdirname, 'clash.rdl')
+            with open(rdl_file, 'w', encoding='utf-8') as fid:
+                fid.write('addrmap clash { reg { field {} c; } a_b; reg { field {} b_c; } a; };')
+            rdlc = compiler_with_udp_registers()
+            rdlc.compile_file(rdl_file)
+            spec = rdlc.elaborate(top_def_name='clash').top
+            PythonExporter().export(node=spec, path=os.path.join(tmpdirname, 'no_fast'),
+                                    skip_test_case_generation=True)
+            with self.assertRaises(RuntimeError):
+                PythonExporter().export(node=spec, path=os.path.join(tmpdirname, 'fast'),
+                                        skip_test_case_generation=True, fast_api=True)
+
+
 if __name__ == '__main__':
 
     unittest.main()
@@ -0,0 +1,87 @@
+"""
+Test for the precomputed field encode and decode
+"""
+import unittest
+
+# pylint: disable-next=unused-wildcard-import,wildcard-import
+from peakrdl_python.lib import *
+from peakrdl_python.lib.utility_functions import swap_msb_lsb_ordering
+
+from .simple_components import AddressMapToTest
+
+
+def reference_swap(width: int, value: int) -> int:
+    """
+    bit by bit reversal of a value, used as the reference for the optimised version
+    """
+    return_value = 0
+    for bit_position in range(width):
+        if value & (1 << bit_position):
+            return_value |= 1 << (width - bit_position - 1)
+    return return_value
+
+
+class TestFieldCodec(unittest.TestCase):
+    """
+    Tests for the encode and decode of the field values
+    """
+
+    def test_swap_msb_lsb_ordering(self) -> None:
+        """
+        check the bit reversal against the bit by bit reference
+        """
+        for width in range(1, 70):
+            for value in [0, 1, (1 << width) - 1, 0x5A5A_A5A5_1234_5678_9ABC & ((1 << width) - 1),
+                          1 << (width - 1)]:
+                with self.subTest(width=width, value=value):
+                    self.assertEqual(swap_msb_lsb_ordering(width=width, value=value),
+                                     reference_swap(width=width, value=value))
+
+    def test_size_props_codec(self) -> None:
+        """
+        check the precomputed encode and decode for lsb0 and msb0 fields, including fields
+        wider than the reversal lookup table
+        """
+        for width, low in [(1, 0), (3, 4), (8, 8), (9, 3), (16, 16)]:
+            high = low + width - 1
+            for msb0 in [False, True]:
+                if msb0:
+                    size_props = FieldSizeProps(width=width, msb=low, lsb=high, high=high, low=low)
+                else:
+                    size_props = FieldSizeProps(width=width, msb=high, lsb=low, high=high, low=low)
+                self.assertEqual(size_props.bitmask, ((1 << width) - 1) << low)
+                self.assertEqual(size_props.max_value, (1 << width) - 1)
+                self.assertEqual(size_props.msb0, msb0 and width > 1)
+                for value in range(0, 1 << width, max(1, (1 << width) // 64)):
+                    with self.subTest(width=width, low=low, msb0=msb0, value=value):
+                        expected = reference_swap(width=width, value=value) if msb0 else value
+                        self.assertEqual(size_props.encode(value), expected << low)
+                        self.assertEqual(size_props.decode(expected << low), value)
+                        self.assertEqual(size_props.decode((expected << low) |
+                                                           ~size_props.bitmask & 0xFFFF_FFFF),
+                                         value)
+
+    def test_unchecked_decode_and_encode(self) -> None:
+        """
+        check that the checks are only skipped when asked for
+        """
+        dut = AddressMapToTest(callbacks=NormalCallbackSet(
+            read_callback=lambda addr, width, accesswidth: 0,
+            write_callback=lambda addr, width, accesswidth, data: None))
+        field = dut.reg_rw_a.field
+
+        self.assertEqual(field.decode_read_value(0x1), 1)
+        self.assertEqual(field.decode_read_value(0x1, checked=False), 1)
+        with self.assertRaises(ValueError):
+            field.decode_read_value(1 << 32)
+        # without the checks the value is simply masked
+        self.assertEqual(field.decode_read_value((1 << 32) | 1, checked=False), 1)
+
+        self.assertEqual(field.encode_write_value(0x1), 1)
+        with self.assertRaises(ValueError):
+            field.encode_write_value(2)
+        self.assertEqual(field.encode_write_value(1, checked=False), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
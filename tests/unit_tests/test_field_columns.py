@@ -0,0 +1,225 @@
+"""
+Test for reading and writing the fields of register arrays and memories as columns
+"""
+import unittest
+from importlib.util import find_spec
+from random import Random
+from unittest.mock import Mock
+
+# pylint: disable-next=unused-wildcard-import,wildcard-import
+from peakrdl_python.lib import *
+
+from .simple_components import ArrayAddressMapToTest
+
+NUMPY_AVAILABLE = find_spec('numpy') is not None
+
+
+class TestFieldColumns(unittest.TestCase):
+    """
+    Tests for the field column reads and writes
+    """
+
+    # pylint: disable=duplicate-code
+    def read(self, addr: int, width: int, accesswidth: int) -> int:
+        """
+        read callback which models a simple address space
+        """
+        assert width == accesswidth == 32
+        return self.memory.get(addr, 0)
+
+    def read_block(self, addr: int, width: int, accesswidth: int, length: int) -> list[int]:
+        """
+        block read callback which models a simple address space
+        """
+        return [self.read(addr=addr + (entry * 4), width=width, accesswidth=accesswidth)
+                for entry in range(length)]
+
+    def write(self, addr: int, width: int, accesswidth: int, data: int) -> None:
+        """
+        write callback which models a simple address space
+        """
+        assert width == accesswidth == 32
+        self.memory[addr] = data
+
+    def write_block(self, addr: int, width: int, accesswidth: int, data: list[int]) -> None:
+        """
+        block write callback which models a simple address space
+        """
+        for entry, entry_data in enumerate(data):
+            self.write(addr=addr + (entry * 4), width=width, accesswidth=accesswidth,
+                       data=entry_data)
+    # pylint: enable=duplicate-code
+
+    def setUp(self) -> None:
+        random = Random(0)
+        self.memory: dict[int, int] = {address: random.getrandbits(32)
+                                       for address in range(0, 0x200, 4)}
+        self.read_block_callback = Mock(side_effect=self.read_block)
+        self.write_block_callback = Mock(side_effect=self.write_block)
+
+    def make_dut(self, stride: int = 4) -> ArrayAddressMapToTest:
+        """
+        make an address map to test, with both single and block read callbacks
+        """
+        return ArrayAddressMapToTest(callbacks=NormalCallbackSet(
+            read_callback=self.read, read_block_callback=self.read_block_callback,
+            write_callback=self.write, write_block_callback=self.write_block_callback),
+            stride=stride)
+
+    @staticmethod
+    def expected_columns(registers) -> dict[str, list[int]]:
+        """
+        field values read one register at a time
+        """
+        registers = list(registers)
+        return {name: [getattr(register, name).read() for register in registers]
+                for name in ['field_lsb0', 'field_msb0', 'field_wide']}
+
+    def test_register_array(self) -> None:
+        """
+        Check the columns match the field values read one at a time, for a complete array,
+        a slice and an array with gaps between the registers
+        """
+        for stride in [4, 8]:
+            dut = self.make_dut(stride=stride)
+            for array in [dut.reg_array, dut.reg_array[1:3, ::2]]:
+                with self.subTest(stride=stride, elements=len(array)):
+                    self.read_block_callback.reset_mock()
+                    columns = array.read_field_columns()
+                    self.read_block_callback.assert_called_once()
+                    self.assertEqual(columns, self.expected_columns(array))
+
+    def test_memory(self) -> None:
+        """
+        Check the memory entries are decoded using the register template
+        """
+        dut = self.make_dut()
+        template = dut.reg_array[0, 0]
+        entries = [dut.mem.address + (entry * 4) for entry in range(dut.mem.entries)]
+        expected = {field.inst_name: [field.decode_read_value(self.memory[address])
+                                      for address in entries]
+                    for field in template.fields}
+
+        self.assertEqual(dut.mem.read_field_columns(template), expected)
+        self.assertEqual(dut.mem.read_field_columns(template, start_entry=4, number_entries=2),
+                         {name: column[4:6] for name, column in expected.items()})
+        self.assertEqual(dut.mem.read_field_columns(template, start_entry=14),
+                         {name: column[14:] for name, column in expected.items()})
+
+        with self.assertRaises(TypeError):
+            dut.mem.read_field_columns(dut.mem)
+        with self.assertRaises(ValueError):
+            dut.mem.read_field_columns(template, start_entry=16)
+
+    def test_register_array_write(self) -> None:
+        """
+        Check the columns are written to every element with a single block write, leaving the
+        fields which are not included unchanged
+        """
+        random = Random(1)
+        for stride in [4, 8]:
+            dut = self.make_dut(stride=stride)
+            for array in [dut.reg_array, dut.reg_array[1:3, ::2]]:
+                with self.subTest(stride=stride, elements=len(array)):
+                    before = self.expected_columns(array)
+                    new_msb0 = [random.getrandbits(4) for _ in range(len(array))]
+                    new_wide = [random.getrandbits(20) for _ in range(len(array))]
+                    self.write_block_callback.reset_mock()
+                    array.write_field_columns(field_msb0=new_msb0, field_wide=new_wide)
+                    self.write_block_callback.assert_called_once()
+                    self.assertEqual(self.expected_columns(array),
+                                     {'field_lsb0': before['field_lsb0'],
+                                      'field_msb0': new_msb0,
+                                      'field_wide': new_wide})
+
+        # when all the fields are written there is no need to read first
+        dut = self.make_dut()
+        self.read_block_callback.reset_mock()
+        dut.reg_array.write_field_columns(field_lsb0=[0xFF] * 16, field_msb0=[0x1] * 16,
+                                          field_wide=[0x1] * 16)
+        self.read_block_callback.assert_not_called()
+        self.assertEqual(self.memory[0x0], 0x800008FF)
+
+    def test_write_checks(self) -> None:
+        """
+        Check the columns are checked before anything is written
+        """
+        dut = self.make_dut()
+        for columns, error in [({}, ValueError),
+                               ({'not_a_field': [0] * 16}, ValueError),
+                               ({'field_msb0': [0] * 15}, ValueError),
+                               ({'field_msb0': [0] * 15 + [16]}, ValueError),
+                               ({'field_msb0': [0] * 15 + [-1]}, ValueError),
+                               ({'field_msb0': [0] * 15 + [0.5]}, TypeError)]:
+            with self.subTest(columns=columns):
+                with self.assertRaises(error):
+                    dut.reg_array.write_field_columns(**columns)
+        self.write_block_callback.assert_not_called()
+
+    def test_memory_write(self) -> None:
+        """
+        Check the memory entries are encoded using the register template
+        """
+        dut = self.make_dut()
+        template = dut.reg_array[0, 0]
+        before = dut.mem.read_field_columns(template)
+        dut.mem.write_field_columns(template, start_entry=2, field_lsb0=[1, 2, 3],
+                                    field_wide=[0x1, 0x2, 0x3])
+        after = dut.mem.read_field_columns(template)
+        self.assertEqual(after['field_msb0'], before['field_msb0'])
+        self.assertEqual(after['field_lsb0'], before['field_lsb0'][:2] + [1, 2, 3] +
+                         before['field_lsb0'][5:])
+        self.assertEqual(after['field_wide'], before['field_wide'][:2] + [1, 2, 3] +
+                         before['field_wide'][5:])
+        self.assertEqual(self.memory[dut.mem.address + 8] >> 12, 0x80000)
+
+        with self.assertRaises(TypeError):
+            dut.mem.write_field_columns(dut.mem, field_lsb0=[1])
+        with self.assertRaises(ValueError):
+            dut.mem.write_field_columns(template, start_entry=15, field_lsb0=[1, 2])
+
+    @unittest.skipUnless(NUMPY_AVAILABLE, 'numpy is not installed')
+    def test_numpy_write(self) -> None:
+        """
+        Check numpy columns are written in the same way as lists, including a mix of the two
+        """
+        # pylint: disable-next=import-outside-toplevel
+        import numpy
+
+        dut = self.make_dut()
+        random = Random(2)
+        new_lsb0 = [random.getrandbits(8) for _ in range(16)]
+        new_msb0 = [random.getrandbits(4) for _ in range(16)]
+        new_wide = [random.getrandbits(20) for _ in range(16)]
+        dut.reg_array.write_field_columns(field_lsb0=numpy.array(new_lsb0, dtype=numpy.uint8),
+                                          field_msb0=numpy.array(new_msb0, dtype=numpy.int64),
+                                          field_wide=new_wide)
+        self.assertEqual(self.expected_columns(dut.reg_array),
+                         {'field_lsb0': new_lsb0, 'field_msb0': new_msb0,
+                          'field_wide': new_wide})
+
+        with self.assertRaises(ValueError):
+            dut.reg_array.write_field_columns(field_msb0=numpy.full(16, 16, dtype=numpy.uint8))
+        with self.assertRaises(TypeError):
+            dut.reg_array.write_field_columns(field_msb0=numpy.zeros(16, dtype=numpy.float64))
+
+    @unittest.skipUnless(NUMPY_AVAILABLE, 'numpy is not installed')
+    def test_numpy_columns(self) -> None:
+        """
+        Check the numpy columns match the list columns
+        """
+        dut = self.make_dut()
+        template = dut.reg_array[0, 0]
+        for columns, numpy_columns in [
+                (dut.reg_array.read_field_columns(), dut.reg_array.read_field_columns_numpy()),
+                (dut.mem.read_field_columns(template),
+                 dut.mem.read_field_columns_numpy(template))]:
+            self.assertEqual(columns.keys(), numpy_columns.keys())
+            for name, column in columns.items():
+                self.assertEqual(numpy_columns[name].tolist(), column)
+            self.assertEqual(numpy_columns['field_msb0'].dtype.itemsize, 1)
+            self.assertEqual(numpy_columns['field_wide'].dtype.itemsize, 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
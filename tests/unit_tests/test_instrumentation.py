@@ -0,0 +1,202 @@
+"""
+Test for the instrumentation of the callbacks
+"""
+import os
+import sys
+import json
+import asyncio
+import unittest
+import tempfile
+from array import array as Array
+
+# pylint: disable-next=unused-wildcard-import,wildcard-import
+from peakrdl_python.lib import *
+
+from .simple_components import AddressMapToTest, AsyncAddressMapToTest
+from .simple_components import MemoryAddressMapToTest
+
+
+class TestCallbackInstrumentation(unittest.TestCase):
+    """
+    Tests for the instrumentation of the synchronous callbacks
+    """
+
+    def read(self, addr: int, width: int, accesswidth: int) -> int:
+        """
+        read callback which models a simple address space
+        """
+        assert width == accesswidth == 32
+        return self.memory.get(addr, 0)
+
+    def write(self, addr: int, width: int, accesswidth: int, data: int) -> None:
+        """
+        write callback which models a simple address space
+        """
+        assert width == accesswidth == 32
+        self.memory[addr] = data
+
+    def setUp(self) -> None:
+        self.memory: dict[int, int] = {}
+        self.instrumentation = CallbackInstrumentation(NormalCallbackSet(
+            read_callback=self.read, write_callback=self.write))
+        self.dut = AddressMapToTest(callbacks=self.instrumentation.callbacks)
+
+    def test_counts(self) -> None:
+        """
+        Check the operations are counted against their address and the data passes through
+        """
+        self.assertIsInstance(self.instrumentation.callbacks, NormalCallbackSet)
+        self.assertIsNone(self.instrumentation.callbacks.read_block_callback)
+
+        self.dut.reg_rw_b.write(0x1234)
+        self.assertEqual(self.dut.reg_rw_b.read(), 0x1234)
+        self.dut.reg_rw_b.read()
+        self.dut.reg_wo.write(0x1)
+
+        statistics = self.instrumentation.statistics
+        self.assertEqual(set(statistics), {(AccessOperation.WRITE, 0x4),
+                                           (AccessOperation.READ, 0x4),
+                                           (AccessOperation.WRITE, 0xC)})
+        read_statistics = statistics[(AccessOperation.READ, 0x4)]
+        self.assertEqual(read_statistics.count, 2)
+        self.assertEqual(read_statistics.bytes, 8)
+        self.assertEqual(sum(read_statistics.histogram), 2)
+        self.assertEqual(len(read_statistics.histogram), len(LATENCY_BUCKETS) + 1)
+        self.assertGreaterEqual(read_statistics.total_seconds, 0.0)
+
+        self.instrumentation.reset()
+        self.assertEqual(self.instrumentation.statistics, {})
+
+    def test_disabled(self) -> None:
+        """
+        When disabled the callbacks are still made but nothing is recorded
+        """
+        self.instrumentation.enabled = False
+        self.dut.reg_rw_a.write(0x5)
+        self.assertEqual(self.dut.reg_rw_a.read(), 0x5)
+        self.assertEqual(self.instrumentation.statistics, {})
+
+        self.instrumentation.enabled = True
+        self.dut.reg_rw_a.read()
+        self.assertEqual(self.instrumentation.statistics[(AccessOperation.READ, 0x0)].count, 1)
+
+        with self.assertRaises(TypeError):
+            self.instrumentation.enabled = 1  # type: ignore[assignment]
+
+    def test_unsupported(self) -> None:
+        """
+        Check the batch callback set and badly ordered buckets are rejected
+        """
+        with self.assertRaises(TypeError):
+            CallbackInstrumentation(BatchCallbackSet(
+                transact_callback=lambda operations: None))  # type: ignore[arg-type]
+        with self.assertRaises(ValueError):
+            CallbackInstrumentation(NormalCallbackSet(read_callback=self.read),
+                                    latency_buckets=[1.0, 1E-3])
+
+    def test_block(self) -> None:
+        """
+        Check the block operations of a memory, both the buffer and legacy array callbacks
+        """
+        # pylint: disable-next=unused-argument
+        def read_block_into(addr: int, width: int, accesswidth: int, length: int,
+                            buffer: memoryview) -> None:
+            for entry in range(length):
+                buffer[entry * 4:(entry + 1) * 4] = entry.to_bytes(width >> 3, sys.byteorder)
+
+        instrumentation = CallbackInstrumentation(NormalCallbackSet(
+            read_callback=self.read, read_block_into_callback=read_block_into))
+        dut = MemoryAddressMapToTest(callbacks=instrumentation.callbacks)
+        buffer = Array('I', [0] * 4)
+        dut.mem.read_into(buffer, start_entry=2)
+        self.assertEqual(list(buffer), [0, 1, 2, 3])
+        # the block is split over the address of each entry it covers
+        statistics = instrumentation.statistics
+        self.assertEqual(set(statistics), {(AccessOperation.READ_BLOCK, address)
+                                           for address in [0x8, 0xC, 0x10, 0x14]})
+        for read_statistics in statistics.values():
+            self.assertEqual(read_statistics.count, 1)
+            self.assertEqual(read_statistics.bytes, 4)
+
+        written: list[int] = []
+        legacy_instrumentation = CallbackInstrumentation(NormalCallbackSetLegacy(
+            write_block_callback=lambda addr, width, accesswidth, data: written.extend(data)))
+        legacy_dut = MemoryAddressMapToTest(callbacks=legacy_instrumentation.callbacks)
+        self.assertIsInstance(legacy_instrumentation.callbacks, NormalCallbackSetLegacy)
+        legacy_dut.mem.write(start_entry=0,
+                             data=Array('L', [1, 2, 3]))  # type: ignore[arg-type]
+        self.assertEqual(written, [1, 2, 3])
+        self.assertEqual({address: entry.bytes for (_, address), entry in
+                          legacy_instrumentation.statistics.items()},
+                         {0x0: 4, 0x4: 4, 0x8: 4})
+
+    def test_export(self) -> None:
+        """
+        Check the JSON and prometheus exports, with the addresses resolved to the registers
+        """
+        self.dut.reg_rw_a.write(0x1)
+        self.dut.reg_rw_a.read()
+
+        exported = json.loads(self.instrumentation.to_json(address_map=self.dut))
+        self.assertEqual(exported['latency_buckets'], list(LATENCY_BUCKETS))
+        self.assertEqual([(access['operation'], access['address'], access['node'],
+                           access['count'], access['bytes'])
+                          for access in exported['accesses']],
+                         [('read', 0x0, 'dut_wrapper.reg_rw_a', 1, 4),
+                          ('write', 0x0, 'dut_wrapper.reg_rw_a', 1, 4)])
+        self.assertIsNone(self.instrumentation.to_dict()['accesses'][0]['node'])
+
+        metrics = self.instrumentation.to_prometheus(address_map=self.dut, prefix='dut')
+        labels = 'operation="read",address="0x0",node="dut_wrapper.reg_rw_a"'
+        self.assertIn(f'dut_accesses_total{{{labels}}} 1\n', metrics)
+        self.assertIn(f'dut_bytes_total{{{labels}}} 4\n', metrics)
+        self.assertIn(f'dut_latency_seconds_bucket{{{labels},le="+Inf"}} 1\n', metrics)
+        self.assertIn(f'dut_latency_seconds_count{{{labels}}} 1\n', metrics)
+        self.assertIn('# TYPE dut_latency_seconds histogram\n', metrics)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'dut.prom')
+            self.instrumentation.write_prometheus(path, address_map=self.dut, prefix='dut')
+            with open(path, encoding='utf-8') as fid:
+                self.assertEqual(fid.read(), metrics)
+            self.assertEqual(os.listdir(temp_dir), ['dut.prom'])
+
+
+class TestAsyncCallbackInstrumentation(unittest.IsolatedAsyncioTestCase):
+    """
+    Tests for the instrumentation of the asynchronous callbacks
+    """
+
+    async def test_counts(self) -> None:
+        """
+        Check the operations are counted and the settings of the callback set are kept
+        """
+        memory: dict[int, int] = {}
+
+        # pylint: disable-next=unused-argument
+        async def read(addr: int, width: int, accesswidth: int) -> int:
+            await asyncio.sleep(0)
+            return memory.get(addr, 0)
+
+        # pylint: disable-next=unused-argument
+        async def write(addr: int, width: int, accesswidth: int, data: int) -> None:
+            await asyncio.sleep(0)
+            memory[addr] = data
+
+        instrumentation = CallbackInstrumentation(AsyncCallbackSet(
+            read_callback=read, write_callback=write, max_bursts_in_flight=2))
+        self.assertIsInstance(instrumentation.callbacks, AsyncCallbackSet)
+        self.assertEqual(instrumentation.callbacks.max_bursts_in_flight, 2)
+
+        dut = AsyncAddressMapToTest(callbacks=instrumentation.callbacks)
+        await dut.write_all({'dut_wrapper.reg_rw_c': 0x12})
+        self.assertEqual((await dut.read_all())['dut_wrapper.reg_rw_c'], 0x12)
+
+        statistics = instrumentation.statistics
+        self.assertEqual(statistics[(AccessOperation.WRITE, 0x10)].count, 1)
+        self.assertEqual(statistics[(AccessOperation.READ, 0x10)].count, 1)
+        self.assertEqual(statistics[(AccessOperation.READ, 0x10)].bytes, 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+"""
+Test for the logging of the register model nodes
+"""
+import logging
+import unittest
+from unittest.mock import patch
+
+# pylint: disable-next=unused-wildcard-import,wildcard-import
+from peakrdl_python.lib import *
+
+from .simple_components import AddressMapToTest
+
+
+class TestLogging(unittest.TestCase):
+    """
+    Tests for the loggers used by the nodes
+    """
+
+    @staticmethod
+    def make_dut() -> AddressMapToTest:
+        """
+        make an address map to test
+        """
+        return AddressMapToTest(callbacks=NormalCallbackSet(
+            read_callback=lambda addr, width, accesswidth: 0,
+            write_callback=lambda addr, width, accesswidth, data: None))
+
+    def test_loggers_created_on_first_use(self) -> None:
+        """
+        Check building the register model does not look up any loggers
+        """
+        with patch('logging.getLogger', wraps=logging.getLogger) as get_logger:
+            dut = self.make_dut()
+        get_logger.assert_not_called()
+
+        with self.assertLogs('dut_wrapper.reg_wo', level=logging.INFO) as logs:
+            with patch('logging.getLogger', wraps=logging.getLogger) as get_logger:
+                dut.reg_wo.write(1)
+                dut.reg_wo.write(0)
+        get_logger.assert_called_once_with('dut_wrapper.reg_wo')
+        self.assertEqual(len(logs.records), 2)
+
+    def test_shared_logger(self) -> None:
+        """
+        Check all the nodes of a section can use a single logger
+        """
+        shared_logger = logging.getLogger('shared_test_logger')
+        dut = self.make_dut()
+        dut.share_logger(shared_logger)
+        with self.assertLogs('shared_test_logger', level=logging.INFO) as logs:
+            with patch('logging.getLogger', wraps=logging.getLogger) as get_logger:
+                dut.reg_wo.write(1)
+                dut.reg_rw_a.write(0)
+        get_logger.assert_not_called()
+        self.assertEqual(len(logs.records), 2)
+
+        # if no logger is given the logger of the section itself is shared
+        dut = self.make_dut()
+        dut.share_logger()
+        with self.assertLogs('dut_wrapper', level=logging.INFO) as logs:
+            dut.reg_wo.write(1)
+        self.assertEqual(logs.records[0].name, 'dut_wrapper')
+
+        with self.assertRaises(TypeError):
+            dut.share_logger('dut_wrapper')  # type: ignore[arg-type]
+
+    def test_disabled_logging(self) -> None:
+        """
+        Check nothing is logged from a write when the level is not enabled
+        """
+        quiet_logger = logging.Logger('quiet_test_logger', level=logging.WARNING)
+        dut = self.make_dut()
+        dut.share_logger(quiet_logger)
+        with patch.object(quiet_logger, 'info') as info:
+            dut.reg_wo.write(1)
+        info.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+"""
+Test for the buffer based memory block access
+"""
+import sys
+import unittest
+from array import array as Array
+from unittest.mock import Mock
+
+# pylint: disable-next=unused-wildcard-import,wildcard-import
+from peakrdl_python.lib import *
+
+from .simple_components import MemoryAddressMapToTest
+
+
+class TestMemoryBuffer(unittest.TestCase):
+    """
+    Tests for the read_into, read_buffer and write_buffer methods of a memory
+    """
+
+    def setUp(self) -> None:
+        self.memory = {addr: addr * 0x01010101 for addr in range(0, 64, 4)}
+
+    def read(self, addr: int, width: int, accesswidth: int) -> int:
+        """
+        read callback which models a simple address space
+        """
+        assert width == accesswidth == 32
+        return self.memory[addr]
+
+    def write(self, addr: int, width: int, accesswidth: int, data: int) -> None:
+        """
+        write callback which models a simple address space
+        """
+        assert width == accesswidth == 32
+        self.memory[addr] = data
+
+    def read_block_into(self, addr: int, width: int, accesswidth: int, length: int,
+                        buffer: memoryview) -> None:
+        """
+        read block into callback which models a simple address space
+        """
+        assert width == accesswidth == 32
+        for entry in range(length):
+            buffer[entry * 4:(entry + 1) * 4] = \
+                self.memory[addr + (entry * 4)].to_bytes(4, sys.byteorder)
+
+    def write_block_buffer(self, addr: int, width: int, accesswidth: int, length: int,
+                           buffer: memoryview) -> None:
+        """
+        write block buffer callback which models a simple address space
+        """
+        assert width == accesswidth == 32
+        assert buffer.readonly
+        for entry in range(length):
+            self.memory[addr + (entry * 4)] = \
+                int.from_bytes(buffer[entry * 4:(entry + 1) * 4], sys.byteorder)
+
+    def test_buffer_callbacks(self) -> None:
+        """
+        Check the buffer callbacks are used if they are available
+        """
+        read_block_into = Mock(side_effect=self.read_block_into)
+        write_block_buffer = Mock(side_effect=self.write_block_buffer)
+        dut = MemoryAddressMapToTest(callbacks=NormalCallbackSet(
+            read_block_into_callback=read_block_into,
+            write_block_buffer_callback=write_block_buffer))
+
+        buffer = Array('I', [0] * 4)
+        self.assertEqual(dut.mem.read_into(buffer, start_entry=2), 4)
+        self.assertEqual(buffer.tolist(), [self.memory[addr] for addr in range(8, 24, 4)])
+        read_block_into.assert_called_once()
+        self.assertEqual(read_block_into.call_args.kwargs['addr'], 8)
+        self.assertEqual(read_block_into.call_args.kwargs['length'], 4)
+
+        dut.mem.write_buffer(Array('I', [1, 2]).tobytes(), start_entry=14)
+        write_block_buffer.assert_called_once()
+        self.assertEqual(self.memory[56], 1)
+        self.assertEqual(self.memory[60], 2)
+
+    def test_fallback_callbacks(self) -> None:
+        """
+        Check the buffer access works with the other callbacks (both normal and legacy)
+        """
+        for callbacks in [NormalCallbackSet(read_callback=self.read,
+                                            write_callback=self.write),
+                          NormalCallbackSetLegacy(read_callback=self.read,
+                                                  write_callback=self.write)]:
+            with self.subTest(callbacks=type(callbacks)):
+                dut = MemoryAddressMapToTest(callbacks=callbacks)
+                data_read = dut.mem.read_buffer(start_entry=0, number_entries=16)
+                self.assertIsInstance(data_read, bytearray)
+                self.assertEqual(memoryview(data_read).cast('I').tolist(),
+                                 [self.memory[addr] for addr in range(0, 64, 4)])
+
+                dut.mem.write_buffer(memoryview(Array('I', [0xA5A5A5A5, 0x5A5A5A5A])),
+                                     start_entry=1)
+                self.assertEqual(self.memory[4], 0xA5A5A5A5)
+                self.assertEqual(self.memory[8], 0x5A5A5A5A)
+
+    def test_wide_memory(self) -> None:
+        """
+        Check the buffer access on a memory wider than the largest native integer
+        """
+        wide_memory = {0: (1 << 100) + 1, 16: (1 << 127) + 2}
+
+        def read(addr: int, width: int, accesswidth: int) -> int:
+            assert width == accesswidth == 128
+            return wide_memory[addr]
+
+        def write(addr: int, width: int, accesswidth: int, data: int) -> None:
+            assert width == accesswidth == 128
+            wide_memory[addr] = data
+
+        dut = MemoryAddressMapToTest(callbacks=NormalCallbackSet(read_callback=read,
+                                                                 write_callback=write),
+                                     width=128, entries=2)
+        data_read = dut.mem.read_buffer(start_entry=0, number_entries=2)
+        self.assertEqual(len(data_read), 32)
+        self.assertEqual(int.from_bytes(data_read[16:], sys.byteorder), (1 << 127) + 2)
+
+        dut.mem.write_buffer(data_read[16:], start_entry=0)
+        self.assertEqual(wide_memory[0], (1 << 127) + 2)
+
+    def test_bad_buffers(self) -> None:
+        """
+        Check that unsuitable buffers are rejected
+        """
+        dut = MemoryAddressMapToTest(callbacks=NormalCallbackSet(read_callback=self.read,
+                                                                 write_callback=self.write))
+        with self.assertRaises(TypeError):
+            dut.mem.read_into([0, 0, 0, 0])
+        with self.assertRaises(TypeError):
+            dut.mem.read_into(bytes(4))
+        with self.assertRaises(ValueError):
+            dut.mem.read_into(bytearray(6))
+        with self.assertRaises(ValueError):
+            dut.mem.read_into(bytearray(4 * 17))
+        with self.assertRaises(ValueError):
+            dut.mem.write_buffer(bytes(8), start_entry=15)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,163 @@
+"""
+Test for the splitting of memory block transfers into bursts
+"""
+import unittest
+from array import array as Array
+from unittest.mock import Mock
+
+# pylint: disable-next=unused-wildcard-import,wildcard-import
+from peakrdl_python.lib import *
+
+from .simple_components import MemoryAddressMapToTest, AsyncMemoryAddressMapToTest
+from .simple_components import BusLatencyModel
+
+
+class TestMemoryBurst(unittest.TestCase):
+    """
+    Tests for the max_burst_length of the callbacks
+    """
+
+    def setUp(self) -> None:
+        self.memory = {addr: addr * 0x01010101 for addr in range(0, 64, 4)}
+
+    def read_block(self, addr: int, width: int, accesswidth: int, length: int) -> list[int]:
+        """
+        read block callback which models a simple address space
+        """
+        assert width == accesswidth == 32
+        return [self.memory[addr + (entry * 4)] for entry in range(length)]
+
+    def write_block(self, addr: int, width: int, accesswidth: int, data: list[int]) -> None:
+        """
+        write block callback which models a simple address space
+        """
+        assert width == accesswidth == 32
+        for entry, entry_data in enumerate(data):
+            self.memory[addr + (entry * 4)] = entry_data
+
+    def test_block_callbacks_split(self) -> None:
+        """
+        Check a long transfer is split into bursts of no more than the maximum length
+        """
+        read_block = Mock(side_effect=self.read_block)
+        write_block = Mock(side_effect=self.write_block)
+        dut = MemoryAddressMapToTest(callbacks=NormalCallbackSet(
+            read_block_callback=read_block, write_block_callback=write_block,
+            max_burst_length=4))
+        assert isinstance(dut.mem, MemoryReadWrite)
+
+        self.assertEqual(dut.mem.read(start_entry=1, number_entries=10),
+                         [self.memory[addr] for addr in range(4, 44, 4)])
+        self.assertEqual([(call.kwargs['addr'], call.kwargs['length'])
+                          for call in read_block.call_args_list],
+                         [(4, 4), (20, 4), (36, 2)])
+
+        dut.mem.write(start_entry=6, data=list(range(10)))
+        self.assertEqual([(call.kwargs['addr'], call.kwargs['data'])
+                          for call in write_block.call_args_list],
+                         [(24, [0, 1, 2, 3]), (40, [4, 5, 6, 7]), (56, [8, 9])])
+
+        # a transfer that fits in a single burst is not split
+        read_block.reset_mock()
+        dut.mem.read(start_entry=0, number_entries=4)
+        read_block.assert_called_once()
+
+    def test_legacy_block_callbacks_split(self) -> None:
+        """
+        Check the bursts of the legacy callbacks are recombined into a single array
+        """
+        def read_block(addr: int, width: int, accesswidth: int, length: int) -> Array:
+            return Array('L', self.read_block(addr=addr, width=width, accesswidth=accesswidth,
+                                              length=length))
+
+        dut = MemoryAddressMapToTest(callbacks=NormalCallbackSetLegacy(
+            read_block_callback=read_block, max_burst_length=3))
+        data_read = dut.mem.read(start_entry=0, number_entries=16)
+        assert isinstance(data_read, Array)
+        self.assertEqual(data_read.tolist(), [self.memory[addr] for addr in range(0, 64, 4)])
+
+    def test_buffer_callbacks_split(self) -> None:
+        """
+        Check the buffer callbacks are passed a slice of the buffer for each burst
+        """
+        lengths: list[int] = []
+
+        def read_block_into(addr: int, width: int, accesswidth: int, length: int,
+                            buffer: memoryview) -> None:
+            assert len(buffer) == length * 4
+            lengths.append(length)
+            buffer.cast('I')[:] = Array('I', self.read_block(addr=addr, width=width,
+                                                             accesswidth=accesswidth,
+                                                             length=length))
+
+        dut = MemoryAddressMapToTest(callbacks=NormalCallbackSet(
+            read_block_into_callback=read_block_into, max_burst_length=5))
+        buffer = Array('I', [0] * 12)
+        dut.mem.read_into(buffer, start_entry=2)
+        self.assertEqual(lengths, [5, 5, 2])
+        self.assertEqual(buffer.tolist(), [self.memory[addr] for addr in range(8, 56, 4)])
+
+    def test_bad_settings(self) -> None:
+        """
+        Check the burst settings are validated
+        """
+        with self.assertRaises(ValueError):
+            _ = NormalCallbackSet(max_burst_length=0)
+        with self.assertRaises(TypeError):
+            _ = NormalCallbackSet(max_burst_length=4.0)  # type: ignore[arg-type]
+        with self.assertRaises(ValueError):
+            _ = AsyncCallbackSet(max_burst_length=4, max_bursts_in_flight=0)
+
+
+class TestAsyncMemoryBurst(unittest.IsolatedAsyncioTestCase):
+    """
+    Tests for the max_burst_length and max_bursts_in_flight of the async callbacks
+    """
+
+    async def asyncSetUp(self) -> None:
+        self.memory = {addr: addr * 0x01010101 for addr in range(0, 64, 4)}
+        self.bus = BusLatencyModel()
+
+    async def read_block(self, addr: int, width: int, accesswidth: int,
+                         length: int) -> list[int]:
+        """
+        read block callback which models a simple address space with some latency
+        """
+        assert width == accesswidth == 32
+        async with self.bus:
+            return [self.memory[addr + (entry * 4)] for entry in range(length)]
+
+    async def write_block(self, addr: int, width: int, accesswidth: int,
+                          data: list[int]) -> None:
+        """
+        write block callback which models a simple address space with some latency
+        """
+        assert width == accesswidth == 32
+        async with self.bus:
+            for entry, entry_data in enumerate(data):
+                self.memory[addr + (entry * 4)] = entry_data
+
+    async def test_bursts_in_flight(self) -> None:
+        """
+        Check the bursts are run concurrently up to the limit and the results kept in order
+        """
+        for max_bursts_in_flight in [1, 2, 8]:
+            with self.subTest(max_bursts_in_flight=max_bursts_in_flight):
+                self.bus = BusLatencyModel()
+                dut = AsyncMemoryAddressMapToTest(callbacks=AsyncCallbackSet(
+                    read_block_callback=self.read_block, write_block_callback=self.write_block,
+                    max_burst_length=2, max_bursts_in_flight=max_bursts_in_flight))
+
+                self.assertEqual(await dut.mem.read(start_entry=0, number_entries=16),
+                                 [self.memory[addr] for addr in range(0, 64, 4)])
+                self.assertEqual(self.bus.peak_in_flight, max_bursts_in_flight)
+
+                self.bus = BusLatencyModel()
+                await dut.mem.write(start_entry=3, data=list(range(11)))
+                self.assertEqual([self.memory[addr] for addr in range(12, 56, 4)],
+                                 list(range(11)))
+                self.assertEqual(self.bus.peak_in_flight, min(max_bursts_in_flight, 6))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,173 @@
+"""
+Test for looking up the nodes of an exported register model by address or path
+"""
+import unittest
+import os
+import tempfile
+import sys
+from itertools import product
+from pathlib import Path
+from contextlib import contextmanager
+
+from peakrdl_python import PythonExporter
+from peakrdl_python import compiler_with_udp_registers
+
+# this assumes the current file is in the unit_test folder under tests
+test_path = Path(__file__).parent.parent
+test_cases = test_path / 'testcases'
+
+
+class TestNodeLookup(unittest.TestCase):
+    """
+    Test class for looking up nodes by address or path in an exported register model
+    """
+
+    test_case_path = test_cases
+
+    @contextmanager
+    def build_python_wrappers_and_make_instance(self, test_case_top_level, lazy_construction):
+        """
+        Context manager to build the python wrappers for a test case, then import them and
+        clean up afterwards
+        """
+        rdlc = compiler_with_udp_registers()
+        rdlc.compile_file(os.path.join(self.test_case_path, test_case_top_level + '.rdl'))
+        spec = rdlc.elaborate(top_def_name=test_case_top_level).top
+
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            # the temporary package, within which the real package is placed is needed to ensure
+            # that there are two separate entries in the python import cache
+            temp_package_name = 'address_lookup_' + ('lazy' if lazy_construction else 'eager')
+            fq_package_path = os.path.join(tmpdirname, temp_package_name)
+            os.makedirs(fq_package_path)
+            with open(os.path.join(fq_package_path, '__init__.py'), 'w', encoding='utf-8') as fid:
+                fid.write('pass\n')
+
+            PythonExporter().export(node=spec,
+                                    path=fq_package_path,
+                                    skip_test_case_generation=True,
+                                    legacy_block_access=False,
+                                    lazy_construction=lazy_construction)
+
+            sys.path.append(tmpdirname)
+
+            reg_model_module = __import__(temp_package_name + '.' + test_case_top_level +
+                                          '.reg_model.' + test_case_top_level,
+                                          globals(), locals(), [test_case_top_level + '_cls'], 0)
+            dut_cls = getattr(reg_model_module, test_case_top_level + '_cls')
+            peakrdl_python_package = __import__(temp_package_name + '.' + test_case_top_level +
+                                                '.lib', globals(), locals(), ['CallbackSet'], 0)
+            callbackset_cls = getattr(peakrdl_python_package, 'NormalCallbackSet')
+
+            yield dut_cls(callbacks=callbackset_cls())
+
+            sys.path.remove(tmpdirname)
+            for module_name in [name for name in sys.modules
+                                if name.startswith(temp_package_name)]:
+                del sys.modules[module_name]
+
+    @classmethod
+    def all_registers(cls, section):
+        """
+        every register in a section, including those in memories
+        """
+        yield from section.get_registers(unroll=True)
+        for memory in section.get_memories(unroll=True) if hasattr(section, 'get_memories') \
+                else []:
+            yield from memory.get_registers(unroll=True)
+        for child_section in section.get_sections(unroll=True):
+            yield from cls.all_registers(child_section)
+
+    def test_register_lookup(self):
+        """
+        Check every register and field can be found from its address
+        """
+        for test_case, lazy_construction in product(['regfile_and_arrays',
+                                                     'memories_with_registers'], [False, True]):
+            with self.subTest(test_case=test_case, lazy_construction=lazy_construction), \
+                    self.build_python_wrappers_and_make_instance(
+                        test_case_top_level=test_case,
+                        lazy_construction=lazy_construction) as dut:
+                registers = list(self.all_registers(dut))
+                self.assertGreater(len(registers), 0)
+                for register in registers:
+                    self.assertIs(dut.node_at(register.address), register)
+                    self.assertIs(dut.node_at(register.address + register.size - 1), register)
+                    for field in register.fields:
+                        self.assertIs(dut.field_at(register.address, field.low), field)
+                        self.assertIs(dut.field_at(register.address, field.high), field)
+                    with self.assertRaises(ValueError):
+                        _ = dut.field_at(register.address, register.width)
+
+                self.assertIsNone(dut.node_at(dut.address + dut.size))
+                self.assertIsNone(dut.field_at(dut.address + dut.size, 0))
+                with self.assertRaises(TypeError):
+                    _ = dut.node_at(float(dut.address))
+
+    def test_path_lookup(self):
+        """
+        Check every register and field can be found from its full instance name
+        """
+        for test_case, lazy_construction in product(['regfile_and_arrays',
+                                                     'memories_with_registers'], [False, True]):
+            with self.subTest(test_case=test_case, lazy_construction=lazy_construction), \
+                    self.build_python_wrappers_and_make_instance(
+                        test_case_top_level=test_case,
+                        lazy_construction=lazy_construction) as dut:
+                self.assertIs(dut.systemrdl_python_child_name_map,
+                              dut.systemrdl_python_child_name_map)
+                # the map is shared by every instance of the class so must not be changeable
+                with self.assertRaises(TypeError):
+                    dut.systemrdl_python_child_name_map['not_a_node'] = 'not_a_node'
+                self.assertIs(dut.find(dut.full_inst_name), dut)
+                for register in self.all_registers(dut):
+                    self.assertIs(dut.find(register.full_inst_name), register)
+                    # the path relative to the top level
+                    relative_path = register.full_inst_name[len(dut.full_inst_name) + 1:]
+                    self.assertIs(dut.find(relative_path), register)
+                    for field in register.fields:
+                        self.assertIs(dut.find(field.full_inst_name), field)
+                        # second lookup comes from the cache
+                        self.assertIs(dut.find(field.full_inst_name), field)
+
+                with self.assertRaises(KeyError):
+                    _ = dut.find('not_a_node')
+                with self.assertRaises(ValueError):
+                    _ = dut.find(dut.full_inst_name + '..')
+                with self.assertRaises(TypeError):
+                    _ = dut.find(None)
+
+    def test_array_path_lookup(self):
+        """
+        Check paths with arrays are resolved and checked
+        """
+        with self.build_python_wrappers_and_make_instance(
+                test_case_top_level='memories_with_registers', lazy_construction=True) as dut:
+            memory = dut.mem_with_internal_registers
+            self.assertIs(dut.find('mem_with_internal_registers.mem_entry_set2'),
+                          memory.mem_entry_set2)
+            self.assertIs(dut.find('mem_with_internal_registers.mem_entry_set2[3]'),
+                          memory.mem_entry_set2[3])
+            with self.assertRaises(IndexError):
+                _ = dut.find('mem_with_internal_registers.mem_entry_set2[4]')
+            with self.assertRaises(ValueError):
+                _ = dut.find('mem_with_internal_registers.mem_entry_set2.lower_entry')
+            with self.assertRaises(ValueError):
+                _ = dut.find('mem_with_internal_registers.mem_entry_set1[0]')
+            with self.assertRaises(KeyError):
+                _ = dut.find('mem_with_internal_registers.mem_entry_set1.lower_entry.bit')
+
+    def test_memory_lookup(self):
+        """
+        Check that an address in a memory which is not one of its registers gives the memory
+        """
+        with self.build_python_wrappers_and_make_instance(
+                test_case_top_level='memories_with_registers', lazy_construction=True) as dut:
+            memory = dut.mem_with_internal_registers
+            last_entry_address = memory.address + memory.size - memory.width_in_bytes
+            self.assertIs(dut.node_at(last_entry_address), memory)
+            self.assertIsNone(dut.field_at(last_entry_address, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
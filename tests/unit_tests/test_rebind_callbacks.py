@@ -0,0 +1,133 @@
+"""
+Test for the caching of the callbacks of each node and replacing the callbacks of an address map
+"""
+import unittest
+from unittest.mock import Mock, patch
+
+# pylint: disable-next=unused-wildcard-import,wildcard-import
+from peakrdl_python.lib import *
+
+from .simple_components import AddressMapToTest, ArrayAddressMapToTest, AsyncAddressMapToTest
+from .simple_components import ReadWriteRegisterToTest
+
+
+class TestRebindCallbacks(unittest.TestCase):
+    """
+    Tests for the rebind_callbacks method of the address map
+    """
+
+    def test_callbacks_cached(self) -> None:
+        """
+        Check the callbacks of a register are only resolved again after they are rebound
+        """
+        dut = AddressMapToTest(callbacks=NormalCallbackSet(read_callback=Mock(return_value=0)))
+        # pylint: disable-next=protected-access
+        resolve = Reg._resolve_callbacks
+        with patch.object(ReadWriteRegisterToTest, '_resolve_callbacks', autospec=True,
+                          side_effect=resolve) as resolve_callbacks:
+            dut.reg_rw_a.read()
+            resolve_callbacks.reset_mock()
+            dut.reg_rw_a.read()
+            dut.reg_rw_a.read()
+            resolve_callbacks.assert_not_called()
+
+            dut.rebind_callbacks(NormalCallbackSet(read_callback=Mock(return_value=0)))
+            dut.reg_rw_a.read()
+            resolve_callbacks.assert_called_once()
+
+    def test_rebind(self) -> None:
+        """
+        Check the registers, register arrays and memories use the new callbacks once they have
+        been rebound
+        """
+        first_read = Mock(return_value=1)
+        first_read_block = Mock(return_value=[1])
+        dut = ArrayAddressMapToTest(callbacks=NormalCallbackSet(
+            read_callback=first_read, read_block_callback=first_read_block))
+        self.assertEqual(dut.reg_array[1, 2].read(), 1)
+        self.assertEqual(dut.mem.read(start_entry=0, number_entries=1), [1])
+
+        second_read = Mock(return_value=2)
+        second_read_block = Mock(return_value=[2])
+        dut.rebind_callbacks(NormalCallbackSet(read_callback=second_read,
+                                               read_block_callback=second_read_block))
+        self.assertEqual(dut.reg_array[1, 2].read(), 2)
+        self.assertEqual(dut.mem.read(start_entry=0, number_entries=1), [2])
+        first_read.assert_called_once()
+        first_read_block.assert_called_once()
+        second_read.assert_called_once_with(addr=0x18, width=32, accesswidth=32)
+        second_read_block.assert_called_once()
+
+    def test_rebind_errors(self) -> None:
+        """
+        Check the new callbacks are type checked and can not be changed while the address map
+        is accessed through a shadow cache
+        """
+        read_callback = Mock(return_value=0)
+        dut = AddressMapToTest(callbacks=NormalCallbackSet(read_callback=read_callback))
+        with self.assertRaises(TypeError):
+            dut.rebind_callbacks(AsyncCallbackSet())  # type: ignore[arg-type]
+
+        with dut.cached():
+            with self.assertRaises(RuntimeError):
+                dut.rebind_callbacks(NormalCallbackSet(read_callback=Mock(return_value=0)))
+            dut.reg_rw_a.read()
+            dut.reg_rw_a.read()
+        # the register is only read from the hardware once, through the cache
+        read_callback.assert_called_once()
+
+        # the cached callbacks of the register are dropped when the shadow cache is removed
+        dut.reg_rw_a.read()
+        self.assertEqual(read_callback.call_count, 2)
+
+    def test_rebind_in_child_cache(self) -> None:
+        """
+        Check the callbacks can not be changed while an address map within the top level is
+        accessed through a shadow cache
+        """
+        dut = AddressMapToTest(callbacks=NormalCallbackSet(read_callback=Mock(return_value=0)))
+        child = AddressMapToTest(callbacks=None, address=0x100, parent=dut)
+        with child.cached():
+            with self.assertRaises(RuntimeError):
+                dut.rebind_callbacks(NormalCallbackSet(read_callback=Mock(return_value=0)))
+        dut.rebind_callbacks(NormalCallbackSet(read_callback=Mock(return_value=0)))
+
+    def test_rebind_in_batch(self) -> None:
+        """
+        Check the callbacks can not be changed while a batch is open
+        """
+        dut = AddressMapToTest(callbacks=BatchCallbackSet(transact_callback=Mock()))
+        with dut.batch():
+            with self.assertRaises(RuntimeError):
+                dut.rebind_callbacks(NormalCallbackSet(read_callback=Mock(return_value=0)))
+        dut.rebind_callbacks(NormalCallbackSet(read_callback=Mock(return_value=0)))
+
+
+class TestAsyncRebindCallbacks(unittest.IsolatedAsyncioTestCase):
+    """
+    Tests for the rebind_callbacks method of the asynchronous address map
+    """
+
+    async def test_rebind(self) -> None:
+        """
+        Check the registers use the new callbacks once they have been rebound
+        """
+        # pylint: disable-next=unused-argument
+        async def first_read(addr: int, width: int, accesswidth: int) -> int:
+            return 1
+
+        # pylint: disable-next=unused-argument
+        async def second_read(addr: int, width: int, accesswidth: int) -> int:
+            return 2
+
+        dut = AsyncAddressMapToTest(callbacks=AsyncCallbackSet(read_callback=first_read))
+        self.assertEqual((await dut.read_all())['dut_wrapper.reg_rw_a'], 1)
+        dut.rebind_callbacks(AsyncCallbackSet(read_callback=second_read))
+        self.assertEqual((await dut.read_all())['dut_wrapper.reg_rw_a'], 2)
+
+        with self.assertRaises(TypeError):
+            dut.rebind_callbacks(NormalCallbackSet())  # type: ignore[arg-type]
+
+
+if __name__ == '__main__':
+    unittest.main()
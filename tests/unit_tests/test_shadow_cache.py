@@ -0,0 +1,201 @@
+"""
+Test for the address map shadow cache
+"""
+import unittest
+from unittest.mock import Mock
+
+# pylint: disable-next=unused-wildcard-import,wildcard-import
+from peakrdl_python.lib import *
+
+from .simple_components import AddressMapToTest, ArrayAddressMapToTest, SideEffectAddressMapToTest
+
+
+class TestShadowCache(unittest.TestCase):
+    """
+    Tests for the cached context manager of the address map
+    """
+
+    def read(self, addr: int, width: int, accesswidth: int) -> int:
+        """
+        read callback which models a simple address space
+        """
+        assert width == accesswidth == 32
+        return self.memory.get(addr, 0)
+
+    def write(self, addr: int, width: int, accesswidth: int, data: int) -> None:
+        """
+        write callback which models a simple address space
+        """
+        assert width == accesswidth == 32
+        self.memory[addr] = data
+
+    def write_block(self, addr: int, width: int, accesswidth: int, data: list[int]) -> None:
+        """
+        block write callback which models a simple address space
+        """
+        for entry, entry_data in enumerate(data):
+            self.write(addr=addr + (entry * 4), width=width, accesswidth=accesswidth,
+                       data=entry_data)
+
+    def setUp(self) -> None:
+        self.memory: dict[int, int] = {}
+        self.read_callback = Mock(side_effect=self.read)
+        self.write_callback = Mock(side_effect=self.write)
+        self.write_block_callback = Mock(side_effect=self.write_block)
+        self.dut = AddressMapToTest(callbacks=NormalCallbackSet(
+            read_callback=self.read_callback,
+            write_callback=self.write_callback,
+            write_block_callback=self.write_block_callback))
+
+    def test_write_back(self) -> None:
+        """
+        Check that field writes are collapsed and the dirty registers are written at the end
+        as a single block
+        """
+        with self.dut.cached():
+            for _ in range(5):
+                self.dut.reg_rw_b.field.write(1)
+                self.dut.reg_rw_b.field.write(0)
+            self.dut.reg_rw_a.field.write(1)
+            self.dut.reg_wo.write(0x3)
+            self.write_callback.assert_not_called()
+            self.write_block_callback.assert_not_called()
+
+        # each register is only read once
+        self.assertEqual(self.read_callback.call_count, 2)
+        # the two contiguous registers are written as a block, the other on its own
+        self.write_block_callback.assert_called_once_with(addr=0x0, width=32, accesswidth=32,
+                                                          data=[0x1, 0x0])
+        self.write_callback.assert_called_once_with(addr=0xC, width=32, accesswidth=32,
+                                                    data=0x3)
+        self.assertEqual(self.memory, {0x0: 0x1, 0x4: 0x0, 0xC: 0x3})
+
+    def test_write_back_bursts(self) -> None:
+        """
+        Check a run of dirty registers longer than the maximum burst length is written in
+        bursts
+        """
+        dut = ArrayAddressMapToTest(callbacks=NormalCallbackSet(
+            read_callback=self.read_callback,
+            write_callback=self.write_callback,
+            write_block_callback=self.write_block_callback,
+            max_burst_length=2))
+        with dut.cached():
+            for index in range(4):
+                dut.reg_array[0, index].write(index + 1)
+
+        self.assertEqual([(call.kwargs['addr'], call.kwargs['data']) for call in
+                          self.write_block_callback.call_args_list],
+                         [(0x0, [0x1, 0x2]), (0x8, [0x3, 0x4])])
+        self.write_callback.assert_not_called()
+        self.assertEqual(self.memory, {0x0: 0x1, 0x4: 0x2, 0x8: 0x3, 0xC: 0x4})
+
+    def test_buffer_callbacks(self) -> None:
+        """
+        Check the buffer callbacks and burst length are passed through the cache
+        """
+        read_block_into_callback = Mock()
+        write_block_buffer_callback = Mock()
+        dut = ArrayAddressMapToTest(callbacks=NormalCallbackSet(
+            read_callback=self.read_callback,
+            write_callback=self.write_callback,
+            read_block_into_callback=read_block_into_callback,
+            write_block_buffer_callback=write_block_buffer_callback,
+            max_burst_length=2))
+        with dut.cached():
+            dut.mem.read_into(bytearray(16))
+            dut.mem.write_buffer(bytes(16))
+
+        self.assertEqual([call.kwargs['addr'] for call in read_block_into_callback.call_args_list],
+                         [0x100, 0x108])
+        self.assertEqual([call.kwargs['addr'] for call in
+                          write_block_buffer_callback.call_args_list], [0x100, 0x108])
+
+    def test_single_dirty_register_uses_single_write(self) -> None:
+        """
+        A run of one register is written with the single write callback
+        """
+        with self.dut.cached():
+            self.dut.reg_rw_b.write(0x5)
+
+        self.write_callback.assert_called_once_with(addr=0x4, width=32, accesswidth=32,
+                                                    data=0x5)
+        self.write_block_callback.assert_not_called()
+
+    def test_volatile_register_not_cached(self) -> None:
+        """
+        Registers with volatile fields are always read from the hardware, after the held writes
+        have been flushed
+        """
+        with self.dut.cached():
+            self.dut.reg_rw_a.write(0x1)
+            self.memory[0x8] = 0x1
+            self.assertEqual(self.dut.reg_ro.read(), 0x1)
+            self.write_callback.assert_called_once_with(addr=0x0, width=32, accesswidth=32,
+                                                        data=0x1)
+            self.memory[0x8] = 0x0
+            self.assertEqual(self.dut.reg_ro.read(), 0x0)
+
+        self.assertEqual(self.read_callback.call_count, 2)
+
+    def test_side_effect_registers_not_cached(self) -> None:
+        """
+        Registers with clear on read or single pulse fields are accessed in the hardware every
+        time
+        """
+        dut = SideEffectAddressMapToTest(callbacks=NormalCallbackSet(
+            read_callback=self.read_callback,
+            write_callback=self.write_callback))
+        with dut.cached():
+            self.memory[0x0] = 0x1
+            self.assertEqual(dut.reg_rclr.read(), 0x1)
+            self.memory[0x0] = 0x0
+            self.assertEqual(dut.reg_rclr.read(), 0x0)
+            dut.reg_pulse.write(0x1)
+            dut.reg_pulse.write(0x1)
+            self.assertEqual(self.write_callback.call_count, 2)
+
+        self.assertEqual(self.read_callback.call_count, 2)
+        self.assertEqual(self.write_callback.call_count, 2)
+
+    def test_write_through(self) -> None:
+        """
+        In write through mode, the writes are issued immediately but the reads are still served
+        from the shadow
+        """
+        with self.dut.cached(policy=CachePolicy.WRITE_THROUGH):
+            self.dut.reg_rw_a.field.write(1)
+            self.write_callback.assert_called_once()
+            self.assertEqual(self.dut.reg_rw_a.read(), 0x1)
+            self.dut.reg_rw_a.field.write(0)
+
+        self.read_callback.assert_called_once()
+        self.assertEqual(self.write_callback.call_count, 2)
+        self.assertEqual(self.memory[0x0], 0x0)
+
+    def test_exception_discards_writes(self) -> None:
+        """
+        Check that held writes are discarded and the cache removed if an exception occurs
+        """
+        with self.assertRaises(ValueError):
+            with self.dut.cached():
+                self.dut.reg_rw_a.write(0x1)
+                raise ValueError('abandon the cached access')
+
+        self.write_callback.assert_not_called()
+        self.write_block_callback.assert_not_called()
+        self.dut.reg_rw_a.write(0x1)
+        self.write_callback.assert_called_once()
+
+    def test_nested_cache_not_permitted(self) -> None:
+        """
+        The cache can not be opened twice
+        """
+        with self.dut.cached():
+            with self.assertRaises(RuntimeError):
+                with self.dut.cached():
+                    pass
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,224 @@
+"""
+Test for the simulator base classes
+"""
+import os
+import tempfile
+import unittest
+from typing import Optional, Union
+from unittest.mock import Mock, patch
+
+from peakrdl_python.sim_lib.simulator import Simulator, MemoryEntry
+from peakrdl_python.sim_lib.memory import Memory, MemoryStorage, DENSE_STORAGE_AUTO_LIMIT
+from peakrdl_python.sim_lib.register import Register, MemoryRegister
+
+
+class SimulatorToTest(Simulator):
+    """
+    Simulator with a set of memories, the memories are 16 entries of 32 bit. Optionally a set
+    of 32 bit registers can be added (which may overlap the memories)
+    """
+
+    def __init__(self, memory_addresses: list[int],
+                 register_addresses: Optional[list[int]] = None):
+        self.memory_addresses = memory_addresses
+        self.register_addresses = [] if register_addresses is None else register_addresses
+        super().__init__(address=0)
+
+    def _build_registers(self) -> dict[int, Union[MemoryRegister, Register]]:
+        return {address: Register(width=32, full_inst_name=f'reg_{index:d}', readable=True,
+                                  writable=True, fields=[])
+                for index, address in enumerate(self.register_addresses)}
+
+    def _build_memories(self) -> list[MemoryEntry]:
+        return [MemoryEntry(start_address=address,
+                            end_address=address + 63,
+                            memory=Memory(width=32, length=16, default_value=0,
+                                          full_inst_name=f'mem_{index:d}'))
+                for index, address in enumerate(self.memory_addresses)]
+
+
+class TestSimulatorMemoryLookup(unittest.TestCase):
+    """
+    Tests for finding the memory at an address
+    """
+
+    def test_memory_for_address(self) -> None:
+        """
+        Check the memory found for addresses inside, between and outside the memories, which
+        are deliberately not provided in address order
+        """
+        sim = SimulatorToTest(memory_addresses=[0x1000, 0x0, 0x100, 0x40])
+        for address, inst_name in [(0x0, 'mem_1'), (0x3F, 'mem_1'), (0x40, 'mem_3'),
+                                   (0x7C, 'mem_3'), (0x100, 'mem_2'), (0x1010, 'mem_0'),
+                                   (0x103F, 'mem_0')]:
+            with self.subTest(address=address):
+                memory_entry = sim.memory_for_address(address)
+                self.assertIsNotNone(memory_entry)
+                assert memory_entry is not None
+                self.assertEqual(memory_entry.memory.full_inst_name, inst_name)
+
+        for address in [0x80, 0xFC, 0x140, 0x1040, 0x100000]:
+            with self.subTest(address=address):
+                self.assertIsNone(sim.memory_for_address(address))
+                with self.assertRaises(RuntimeError):
+                    _ = sim.memory_for_address_with_exception(address)
+
+        # accesses are routed to the memory
+        sim.write(addr=0x104, width=32, accesswidth=32, data=0x1234)
+        self.assertEqual(sim.read(addr=0x104, width=32, accesswidth=32), 0x1234)
+        memory = sim.node_by_full_name('mem_2')
+        assert isinstance(memory, Memory)
+        self.assertEqual(memory.value[1], 0x1234)
+
+    def test_no_memories(self) -> None:
+        """
+        A simulator with no memories, returns nothing for any address
+        """
+        sim = SimulatorToTest(memory_addresses=[])
+        self.assertIsNone(sim.memory_for_address(0))
+        self.assertEqual(sim.read(addr=0, width=32, accesswidth=32), 0)
+
+    def test_overlapping_memories(self) -> None:
+        """
+        Overlapping memories are detected when the simulator is built
+        """
+        with self.assertRaises(RuntimeError):
+            _ = SimulatorToTest(memory_addresses=[0x0, 0x100, 0x120])
+
+
+
+class TestSimulatorBlockAccess(unittest.TestCase):
+    """
+    Tests for the block access of the simulator
+    """
+
+    def setUp(self) -> None:
+        self.sim = SimulatorToTest(memory_addresses=[0x0, 0x40], register_addresses=[0x48])
+        memory_0 = self.sim.node_by_full_name('mem_0')
+        memory_1 = self.sim.node_by_full_name('mem_1')
+        assert isinstance(memory_0, Memory)
+        assert isinstance(memory_1, Memory)
+        self.memory_0 = memory_0
+        self.memory_1 = memory_1
+
+    def test_block_within_memory(self) -> None:
+        """
+        A block within a single memory is accessed as a single operation
+        """
+        with patch.object(self.sim, '_read') as read_patch, \
+                patch.object(self.sim, '_write') as write_patch:
+            self.sim.write_block(addr=0x8, width=32, accesswidth=32, data=[1, 2, 3, 4])
+            self.assertEqual(self.sim.read_block(addr=0x4, width=32, accesswidth=32, length=6),
+                             [0, 1, 2, 3, 4, 0])
+            read_patch.assert_not_called()
+            write_patch.assert_not_called()
+
+        self.assertEqual([self.memory_0.value[offset] for offset in range(2, 6)], [1, 2, 3, 4])
+
+    def test_block_falls_back(self) -> None:
+        """
+        Blocks which are not contained in a single memory or include a register are accessed
+        one word at a time
+        """
+        self.sim.write_block(addr=0x38, width=32, accesswidth=32, data=[1, 2, 3, 4, 5])
+        self.assertEqual(self.memory_0.value[15], 2)
+        self.assertEqual(self.memory_1.value[0], 3)
+        # the register in the memory takes precedence
+        self.assertEqual(self.memory_1.value[2], 0)
+        self.assertEqual(self.sim.register_by_full_name('reg_0').value, 5)
+        self.assertEqual(self.sim.read_block(addr=0x3C, width=32, accesswidth=32, length=4),
+                         [2, 3, 4, 5])
+
+    def test_block_callbacks(self) -> None:
+        """
+        The memory callbacks are called for every word of a block
+        """
+        self.memory_0.read_callback = Mock()
+        self.memory_0.write_callback = Mock()
+        self.sim.write_block(addr=0x0, width=32, accesswidth=32, data=[1, 2, 3])
+        self.assertEqual(self.sim.read_block(addr=0x0, width=32, accesswidth=32, length=3),
+                         [1, 2, 3])
+        self.assertEqual(self.memory_0.write_callback.call_count, 3)
+        self.memory_0.read_callback.assert_called_with(offset=2, value=3)
+
+
+
+class TestSimulatorMemoryStorage(unittest.TestCase):
+    """
+    Tests for the backing storage of the simulated memories
+    """
+
+    def test_auto_storage(self) -> None:
+        """
+        Check dense storage is selected for small memories of up to 64 bit wide
+        """
+        for width, length, storage in [
+                (32, 16, MemoryStorage.DENSE),
+                (64, DENSE_STORAGE_AUTO_LIMIT // 8, MemoryStorage.DENSE),
+                (64, (DENSE_STORAGE_AUTO_LIMIT // 8) + 1, MemoryStorage.SPARSE),
+                (128, 16, MemoryStorage.SPARSE)]:
+            with self.subTest(width=width, length=length):
+                memory = Memory(width=width, length=length, default_value=0,
+                                full_inst_name='mem')
+                self.assertIs(memory.storage, storage)
+
+        with self.assertRaises(ValueError):
+            _ = Memory(width=128, length=16, default_value=0, full_inst_name='mem',
+                       storage=MemoryStorage.DENSE)
+
+    def test_storage_equivalent(self) -> None:
+        """
+        Check the memory behaves the same with either storage, including when it is changed
+        """
+        for storage in [MemoryStorage.SPARSE, MemoryStorage.DENSE]:
+            with self.subTest(storage=storage):
+                memory = Memory(width=16, length=8, default_value=0x5A5A, full_inst_name='mem',
+                                storage=storage)
+                memory.write(offset=1, data=0x1234)
+                memory.write_block(offset=4, data=[1, 2, 3])
+                self.assertEqual(memory.read(offset=1), 0x1234)
+                self.assertEqual(memory.read_block(offset=0, length=8),
+                                 [0x5A5A, 0x1234, 0x5A5A, 0x5A5A, 1, 2, 3, 0x5A5A])
+
+                other_storage = MemoryStorage.DENSE if storage is MemoryStorage.SPARSE else \
+                    MemoryStorage.SPARSE
+                memory.storage = other_storage
+                self.assertIs(memory.storage, other_storage)
+                self.assertEqual(memory.read_block(offset=0, length=8),
+                                 [0x5A5A, 0x1234, 0x5A5A, 0x5A5A, 1, 2, 3, 0x5A5A])
+
+    def test_load_dump(self) -> None:
+        """
+        Check the memory content can be loaded and dumped, both as bytes and files
+        """
+        for width, storage in [(32, MemoryStorage.SPARSE), (32, MemoryStorage.DENSE),
+                               (128, MemoryStorage.SPARSE)]:
+            with self.subTest(width=width, storage=storage):
+                memory = Memory(width=width, length=8, default_value=0, full_inst_name='mem',
+                                storage=storage)
+                width_in_bytes = width // 8
+                image = b''.join(entry.to_bytes(width_in_bytes, 'little')
+                                 for entry in [0x11, 0x22 << (width - 8), 0x33])
+                memory.load(image, offset=2)
+                self.assertEqual(memory.read_block(offset=1, length=4),
+                                 [0, 0x11, 0x22 << (width - 8), 0x33])
+                self.assertEqual(memory.dump(offset=2, length=3), image)
+                self.assertEqual(len(memory.dump()), 8 * width_in_bytes)
+
+                with tempfile.TemporaryDirectory() as temp_dir:
+                    file_name = os.path.join(temp_dir, 'mem.bin')
+                    memory.dump_file(file_name)
+                    copy = Memory(width=width, length=8, default_value=0,
+                                  full_inst_name='copy', storage=storage)
+                    copy.load_file(file_name)
+                    self.assertEqual(copy.read_block(offset=0, length=8),
+                                     memory.read_block(offset=0, length=8))
+
+                with self.assertRaises(IndexError):
+                    memory.load(image, offset=6)
+                with self.assertRaises(ValueError):
+                    memory.load(image[:-1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,283 @@
+"""
+Test for the register state snapshot and restore
+"""
+import unittest
+from array import array as Array
+from unittest.mock import Mock
+
+# pylint: disable-next=unused-wildcard-import,wildcard-import
+from peakrdl_python.lib import *
+
+from .simple_components import AddressMapToTest, AsyncAddressMapToTest
+from .simple_components import MemoryAddressMapToTest
+
+
+class TestSnapshot(unittest.TestCase):
+    """
+    Tests for the snapshot and restore methods of the address map
+    """
+
+    def read(self, addr: int, width: int, accesswidth: int) -> int:
+        """
+        read callback which models a simple address space
+        """
+        assert width == accesswidth == 32
+        return self.memory.get(addr, 0)
+
+    def write(self, addr: int, width: int, accesswidth: int, data: int) -> None:
+        """
+        write callback which models a simple address space
+        """
+        assert width == accesswidth == 32
+        self.memory[addr] = data
+
+    def read_block(self, addr: int, width: int, accesswidth: int, length: int) -> list[int]:
+        """
+        block read callback which models a simple address space
+        """
+        return [self.read(addr=addr + (entry * 4), width=width, accesswidth=accesswidth)
+                for entry in range(length)]
+
+    def write_block(self, addr: int, width: int, accesswidth: int, data: list[int]) -> None:
+        """
+        block write callback which models a simple address space
+        """
+        for entry, entry_data in enumerate(data):
+            self.write(addr=addr + (entry * 4), width=width, accesswidth=accesswidth,
+                       data=entry_data)
+
+    def setUp(self) -> None:
+        self.memory: dict[int, int] = {}
+        self.read_block_callback = Mock(side_effect=self.read_block)
+        self.write_block_callback = Mock(side_effect=self.write_block)
+        self.read_callback = Mock(side_effect=self.read)
+        self.write_callback = Mock(side_effect=self.write)
+
+    def test_runs(self) -> None:
+        """
+        Check the readable registers are read as a single run and only the writable registers
+        in the snapshot are restored
+        """
+        dut = AddressMapToTest(callbacks=NormalCallbackSet(
+            read_callback=self.read_callback, write_callback=self.write_callback,
+            read_block_callback=self.read_block_callback,
+            write_block_callback=self.write_block_callback))
+        self.memory.update({0x0: 0x1, 0x4: 0x2, 0x8: 0x3, 0xC: 0x4})
+
+        snapshot = dut.snapshot()
+        self.read_block_callback.assert_called_once_with(addr=0x0, width=32, accesswidth=32,
+                                                         length=3)
+        self.read_callback.assert_not_called()
+        self.assertEqual(snapshot.runs, [(0x0, 32, 32, [0x1, 0x2, 0x3])])
+        self.assertEqual(snapshot.values(address=0x4, width=32, length=2), [0x2, 0x3])
+        self.assertIsNone(snapshot.values(address=0xC, width=32))
+
+        self.memory.clear()
+        dut.restore(snapshot)
+        # the read only register is not written and the write only one is not in the snapshot
+        self.write_block_callback.assert_called_once_with(addr=0x0, width=32, accesswidth=32,
+                                                          data=[0x1, 0x2])
+        self.write_callback.assert_not_called()
+        self.assertEqual(self.memory, {0x0: 0x1, 0x4: 0x2})
+
+        with self.assertRaises(TypeError):
+            dut.restore(snapshot.to_dict())  # type: ignore[arg-type]
+
+    def test_single_access(self) -> None:
+        """
+        Without the block callbacks each register is accessed on its own
+        """
+        dut = AddressMapToTest(callbacks=NormalCallbackSet(
+            read_callback=self.read_callback, write_callback=self.write_callback))
+        self.memory.update({0x0: 0x1, 0x4: 0x2, 0x8: 0x3})
+        snapshot = dut.snapshot()
+        self.assertEqual(self.read_callback.call_count, 3)
+        self.assertEqual(snapshot.runs, [(0x0, 32, 32, [0x1, 0x2, 0x3])])
+        dut.restore(snapshot)
+        self.assertEqual(self.write_callback.call_count, 2)
+
+    def test_memory_bursts(self) -> None:
+        """
+        Check a memory is read and written in bursts of the maximum burst length
+        """
+        dut = MemoryAddressMapToTest(callbacks=NormalCallbackSet(
+            read_block_callback=self.read_block_callback,
+            write_block_callback=self.write_block_callback,
+            max_burst_length=5))
+        self.memory.update({entry * 4: entry for entry in range(16)})
+
+        snapshot = dut.snapshot()
+        self.assertEqual([call.kwargs['length'] for call in
+                          self.read_block_callback.call_args_list], [5, 5, 5, 1])
+        self.assertEqual(snapshot.runs, [(0x0, 32, 32, list(range(16)))])
+
+        self.memory.clear()
+        dut.restore(snapshot)
+        self.assertEqual([(call.kwargs['addr'], len(call.kwargs['data'])) for call in
+                          self.write_block_callback.call_args_list],
+                         [(0x0, 5), (0x14, 5), (0x28, 5), (0x3C, 1)])
+        self.assertEqual(self.memory, {entry * 4: entry for entry in range(16)})
+
+    def test_legacy(self) -> None:
+        """
+        Check the legacy callbacks are given arrays
+        """
+        written: list[Array] = []
+        dut = MemoryAddressMapToTest(callbacks=NormalCallbackSetLegacy(
+            read_block_callback=lambda addr, width, accesswidth, length: Array('L', [7] * length),
+            write_block_callback=lambda addr, width, accesswidth, data: written.append(data)))
+        snapshot = dut.snapshot()
+        self.assertEqual(snapshot.runs, [(0x0, 32, 32, [7] * 16)])
+        dut.restore(snapshot)
+        self.assertEqual(len(written), 1)
+        self.assertIsInstance(written[0], Array)
+        self.assertEqual(written[0].tolist(), [7] * 16)
+
+    def test_memory_width_not_bytes(self) -> None:
+        """
+        Check a memory whose width is not a multiple of 8 round trips through a snapshot, the
+        words occupy the next power of two bytes
+        """
+        memory: dict[int, int] = {entry * 2: (entry * 0x101) & 0xFFF for entry in range(16)}
+
+        # pylint: disable-next=unused-argument
+        def read_block(addr: int, width: int, accesswidth: int, length: int) -> list[int]:
+            return [memory.get(addr + (entry * 2), 0) for entry in range(length)]
+
+        # pylint: disable-next=unused-argument
+        def write_block(addr: int, width: int, accesswidth: int, data: list[int]) -> None:
+            for entry, entry_data in enumerate(data):
+                memory[addr + (entry * 2)] = entry_data
+
+        dut = MemoryAddressMapToTest(callbacks=NormalCallbackSet(
+            read_block_callback=read_block, write_block_callback=write_block), width=12)
+        expected = dict(memory)
+        snapshot = RegisterSnapshot.from_bytes(dut.snapshot().to_bytes())
+        self.assertEqual(snapshot.runs, [(0x0, 12, 12, [expected[entry * 2]
+                                                        for entry in range(16)])])
+
+        memory.clear()
+        self.assertEqual(snapshot.diff(dut.snapshot()),
+                         [(entry * 2, 12, expected[entry * 2], 0) for entry in range(1, 16)])
+        dut.restore(snapshot)
+        self.assertEqual(memory, expected)
+
+    def test_serialisation(self) -> None:
+        """
+        Check the binary and JSON forms round trip, including words which do not fit a
+        python array
+        """
+        snapshot = RegisterSnapshot([(0x100, 8, 8, [0xA5, 0x5A]),
+                                     (0x0, 32, 32, [0x1234_5678, 0xFFFF_FFFF]),
+                                     (0x200, 128, 32, [(1 << 127) | 1])])
+        self.assertEqual([run[0] for run in snapshot.runs], [0x0, 0x100, 0x200])
+
+        data = snapshot.to_bytes()
+        self.assertEqual(RegisterSnapshot.from_bytes(data), snapshot)
+        self.assertEqual(RegisterSnapshot.from_dict(snapshot.to_dict()), snapshot)
+        self.assertIn('"runs"', snapshot.to_json())
+
+        with self.assertRaises(ValueError):
+            RegisterSnapshot.from_bytes(b'XXXX' + data[4:])
+        with self.assertRaises(ValueError):
+            RegisterSnapshot.from_bytes(data[:-1])
+        with self.assertRaises(ValueError):
+            RegisterSnapshot([(0x0, 32, 32, [1, 2]), (0x4, 32, 32, [3])])
+
+
+class TestSnapshotDiff(unittest.TestCase):
+    """
+    Tests for comparing snapshots
+    """
+
+    def test_same_layout(self) -> None:
+        """
+        Check the differences are found in a long run, where most chunks are identical
+        """
+        golden = RegisterSnapshot([(0x0, 32, 32, list(range(1000))), (0x1000, 16, 16, [1, 2])])
+        observed_data = list(range(1000))
+        observed_data[3] = 0xFFFF
+        observed_data[700] = 0
+        observed = RegisterSnapshot([(0x0, 32, 32, observed_data),
+                                     (0x1000, 16, 16, [1, 2])])
+
+        self.assertEqual(golden.diff(golden), [])
+        self.assertEqual(golden.diff(observed), [(0xC, 32, 3, 0xFFFF), (0xAF0, 32, 700, 0)])
+        # the packed form kept from the binary form gives the same result
+        self.assertEqual(RegisterSnapshot.from_bytes(golden.to_bytes()).diff(observed),
+                         golden.diff(observed))
+
+    def test_different_layout(self) -> None:
+        """
+        Check snapshots with runs split differently are compared a word at a time, including
+        words which are only in one of them
+        """
+        snapshot_a = RegisterSnapshot([(0x0, 32, 32, [1, 2, 3, 4])])
+        snapshot_b = RegisterSnapshot([(0x0, 32, 32, [1, 2]), (0x8, 32, 32, [3, 5]),
+                                       (0x20, 32, 32, [6])])
+        self.assertEqual(snapshot_a.diff(snapshot_b),
+                         [(0xC, 32, 4, 5), (0x20, 32, None, 6)])
+        self.assertEqual(snapshot_b.diff(snapshot_a),
+                         [(0xC, 32, 5, 4), (0x20, 32, 6, None)])
+        with self.assertRaises(TypeError):
+            snapshot_a.diff(snapshot_a.runs)  # type: ignore[arg-type]
+
+    def test_decode(self) -> None:
+        """
+        Check the differences are decoded into the registers and fields
+        """
+        dut = AddressMapToTest(callbacks=NormalCallbackSet(
+            read_callback=lambda addr, width, accesswidth: 0))
+        golden = RegisterSnapshot([(0x0, 32, 32, [0x1, 0x0, 0x0]), (0x100, 32, 32, [0x0])])
+        observed = RegisterSnapshot([(0x0, 32, 32, [0x0, 0x2, 0x0]), (0x100, 32, 32, [0x1])])
+
+        differences = dut.diff(golden, observed)
+        self.assertEqual([(difference.address, difference.node_name, difference.value_a,
+                           difference.value_b, difference.fields)
+                          for difference in differences],
+                         [(0x0, 'dut_wrapper.reg_rw_a', 0x1, 0x0, {'field': (1, 0)}),
+                          (0x4, 'dut_wrapper.reg_rw_b', 0x0, 0x2, {}),
+                          (0x100, None, 0x0, 0x1, {})])
+        self.assertIn('dut_wrapper.reg_rw_a', repr(differences[0]))
+
+
+class TestAsyncSnapshot(unittest.IsolatedAsyncioTestCase):
+    """
+    Tests for the snapshot and restore methods of the asynchronous address map
+    """
+
+    async def test_round_trip(self) -> None:
+        """
+        Check the registers are read as runs and restored
+        """
+        memory: dict[int, int] = {index * 4: index + 1 for index in range(6)}
+        block_reads: list[tuple[int, int]] = []
+
+        # pylint: disable-next=unused-argument
+        async def read(addr: int, width: int, accesswidth: int) -> int:
+            return memory.get(addr, 0)
+
+        # pylint: disable-next=unused-argument
+        async def write(addr: int, width: int, accesswidth: int, data: int) -> None:
+            memory[addr] = data
+
+        # pylint: disable-next=unused-argument
+        async def read_block(addr: int, width: int, accesswidth: int, length: int) -> list[int]:
+            block_reads.append((addr, length))
+            return [memory.get(addr + (entry * 4), 0) for entry in range(length)]
+
+        dut = AsyncAddressMapToTest(callbacks=AsyncCallbackSet(
+            read_callback=read, write_callback=write, read_block_callback=read_block,
+            max_burst_length=2))
+        snapshot = await dut.snapshot()
+        # reg_wo at 0xC splits the readable registers into two runs
+        self.assertEqual(snapshot.runs, [(0x0, 32, 32, [1, 2, 3]), (0x10, 32, 32, [5, 6])])
+        self.assertEqual(block_reads, [(0x0, 2), (0x8, 1), (0x10, 2)])
+
+        memory.clear()
+        await dut.restore(snapshot)
+        self.assertEqual(memory, {0x0: 1, 0x4: 2, 0x10: 5, 0x14: 6})
+
+
+if __name__ == '__main__':
+    unittest.main()
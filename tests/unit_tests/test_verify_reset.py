@@ -0,0 +1,97 @@
+"""
+Test for the reset values of the registers and the check of an address map against them
+"""
+import unittest
+from unittest.mock import Mock
+
+# pylint: disable-next=unused-wildcard-import,wildcard-import
+from peakrdl_python.lib import *
+
+from .simple_components import AddressMapToTest, AsyncAddressMapToTest, SideEffectAddressMapToTest
+
+
+class TestVerifyReset(unittest.TestCase):
+    """
+    Tests for the reset value and mask of the registers and the verify_reset method of the
+    address map
+    """
+
+    def setUp(self) -> None:
+        self.memory: dict[int, int] = {}
+        self.read_callback = Mock(
+            side_effect=lambda addr, width, accesswidth: self.memory.get(addr, 0))
+        self.dut = AddressMapToTest(callbacks=NormalCallbackSet(read_callback=self.read_callback))
+
+    def test_reset_value_and_mask(self) -> None:
+        """
+        Check only readable fields with a known reset value, which are not volatile, are
+        included
+        """
+        self.assertEqual((self.dut.reg_rw_a.reset_value, self.dut.reg_rw_a.reset_mask), (0, 0))
+        self.assertEqual((self.dut.reg_rw_b.reset_value, self.dut.reg_rw_b.reset_mask), (1, 1))
+        # the field of reg_ro has a reset value but is volatile
+        self.assertEqual(self.dut.reg_ro.field.default, 0)
+        self.assertEqual((self.dut.reg_ro.reset_value, self.dut.reg_ro.reset_mask), (0, 0))
+
+    def test_verify_reset(self) -> None:
+        """
+        Check only the registers with something to check are read and the bits outside the
+        mask are ignored
+        """
+        self.memory[0x4] = 0x1
+        self.assertEqual(self.dut.verify_reset(), [])
+        self.read_callback.assert_called_once_with(addr=0x4, width=32, accesswidth=32)
+
+        self.memory[0x4] = 0xFFFF_FFFF
+        self.assertEqual(self.dut.verify_reset(), [])
+
+        self.memory[0x4] = 0xFFFF_FFFE
+        differences = self.dut.verify_reset()
+        self.assertEqual([(difference.address, difference.node_name, difference.value_a,
+                           difference.value_b, difference.fields)
+                          for difference in differences],
+                         [(0x4, 'dut_wrapper.reg_rw_b', 0x1, 0xFFFF_FFFE, {'field': (1, 0)})])
+
+    def test_read_side_effect_not_read(self) -> None:
+        """
+        Check a register with a clear on read field is not read, even though it has a reset
+        value
+        """
+        dut = SideEffectAddressMapToTest(callbacks=NormalCallbackSet(
+            read_callback=self.read_callback))
+        self.assertEqual(dut.reg_rclr.reset_mask, 1)
+        self.assertEqual(dut.verify_reset(), [])
+        self.read_callback.assert_not_called()
+
+
+class TestAsyncVerifyReset(unittest.IsolatedAsyncioTestCase):
+    """
+    Tests for the verify_reset method of the asynchronous address map
+    """
+
+    async def test_verify_reset(self) -> None:
+        """
+        Check the registers with a reset value are read as a single block
+        """
+        block_reads: list[tuple[int, int]] = []
+
+        # pylint: disable-next=unused-argument
+        async def read(addr: int, width: int, accesswidth: int) -> int:
+            raise RuntimeError('the registers should be read as a block')
+
+        # pylint: disable-next=unused-argument
+        async def read_block(addr: int, width: int, accesswidth: int, length: int) -> list[int]:
+            block_reads.append((addr, length))
+            return [0xF5, 0x7]
+
+        dut = AsyncAddressMapToTest(callbacks=AsyncCallbackSet(
+            read_callback=read, read_block_callback=read_block))
+        differences = await dut.verify_reset()
+        self.assertEqual(block_reads, [(0x10, 2)])
+        self.assertEqual([(difference.node_name, difference.value_a, difference.value_b)
+                          for difference in differences],
+                         [('dut_wrapper.reg_rw_d', 0x5, 0x7)])
+
+
+if __name__ == '__main__':
+    unittest.main()